@@ -6,110 +6,74 @@ Quilt packages and S3 buckets through a secure, authenticated interface.
 
 from __future__ import annotations
 
-from .config import DeploymentMode
-
-# Re-export all tools for easy access
-from .tools.catalog import (
-    catalog_uri,
-    catalog_url,
-    catalog_configure,
-)
-from .services.auth_metadata import (
-    auth_status,
-    catalog_info,
-    filesystem_status,
-)
-from .tools.buckets import (
-    bucket_object_fetch,
-    bucket_object_info,
-    bucket_object_link,
-    bucket_object_text,
-    bucket_objects_list,
-    bucket_objects_put,
-)
-from .services.permissions_service import (
-    bucket_recommendations_get,
-    check_bucket_access as bucket_access_check,
-    discover_permissions as aws_permissions_discover,
-)
-from .services.metadata_service import (
-    create_metadata_from_template,
-    fix_metadata_validation_issues,
-    get_metadata_template,
-    list_metadata_templates,
-    show_metadata_examples,
-    validate_metadata_structure,
-)
-from .tools.quilt_summary import (
-    create_quilt_summary_files,
-    generate_quilt_summarize_json,
-    generate_package_visualizations,
-)
-from .tools.packages import (
-    package_browse,
-    package_create,
-    package_delete,
-    package_diff,
-    package_update,
-    packages_list,
-)
-from .tools.s3_package_ingestion import package_create_from_s3
-from .tools.tabulator import (
-    tabulator_tables_list,
-    tabulator_table_create,
-    tabulator_table_delete,
-    tabulator_table_rename,
-    tabulator_buckets_list,
-    tabulator_bucket_query,
-)
+from importlib import import_module
+from typing import Any, Dict, Tuple
 
-__version__ = "0.5.6"
+from .config import DeploymentMode
 
-__all__ = [
-    "DeploymentMode",
+# Tools are re-exported lazily: importing ``quilt_mcp`` (which every submodule
+# import does) must not pull in every tool module and its dependencies.
+_EXPORTS: Dict[str, Tuple[str, str]] = {
     # Auth tools
-    "auth_status",
-    "catalog_info",
-    "catalog_url",
-    "catalog_uri",
-    "catalog_configure",
-    "filesystem_status",
+    "auth_status": ("quilt_mcp.services.auth_metadata", "auth_status"),
+    "catalog_info": ("quilt_mcp.services.auth_metadata", "catalog_info"),
+    "catalog_url": ("quilt_mcp.tools.catalog", "catalog_url"),
+    "catalog_uri": ("quilt_mcp.tools.catalog", "catalog_uri"),
+    "catalog_configure": ("quilt_mcp.tools.catalog", "catalog_configure"),
+    "filesystem_status": ("quilt_mcp.services.auth_metadata", "filesystem_status"),
     # Bucket tools
-    "bucket_object_info",
-    "bucket_object_text",
-    "bucket_objects_list",
-    "bucket_objects_put",
-    "bucket_object_fetch",
-    "bucket_object_link",
+    "bucket_object_info": ("quilt_mcp.tools.buckets", "bucket_object_info"),
+    "bucket_object_text": ("quilt_mcp.tools.buckets", "bucket_object_text"),
+    "bucket_objects_list": ("quilt_mcp.tools.buckets", "bucket_objects_list"),
+    "bucket_objects_put": ("quilt_mcp.tools.buckets", "bucket_objects_put"),
+    "bucket_object_fetch": ("quilt_mcp.tools.buckets", "bucket_object_fetch"),
+    "bucket_object_link": ("quilt_mcp.tools.buckets", "bucket_object_link"),
     # Package tools
-    "package_browse",
-    "package_create",
-    "package_create_from_s3",
-    "package_delete",
-    "package_diff",
-    "package_update",
-    "packages_list",
+    "package_browse": ("quilt_mcp.tools.packages", "package_browse"),
+    "package_create": ("quilt_mcp.tools.packages", "package_create"),
+    "package_create_from_s3": ("quilt_mcp.tools.s3_package_ingestion", "package_create_from_s3"),
+    "package_delete": ("quilt_mcp.tools.packages", "package_delete"),
+    "package_diff": ("quilt_mcp.tools.packages", "package_diff"),
+    "package_update": ("quilt_mcp.tools.packages", "package_update"),
+    "packages_list": ("quilt_mcp.tools.packages", "packages_list"),
     # Permission tools
-    "aws_permissions_discover",
-    "bucket_access_check",
-    "bucket_recommendations_get",
+    "aws_permissions_discover": ("quilt_mcp.services.permissions_service", "discover_permissions"),
+    "bucket_access_check": ("quilt_mcp.services.permissions_service", "check_bucket_access"),
+    "bucket_recommendations_get": ("quilt_mcp.services.permissions_service", "bucket_recommendations_get"),
     # Metadata helpers
-    "get_metadata_template",
-    "list_metadata_templates",
-    "validate_metadata_structure",
+    "get_metadata_template": ("quilt_mcp.services.metadata_service", "get_metadata_template"),
+    "list_metadata_templates": ("quilt_mcp.services.metadata_service", "list_metadata_templates"),
+    "validate_metadata_structure": ("quilt_mcp.services.metadata_service", "validate_metadata_structure"),
     # Metadata examples and guidance
-    "show_metadata_examples",
-    "create_metadata_from_template",
-    "fix_metadata_validation_issues",
+    "show_metadata_examples": ("quilt_mcp.services.metadata_service", "show_metadata_examples"),
+    "create_metadata_from_template": ("quilt_mcp.services.metadata_service", "create_metadata_from_template"),
+    "fix_metadata_validation_issues": ("quilt_mcp.services.metadata_service", "fix_metadata_validation_issues"),
     # Quilt summary and visualization tools
-    "create_quilt_summary_files",
-    "generate_quilt_summarize_json",
-    "generate_package_visualizations",
+    "create_quilt_summary_files": ("quilt_mcp.tools.quilt_summary", "create_quilt_summary_files"),
+    "generate_quilt_summarize_json": ("quilt_mcp.tools.quilt_summary", "generate_quilt_summarize_json"),
+    "generate_package_visualizations": ("quilt_mcp.tools.quilt_summary", "generate_package_visualizations"),
     # Tabulator tools
-    "tabulator_tables_list",
-    "tabulator_table_create",
-    "tabulator_table_delete",
-    "tabulator_table_rename",
-    "tabulator_buckets_list",
-    "tabulator_bucket_query",
-]
+    "tabulator_tables_list": ("quilt_mcp.tools.tabulator", "tabulator_tables_list"),
+    "tabulator_table_create": ("quilt_mcp.tools.tabulator", "tabulator_table_create"),
+    "tabulator_table_delete": ("quilt_mcp.tools.tabulator", "tabulator_table_delete"),
+    "tabulator_table_rename": ("quilt_mcp.tools.tabulator", "tabulator_table_rename"),
+    "tabulator_buckets_list": ("quilt_mcp.tools.tabulator", "tabulator_buckets_list"),
+    "tabulator_bucket_query": ("quilt_mcp.tools.tabulator", "tabulator_bucket_query"),
+}
+
+__version__ = "0.5.6"
+
+__all__ = ["DeploymentMode", *_EXPORTS]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'quilt_mcp' has no attribute '{name}'")
+    module_path, attribute = _EXPORTS[name]
+    value = getattr(import_module(module_path), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals().keys()) + list(_EXPORTS))
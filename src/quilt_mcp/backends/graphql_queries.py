@@ -27,6 +27,47 @@ query GetPackage($bucket: String!, $name: String!, $hash: String!) {
 }
 """
 
+PACKAGE_DIR_ENTRIES_QUERY = """
+query PackageDirEntries($bucket: String!, $name: String!, $hash: String!, $path: String!) {
+  package(bucket: $bucket, name: $name) {
+    revision(hashOrTag: $hash) {
+      hash
+      dir(path: $path) {
+        children {
+          __typename
+          ... on PackageFile { path size physicalKey }
+          ... on PackageDir { path }
+        }
+      }
+    }
+  }
+}
+"""
+
+BROWSE_PACKAGE_LISTING_QUERY = """
+query BrowsePackageListing($bucket: String!, $name: String!, $hash: String!, $path: String!) {
+  package(bucket: $bucket, name: $name) {
+    revision(hashOrTag: $hash) {
+      hash
+      userMeta
+      dir(path: $path) {
+        path
+        children {
+          __typename
+          ... on PackageFile { path size physicalKey }
+          ... on PackageDir { path size }
+        }
+      }
+      file(path: $path) {
+        path
+        size
+        physicalKey
+      }
+    }
+  }
+}
+"""
+
 PACKAGE_REVISIONS_FOR_DELETE_QUERY = """
 query PackageRevisionsForDelete($bucket: String!, $name: String!, $page: Int!, $perPage: Int!) {
   package(bucket: $bucket, name: $name) {
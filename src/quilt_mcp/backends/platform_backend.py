@@ -6,14 +6,17 @@ Platform GraphQL API and JWT authentication claims.
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import json
 import logging
 import os
 from contextlib import contextmanager
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any, cast
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Dict, Any, Sequence, Tuple, cast
 
-import boto3
+import httpx
 
 from quilt_mcp.ops.quilt_ops import QuiltOps
 from quilt_mcp.ops.tabulator_mixin import TabulatorMixin
@@ -27,14 +30,18 @@ from quilt_mcp.domain import (
     Catalog_Config,
 )
 from quilt_mcp.domain.package_builder import PackageBuilder, PackageEntry
+from quilt_mcp.services.aws_client_registry import get_pooled_client
 from quilt_mcp.services.browsing_session_client import BrowsingSessionClient
 from quilt_mcp.services.jwt_auth_service import JWTAuthService
+from quilt_mcp.services.manifest_cache import entries_size, get_manifest_cache, is_top_hash, manifest_key
 from quilt_mcp.utils.common import graphql_endpoint, normalize_url, get_dns_name_from_url, _runtime_boto3_session
-from quilt_mcp.backends.platform_graphql_client import PlatformGraphQLClient
+from quilt_mcp.backends.platform_graphql_client import GraphQLRequest, PlatformGraphQLClient
 from quilt_mcp.backends.graphql_queries import (
+    BROWSE_PACKAGE_LISTING_QUERY,
     DELETE_REVISION_MUTATION,
     GET_PACKAGE_QUERY,
     PACKAGE_CONSTRUCT_MUTATION,
+    PACKAGE_DIR_ENTRIES_QUERY,
     PACKAGE_REVISIONS_FOR_DELETE_QUERY,
 )
 from quilt_mcp.utils.helpers import extract_bucket_from_registry
@@ -42,6 +49,22 @@ from quilt_mcp.utils.helpers import extract_bucket_from_registry
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_DELETE_CONCURRENCY = 8
+
+
+def _delete_concurrency() -> int:
+    """Return how many revision deletions may be in flight at once."""
+    try:
+        return max(1, int(os.getenv("QUILT_DELETE_CONCURRENCY", str(DEFAULT_DELETE_CONCURRENCY))))
+    except ValueError:
+        return DEFAULT_DELETE_CONCURRENCY
+
+
+def _walk_key(path: str) -> Tuple[str, ...]:
+    """Sort key ordering logical keys like a depth-first walk over sorted names."""
+    return tuple(path.rstrip("/").split("/"))
+
+
 @dataclass
 class DeletionResult:
     """Structured result for package deletion attempts."""
@@ -50,6 +73,7 @@ class DeletionResult:
     method: str
     revision_count: int = 0
     error: str | None = None
+    failures: Dict[str, str] = field(default_factory=dict)
 
 
 class Platform_Backend(TabulatorMixin, QuiltOps):
@@ -92,6 +116,7 @@ class Platform_Backend(TabulatorMixin, QuiltOps):
             session=self._session,
             endpoint=self._graphql_endpoint,
             auth_header=f"Bearer {self._access_token}",
+            array_batching=os.getenv("QUILT_GRAPHQL_ARRAY_BATCHING", "").lower() in {"1", "true", "yes"},
         )
 
         ttl_seconds = int(os.getenv("QUILT_BROWSING_SESSION_TTL", "180"))
@@ -125,7 +150,7 @@ class Platform_Backend(TabulatorMixin, QuiltOps):
         variables: Optional[Dict[str, Any]] = None,
         registry: Optional[str] = None,
     ) -> Dict[str, Any]:
-        try:
+        with self._graphql_errors():
             result = self._graphql_client.execute(query=query, variables=variables)
 
             if "errors" in result:
@@ -133,7 +158,38 @@ class Platform_Backend(TabulatorMixin, QuiltOps):
                 raise BackendError(f"GraphQL query failed: {'; '.join(error_messages)}")
 
             return result
-        except self._requests.HTTPError as exc:
+
+    async def aexecute_graphql_query(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Asyncio equivalent of execute_graphql_query(), awaiting the shared httpx client."""
+        with self._graphql_errors():
+            result = await self._graphql_client.aexecute(query=query, variables=variables)
+
+            if "errors" in result:
+                error_messages = [err.get("message", str(err)) for err in result.get("errors", [])]
+                raise BackendError(f"GraphQL query failed: {'; '.join(error_messages)}")
+
+            return result
+
+    def execute_graphql_batch(self, requests: Sequence[GraphQLRequest]) -> List[Dict[str, Any]]:
+        """Run independent GraphQL operations in a single HTTP round trip.
+
+        Returns one response dict per request, in order. Unlike
+        execute_graphql_query(), GraphQL errors are left in each response's
+        ``errors`` list so one failing operation does not hide the others.
+        """
+        with self._graphql_errors():
+            return self._graphql_client.execute_batch(requests)
+
+    @contextmanager
+    def _graphql_errors(self) -> Iterator[None]:
+        """Translate transport failures into AuthenticationError/BackendError."""
+        try:
+            yield
+        except (self._requests.HTTPError, httpx.HTTPStatusError) as exc:
             status = exc.response.status_code if exc.response is not None else None
             if status in {401, 403}:
                 raise AuthenticationError("GraphQL query not authorized") from exc
@@ -321,15 +377,14 @@ class Platform_Backend(TabulatorMixin, QuiltOps):
     def get_aws_client(self, service_name: str, region: Optional[str] = None) -> Any:
         runtime_session = _runtime_boto3_session()
         if runtime_session is not None:
-            return runtime_session.client(service_name, region_name=region)
+            return get_pooled_client(runtime_session, service_name, region)
 
         try:
-            jwt_session = JWTAuthService().get_boto3_session()
-            return jwt_session.client(service_name, region_name=region)
+            return JWTAuthService().get_aws_client(service_name, region=region)
         except Exception:
             pass
 
-        return boto3.client(service_name, region_name=region)
+        return get_pooled_client(None, service_name, region)
 
     def get_boto3_client(self, service_name: str, region: Optional[str] = None) -> Any:
         """Backward-compatible alias for get_aws_client()."""
@@ -421,45 +476,74 @@ class Platform_Backend(TabulatorMixin, QuiltOps):
         if not revision_hashes:
             return DeletionResult(success=False, method="graphql", error="No package revisions found")
 
-        had_failure = False
-        for hash_or_tag in sorted(set(revision_hashes), reverse=True):
-            try:
-                result = self.execute_graphql_query(
-                    DELETE_REVISION_MUTATION,
-                    variables={"bucket": bucket_name, "name": package_name, "hash": hash_or_tag},
-                )
-                payload = result.get("data", {}).get("packageRevisionDelete", {})
-                if payload.get("__typename") != "PackageRevisionDeleteSuccess":
-                    had_failure = True
-                    logger.error(
-                        "Package revision delete returned non-success",
+        unique_hashes = sorted(set(revision_hashes), reverse=True)
+        concurrency = min(len(unique_hashes), _delete_concurrency())
+        failures: Dict[str, str] = {}
+        completed = 0
+        progress_step = max(1, len(unique_hashes) // 10)
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="revision-delete") as executor:
+            futures = {
+                executor.submit(self._delete_revision, bucket_name, package_name, hash_or_tag): hash_or_tag
+                for hash_or_tag in unique_hashes
+            }
+            for future in as_completed(futures):
+                error = future.result()
+                if error is not None:
+                    failures[futures[future]] = error
+                completed += 1
+                if completed % progress_step == 0 or completed == len(unique_hashes):
+                    logger.info(
+                        "Package revision delete progress",
                         extra={
                             "bucket": bucket_name,
                             "package_name": package_name,
-                            "hash": hash_or_tag,
-                            "typename": payload.get("__typename"),
-                            "message": payload.get("message"),
+                            "completed": completed,
+                            "total": len(unique_hashes),
+                            "failed": len(failures),
                         },
                     )
-            except Exception as exc:
-                had_failure = True
-                logger.error(
-                    "Package revision delete failed",
-                    extra={
-                        "bucket": bucket_name,
-                        "package_name": package_name,
-                        "hash": hash_or_tag,
-                        "error": str(exc),
-                    },
-                )
 
         return DeletionResult(
-            success=not had_failure,
+            success=not failures,
             method="graphql",
-            revision_count=len(set(revision_hashes)),
-            error=None if not had_failure else "GraphQL revision deletion had failures",
+            revision_count=len(unique_hashes),
+            error=None if not failures else f"GraphQL revision deletion failed for {len(failures)} revision(s)",
+            failures=failures,
         )
 
+    def _delete_revision(self, bucket_name: str, package_name: str, hash_or_tag: str) -> Optional[str]:
+        """Delete one package revision; return an error message instead of raising."""
+        try:
+            result = self.execute_graphql_query(
+                DELETE_REVISION_MUTATION,
+                variables={"bucket": bucket_name, "name": package_name, "hash": hash_or_tag},
+            )
+            payload = result.get("data", {}).get("packageRevisionDelete", {})
+            if payload.get("__typename") == "PackageRevisionDeleteSuccess":
+                return None
+            logger.error(
+                "Package revision delete returned non-success",
+                extra={
+                    "bucket": bucket_name,
+                    "package_name": package_name,
+                    "hash": hash_or_tag,
+                    "typename": payload.get("__typename"),
+                    "response_message": payload.get("message"),
+                },
+            )
+            return str(payload.get("message") or payload.get("__typename") or "Unknown delete response")
+        except Exception as exc:
+            logger.error(
+                "Package revision delete failed",
+                extra={
+                    "bucket": bucket_name,
+                    "package_name": package_name,
+                    "hash": hash_or_tag,
+                    "error": str(exc),
+                },
+            )
+            return str(exc)
+
     def delete_package(self, bucket: str, name: str) -> bool:
         """Delete all known package revisions.
 
@@ -487,6 +571,7 @@ class Platform_Backend(TabulatorMixin, QuiltOps):
                         "package_name": name,
                         "error": graphql_result.error,
                         "revision_count": graphql_result.revision_count,
+                        "failed_hashes": sorted(graphql_result.failures),
                     },
                 )
             return graphql_result.success
@@ -622,7 +707,8 @@ class Platform_Backend(TabulatorMixin, QuiltOps):
             top_hash: Optional specific version hash
 
         Returns:
-            Package data structure with contentsFlatMap
+            Package data structure with bucket, name and revision hash/userMeta/
+            contentsFlatMap (null for packages over 10,000 entries)
 
         Raises:
             NotFoundError: If package not found
@@ -641,20 +727,115 @@ class Platform_Backend(TabulatorMixin, QuiltOps):
         if not package_data:
             raise NotFoundError(f"Package not found: {package_name}")
 
-        return package_data
+        return {"bucket": bucket, "name": package_name, **package_data}
+
+    def _backend_get_packages(self, packages: List[Tuple[str, Optional[str]]], registry: str) -> List[Any]:
+        """Retrieve several packages with one batched GraphQL request (backend primitive).
+
+        Args:
+            packages: (package_name, top_hash) pairs; top_hash None means latest
+            registry: Registry S3 URL
+
+        Returns:
+            Package data structures in the order requested (see _backend_get_package)
+
+        Raises:
+            NotFoundError: If any package not found
+        """
+        if len(packages) == 1:
+            package_name, top_hash = packages[0]
+            return [self._backend_get_package(package_name, registry, top_hash)]
+
+        bucket = self._extract_bucket_from_registry(registry)
+        requests = [
+            GraphQLRequest(GET_PACKAGE_QUERY, {"bucket": bucket, "name": package_name, "hash": top_hash or "latest"})
+            for package_name, top_hash in packages
+        ]
+        results = self.execute_graphql_batch(requests)
+
+        loaded = []
+        for (package_name, _), result in zip(packages, results, strict=True):
+            if result.get("errors"):
+                error_messages = [err.get("message", str(err)) for err in result["errors"]]
+                raise BackendError(f"GraphQL query failed: {'; '.join(error_messages)}")
+            package_data = (result.get("data") or {}).get("package")
+            if not package_data:
+                raise NotFoundError(f"Package not found: {package_name}")
+            loaded.append({"bucket": bucket, "name": package_name, **package_data})
+        return loaded
+
+    def _backend_list_package_dir(
+        self, package_name: str, registry: str, path: str, top_hash: Optional[str] = None
+    ) -> Tuple[List[Content_Info], Optional[Dict[str, Any]], Optional[str]]:
+        """List a package path with metadata in one GraphQL query (backend primitive).
+
+        Fetches the revision hash, user metadata and the one-level directory
+        listing (or the single file) at ``path`` without the contentsFlatMap
+        manifest used by _backend_get_package().
+
+        Args:
+            package_name: Full package name
+            registry: Registry S3 URL
+            path: Path within the package ("" for the root)
+            top_hash: Optional specific version hash
+
+        Returns:
+            Tuple of (entries, package metadata, revision hash)
+
+        Raises:
+            NotFoundError: If the package or path doesn't exist
+        """
+        variables = {
+            "bucket": self._extract_bucket_from_registry(registry),
+            "name": package_name,
+            "hash": top_hash or "latest",
+            "path": path or "",
+        }
+        result = self.execute_graphql_query(BROWSE_PACKAGE_LISTING_QUERY, variables=variables)
+        revision = (result.get("data", {}).get("package") or {}).get("revision")
+        if not revision:
+            raise NotFoundError(f"Package not found: {package_name}")
+
+        dir_info = revision.get("dir")
+        file_info = revision.get("file")
+        if dir_info:
+            entries = [self._transform_content_entry(entry) for entry in dir_info.get("children", [])]
+        elif file_info:
+            entries = [self._transform_content_entry({"__typename": "PackageFile", **file_info})]
+        else:
+            raise NotFoundError(f"Path not found in package: {path}")
+
+        return entries, self._parse_meta(revision.get("userMeta")), revision.get("hash") or top_hash
 
     def _backend_get_package_entries(self, package: Any) -> Dict[str, PackageEntry]:
         """Get all entries from package data (backend primitive).
 
         Args:
-            package: Package data structure from GraphQL
+            package: Package data structure from _backend_get_package()
 
         Returns:
             Dict mapping logical_key to PackageEntry with normalized types
         """
-        contents_flat_map = package.get("revision", {}).get("contentsFlatMap", {})
-        entries: Dict[str, PackageEntry] = {}
+        revision = package.get("revision") or {}
+        contents_flat_map = revision.get("contentsFlatMap")
+        if not isinstance(contents_flat_map, dict):
+            # contentsFlatMap is null above its 10,000-entry cap: page through the
+            # revision's directories instead. The walk costs one query per
+            # directory and carries no hash or meta, so the result is cached per
+            # immutable revision hash (access was checked when loading package).
+            top_hash = revision.get("hash") or ""
+            cache = get_manifest_cache()
+            key = manifest_key(f"s3://{package['bucket']}", top_hash, "entries") if is_top_hash(top_hash) else None
+            cached = cache.get(key) if key else None
+            if cached is not None:
+                return cast(Dict[str, PackageEntry], cached)
+            entries_iter = self._iter_revision_entries(package["bucket"], package["name"], top_hash or "latest", "")
+            walked = {entry["logicalKey"]: entry for entry in entries_iter}
+            if key:
+                cache.put(key, walked, entries_size(walked))
+            return walked
 
+        entries: Dict[str, PackageEntry] = {}
         for logical_key, entry_data in contents_flat_map.items():
             if isinstance(entry_data, dict):
                 entries[logical_key] = PackageEntry(
@@ -667,6 +848,65 @@ class Platform_Backend(TabulatorMixin, QuiltOps):
 
         return entries
 
+    def _backend_iter_package_entries(
+        self, package_name: str, registry: str, top_hash: Optional[str] = None, prefix: Optional[str] = None
+    ) -> Iterator[PackageEntry]:
+        """Stream package entries one directory listing at a time (backend primitive).
+
+        Args:
+            package_name: Full package name
+            registry: Registry S3 URL
+            top_hash: Optional specific version hash
+            prefix: Optional logical-key prefix
+
+        Yields:
+            PackageEntry for each file under ``prefix``, in package walk order
+        """
+        bucket = self._extract_bucket_from_registry(registry)
+        return self._iter_revision_entries(bucket, package_name, top_hash or "latest", prefix or "")
+
+    def _iter_revision_entries(
+        self, bucket: str, package_name: str, hash_or_tag: str, prefix: str
+    ) -> Iterator[PackageEntry]:
+        """Walk a revision's directory tree, holding only unvisited siblings in memory.
+
+        Directories are expanded lazily from a heap ordered by path segments, so
+        files come out in the same order as ``quilt3.Package.walk()``. The first
+        response pins the revision hash so later pages read the same revision.
+        """
+        start = prefix[: prefix.rfind("/") + 1]
+        order = itertools.count()
+        pending: List[Tuple[Tuple[str, ...], int, str, Optional[Dict[str, Any]]]] = [
+            (_walk_key(start), next(order), start, None)
+        ]
+        while pending:
+            _, _, path, file_data = heapq.heappop(pending)
+            if file_data is not None:
+                yield PackageEntry(
+                    logicalKey=path,
+                    physicalKey=file_data.get("physicalKey") or "",
+                    size=self._normalize_size(file_data.get("size")),
+                    hash=None,
+                    meta=None,
+                )
+                continue
+
+            variables = {"bucket": bucket, "name": package_name, "hash": hash_or_tag, "path": path}
+            result = self.execute_graphql_query(PACKAGE_DIR_ENTRIES_QUERY, variables=variables)
+            revision = (result.get("data", {}).get("package") or {}).get("revision")
+            if not revision:
+                raise NotFoundError(f"Package not found: {package_name}")
+            hash_or_tag = revision.get("hash") or hash_or_tag
+
+            for child in (revision.get("dir") or {}).get("children", []):
+                child_path = child.get("path") or ""
+                if child.get("__typename") == "PackageDir":
+                    dir_path = child_path if child_path.endswith("/") else f"{child_path}/"
+                    if dir_path.startswith(prefix) or prefix.startswith(dir_path):
+                        heapq.heappush(pending, (_walk_key(dir_path), next(order), child_path, None))
+                elif child_path.startswith(prefix):
+                    heapq.heappush(pending, (_walk_key(child_path), next(order), child_path, child))
+
     def _backend_get_package_metadata(self, package: Any) -> Dict[str, Any]:
         """Get metadata from package data (backend primitive).
 
@@ -815,6 +1055,7 @@ class Platform_Backend(TabulatorMixin, QuiltOps):
                     "path": entry.get("path", ""),
                     "size": entry.get("size"),
                     "type": "directory" if entry.get("__typename") == "PackageDir" else "file",
+                    "physicalKey": entry.get("physicalKey"),
                 }
                 for entry in children
             ]
@@ -825,6 +1066,7 @@ class Platform_Backend(TabulatorMixin, QuiltOps):
                     "path": file_info.get("path", ""),
                     "size": file_info.get("size"),
                     "type": "file",
+                    "physicalKey": file_info.get("physicalKey"),
                 }
             ]
 
@@ -1010,6 +1252,7 @@ class Platform_Backend(TabulatorMixin, QuiltOps):
             modified_date=None,
             download_url=None,
             meta=meta,  # Entry-level metadata
+            physical_key=entry.get("physicalKey"),
         )
 
     def _normalize_package_datetime(self, datetime_value: Any) -> str:
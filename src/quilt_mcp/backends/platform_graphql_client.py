@@ -2,33 +2,314 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import re
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from quilt_mcp.services.async_http_client import get_async_http_client
+
+_OPERATION_HEADER = re.compile(r"\s*(?:(query|mutation)\b\s*(\w+)?\s*(?:\(([^)]*)\))?\s*)?\{")
+_STRING_LITERAL = re.compile(r'"(?:\\.|[^"\\])*"')
+_VARIABLE = re.compile(r"\$(\w+)")
+_NAME = re.compile(r"[_A-Za-z]\w*")
+
+
+@dataclass(frozen=True)
+class GraphQLRequest:
+    """One GraphQL operation to run as part of a batch."""
+
+    query: str
+    variables: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class GraphQLRequestCounter:
+    """Counts GraphQL HTTP round trips and operations issued in a tracked context."""
+
+    requests: int = 0
+    operations: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, operations: int) -> None:
+        with self._lock:
+            self.requests += 1
+            self.operations += operations
+
+
+_request_counter: ContextVar[Optional[GraphQLRequestCounter]] = ContextVar("graphql_request_counter", default=None)
+
+
+@contextmanager
+def track_graphql_requests() -> Iterator[GraphQLRequestCounter]:
+    """Count GraphQL POSTs made in the current context (e.g. one tool call).
+
+    Worker threads only report to the counter when they run in a copy of the
+    caller's context.
+    """
+    counter = GraphQLRequestCounter()
+    token = _request_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _request_counter.reset(token)
+
+
+@dataclass
+class _ParsedOperation:
+    operation_type: str
+    variable_definitions: str
+    selections: str
+
+
+def _split_strings(text: str) -> List[Tuple[str, bool]]:
+    """Split ``text`` into (chunk, is_string_literal) parts."""
+    parts: List[Tuple[str, bool]] = []
+    position = 0
+    for match in _STRING_LITERAL.finditer(text):
+        parts.append((text[position : match.start()], False))
+        parts.append((match.group(0), True))
+        position = match.end()
+    parts.append((text[position:], False))
+    return parts
+
+
+def _prefix_variables(text: str, prefix: str) -> str:
+    return "".join(
+        chunk if is_string else _VARIABLE.sub(lambda m: f"${prefix}{m.group(1)}", chunk)
+        for chunk, is_string in _split_strings(text)
+    )
+
+
+def _parse_operation(query: str) -> _ParsedOperation:
+    """Split a single-operation document into its type, variable definitions and selections."""
+    header = _OPERATION_HEADER.match(query)
+    end = query.rstrip().rfind("}")
+    if header is None or end < header.end() or query[end + 1 :].strip():
+        raise ValueError("Only single-operation GraphQL documents can be batched")
+    return _ParsedOperation(
+        operation_type=header.group(1) or "query",
+        variable_definitions=(header.group(3) or "").strip(),
+        selections=query[header.end() : end],
+    )
+
+
+def _skip_separators(text: str, index: int) -> int:
+    while index < len(text) and text[index] in " \t\r\n,":
+        index += 1
+    return index
+
+
+def _alias_top_level_fields(selections: str, prefix: str) -> Tuple[str, Dict[str, str]]:
+    """Prefix the response key of every top-level field in a selection set.
+
+    Returns the rewritten selections and a map from prefixed response key to
+    the key the caller expects (the field name, or its existing alias).
+    """
+    out: List[str] = []
+    response_keys: Dict[str, str] = {}
+    depth = 0
+    i = 0
+    while i < len(selections):
+        char = selections[i]
+        if char == '"':
+            literal = _STRING_LITERAL.match(selections, i)
+            stop = literal.end() if literal else len(selections)
+            out.append(selections[i:stop])
+            i = stop
+            continue
+        if char in "{(":
+            depth += 1
+        elif char in "})":
+            depth -= 1
+        elif depth == 0 and selections.startswith("...", i):
+            raise ValueError("Top-level fragment spreads cannot be batched")
+        elif depth == 0 and (name := _NAME.match(selections, i)) is not None:
+            if i > 0 and selections[i - 1] == "@":
+                # Directive name, not a field.
+                out.append(name.group(0))
+                i = name.end()
+                continue
+            response_key = name.group(0)
+            response_keys[prefix + response_key] = response_key
+            colon = _skip_separators(selections, name.end())
+            if colon < len(selections) and selections[colon] == ":":
+                # Already aliased: prefix the alias and copy ": fieldName" verbatim.
+                field_name = _NAME.match(selections, _skip_separators(selections, colon + 1))
+                if field_name is None:
+                    raise ValueError("Malformed GraphQL alias")
+                out.append(prefix + selections[i : field_name.end()])
+                i = field_name.end()
+            else:
+                out.append(f"{prefix}{response_key}: {response_key}")
+                i = name.end()
+            continue
+        out.append(char)
+        i += 1
+    return "".join(out), response_keys
+
+
+def merge_requests(requests: Sequence[GraphQLRequest]) -> Tuple[GraphQLRequest, List[Dict[str, str]]]:
+    """Merge independent operations into one aliased document.
+
+    Every operation's variables and top-level response keys are prefixed with
+    ``b<index>_`` so they cannot collide. Returns the merged request and, per
+    input request, the map from prefixed response key to original key.
+
+    Raises:
+        ValueError: If an operation cannot be merged (several operations or
+            fragment definitions in one document, top-level fragment spreads,
+            or mixed queries and mutations)
+    """
+    operation_types = set()
+    definitions: List[str] = []
+    bodies: List[str] = []
+    variables: Dict[str, Any] = {}
+    response_keys: List[Dict[str, str]] = []
+    for index, request in enumerate(requests):
+        prefix = f"b{index}_"
+        parsed = _parse_operation(request.query)
+        operation_types.add(parsed.operation_type)
+        if parsed.variable_definitions:
+            definitions.append(_prefix_variables(parsed.variable_definitions, prefix))
+        body, keys = _alias_top_level_fields(_prefix_variables(parsed.selections, prefix), prefix)
+        bodies.append(body)
+        response_keys.append(keys)
+        for name, value in (request.variables or {}).items():
+            variables[f"{prefix}{name}"] = value
+    if len(operation_types) > 1:
+        raise ValueError("Queries and mutations cannot be batched together")
+
+    operation_type = operation_types.pop() if operation_types else "query"
+    signature = f"({', '.join(definitions)})" if definitions else ""
+    document = f"{operation_type} Batched{signature} {{\n" + "\n".join(bodies) + "\n}"
+    return GraphQLRequest(query=document, variables=variables or None), response_keys
+
+
+def split_response(result: Dict[str, Any], response_keys: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """Split a merged response back into one result per batched request."""
+    data = result.get("data")
+    owners = {prefixed: index for index, keys in enumerate(response_keys) for prefixed in keys}
+    results: List[Dict[str, Any]] = []
+    for keys in response_keys:
+        if isinstance(data, dict):
+            results.append({"data": {original: data.get(prefixed) for prefixed, original in keys.items()}})
+        else:
+            results.append({"data": None})
+
+    for error in result.get("errors") or []:
+        path = error.get("path") if isinstance(error, dict) else None
+        owner = owners.get(path[0]) if path else None
+        if owner is None or not path:
+            # Errors that cannot be attributed (e.g. validation errors) apply to every request.
+            for item in results:
+                item.setdefault("errors", []).append(error)
+            continue
+        error = {**error, "path": [response_keys[owner][path[0]], *path[1:]]}
+        results[owner].setdefault("errors", []).append(error)
+    return results
+
+
+def _payload(request: GraphQLRequest) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"query": request.query}
+    if request.variables:
+        payload["variables"] = request.variables
+    return payload
+
+
+def _as_result(result: Any) -> Dict[str, Any]:
+    if not isinstance(result, dict):
+        raise ValueError("GraphQL response was not a JSON object")
+    return result
 
 
 class PlatformGraphQLClient:
-    """Thin HTTP client wrapper for GraphQL execution."""
+    """Thin HTTP client wrapper for GraphQL execution.
+
+    ``execute_batch`` sends several independent operations in one round trip,
+    either merged into one aliased document (works with any GraphQL server) or,
+    with ``array_batching``, as a JSON array of operations for servers that
+    accept batched requests.
 
-    def __init__(self, session: Any, endpoint: str, auth_header: str) -> None:
+    ``aexecute``/``aexecute_batch`` are the asyncio equivalents; they go through
+    the shared ``httpx.AsyncClient`` instead of the ``requests`` session.
+    """
+
+    def __init__(self, session: Any, endpoint: str, auth_header: str, *, array_batching: bool = False) -> None:
         self._session = session
         self._endpoint = endpoint
         self._auth_header = auth_header
+        self._array_batching = array_batching
 
     def execute(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        payload: Dict[str, Any] = {"query": query}
-        if variables:
-            payload["variables"] = variables
-        response = self._session.post(
-            self._endpoint,
-            json=payload,
-            headers={
-                "Authorization": self._auth_header,
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            },
-            timeout=60,
+        return _as_result(self._post(_payload(GraphQLRequest(query, variables)), operations=1))
+
+    async def aexecute(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return _as_result(await self._apost(_payload(GraphQLRequest(query, variables)), operations=1))
+
+    def execute_batch(self, requests: Sequence[GraphQLRequest]) -> List[Dict[str, Any]]:
+        """Run independent operations in one HTTP request.
+
+        Returns one response dict per request, in order. GraphQL errors are
+        attached to the request they belong to rather than raised.
+        """
+        if not requests:
+            return []
+        if len(requests) == 1:
+            return [self.execute(requests[0].query, requests[0].variables)]
+        payload, response_keys = self._batch_payload(requests)
+        return self._split_batch(self._post(payload, operations=len(requests)), requests, response_keys)
+
+    async def aexecute_batch(self, requests: Sequence[GraphQLRequest]) -> List[Dict[str, Any]]:
+        """Asyncio equivalent of execute_batch()."""
+        if not requests:
+            return []
+        if len(requests) == 1:
+            return [await self.aexecute(requests[0].query, requests[0].variables)]
+        payload, response_keys = self._batch_payload(requests)
+        return self._split_batch(await self._apost(payload, operations=len(requests)), requests, response_keys)
+
+    def _batch_payload(self, requests: Sequence[GraphQLRequest]) -> Tuple[Any, Optional[List[Dict[str, str]]]]:
+        if self._array_batching:
+            return [_payload(request) for request in requests], None
+        merged, response_keys = merge_requests(requests)
+        return _payload(merged), response_keys
+
+    @staticmethod
+    def _split_batch(
+        result: Any, requests: Sequence[GraphQLRequest], response_keys: Optional[List[Dict[str, str]]]
+    ) -> List[Dict[str, Any]]:
+        if response_keys is not None:
+            return split_response(_as_result(result), response_keys)
+        if not isinstance(result, list) or len(result) != len(requests):
+            raise ValueError("GraphQL batch response did not match the batched requests")
+        return [_as_result(item) for item in result]
+
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": self._auth_header,
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+
+    def _post(self, payload: Any, *, operations: int) -> Any:
+        _record_request(operations)
+        response = self._session.post(self._endpoint, json=payload, headers=self._headers(), timeout=60)
+        response.raise_for_status()
+        return response.json()
+
+    async def _apost(self, payload: Any, *, operations: int) -> Any:
+        _record_request(operations)
+        response = await get_async_http_client().post(
+            self._endpoint, json=payload, headers=self._headers(), timeout=60
         )
         response.raise_for_status()
-        result = response.json()
-        if not isinstance(result, dict):
-            raise ValueError("GraphQL response was not a JSON object")
-        return result
+        return response.json()
+
+
+def _record_request(operations: int) -> None:
+    counter = _request_counter.get()
+    if counter is not None:
+        counter.record(operations)
@@ -12,8 +12,9 @@ The implementation is organized into modular components:
 - quilt3_backend_session: Session, config, and AWS operations
 """
 
+import json
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 
 from quilt_mcp.ops.quilt_ops import QuiltOps
 from quilt_mcp.utils.helpers import extract_bucket_from_registry
@@ -22,6 +23,7 @@ from quilt_mcp.domain.package_info import Package_Info
 from quilt_mcp.domain.content_info import Content_Info
 from quilt_mcp.domain.bucket_info import Bucket_Info
 from quilt_mcp.domain.package_builder import PackageBuilder, PackageEntry
+from quilt_mcp.services.manifest_cache import entries_size, is_top_hash
 from quilt_mcp.backends.quilt3_backend_base import Quilt3_Backend_Base, quilt3, requests, boto3
 from quilt_mcp.backends.quilt3_backend_packages import Quilt3_Backend_Packages
 from quilt_mcp.backends.quilt3_backend_content import Quilt3_Backend_Content
@@ -32,6 +34,10 @@ from quilt_mcp.ops.tabulator_mixin import TabulatorMixin
 
 logger = logging.getLogger(__name__)
 
+# Full SHA-256 top hashes name manifests under .quilt/packages/.
+MANIFEST_HASH_LENGTH = 64
+MANIFEST_CHUNK_SIZE = 64 * 1024
+
 
 class Quilt3_Backend(
     Quilt3_Backend_Session,
@@ -201,6 +207,41 @@ class Quilt3_Backend(
         else:
             return self.quilt3.Package.browse(package_name, registry=registry)
 
+    def _backend_resolve_top_hash(
+        self, package_name: str, registry: str, top_hash: Optional[str] = None
+    ) -> Optional[str]:
+        """Resolve latest or a hash prefix without downloading the manifest (backend primitive).
+
+        Reads the small ``latest`` pointer object (or resolves a prefix against
+        the registry's revision list); full hashes are returned as-is.
+
+        Args:
+            package_name: Full package name
+            registry: Registry S3 URL
+            top_hash: Optional hash or hash prefix (resolves latest if None)
+
+        Returns:
+            Full top hash
+        """
+        if is_top_hash(top_hash):
+            return top_hash
+        package_registry = self.quilt3.backends.get_package_registry(registry)
+        if top_hash:
+            return str(package_registry.resolve_top_hash(package_name, top_hash))
+        pointer = self.quilt3.data_transfer.get_bytes(package_registry.pointer_latest_pk(package_name))
+        return str(pointer.decode("utf-8").strip())
+
+    def _backend_package_size(self, package: Any) -> int:
+        """Estimate the memory held by a parsed quilt3 manifest (backend primitive).
+
+        Args:
+            package: quilt3.Package object
+
+        Returns:
+            Approximate size in bytes
+        """
+        return entries_size((logical_key for logical_key, _ in package.walk()), package.meta)
+
     def _backend_get_package_entries(self, package: Any) -> Dict[str, PackageEntry]:
         """Get all entries from quilt3 package (backend primitive).
 
@@ -223,6 +264,60 @@ class Quilt3_Backend(
             )
         return entries
 
+    def _backend_iter_package_entries(
+        self, package_name: str, registry: str, top_hash: Optional[str] = None, prefix: Optional[str] = None
+    ) -> Iterator[PackageEntry]:
+        """Stream entries from the registry's JSONL manifest (backend primitive).
+
+        Reads ``.quilt/packages/<top_hash>`` line by line from S3 instead of
+        loading the whole tree with ``Package.browse()``. Short (abbreviated)
+        hashes fall back to the default implementation, which resolves them.
+
+        Args:
+            package_name: Full package name
+            registry: Registry S3 URL
+            top_hash: Optional full version hash (streams latest if None)
+            prefix: Optional logical-key prefix
+
+        Yields:
+            PackageEntry for each file under ``prefix``, in manifest order
+        """
+        if top_hash and len(top_hash) < MANIFEST_HASH_LENGTH:
+            yield from super()._backend_iter_package_entries(package_name, registry, top_hash, prefix)
+            return
+
+        bucket = extract_bucket_from_registry(registry)
+        s3 = self.get_aws_client("s3")
+        try:
+            if not top_hash:
+                pointer = s3.get_object(Bucket=bucket, Key=f".quilt/named_packages/{package_name}/latest")
+                top_hash = pointer["Body"].read().decode("utf-8").strip()
+            manifest = s3.get_object(Bucket=bucket, Key=f".quilt/packages/{top_hash}")
+        except s3.exceptions.NoSuchKey as e:
+            raise NotFoundError(f"Package not found: {package_name}") from e
+
+        body = manifest["Body"]
+        try:
+            for line in body.iter_lines(chunk_size=MANIFEST_CHUNK_SIZE):
+                if not line:
+                    continue
+                record = json.loads(line)
+                logical_key = record.get("logical_key")
+                if logical_key is None or (prefix and not logical_key.startswith(prefix)):
+                    # The first line carries package-level metadata, not an entry.
+                    continue
+                physical_keys = record.get("physical_keys") or []
+                entry_hash = record.get("hash")
+                yield PackageEntry(
+                    logicalKey=logical_key,
+                    physicalKey=str(physical_keys[0]) if physical_keys else "",
+                    size=self._normalize_size(record.get("size")),
+                    hash=entry_hash.get("value") if isinstance(entry_hash, dict) else entry_hash,
+                    meta=(record.get("meta") or {}).get("user_meta"),
+                )
+        finally:
+            body.close()
+
     def _backend_get_package_metadata(self, package: Any) -> Dict[str, Any]:
         """Get metadata from quilt3 package (backend primitive).
 
@@ -234,6 +329,35 @@ class Quilt3_Backend(
         """
         return package.meta or {}
 
+    def _backend_list_package_dir(
+        self, package_name: str, registry: str, path: str, top_hash: Optional[str] = None
+    ) -> Tuple[List[Content_Info], Optional[Dict[str, Any]], Optional[str]]:
+        """List a quilt3 package path with metadata from one manifest load (backend primitive).
+
+        Args:
+            package_name: Full package name
+            registry: Registry S3 URL
+            path: Path within the package ("" for the root)
+            top_hash: Optional specific version hash
+
+        Returns:
+            Tuple of (entries, package metadata, revision hash)
+
+        Raises:
+            NotFoundError: If the path doesn't exist in the package
+        """
+        package = self._load_package(package_name, registry, top_hash)
+        try:
+            node = package[path] if path else package
+        except KeyError as e:
+            raise NotFoundError(f"Path not found in package: {path}") from e
+        if hasattr(node, "walk"):
+            entries = [self._transform_content(key, entry) for key, entry in node.walk()]
+        else:
+            # ``path`` names a single file: list just that entry, as the platform backend does.
+            entries = [self._transform_content(path, node)]
+        return entries, package.meta or None, top_hash or package.top_hash
+
     def _backend_search_packages(self, query: str, registry: str) -> List[Dict[str, Any]]:
         """Execute Elasticsearch package search via quilt3 (backend primitive).
 
@@ -352,6 +476,7 @@ class Quilt3_Backend(
                     "path": key,
                     "size": entry.size if hasattr(entry, 'size') else None,
                     "type": "file",  # walk() only yields files, directories are not yielded
+                    "physical_key": str(entry.physical_key) if getattr(entry, "physical_key", None) else None,
                 }
             )
 
@@ -371,11 +496,7 @@ class Quilt3_Backend(
         Returns:
             Presigned URL for file download
         """
-        # Browse package
-        if top_hash:
-            package = self.quilt3.Package.browse(package_name, registry=registry, top_hash=top_hash)
-        else:
-            package = self.quilt3.Package.browse(package_name, registry=registry)
+        package = self._load_package(package_name, registry, top_hash)
 
         # Get presigned URL
         return str(package.get_url(path))
@@ -492,6 +613,7 @@ class Quilt3_Backend(
             modified_date=None,  # quilt3 doesn't provide this in walk()
             download_url=None,  # Not available in browse results
             meta=entry.get("meta"),  # Entry-level metadata
+            physical_key=entry.get("physical_key"),
         )
 
     def _escape_elasticsearch_query(self, query: str) -> str:
@@ -28,6 +28,7 @@ class Quilt3_Backend_Content:
 
         def _normalize_size(self, size: Any) -> Optional[int]: ...
         def _normalize_datetime(self, dt: Any) -> Optional[str]: ...
+        def _load_package(self, package_name: str, registry: str, top_hash: Optional[str] = None) -> Any: ...
 
     def browse_content(self, package_name: str, registry: str, path: str = "") -> List[Content_Info]:
         """Browse contents of a package at the specified path.
@@ -45,7 +46,7 @@ class Quilt3_Backend_Content:
         """
         try:
             logger.debug(f"Browsing content for: {package_name} at path: {path}")
-            package = self.quilt3.Package.browse(package_name, registry=registry)
+            package = self._load_package(package_name, registry)
 
             # Browse the specific path if provided
             if path:
@@ -76,7 +77,7 @@ class Quilt3_Backend_Content:
         """
         try:
             logger.debug(f"Getting content URL for: {package_name}/{path}")
-            package = self.quilt3.Package.browse(package_name, registry=registry)
+            package = self._load_package(package_name, registry)
             url = package.get_url(path)
             logger.debug(f"Generated URL for: {package_name}/{path}")
             return str(url)
@@ -112,6 +113,7 @@ class Quilt3_Backend_Content:
             size = self._normalize_size(getattr(quilt3_entry, 'size', None))
             modified_date = self._normalize_datetime(getattr(quilt3_entry, 'modified', None))
             meta = getattr(quilt3_entry, 'meta', None)
+            physical_key = getattr(quilt3_entry, 'physical_key', None)
 
             content_info = Content_Info(
                 path=key,
@@ -120,6 +122,7 @@ class Quilt3_Backend_Content:
                 modified_date=modified_date,
                 download_url=None,  # URL not provided in transformation, use get_content_url
                 meta=meta,  # Entry-level metadata
+                physical_key=str(physical_key) if physical_key is not None else None,
             )
 
             logger.debug(f"Successfully transformed content: {content_info.path} ({content_info.type})")
@@ -40,6 +40,7 @@ class Quilt3_Backend_Packages:
         def _normalize_description(self, description: Any) -> str: ...
         def _normalize_datetime(self, dt: Any) -> Optional[str]: ...
         def _backend_get_package(self, package_name: str, registry: str, top_hash: Optional[str] = None) -> Any: ...
+        def _load_package(self, package_name: str, registry: str, top_hash: Optional[str] = None) -> Any: ...
         def _backend_diff_packages(self, pkg1: Any, pkg2: Any) -> dict[str, list[str]]: ...
 
     # =========================================================================
@@ -78,7 +79,7 @@ class Quilt3_Backend_Packages:
         """
         try:
             logger.debug(f"Getting package info for: {package_name} in registry: {registry}")
-            package = self.quilt3.Package.browse(package_name, registry=registry)
+            package = self._load_package(package_name, registry)
             result = self._transform_package(package)
             logger.debug(f"Retrieved package info for: {package_name}")
             return result
@@ -223,9 +224,9 @@ class Quilt3_Backend_Packages:
         try:
             logger.debug(f"Diffing packages: {package1_name} vs {package2_name} in registry: {registry}")
 
-            # Get packages (uses primitive)
-            pkg1 = self._backend_get_package(package1_name, registry, package1_hash)
-            pkg2 = self._backend_get_package(package2_name, registry, package2_hash)
+            # Get packages (uses primitive, via manifest cache)
+            pkg1 = self._load_package(package1_name, registry, package1_hash)
+            pkg2 = self._load_package(package2_name, registry, package2_hash)
 
             # Diff packages (uses primitive)
             diff_dict = self._backend_diff_packages(pkg1, pkg2)
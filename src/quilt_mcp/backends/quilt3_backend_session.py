@@ -14,6 +14,8 @@ from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from quilt_mcp.ops.exceptions import AuthenticationError, BackendError, ValidationError, NotFoundError
 from quilt_mcp.domain.auth_status import Auth_Status
 from quilt_mcp.domain.catalog_config import Catalog_Config
+from quilt_mcp.services.aws_client_registry import get_pooled_client
+from quilt_mcp.services.catalog_config_cache import get_catalog_config_cache
 from quilt_mcp.utils.common import _runtime_boto3_session
 
 if TYPE_CHECKING:
@@ -122,10 +124,7 @@ class Quilt3_Backend_Session:
             config_url = f"{normalized_url}/config.json"
 
             logger.debug(f"Fetching config from: {config_url}")
-            response = session.get(config_url, timeout=10)
-            response.raise_for_status()
-
-            full_config = response.json()
+            full_config = get_catalog_config_cache().fetch(config_url, session=session)
             logger.debug("Successfully fetched catalog configuration")
 
             # Transform to Catalog_Config domain object
@@ -389,7 +388,7 @@ class Quilt3_Backend_Session:
             runtime_session = _runtime_boto3_session()
             if runtime_session is not None:
                 logger.debug(f"Using runtime context session for {service_name}")
-                return runtime_session.client(service_name, region_name=region)
+                return get_pooled_client(runtime_session, service_name, region)
 
             # Priority 2: quilt3 authenticated session
             quilt3_session_error = None
@@ -397,7 +396,7 @@ class Quilt3_Backend_Session:
                 botocore_session = self.quilt3.session.create_botocore_session()
                 boto3_session = self.boto3.Session(botocore_session=botocore_session)
                 logger.debug(f"Using quilt3 session credentials for {service_name}")
-                return boto3_session.client(service_name, region_name=region)
+                return get_pooled_client(boto3_session, service_name, region)
             except Exception as e:
                 quilt3_session_error = e
                 # Check if quilt3 is configured (has config file)
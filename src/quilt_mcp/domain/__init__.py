@@ -10,6 +10,7 @@ from .bucket_info import Bucket_Info
 from .auth_status import Auth_Status
 from .catalog_config import Catalog_Config
 from .package_creation import Package_Creation_Result
+from .package_listing import Package_Listing
 from .user import User
 from .role import Role
 from .sso_config import SSOConfig
@@ -21,6 +22,7 @@ __all__ = [
     "Auth_Status",
     "Catalog_Config",
     "Package_Creation_Result",
+    "Package_Listing",
     "User",
     "Role",
     "SSOConfig",
@@ -22,6 +22,7 @@ class Content_Info:
         modified_date: ISO 8601 formatted modification date (optional)
         download_url: URL for downloading the content (optional)
         meta: Entry-level metadata dictionary (optional)
+        physical_key: Physical storage location, e.g. ``s3://bucket/key?versionId=...`` (optional)
     """
 
     path: str
@@ -30,6 +31,7 @@ class Content_Info:
     modified_date: Optional[str]
     download_url: Optional[str]
     meta: Optional[Dict[str, Any]] = None
+    physical_key: Optional[str] = None
 
     def __post_init__(self) -> None:
         """Validate required fields after initialization."""
@@ -0,0 +1,65 @@
+"""Package_Listing domain object for paginated package browsing.
+
+This module defines the Package_Listing dataclass returned by
+``QuiltOps.browse_package``: one page of a package directory listing together
+with the revision's user metadata, fetched in a single backend round trip.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .content_info import Content_Info
+
+
+@dataclass(frozen=True)
+class Package_Listing:
+    """One page of entries under a path in a specific package revision.
+
+    Attributes:
+        package_name: Full package name in "user/package" format
+        registry: Registry URL where the package is stored
+        path: Path within the package that was listed ("" for the root)
+        top_hash: Hash of the revision that was listed (None if unknown)
+        entries: Entries on this page
+        metadata: Package-level user metadata (None if the revision has none)
+        total_entries: Number of entries under ``path`` across all pages
+        next_cursor: Opaque cursor for the next page (None on the last page)
+    """
+
+    package_name: str
+    registry: str
+    path: str
+    top_hash: Optional[str]
+    entries: List[Content_Info] = field(default_factory=list)
+    metadata: Optional[Dict[str, Any]] = None
+    total_entries: int = 0
+    next_cursor: Optional[str] = None
+
+    def __hash__(self) -> int:
+        """Custom hash implementation for hashable dataclass."""
+        return hash((self.package_name, self.registry, self.path, self.top_hash, self.next_cursor))
+
+
+def encode_listing_cursor(offset: int, top_hash: Optional[str]) -> str:
+    """Encode a page offset and the revision it belongs to as an opaque cursor."""
+    payload = json.dumps({"o": offset, "h": top_hash}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_listing_cursor(cursor: str) -> Tuple[int, Optional[str]]:
+    """Decode a cursor produced by :func:`encode_listing_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        offset, top_hash = payload["o"], payload.get("h")
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(offset, int) or offset < 0 or not (top_hash is None or isinstance(top_hash, str)):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return offset, top_hash
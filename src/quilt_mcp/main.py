@@ -107,6 +107,13 @@ def main() -> None:
                 "Can also be set via QUILT_DEPLOYMENT."
             ),
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help=(
+                "Number of HTTP worker processes (multiuser HTTP transport only). Can also be set via FASTMCP_WORKERS."
+            ),
+        )
         args = parser.parse_args()
 
         # Load .env for development (project root only, not user's home directory)
@@ -150,6 +157,8 @@ def main() -> None:
         # Docker deployments override to http via FASTMCP_TRANSPORT env var
         # setdefault() respects explicit environment variable if already set
         os.environ.setdefault("FASTMCP_TRANSPORT", mode_config.default_transport)
+        if args.workers is not None:
+            os.environ["FASTMCP_WORKERS"] = str(args.workers)
 
         # Determine skip_banner setting with precedence: CLI flag > env var > default
         skip_banner = args.skip_banner
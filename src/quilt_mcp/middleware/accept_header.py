@@ -0,0 +1,32 @@
+"""Accept header normalization for MCP HTTP transports."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+JSON = "application/json"
+EVENT_STREAM = "text/event-stream"
+
+
+def normalize_accept_header(path: str, accept: str) -> Optional[str]:
+    """Return the Accept header value to use for ``path``, or None to leave it unchanged.
+
+    The streamable HTTP transport rejects requests that do not accept both JSON
+    and SSE, but many HTTP clients send only one of them (or nothing). MCP
+    protocol endpoints get both; other endpoints that accept JSON also get SSE.
+    """
+    needs_json = JSON not in accept
+    needs_sse = EVENT_STREAM not in accept
+
+    if path.startswith("/mcp"):
+        if needs_json and needs_sse:
+            # No Accept header or missing both - add both
+            return f"{JSON}, {EVENT_STREAM}"
+        if needs_json:
+            return f"{JSON}, {accept}"
+        if needs_sse:
+            return f"{accept}, {EVENT_STREAM}"
+        return None
+    if not needs_json and needs_sse:
+        return f"{accept}, {EVENT_STREAM}"
+    return None
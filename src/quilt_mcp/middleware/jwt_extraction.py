@@ -4,11 +4,10 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Optional, cast
+from typing import Dict, Optional
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from quilt_mcp.context.runtime_context import (
     RuntimeAuthState,
@@ -16,37 +15,59 @@ from quilt_mcp.context.runtime_context import (
     push_runtime_context,
     reset_runtime_context,
 )
+from quilt_mcp.middleware.accept_header import normalize_accept_header
 
 logger = logging.getLogger(__name__)
 FALLBACK_JWT_ENV_VAR = "QUILT_FALLBACK_JWT"
 
+_WANTED_HEADERS = {b"authorization", b"accept", b"mcp-session-id", b"x-request-id"}
 
-class JwtExtractionMiddleware(BaseHTTPMiddleware):
+
+class JwtExtractionMiddleware:
     """
     Extract JWT bearer tokens from Authorization header.
 
     This middleware performs NO validation - it only extracts the token
     and puts it in the runtime context. All validation happens at the
     GraphQL backend layer.
+
+    It is plain ASGI (not ``BaseHTTPMiddleware``): it reads the request headers
+    once, never wraps the response, and so adds no extra task or stream per
+    request and passes streaming/SSE responses through untouched. With
+    ``normalize_accept`` it also applies ``normalize_accept_header`` in the
+    same pass, replacing a separate middleware layer.
     """
 
     # Health check endpoints that don't require JWT
     HEALTH_PATHS = {"/", "/health", "/healthz"}
 
-    def __init__(self, app, *, require_jwt: bool = True) -> None:
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, *, require_jwt: bool = True, normalize_accept: bool = False) -> None:
+        self.app = app
         self.require_jwt = require_jwt
-
-    async def dispatch(self, request: Request, call_next) -> Response:
-        # Skip JWT for health check endpoints
-        if request.url.path in self.HEALTH_PATHS:
-            return cast(Response, await call_next(request))
+        self.normalize_accept = normalize_accept
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        # Skip health check endpoints and non-HTTP traffic (lifespan)
+        if scope["type"] != "http" or path in self.HEALTH_PATHS:
+            await self.app(scope, receive, send)
+            return
+        if not self.require_jwt and not self.normalize_accept:
+            await self.app(scope, receive, send)
+            return
+
+        headers = _read_headers(scope)
+        if self.normalize_accept:
+            accept = normalize_accept_header(path, headers.get(b"accept", ""))
+            if accept is not None:
+                scope = _with_header(scope, b"accept", accept)
 
         if not self.require_jwt:
-            return cast(Response, await call_next(request))
+            await self.app(scope, receive, send)
+            return
 
-        request_id = _get_request_id(request)
-        auth_header = request.headers.get("authorization")
+        request_id = _get_request_id(headers)
+        auth_header = headers.get(b"authorization")
 
         if not auth_header:
             fallback_token = os.getenv(FALLBACK_JWT_ENV_VAR, "").strip()
@@ -55,43 +76,62 @@ class JwtExtractionMiddleware(BaseHTTPMiddleware):
                     "Using %s fallback token for unauthenticated request (request_id=%s, path=%s)",
                     FALLBACK_JWT_ENV_VAR,
                     request_id,
-                    request.url.path,
+                    path,
                 )
-                return await self._run_with_token(request, call_next, token=fallback_token)
+                await self._run_with_token(scope, receive, send, token=fallback_token)
+                return
 
             logger.warning("JWT required but missing Authorization header (request_id=%s)", request_id)
-            return _error_response(
-                401,
-                "JWT authentication required. Provide Authorization: Bearer header.",
+            await _error_response(401, "JWT authentication required. Provide Authorization: Bearer header.")(
+                scope, receive, send
             )
+            return
 
         if not auth_header.lower().startswith("bearer "):
             logger.warning("Invalid Authorization header format (request_id=%s)", request_id)
-            return _error_response(401, "Invalid Authorization header. Expected Bearer token.")
+            await _error_response(401, "Invalid Authorization header. Expected Bearer token.")(scope, receive, send)
+            return
 
         token = auth_header[7:].strip()
         if not token:
             logger.warning("Empty Bearer token provided (request_id=%s)", request_id)
-            return _error_response(401, "JWT authentication required. Provide Authorization: Bearer header.")
+            await _error_response(401, "JWT authentication required. Provide Authorization: Bearer header.")(
+                scope, receive, send
+            )
+            return
 
-        return await self._run_with_token(request, call_next, token=token)
+        await self._run_with_token(scope, receive, send, token=token)
 
-    async def _run_with_token(self, request: Request, call_next, *, token: str) -> Response:
+    async def _run_with_token(self, scope: Scope, receive: Receive, send: Send, *, token: str) -> None:
         # Extract token WITHOUT validation - GraphQL will validate
         # Claims are empty because we don't validate locally
         auth_state = RuntimeAuthState(scheme="Bearer", access_token=token, claims={})
         token_handle = push_runtime_context(environment=get_runtime_environment(), auth=auth_state)
         try:
-            response: Response = await call_next(request)
+            await self.app(scope, receive, send)
         finally:
             reset_runtime_context(token_handle)
 
-        return response
 
+def _read_headers(scope: Scope) -> Dict[bytes, str]:
+    """Return the first value of each header this middleware uses, in one pass over the scope."""
+    found: Dict[bytes, str] = {}
+    for name, value in scope.get("headers", ()):
+        if name in _WANTED_HEADERS and name not in found:
+            found[name] = value.decode("latin-1")
+    return found
 
-def _get_request_id(request: Request) -> Optional[str]:
-    return request.headers.get("mcp-session-id") or request.headers.get("x-request-id")
+
+def _with_header(scope: Scope, name: bytes, value: str) -> Scope:
+    """Return a copy of ``scope`` with every ``name`` header replaced by ``value``."""
+    headers = [(key, raw) for key, raw in scope.get("headers", ()) if key != name]
+    headers.append((name, value.encode("latin-1")))
+    return {**scope, "headers": headers}
 
 
 def _error_response(status_code: int, message: str) -> JSONResponse:
     return JSONResponse(status_code=status_code, content={"error": message})
+
+
+def _get_request_id(headers: Dict[bytes, str]) -> Optional[str]:
+    return headers.get(b"mcp-session-id") or headers.get(b"x-request-id")
@@ -0,0 +1,187 @@
+"""Process-wide pool of QuiltOps backend instances.
+
+``QuiltOpsFactory.create()`` runs on nearly every tool call. Building a
+``Platform_Backend`` allocates a ``requests.Session`` (and its TCP/TLS
+connection pool), a GraphQL client and a browsing-session client, all of
+which are discarded when the call returns. The pool keeps one backend per
+identity (backend type plus the JWT and endpoints it authenticates with) and
+hands the same instance to every caller presenting that identity.
+
+Thread-safety contract: a pooled backend is shared by concurrent tool calls,
+so backends must be fully configured in ``__init__`` and must not be mutated
+per request afterwards. Per-instance caches must be guarded by locks (as the
+browsing-session cache is), and lazily created helpers must be safe to build
+twice. Evicted backends are not closed explicitly; a caller that still holds
+one can finish its request and the instance is garbage-collected afterwards.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from quilt_mcp.ops.quilt_ops import QuiltOps
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_IDLE_TTL_SECONDS = 1800
+# Stop handing out backends shortly before their token expires.
+EXPIRY_SKEW_SECONDS = 60
+
+BackendKey = Tuple[str, str]
+
+
+@dataclass
+class _Entry:
+    backend: QuiltOps
+    expires_at: Optional[float]
+    last_used: float
+
+
+class BackendPool:
+    """Thread-safe LRU pool of backends with idle and token-expiry eviction.
+
+    Args:
+        max_entries: Maximum number of pooled backends
+        idle_ttl_seconds: Time after last use at which a backend is dropped
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        idle_ttl_seconds: float = DEFAULT_IDLE_TTL_SECONDS,
+    ) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._idle_ttl = float(idle_ttl_seconds)
+        self._entries: OrderedDict[BackendKey, _Entry] = OrderedDict()
+        self._inflight: Dict[BackendKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(
+        self,
+        key: BackendKey,
+        factory: Callable[[], QuiltOps],
+        *,
+        expires_at: float | Callable[[], Optional[float]] | None = None,
+    ) -> QuiltOps:
+        """Return the pooled backend for ``key``, building it with ``factory`` on a miss.
+
+        Args:
+            key: (backend type, identity hash) tuple
+            factory: Callable constructing a new backend
+            expires_at: POSIX timestamp after which the identity's token is invalid, or a
+                callable returning it that is only invoked when a backend is built
+
+        Returns:
+            Backend instance shared with other callers using the same key
+        """
+        with self._lock:
+            backend = self._lookup(key, time.time())
+            if backend is not None:
+                self._hits += 1
+                return backend
+            flight = self._inflight.setdefault(key, threading.Lock())
+
+        with flight:
+            with self._lock:
+                backend = self._lookup(key, time.time())
+                if backend is not None:
+                    self._hits += 1
+                    return backend
+                self._misses += 1
+
+            try:
+                backend = factory()
+            finally:
+                with self._lock:
+                    if self._inflight.get(key) is flight:
+                        del self._inflight[key]
+
+            if callable(expires_at):
+                expires_at = expires_at()
+            now = time.time()
+            entry = _Entry(backend=backend, expires_at=expires_at, last_used=now)
+            if self._is_stale(entry, now):
+                return backend
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                self._evict_locked(now)
+            return backend
+
+    def clear(self) -> None:
+        """Drop every pooled backend and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+            }
+
+    def _lookup(self, key: BackendKey, now: float) -> Optional[QuiltOps]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._is_stale(entry, now):
+            del self._entries[key]
+            self._evictions += 1
+            return None
+        entry.last_used = now
+        self._entries.move_to_end(key)
+        return entry.backend
+
+    def _is_stale(self, entry: _Entry, now: float) -> bool:
+        if entry.expires_at is not None and entry.expires_at - EXPIRY_SKEW_SECONDS <= now:
+            return True
+        return now - entry.last_used > self._idle_ttl
+
+    def _evict_locked(self, now: float) -> None:
+        for key in [k for k, entry in self._entries.items() if self._is_stale(entry, now)]:
+            del self._entries[key]
+            self._evictions += 1
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+_pool: Optional[BackendPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_backend_pool() -> BackendPool:
+    """Return the process-wide backend pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = BackendPool(
+                    max_entries=int(os.getenv("QUILT_BACKEND_POOL_SIZE", str(DEFAULT_MAX_ENTRIES))),
+                    idle_ttl_seconds=float(os.getenv("QUILT_BACKEND_POOL_IDLE_TTL", str(DEFAULT_IDLE_TTL_SECONDS))),
+                )
+    return _pool
+
+
+def reset_backend_pool() -> None:
+    """Discard the process-wide pool (primarily for tests)."""
+    global _pool
+    with _pool_lock:
+        _pool = None
@@ -6,7 +6,9 @@ based on ModeConfig. The factory uses centralized mode configuration to determin
 to create, eliminating scattered credential detection logic.
 """
 
+import hashlib
 import logging
+import os
 from typing import Optional
 
 try:
@@ -14,6 +16,8 @@ try:
 except ImportError:
     quilt3 = None
 
+from quilt_mcp.auth.jwt_discovery import JWTDiscovery
+from quilt_mcp.ops.backend_pool import get_backend_pool
 from quilt_mcp.ops.quilt_ops import QuiltOps
 from quilt_mcp.ops.exceptions import AuthenticationError
 from quilt_mcp.backends.quilt3_backend import Quilt3_Backend
@@ -35,12 +39,17 @@ class QuiltOpsFactory:
     """
 
     @staticmethod
-    def create() -> QuiltOps:
+    def create(*, pooled: bool = True) -> QuiltOps:
         """Create QuiltOps instance based on mode configuration.
 
-        Uses ModeConfig to determine the appropriate backend type and creates
-        the corresponding backend instance. This eliminates the need for
-        scattered credential detection logic.
+        Uses ModeConfig to determine the appropriate backend type. Backends are
+        pooled process-wide per identity (see ``quilt_mcp.ops.backend_pool``),
+        so repeated calls with the same JWT and endpoints return the same warm
+        instance.
+
+        Args:
+            pooled: Return a shared backend from the pool (default). Pass False
+                to always build a new, unshared instance.
 
         Returns:
             QuiltOps instance with appropriate backend
@@ -53,14 +62,61 @@ class QuiltOpsFactory:
 
         if mode_config.backend_type == "quilt3":
             # Local development mode - use quilt3 library
-            logger.info("Creating Quilt3_Backend for local development mode")
-            return Quilt3_Backend()
+            if not pooled:
+                return QuiltOpsFactory._create_quilt3_backend()
+            return get_backend_pool().get(("quilt3", "local"), QuiltOpsFactory._create_quilt3_backend)
 
         elif mode_config.backend_type == "graphql":
             # Multiuser production mode - use Platform GraphQL backend
-            logger.info("Creating Platform_Backend for multiuser mode")
-            return Platform_Backend()
+            token = JWTDiscovery.discover() if pooled else None
+            if not token:
+                # Let the backend raise its own error for missing credentials.
+                return QuiltOpsFactory._create_platform_backend()
+            return get_backend_pool().get(
+                ("graphql", _platform_identity(token)),
+                QuiltOpsFactory._create_platform_backend,
+                expires_at=lambda: _token_expiry(token),
+            )
 
         else:
             # This should never happen with proper ModeConfig implementation
             raise AuthenticationError(f"Unknown backend type: {mode_config.backend_type}")
+
+    @staticmethod
+    def _create_quilt3_backend() -> QuiltOps:
+        logger.info("Creating Quilt3_Backend for local development mode")
+        return Quilt3_Backend()
+
+    @staticmethod
+    def _create_platform_backend() -> QuiltOps:
+        logger.info("Creating Platform_Backend for multiuser mode")
+        return Platform_Backend()
+
+
+def _platform_identity(token: str) -> str:
+    """Hash the JWT and the endpoint settings a Platform_Backend is built from."""
+    material = "\0".join(
+        [
+            token,
+            os.getenv("QUILT_CATALOG_URL", ""),
+            os.getenv("QUILT_REGISTRY_URL", ""),
+            os.getenv("QUILT_GRAPHQL_ENDPOINT", ""),
+            os.getenv("QUILT_BROWSING_SESSION_TTL", ""),
+        ]
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _token_expiry(token: str) -> Optional[float]:
+    """Return the JWT's ``exp`` claim without verifying the signature, if present.
+
+    Not memoized, since a cache would keep raw tokens alive as keys; the backend
+    pool only calls this when it builds a new backend.
+    """
+    try:
+        import jwt as pyjwt
+
+        exp = pyjwt.decode(token, options={"verify_signature": False}).get("exp")
+        return float(exp) if exp is not None else None
+    except Exception:
+        return None
@@ -5,13 +5,25 @@ for Quilt operations. Implementations can use either quilt3 library or Platform
 while maintaining consistent domain-driven operations for MCP tools.
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
-from ..domain import Package_Info, Content_Info, Bucket_Info, Auth_Status, Catalog_Config, Package_Creation_Result
+from ..domain import (
+    Package_Info,
+    Content_Info,
+    Bucket_Info,
+    Auth_Status,
+    Catalog_Config,
+    Package_Creation_Result,
+    Package_Listing,
+)
+from ..domain.package_listing import decode_listing_cursor, encode_listing_cursor
 from ..domain.package_builder import PackageBuilder, PackageEntry
+from ..services.catalog_config_cache import get_catalog_config_cache
+from ..services.manifest_cache import entries_size, get_manifest_cache, is_top_hash, manifest_key
 from ..utils.helpers import extract_bucket_from_registry
 from .admin_ops import AdminOps
 
@@ -283,6 +295,75 @@ class QuiltOps(ABC):
 
         return True
 
+    def _resolve_manifest_hash(self, package_name: str, registry: str, top_hash: Optional[str]) -> Optional[str]:
+        """Resolve a revision to the full top hash used as manifest cache key.
+
+        Returns None when the cache is disabled or the backend cannot resolve the
+        revision cheaply; callers then load the package directly, which surfaces
+        any real error.
+        """
+        from .exceptions import NotFoundError
+
+        if not get_manifest_cache().enabled:
+            return None
+        try:
+            resolved = self._backend_resolve_top_hash(package_name, registry, top_hash)
+        except NotFoundError:
+            raise
+        except Exception as e:
+            logger.debug(f"Could not resolve top hash for {package_name}: {e}")
+            return None
+        return resolved if is_top_hash(resolved) else None
+
+    def _load_package(self, package_name: str, registry: str, top_hash: Optional[str] = None) -> Any:
+        """Load a package revision, reusing a cached manifest when possible.
+
+        Revisions are immutable, so a package loaded once for a resolved top hash
+        is served from the process-wide manifest cache afterwards. Only the
+        cheap ``latest`` -> hash resolution step touches the registry again.
+
+        Args:
+            package_name: Full package name in "user/package" format
+            registry: Registry S3 URL
+            top_hash: Optional specific version hash (loads latest if None)
+
+        Returns:
+            Backend-specific package object (shared; must not be mutated)
+        """
+        return self._load_packages([(package_name, top_hash)], registry)[0]
+
+    def _load_packages(self, packages: List[Tuple[str, Optional[str]]], registry: str) -> List[Any]:
+        """Load several package revisions, fetching cache misses in one backend call.
+
+        Args:
+            packages: (package_name, top_hash) pairs; top_hash None means latest
+            registry: Registry S3 URL
+
+        Returns:
+            Backend-specific package objects in the order requested
+        """
+        cache = get_manifest_cache()
+        loaded: List[Any] = [None] * len(packages)
+        misses: List[Tuple[int, str, Optional[str], Optional[Tuple[str, str, str]]]] = []
+        for index, (package_name, top_hash) in enumerate(packages):
+            resolved = self._resolve_manifest_hash(package_name, registry, top_hash)
+            if resolved is None:
+                misses.append((index, package_name, top_hash, None))
+                continue
+            # Backend package objects record their name, so they are cached per package.
+            key = manifest_key(registry, resolved, f"package:{package_name}")
+            loaded[index] = cache.get(key)
+            if loaded[index] is None:
+                misses.append((index, package_name, resolved, key))
+
+        if misses:
+            fetched = self._backend_get_packages([(name, top_hash) for _, name, top_hash, _ in misses], registry)
+            for (index, _, _, cache_key), package in zip(misses, fetched, strict=True):
+                if cache_key is not None:
+                    cache.put(cache_key, package, self._backend_package_size(package))
+                loaded[index] = package
+        return loaded
+
     # =========================================================================
     # Backend Primitives (Abstract - Template Method Pattern)
     # =========================================================================
@@ -390,6 +471,61 @@ class QuiltOps(ABC):
         """
         pass
 
+    def _backend_get_packages(self, packages: List[Tuple[str, Optional[str]]], registry: str) -> List[Any]:
+        """Retrieve several packages from the registry (concrete method).
+
+        The default fetches them one by one with _backend_get_package().
+        Backends that can combine lookups into one round trip override this.
+
+        Args:
+            packages: (package_name, top_hash) pairs; top_hash None means latest
+            registry: Registry S3 URL
+
+        Returns:
+            Backend-specific package objects in the order requested
+
+        Raises:
+            NotFoundError: If any package doesn't exist
+            BackendError: If retrieval fails
+        """
+        return [self._backend_get_package(package_name, registry, top_hash) for package_name, top_hash in packages]
+
+    def _backend_resolve_top_hash(
+        self, package_name: str, registry: str, top_hash: Optional[str] = None
+    ) -> Optional[str]:
+        """Resolve a revision reference to its full top hash (concrete method).
+
+        Used to look up immutable manifests in the process-wide manifest cache.
+        Backends whose package loads are expensive override this with a lookup
+        that is much cheaper than loading the package (e.g. reading the small
+        ``latest`` pointer). The default returns None, which bypasses the cache.
+
+        Args:
+            package_name: Full package name in "user/package" format
+            registry: Registry S3 URL
+            top_hash: Optional hash or hash prefix (resolves latest if None)
+
+        Returns:
+            Full 64-character top hash, or None if it cannot be resolved cheaply
+
+        Raises:
+            NotFoundError: If the package doesn't exist
+        """
+        return None
+
+    def _backend_package_size(self, package: Any) -> int:
+        """Estimate the memory held by a loaded package object (concrete method).
+
+        Used to charge cached packages against the manifest cache's byte budget.
+
+        Args:
+            package: Backend-specific package object
+
+        Returns:
+            Approximate size in bytes
+        """
+        return len(repr(package))
+
     @abstractmethod
     def _backend_get_package_entries(self, package: Any) -> Dict[str, PackageEntry]:
         """Get all entries (files) from a package (backend primitive).
@@ -409,6 +545,33 @@ class QuiltOps(ABC):
         """
         pass
 
+    def _backend_iter_package_entries(
+        self, package_name: str, registry: str, top_hash: Optional[str] = None, prefix: Optional[str] = None
+    ) -> Iterator[PackageEntry]:
+        """Stream the entries (files) of a package revision (concrete method).
+
+        Default implementation loading the package via _load_package() and
+        _backend_get_package_entries(). Backends should override this to page
+        through the manifest so memory use does not grow with package size.
+
+        Args:
+            package_name: Full package name in "user/package" format
+            registry: Registry S3 URL
+            top_hash: Optional specific version hash (streams latest if None)
+            prefix: Optional logical-key prefix; only matching entries are yielded
+
+        Yields:
+            PackageEntry for each file, with normalized types
+
+        Raises:
+            NotFoundError: If package doesn't exist
+            BackendError: If streaming fails
+        """
+        package = self._load_package(package_name, registry, top_hash)
+        for logical_key, entry in self._backend_get_package_entries(package).items():
+            if not prefix or logical_key.startswith(prefix):
+                yield entry
+
     @abstractmethod
     def _backend_get_package_metadata(self, package: Any) -> Dict[str, Any]:
         """Get package-level metadata (backend primitive).
@@ -468,12 +631,10 @@ class QuiltOps(ABC):
         added = sorted(keys2 - keys1)
         deleted = sorted(keys1 - keys2)
 
-        # Find modified files (same key, different hash)
+        # Find modified files (same key, different content)
         modified = []
         for key in sorted(keys1 & keys2):
-            hash1 = entries1[key].get("hash")
-            hash2 = entries2[key].get("hash")
-            if hash1 != hash2:
+            if self._entry_changed(entries1[key], entries2[key]):
                 modified.append(key)
 
         return {
@@ -482,6 +643,18 @@ class QuiltOps(ABC):
             "modified": modified,
         }
 
+    @staticmethod
+    def _entry_changed(entry1: PackageEntry, entry2: PackageEntry) -> bool:
+        """Return True if two entries for the same logical key differ.
+
+        Compares content hashes when both entries carry one; otherwise (e.g. entries
+        streamed from a listing API without hashes) compares physical key and size.
+        """
+        hash1, hash2 = entry1.get("hash"), entry2.get("hash")
+        if hash1 is not None and hash2 is not None:
+            return bool(hash1 != hash2)
+        return (entry1.get("physicalKey"), entry1.get("size")) != (entry2.get("physicalKey"), entry2.get("size"))
+
     @abstractmethod
     def _backend_browse_package_content(self, package: Any, path: str) -> List[Dict[str, Any]]:
         """List contents of a package at a specific path (backend primitive).
@@ -500,6 +673,35 @@ class QuiltOps(ABC):
         """
         pass
 
+    def _backend_list_package_dir(
+        self, package_name: str, registry: str, path: str, top_hash: Optional[str] = None
+    ) -> Tuple[List[Content_Info], Optional[Dict[str, Any]], Optional[str]]:
+        """List a package path together with package metadata (concrete method).
+
+        Default implementation loading the package once via _load_package().
+        Backends should override this to fetch metadata and the listing in a single
+        request without materializing the whole manifest.
+
+        Args:
+            package_name: Full package name in "user/package" format
+            registry: Registry S3 URL
+            path: Path within package to list (empty string for root)
+            top_hash: Optional specific version hash (lists latest if None)
+
+        Returns:
+            Tuple of (entries, package metadata, hash of the revision listed)
+
+        Raises:
+            NotFoundError: If package or path doesn't exist
+            BackendError: If the listing fails
+        """
+        package = self._load_package(package_name, registry, top_hash)
+        entries = [
+            self._transform_content_entry_to_content_info(entry)
+            for entry in self._backend_browse_package_content(package, path)
+        ]
+        return entries, self._backend_get_package_metadata(package) or None, top_hash
+
     @abstractmethod
     def _backend_get_file_url(
         self, package_name: str, registry: str, path: str, top_hash: Optional[str] = None
@@ -536,7 +738,9 @@ class QuiltOps(ABC):
     def _backend_get_catalog_config(self, catalog_url: str) -> Dict[str, Any]:
         """Fetch catalog configuration from a catalog URL (concrete method).
 
-        Standard HTTP GET implementation. Backends can override if needed.
+        Standard HTTP GET implementation through the process-wide catalog config
+        cache, which revalidates with ETag/Last-Modified once its TTL expires.
+        Backends can override if needed.
 
         Args:
             catalog_url: Catalog URL (e.g., "https://example.quiltdata.com")
@@ -556,10 +760,7 @@ class QuiltOps(ABC):
         config_url = f"{normalized_url}/config.json"
 
         try:
-            response = requests.get(config_url, timeout=10)
-            response.raise_for_status()
-            result: Dict[str, Any] = response.json()
-            return result
+            return get_catalog_config_cache().fetch(config_url)
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
                 from .exceptions import NotFoundError
@@ -818,8 +1019,8 @@ class QuiltOps(ABC):
             self._validate_package_name(package_name)
             self._validate_registry(registry)
 
-            # STEP 2: GET PACKAGE (backend primitive)
-            package = self._backend_get_package(package_name, registry)
+            # STEP 2: GET PACKAGE (backend primitive, via manifest cache)
+            package = self._load_package(package_name, registry)
 
             # STEP 3: BROWSE CONTENT (backend primitive)
             content_entries = self._backend_browse_package_content(package, path)
@@ -841,6 +1042,145 @@ class QuiltOps(ABC):
                 context={"package_name": package_name, "registry": registry, "path": path},
             ) from e
 
+    def browse_package(
+        self,
+        package_name: str,
+        registry: str,
+        path: str = "",
+        *,
+        limit: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Package_Listing:
+        """Browse one page of a package path with its metadata (concrete method).
+
+        Unlike browse_content() followed by get_package_metadata(), this costs a
+        single backend round trip. The cursor pins the revision that was listed,
+        so later pages stay consistent even if a new revision is pushed meanwhile.
+
+        Workflow:
+            1. Validate inputs and decode cursor
+            2. List path with metadata (backend primitive)
+            3. Slice the requested page and build the next cursor
+            4. Return Package_Listing
+
+        Args:
+            package_name: Full package name in "user/package" format
+            registry: Registry URL where the package is stored
+            path: Path within the package to browse (defaults to root)
+            limit: Maximum entries to return (0 for all remaining entries)
+            cursor: Cursor from a previous page's ``next_cursor``
+
+        Returns:
+            Package_Listing with the page of entries and package metadata
+
+        Raises:
+            ValidationError: When parameters or the cursor are invalid
+            NotFoundError: When package or path doesn't exist
+            BackendError: When the backend operation fails
+        """
+        from .exceptions import ValidationError, NotFoundError, BackendError
+
+        try:
+            self._validate_package_name(package_name)
+            self._validate_registry(registry)
+            if limit < 0:
+                raise ValidationError("limit must be zero or a positive integer", {"field": "limit"})
+            offset, top_hash = 0, None
+            if cursor:
+                try:
+                    offset, top_hash = decode_listing_cursor(cursor)
+                except ValueError as e:
+                    raise ValidationError(str(e), {"field": "cursor"}) from e
+
+            entries, metadata, listed_hash = self._list_package_dir_cached(package_name, registry, path, top_hash)
+
+            end = offset + limit if limit > 0 else len(entries)
+            next_cursor = encode_listing_cursor(end, listed_hash) if end < len(entries) else None
+            return Package_Listing(
+                package_name=package_name,
+                registry=registry,
+                path=path,
+                top_hash=listed_hash,
+                entries=entries[offset:end],
+                metadata=metadata,
+                total_entries=len(entries),
+                next_cursor=next_cursor,
+            )
+
+        except (ValidationError, NotFoundError):
+            raise
+        except Exception as e:
+            raise BackendError(
+                f"Browse package failed: {str(e)}",
+                context={"package_name": package_name, "registry": registry, "path": path},
+            ) from e
+
+    def _list_package_dir_cached(
+        self, package_name: str, registry: str, path: str, top_hash: Optional[str]
+    ) -> Tuple[List[Content_Info], Optional[Dict[str, Any]], Optional[str]]:
+        """List a package path, reusing the directory index cached for its top hash."""
+        resolved = self._resolve_manifest_hash(package_name, registry, top_hash)
+        if resolved is None:
+            entries, metadata, listed_hash = self._backend_list_package_dir(package_name, registry, path, top_hash)
+            return entries, metadata, listed_hash or top_hash
+
+        cache = get_manifest_cache()
+        key = manifest_key(registry, resolved, f"dir:{path}")
+        cached = cache.get(key)
+        if cached is not None:
+            entries, metadata = cached
+            return entries, metadata, resolved
+
+        entries, metadata, listed_hash = self._backend_list_package_dir(package_name, registry, path, resolved)
+        if (listed_hash or resolved) == resolved:
+            cache.put(key, (entries, metadata), entries_size((entry.path for entry in entries), metadata))
+        return entries, metadata, resolved
+
+    def iter_package_entries(
+        self,
+        package_name: str,
+        registry: str,
+        top_hash: Optional[str] = None,
+        prefix: Optional[str] = None,
+    ) -> Iterator[PackageEntry]:
+        """Stream the file entries of a package revision (concrete method).
+
+        Entries are produced incrementally by the backend, so callers can process
+        manifests of any size without holding the whole package in memory.
+        Inputs are validated eagerly; backend errors surface while iterating.
+
+        Args:
+            package_name: Full package name in "user/package" format
+            registry: Registry URL where the package is stored
+            top_hash: Optional specific version hash (streams latest if None)
+            prefix: Optional logical-key prefix, e.g. "data/raw/"
+
+        Returns:
+            Iterator of PackageEntry dicts (logicalKey, physicalKey, size, hash, meta)
+
+        Raises:
+            ValidationError: When package_name or registry are invalid
+            NotFoundError: When the package doesn't exist (raised on iteration)
+            BackendError: When the backend operation fails (raised on iteration)
+        """
+        self._validate_package_name(package_name)
+        self._validate_registry(registry)
+        entries = self._backend_iter_package_entries(package_name, registry, top_hash, prefix or None)
+        return self._guard_entry_stream(
+            entries, {"package_name": package_name, "registry": registry, "top_hash": top_hash}
+        )
+
+    @staticmethod
+    def _guard_entry_stream(entries: Iterator[PackageEntry], context: Dict[str, Any]) -> Iterator[PackageEntry]:
+        from .exceptions import ValidationError, NotFoundError, BackendError
+
+        try:
+            yield from entries
+        except (ValidationError, NotFoundError):
+            raise
+        except Exception as e:
+            raise BackendError(f"Iterate package entries failed: {str(e)}", context=context) from e
+
     def get_package_metadata(self, package_name: str, registry: str) -> Dict[str, Any]:
         """Get package metadata via public QuiltOps API (concrete method).
 
@@ -856,7 +1196,7 @@ class QuiltOps(ABC):
             self._validate_package_name(package_name)
             self._validate_registry(registry)
 
-            package = self._backend_get_package(package_name, registry)
+            package = self._load_package(package_name, registry)
             metadata = self._backend_get_package_metadata(package)
             return metadata if isinstance(metadata, dict) else {}
 
@@ -1273,6 +1613,18 @@ class QuiltOps(ABC):
         """
         ...
 
+    async def alist_tabulator_tables(self, bucket: str) -> List[Dict[str, str]]:
+        """Asyncio equivalent of list_tabulator_tables().
+
+        TabulatorMixin awaits the backend's async GraphQL transport; this
+        default runs the synchronous call in a worker thread.
+        """
+        return await asyncio.to_thread(self.list_tabulator_tables, bucket)
+
+    async def aget_open_query_status(self) -> Dict[str, Any]:
+        """Asyncio equivalent of get_open_query_status() (worker-thread default, see alist_tabulator_tables())."""
+        return await asyncio.to_thread(self.get_open_query_status)
+
     @abstractmethod
     def set_open_query(self, enabled: bool) -> Dict[str, Any]:
         """Set tabulator open query status via GraphQL.
@@ -1452,10 +1804,9 @@ class QuiltOps(ABC):
 
         Workflow:
             1. Validate inputs (validation in base class)
-            2. Get first package (backend primitive)
-            3. Get second package (backend primitive)
-            4. Compute diff (backend primitive)
-            5. Return result
+            2. Get both packages (backend primitive, fetched together)
+            3. Compute diff (backend primitive)
+            4. Return result
 
         Args:
             package1_name: Full name of the first package in "user/package" format
@@ -1486,16 +1837,15 @@ class QuiltOps(ABC):
             self._validate_package_name(package2_name)
             self._validate_registry(registry)
 
-            # STEP 2: GET FIRST PACKAGE (backend primitive)
-            pkg1 = self._backend_get_package(package1_name, registry, package1_hash)
-
-            # STEP 3: GET SECOND PACKAGE (backend primitive)
-            pkg2 = self._backend_get_package(package2_name, registry, package2_hash)
+            # STEP 2: GET BOTH PACKAGES (backend primitive, one lookup for both)
+            pkg1, pkg2 = self._load_packages(
+                [(package1_name, package1_hash), (package2_name, package2_hash)], registry
+            )
 
-            # STEP 4: COMPUTE DIFF (backend primitive)
+            # STEP 3: COMPUTE DIFF (backend primitive)
             diff_result = self._backend_diff_packages(pkg1, pkg2)
 
-            # STEP 5: RETURN
+            # STEP 4: RETURN
             return diff_result
 
         except (ValidationError, NotFoundError):
@@ -1566,7 +1916,7 @@ class QuiltOps(ABC):
             self._validate_package_update_inputs(package_name, s3_uris, registry)
 
             # STEP 2: GET EXISTING PACKAGE (backend primitive)
-            existing_package = self._backend_get_package(package_name, registry)
+            existing_package = self._load_package(package_name, registry)
 
             # STEP 3: GET EXISTING ENTRIES (backend primitive)
             existing_entries = self._backend_get_package_entries(existing_package)
@@ -4,12 +4,32 @@ This mixin provides table management for Quilt tabulator functionality.
 Works with any backend implementing the required auth/endpoint methods.
 """
 
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from quilt_mcp.ops.exceptions import BackendError, ValidationError, AuthenticationError
 
 logger = logging.getLogger(__name__)
 
+_LIST_TABULATOR_TABLES_QUERY = """
+query ListTabulatorTables($name: String!) {
+  bucketConfig(name: $name) {
+    tabulatorTables {
+      name
+      config
+    }
+  }
+}
+"""
+
+_OPEN_QUERY_STATUS_QUERY = """
+query GetOpenQueryStatus {
+    admin {
+        tabulatorOpenQuery
+    }
+}
+"""
+
 
 class TabulatorMixin:
     """Shared Tabulator operations using GraphQL.
@@ -108,6 +128,14 @@ class TabulatorMixin:
             logger.error(f"GraphQL query failed: {str(e)}")
             raise BackendError(f"GraphQL query failed: {str(e)}")
 
+    async def aexecute_graphql_query(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Asyncio equivalent of execute_graphql_query().
+
+        Runs the synchronous query in a worker thread; backends with an async
+        transport (Platform_Backend) override this to await it instead.
+        """
+        return await asyncio.to_thread(self.execute_graphql_query, query, variables)
+
     def list_tabulator_tables(self, bucket: str) -> List[Dict[str, str]]:
         """List all tabulator tables in a bucket.
 
@@ -121,22 +149,24 @@ class TabulatorMixin:
             BackendError: If GraphQL query fails
             ValidationError: If bucket not found
         """
-        query = """
-        query ListTabulatorTables($name: String!) {
-          bucketConfig(name: $name) {
-            tabulatorTables {
-              name
-              config
-            }
-          }
-        }
-        """
+        try:
+            result = self.execute_graphql_query(_LIST_TABULATOR_TABLES_QUERY, {"name": bucket})
+        except Exception as e:
+            raise BackendError(f"Failed to list tabulator tables: {str(e)}", context={"bucket": bucket}) from e
 
+        return self._tabulator_tables(result, bucket)
+
+    async def alist_tabulator_tables(self, bucket: str) -> List[Dict[str, str]]:
+        """Asyncio equivalent of list_tabulator_tables()."""
         try:
-            result = self.execute_graphql_query(query, {"name": bucket})
+            result = await self.aexecute_graphql_query(_LIST_TABULATOR_TABLES_QUERY, {"name": bucket})
         except Exception as e:
             raise BackendError(f"Failed to list tabulator tables: {str(e)}", context={"bucket": bucket}) from e
 
+        return self._tabulator_tables(result, bucket)
+
+    @staticmethod
+    def _tabulator_tables(result: Dict[str, Any], bucket: str) -> List[Dict[str, str]]:
         # Extract tables from GraphQL response
         bucket_config = result.get('data', {}).get('bucketConfig')
         if not bucket_config:
@@ -354,23 +384,26 @@ class TabulatorMixin:
         Raises:
             BackendError: If GraphQL query fails
         """
-        query = """
-        query GetOpenQueryStatus {
-            admin {
-                tabulatorOpenQuery
-            }
-        }
-        """
         try:
-            result = self.execute_graphql_query(query)
-            enabled = result.get("data", {}).get("admin", {}).get("tabulatorOpenQuery", False)
-            return {
-                "success": True,
-                "open_query_enabled": enabled,
-            }
+            return self._open_query_status(self.execute_graphql_query(_OPEN_QUERY_STATUS_QUERY))
         except Exception as exc:
             raise BackendError(f"Failed to get open query status: {exc}")
 
+    async def aget_open_query_status(self) -> Dict[str, Any]:
+        """Asyncio equivalent of get_open_query_status()."""
+        try:
+            return self._open_query_status(await self.aexecute_graphql_query(_OPEN_QUERY_STATUS_QUERY))
+        except Exception as exc:
+            raise BackendError(f"Failed to get open query status: {exc}")
+
+    @staticmethod
+    def _open_query_status(result: Dict[str, Any]) -> Dict[str, Any]:
+        enabled = result.get("data", {}).get("admin", {}).get("tabulatorOpenQuery", False)
+        return {
+            "success": True,
+            "open_query_enabled": enabled,
+        }
+
     def set_open_query(self, enabled: bool) -> Dict[str, Any]:
         """Set tabulator open query status via GraphQL.
 
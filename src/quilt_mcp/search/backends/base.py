@@ -64,6 +64,10 @@ class BackendResponse:
     query_time_ms: Optional[float] = None
     error_message: Optional[str] = None
     raw_response: Optional[Dict[str, Any]] = None
+    # Fan-out report (total/succeeded/timed_out/failed shards) for sharded searches
+    shards: Optional[Dict[str, Any]] = None
+    # Count-only searches: aggregated counts (per bucket, per extension, size histogram)
+    aggregations: Optional[Dict[str, Any]] = None
 
     def __post_init__(self):
         if self.results is None:
@@ -152,6 +156,34 @@ class SearchBackend(ABC):
         """
         pass
 
+    async def count(
+        self,
+        query: str,
+        scope: str = "global",
+        bucket: str = "",
+        filters: Optional[Dict[str, Any]] = None,
+        include_aggregations: bool = False,
+    ) -> BackendResponse:
+        """Count documents matching a query.
+
+        Backends that can ask the index for hit totals should override this;
+        the default runs a regular search (default limit of 50) and counts the
+        returned results.
+
+        Args:
+            query: Search query string
+            scope: Search scope (global, package, file)
+            bucket: S3 bucket to search in (empty = all buckets)
+            filters: Additional filters to apply
+            include_aggregations: Also return aggregated counts, if supported
+
+        Returns:
+            BackendResponse with ``total`` set
+        """
+        response = await self.search(query, scope, bucket, filters, 50)
+        response.total = len(response.results)
+        return response
+
     @abstractmethod
     async def health_check(self) -> bool:
         """Check if the backend is available and healthy.
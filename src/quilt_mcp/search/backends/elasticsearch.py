@@ -11,10 +11,13 @@ This backend simply:
 """
 
 import asyncio
+import heapq
 import json
 import logging
+import os
 import time
-from typing import Dict, List, Any, Optional, TYPE_CHECKING, cast
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Any, Optional, Tuple, TYPE_CHECKING, cast
 
 import requests
 
@@ -41,13 +44,59 @@ from ..exceptions import (
     AuthenticationRequired,
     BackendError,
 )
+from ...services.async_http_client import get_async_http_client
+from ...services.catalog_config_cache import get_catalog_config_cache
 from ...utils.common import normalize_url
+from ..utils.bucket_catalog import get_bucket_catalog_cache, get_index_pattern_limits
+from ..utils.identity import search_identity
 
 # Import search_api at module level for better testability and performance
 from quilt3.search_util import search_api
 
 logger = logging.getLogger(__name__)
 
+# Bucket counts tried, largest first, when a catalog rejects a pattern as too large.
+SHARD_SIZES = (50, 40, 30, 20, 10)
+DEFAULT_FANOUT_CONCURRENCY = 8
+DEFAULT_SHARD_TIMEOUT_SECONDS = 30
+
+# Aggregations for count-only searches
+COUNT_AGGREGATION_TERMS = 100
+SIZE_HISTOGRAM_RANGES: List[Dict[str, Any]] = [
+    {"key": "<1KB", "to": 1024},
+    {"key": "1KB-1MB", "from": 1024, "to": 1024**2},
+    {"key": "1MB-100MB", "from": 1024**2, "to": 100 * 1024**2},
+    {"key": "100MB-1GB", "from": 100 * 1024**2, "to": 1024**3},
+    {"key": ">=1GB", "from": 1024**3},
+]
+
+
+# (url, headers) for the registry search API
+SearchTarget = Tuple[str, Dict[str, str]]
+
+
+class _SearchTargetResolver:
+    """Resolves the search URL and auth headers once per query, in a worker thread."""
+
+    def __init__(self, resolve: Callable[[], Optional[SearchTarget]]) -> None:
+        self._resolve = resolve
+        self._lock = asyncio.Lock()
+        self._resolved = False
+        self._target: Optional[SearchTarget] = None
+
+    async def get(self) -> Optional[SearchTarget]:
+        async with self._lock:
+            if not self._resolved:
+                self._target = await asyncio.to_thread(self._resolve)
+                self._resolved = True
+        return self._target
+
+
+# Set by _run_query() so fan-out shards share one resolution
+_search_target_resolver: ContextVar[Optional[_SearchTargetResolver]] = ContextVar(
+    "quilt_search_target_resolver", default=None
+)
+
 
 def escape_elasticsearch_query(query: str) -> str:
     r"""Escape special characters in Elasticsearch query_string queries.
@@ -126,6 +175,8 @@ class Quilt3ElasticsearchBackend(SearchBackend):
         else:
             self.quilt_ops = None
         self._session_available = False
+        self._auth_error: Optional[AuthenticationRequired] = None
+        self._http_session: Optional[requests.Session] = None
 
         # Initialize scope handlers
         self.scope_handlers: Dict[str, ScopeHandler] = {
@@ -198,6 +249,13 @@ class Quilt3ElasticsearchBackend(SearchBackend):
 
         return bucket
 
+    @property
+    def http_session(self) -> requests.Session:
+        """HTTP session for search API calls, kept alive for the backend's lifetime."""
+        if self._http_session is None:
+            self._http_session = requests.Session()
+        return self._http_session
+
     def _initialize(self):
         """Initialize backend by checking quilt3 session availability."""
         self._check_session()
@@ -215,6 +273,7 @@ class Quilt3ElasticsearchBackend(SearchBackend):
             self._session_available = bool(registry_url)
             if self._session_available:
                 self._update_status(BackendStatus.AVAILABLE)
+                self._auth_error = None
             else:
                 self._update_status(BackendStatus.UNAVAILABLE, "No quilt3 session configured")
                 self._auth_error = AuthenticationRequired(
@@ -230,33 +289,41 @@ class Quilt3ElasticsearchBackend(SearchBackend):
             )
 
     async def health_check(self) -> bool:
-        """Check if Elasticsearch backend is healthy."""
+        """Check if Elasticsearch backend is healthy.
+
+        Re-runs the session check so a long-lived backend picks up logins
+        and logouts that happened after it was initialized.
+        """
+        await asyncio.to_thread(self._check_session)
+        self._initialized = True
+        return self._session_available
+
+    def _catalog_key(self) -> str:
+        """Return the registry URL identifying the catalog searches go to."""
+        backend = self.backend if self.backend is not None else self.quilt_ops
         try:
-            if self.backend:
-                auth_status = self.backend.get_auth_status()
-                registry_url = auth_status.registry_url
-            else:
-                assert self.quilt_ops is not None, "quilt_ops should be set when backend is None"
-                auth_status = self.quilt_ops.get_auth_status()
-                registry_url = auth_status.registry_url
-            if registry_url:
-                self._update_status(BackendStatus.AVAILABLE)
-                return True
-            else:
-                self._update_status(BackendStatus.UNAVAILABLE, "No registry URL available")
-                return False
-        except Exception as e:
-            self._update_status(BackendStatus.ERROR, f"Health check failed: {e}")
-            return False
+            return normalize_url(backend.get_registry_url() or "") if backend is not None else ""
+        except Exception:
+            return ""
 
     def _get_available_buckets(self) -> list[str]:
         """Get list of available bucket names from catalog.
 
+        The list is cached per (identity, catalog) and refreshed in the
+        background once stale, so unscoped searches do not issue a
+        ``bucketConfigs`` query every time.
+
         Returns:
             List of bucket names
+        """
+        key = (search_identity(), self._catalog_key())
+        return get_bucket_catalog_cache().get(key, self._fetch_available_buckets)
 
-        Raises:
-            Exception if GraphQL query fails
+    def _fetch_available_buckets(self) -> list[str]:
+        """Fetch the list of available bucket names from the catalog.
+
+        Returns:
+            List of bucket names (empty if the query fails)
         """
         try:
             # Prefer backend for proper abstraction
@@ -284,10 +351,8 @@ class Quilt3ElasticsearchBackend(SearchBackend):
 
                 normalized_catalog = normalize_url(logged_in_url)
 
-                # Fetch catalog config
-                config_response = session.get(f"{normalized_catalog}/config.json", timeout=10)
-                config_response.raise_for_status()
-                config_data = config_response.json()
+                # Fetch catalog config (cached and revalidated process-wide)
+                config_data = get_catalog_config_cache().fetch(f"{normalized_catalog}/config.json", session=session)
                 registry_url = config_data.get("registryUrl")
 
                 if not registry_url:
@@ -411,39 +476,85 @@ class Quilt3ElasticsearchBackend(SearchBackend):
             logger.warning("No buckets available for search, returning empty pattern")
             return ""
 
-        # Use ALL available buckets - let Elasticsearch handle limits
-        # If we hit a 403 error, the caller should implement retry logic
-        return self.build_index_pattern_for_scope(scope, available_buckets)
+        # Use ALL available buckets unless this catalog previously rejected a
+        # pattern this large; then start from the largest size it accepted.
+        # If we hit a 403 error, the caller retries with fewer buckets.
+        start_size = get_index_pattern_limits().start_size(self._catalog_key(), len(available_buckets))
+        return self.build_index_pattern_for_scope(scope, available_buckets[:start_size])
+
+    @classmethod
+    def _pattern_bucket_count(cls, index_pattern: str) -> int:
+        """Return how many distinct buckets an index pattern covers."""
+        return len({cls.get_bucket_from_index(index) for index in index_pattern.split(",") if index})
+
+    def _search_target(self) -> Optional[SearchTarget]:
+        """Return (url, headers) for the registry search API, or None without a registry.
+
+        Resolving auth headers may block (quilt3 token refresh), so async
+        callers run this in a worker thread.
+        """
+        backend = self.backend if self.backend is not None else self.quilt_ops
+        if backend is None:
+            return None
+        registry_url = backend.get_registry_url()
+        if not registry_url:
+            return None
+        headers: Dict[str, str] = {}
+        try:
+            headers = backend.get_graphql_auth_headers()
+        except Exception:
+            headers = {}
+        return f"{normalize_url(registry_url)}/api/search", headers
+
+    @staticmethod
+    def _search_params(dsl_query: Dict[str, Any], index_pattern: str, limit: int) -> Dict[str, str]:
+        """Build the query parameters for a freeform registry search."""
+        return {
+            "index": index_pattern,
+            "action": "freeform",
+            "body": json.dumps(dsl_query),
+            "size": str(limit),
+        }
+
+    def _search_request(
+        self, dsl_query: Dict[str, Any], index_pattern: str, limit: int
+    ) -> Optional[Tuple[str, Dict[str, str], Dict[str, str]]]:
+        """Build (url, params, headers) for the registry search API, or None without a registry."""
+        target = self._search_target()
+        if target is None:
+            return None
+        url, headers = target
+        return url, self._search_params(dsl_query, index_pattern, limit), headers
 
     def _execute_search_api(self, dsl_query: Dict[str, Any], index_pattern: str, limit: int) -> Dict[str, Any]:
         """Execute search API request with backend-authenticated path when available."""
-        backend = self.backend if self.backend is not None else self.quilt_ops
-        if backend is not None:
-            registry_url = backend.get_registry_url()
-            if registry_url:
-                params: Dict[str, str] = {
-                    "index": index_pattern,
-                    "action": "freeform",
-                    "body": json.dumps(dsl_query),
-                    "size": str(limit),
-                }
-                headers: Dict[str, str] = {}
-                try:
-                    headers = backend.get_graphql_auth_headers()
-                except Exception:
-                    headers = {}
-                response = requests.get(
-                    f"{normalize_url(registry_url)}/api/search",
-                    params=params,
-                    headers=headers,
-                    timeout=60,
-                )
-                response.raise_for_status()
-                return cast(Dict[str, Any], response.json())
+        request = self._search_request(dsl_query, index_pattern, limit)
+        if request is not None:
+            url, params, headers = request
+            response = self.http_session.get(url, params=params, headers=headers, timeout=60)
+            response.raise_for_status()
+            return cast(Dict[str, Any], response.json())
 
         # Fallback to quilt3's search utility (requires quilt3 session context).
         return cast(Dict[str, Any], search_api(query=dsl_query, index=index_pattern, limit=limit))
 
+    async def _aexecute_search_api(self, dsl_query: Dict[str, Any], index_pattern: str, limit: int) -> Dict[str, Any]:
+        """Asyncio equivalent of _execute_search_api() using the shared httpx client.
+
+        The URL and auth headers are resolved in a worker thread (once per
+        query when called under _run_query()), as is the quilt3-session
+        fallback used when the backend has no registry URL.
+        """
+        resolver = _search_target_resolver.get()
+        target = await resolver.get() if resolver is not None else await asyncio.to_thread(self._search_target)
+        if target is None:
+            return await asyncio.to_thread(self._execute_search_api, dsl_query, index_pattern, limit)
+        url, headers = target
+        params = self._search_params(dsl_query, index_pattern, limit)
+        response = await get_async_http_client().get(url, params=params, headers=headers, timeout=60)
+        response.raise_for_status()
+        return cast(Dict[str, Any], response.json())
+
     async def search(
         self,
         query: str,
@@ -453,28 +564,19 @@ class Quilt3ElasticsearchBackend(SearchBackend):
         limit: int = 50,
     ) -> BackendResponse:
         """Execute search using Elasticsearch."""
-        # Ensure backend is initialized before searching
-        self.ensure_initialized()
+        # Ensure backend is initialized before searching. Initialization, the
+        # index pattern (which may fetch bucketConfigs) and error reporting can
+        # block, so they run in worker threads rather than on the event loop.
+        await asyncio.to_thread(self.ensure_initialized)
 
         start_time = time.time()
 
         if not self._session_available:
-            auth_error = getattr(self, "_auth_error", None)
-            if auth_error:
-                error_msg = f"{auth_error.message}: {auth_error.cause}"
-            else:
-                error_msg = "Quilt3 session not available - authentication required"
-
-            return BackendResponse(
-                backend_type=self.backend_type,
-                status=BackendStatus.UNAVAILABLE,
-                results=[],
-                error_message=error_msg,
-            )
+            return self._unavailable_response()
 
         try:
             # Build index pattern
-            index_pattern = self._build_index_pattern(scope, bucket)
+            index_pattern = await asyncio.to_thread(self._build_index_pattern, scope, bucket)
             if not index_pattern:
                 logger.info("No searchable buckets available for scope=%s bucket=%s", scope, bucket)
                 query_time = (time.time() - start_time) * 1000
@@ -489,131 +591,11 @@ class Quilt3ElasticsearchBackend(SearchBackend):
             # Get scope handler
             handler = self.scope_handlers.get(scope)
             if not handler:
-                return BackendResponse(
-                    backend_type=self.backend_type,
-                    status=BackendStatus.ERROR,
-                    results=[],
-                    error_message=f"Invalid scope: {scope}. Must be one of {list(self.scope_handlers.keys())}",
-                )
+                return self._invalid_scope_response(scope)
 
-            # Build query DSL
-            escaped_query = escape_elasticsearch_query(query)
-            dsl_query: Dict[str, Any] = {
-                "from": 0,
-                "size": limit,
-                "query": {"query_string": {"query": escaped_query}},
-            }
-
-            # Add query filter if handler provides it
-            if hasattr(handler, 'build_query_filter'):
-                dsl_query["query"] = handler.build_query_filter(escaped_query)
-
-            # Add collapse config if handler provides it
-            if hasattr(handler, 'build_collapse_config'):
-                collapse_config = handler.build_collapse_config()
-                if collapse_config:
-                    dsl_query["collapse"] = collapse_config
-
-            # Apply filters if provided
-            if filters:
-                filter_clauses: List[Dict[str, Any]] = []
-
-                if filters.get("file_extensions"):
-                    filter_clauses.append({"terms": {"ext": [ext.lstrip(".") for ext in filters["file_extensions"]]}})
-                if filters.get("size_gt"):
-                    filter_clauses.append({"range": {"size": {"gt": filters["size_gt"]}}})
-                if filters.get("size_min"):
-                    filter_clauses.append({"range": {"size": {"gte": filters["size_min"]}}})
-                if filters.get("size_max"):
-                    filter_clauses.append({"range": {"size": {"lte": filters["size_max"]}}})
-                if filters.get("created_after"):
-                    filter_clauses.append({"range": {"last_modified": {"gte": filters["created_after"]}}})
-                if filters.get("created_before"):
-                    filter_clauses.append({"range": {"last_modified": {"lte": filters["created_before"]}}})
-
-                if filter_clauses:
-                    # If query is already a bool query (from handler), add filters to it
-                    current_query = dsl_query["query"]
-                    if isinstance(current_query, dict) and "bool" in current_query:
-                        # Merge filters into existing bool query
-                        if "filter" not in current_query["bool"]:
-                            current_query["bool"]["filter"] = []
-                        current_query["bool"]["filter"].extend(filter_clauses)
-                    else:
-                        # Create new bool query with filters
-                        dsl_query["query"] = {
-                            "bool": {
-                                "must": [current_query],
-                                "filter": filter_clauses,
-                            }
-                        }
-
-            # Execute search with retry logic for 403 errors (too many indices)
-            # Try search with full index pattern first
-            try:
-                # Run synchronous search_api in thread pool to avoid blocking event loop
-                response = await asyncio.to_thread(self._execute_search_api, dsl_query, index_pattern, limit)
-            except Exception as search_error:
-                # Check if error is 403 and we're searching multiple buckets
-                if "403" in str(search_error) and "," in index_pattern and not bucket:
-                    # 403 likely means too many indices - retry with fewer buckets
-                    logger.info(
-                        f"Got 403 error with {len(index_pattern.split(','))} indices, retrying with fewer buckets"
-                    )
-
-                    # Get available bucket list
-                    available_buckets = self._get_available_buckets()
-
-                    # Try with progressively fewer buckets until it works
-                    # Start at 50 and reduce by 10 each time
-                    for max_buckets in [50, 40, 30, 20, 10]:
-                        try:
-                            reduced_buckets = available_buckets[:max_buckets]
-                            reduced_pattern = self.build_index_pattern_for_scope(scope, reduced_buckets)
-
-                            logger.info(
-                                f"Retrying with {max_buckets} buckets ({len(reduced_pattern.split(','))} indices)"
-                            )
-                            # Run synchronous search_api in thread pool to avoid blocking event loop
-                            response = await asyncio.to_thread(
-                                self._execute_search_api, dsl_query, reduced_pattern, limit
-                            )
-                            logger.info(f"✅ Search succeeded with {max_buckets} buckets")
-                            break
-                        except Exception as retry_error:
-                            if "403" in str(retry_error):
-                                logger.debug(f"Still getting 403 with {max_buckets} buckets, trying fewer")
-                                continue
-                            else:
-                                # Different error, re-raise
-                                raise
-                    else:
-                        # All retries failed, raise original error
-                        raise search_error
-                else:
-                    # Not a 403 or not a multi-bucket search, re-raise
-                    raise
-
-            if "error" in response:
-                # Get catalog URL for error reporting
-                catalog_url = None
-                if self._session_available:
-                    try:
-                        if self.backend:
-                            auth_status = self.backend.get_auth_status()
-                        else:
-                            assert self.quilt_ops is not None, "quilt_ops should be set when backend is None"
-                            auth_status = self.quilt_ops.get_auth_status()
-                        catalog_url = auth_status.logged_in_url
-                    except Exception:
-                        pass
-
-                raise BackendError(
-                    backend_name="elasticsearch",
-                    cause=response["error"],
-                    authenticated=self._session_available,
-                    catalog_url=catalog_url,
-                )
+            dsl_query = self._build_query_dsl(handler, query, filters, limit)
+            response, shard_report = await self._run_query(dsl_query, scope, bucket, index_pattern, limit)
+            await self._araise_for_response_error(response)
 
             # Convert results using scope handler
             hits = response.get("hits", {}).get("hits", [])
@@ -627,24 +609,437 @@ class Quilt3ElasticsearchBackend(SearchBackend):
                 results=results,
                 total=len(results),
                 query_time_ms=query_time,
+                shards=shard_report,
             )
 
         except Exception as e:
-            query_time = (time.time() - start_time) * 1000
-            self._update_status(BackendStatus.ERROR, str(e))
+            return self._error_response(e, start_time)
+
+    async def count(
+        self,
+        query: str,
+        scope: str = "global",
+        bucket: str = "",
+        filters: Optional[Dict[str, Any]] = None,
+        include_aggregations: bool = False,
+    ) -> BackendResponse:
+        """Count matching documents without fetching hits.
+
+        Sends ``size: 0`` with ``track_total_hits`` so the total is the exact
+        index hit count, optionally with per-bucket, per-extension and size
+        histogram aggregations computed in the same request.
 
-            error_message = str(e)
-            if isinstance(e, BackendError):
-                error_message = f"{e.message}: {e.cause}"
+        Returns:
+            BackendResponse with ``total`` set, no results, and ``aggregations``
+            when requested
+        """
+        await asyncio.to_thread(self.ensure_initialized)
+
+        start_time = time.time()
+
+        if not self._session_available:
+            return self._unavailable_response()
+
+        try:
+            index_pattern = await asyncio.to_thread(self._build_index_pattern, scope, bucket)
+            if not index_pattern:
+                return BackendResponse(
+                    backend_type=self.backend_type,
+                    status=BackendStatus.AVAILABLE,
+                    results=[],
+                    total=0,
+                    query_time_ms=(time.time() - start_time) * 1000,
+                    aggregations=self._format_aggregations({}) if include_aggregations else None,
+                )
+
+            handler = self.scope_handlers.get(scope)
+            if not handler:
+                return self._invalid_scope_response(scope)
+
+            dsl_query = self._build_query_dsl(handler, query, filters, 0)
+            dsl_query.pop("collapse", None)
+            dsl_query["track_total_hits"] = True
+            if include_aggregations:
+                dsl_query["aggs"] = self._count_aggregations()
+
+            response, shard_report = await self._run_query(
+                dsl_query, scope, bucket, index_pattern, 0, merge=self._merge_count_responses
+            )
+            await self._araise_for_response_error(response)
 
             return BackendResponse(
                 backend_type=self.backend_type,
-                status=BackendStatus.ERROR,
+                status=BackendStatus.AVAILABLE,
                 results=[],
-                query_time_ms=query_time,
-                error_message=error_message,
+                total=self._total_hits(response),
+                query_time_ms=(time.time() - start_time) * 1000,
+                shards=shard_report,
+                aggregations=self._format_aggregations(response.get("aggregations", {}))
+                if include_aggregations
+                else None,
+            )
+
+        except Exception as e:
+            return self._error_response(e, start_time)
+
+    def _build_query_dsl(
+        self,
+        handler: ScopeHandler,
+        query: str,
+        filters: Optional[Dict[str, Any]],
+        limit: int,
+    ) -> Dict[str, Any]:
+        """Build the Elasticsearch query DSL for a scope handler, query and filters."""
+        escaped_query = escape_elasticsearch_query(query)
+        dsl_query: Dict[str, Any] = {
+            "from": 0,
+            "size": limit,
+            "query": {"query_string": {"query": escaped_query}},
+        }
+
+        # Add query filter if handler provides it
+        if hasattr(handler, 'build_query_filter'):
+            dsl_query["query"] = handler.build_query_filter(escaped_query)
+
+        # Add collapse config if handler provides it
+        if hasattr(handler, 'build_collapse_config'):
+            collapse_config = handler.build_collapse_config()
+            if collapse_config:
+                dsl_query["collapse"] = collapse_config
+
+        # Apply filters if provided
+        if filters:
+            filter_clauses: List[Dict[str, Any]] = []
+
+            if filters.get("file_extensions"):
+                filter_clauses.append({"terms": {"ext": [ext.lstrip(".") for ext in filters["file_extensions"]]}})
+            if filters.get("size_gt"):
+                filter_clauses.append({"range": {"size": {"gt": filters["size_gt"]}}})
+            if filters.get("size_min"):
+                filter_clauses.append({"range": {"size": {"gte": filters["size_min"]}}})
+            if filters.get("size_max"):
+                filter_clauses.append({"range": {"size": {"lte": filters["size_max"]}}})
+            if filters.get("created_after"):
+                filter_clauses.append({"range": {"last_modified": {"gte": filters["created_after"]}}})
+            if filters.get("created_before"):
+                filter_clauses.append({"range": {"last_modified": {"lte": filters["created_before"]}}})
+
+            if filter_clauses:
+                # If query is already a bool query (from handler), add filters to it
+                current_query = dsl_query["query"]
+                if isinstance(current_query, dict) and "bool" in current_query:
+                    # Merge filters into existing bool query
+                    if "filter" not in current_query["bool"]:
+                        current_query["bool"]["filter"] = []
+                    current_query["bool"]["filter"].extend(filter_clauses)
+                else:
+                    # Create new bool query with filters
+                    dsl_query["query"] = {
+                        "bool": {
+                            "must": [current_query],
+                            "filter": filter_clauses,
+                        }
+                    }
+
+        return dsl_query
+
+    async def _run_query(
+        self,
+        dsl_query: Dict[str, Any],
+        scope: str,
+        bucket: str,
+        index_pattern: str,
+        limit: int,
+        merge: Optional[Callable[[List[Dict[str, Any]], int], Dict[str, Any]]] = None,
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Run a query against one bucket, or against every bucket with fan-out."""
+        token = _search_target_resolver.set(_SearchTargetResolver(self._search_target))
+        try:
+            if self.normalize_bucket_name(bucket):
+                response = await self._aexecute_search_api(dsl_query, index_pattern, limit)
+                return response, None
+            return await self._search_all_buckets(dsl_query, scope, index_pattern, limit, merge=merge)
+        finally:
+            _search_target_resolver.reset(token)
+
+    def _unavailable_response(self) -> BackendResponse:
+        auth_error = self._auth_error
+        if auth_error:
+            error_msg = f"{auth_error.message}: {auth_error.cause}"
+        else:
+            error_msg = "Quilt3 session not available - authentication required"
+
+        return BackendResponse(
+            backend_type=self.backend_type,
+            status=BackendStatus.UNAVAILABLE,
+            results=[],
+            error_message=error_msg,
+        )
+
+    def _invalid_scope_response(self, scope: str) -> BackendResponse:
+        return BackendResponse(
+            backend_type=self.backend_type,
+            status=BackendStatus.ERROR,
+            results=[],
+            error_message=f"Invalid scope: {scope}. Must be one of {list(self.scope_handlers.keys())}",
+        )
+
+    def _error_response(self, error: Exception, start_time: float) -> BackendResponse:
+        query_time = (time.time() - start_time) * 1000
+        self._update_status(BackendStatus.ERROR, str(error))
+
+        error_message = str(error)
+        if isinstance(error, BackendError):
+            error_message = f"{error.message}: {error.cause}"
+
+        return BackendResponse(
+            backend_type=self.backend_type,
+            status=BackendStatus.ERROR,
+            results=[],
+            query_time_ms=query_time,
+            error_message=error_message,
+        )
+
+    async def _araise_for_response_error(self, response: Dict[str, Any]) -> None:
+        """Asyncio equivalent of _raise_for_response_error(); auth lookup runs in a worker thread."""
+        if "error" in response:
+            await asyncio.to_thread(self._raise_for_response_error, response)
+
+    def _raise_for_response_error(self, response: Dict[str, Any]) -> None:
+        """Raise BackendError if the search API returned an error payload."""
+        if "error" not in response:
+            return
+
+        # Get catalog URL for error reporting
+        catalog_url = None
+        if self._session_available:
+            try:
+                if self.backend:
+                    auth_status = self.backend.get_auth_status()
+                else:
+                    assert self.quilt_ops is not None, "quilt_ops should be set when backend is None"
+                    auth_status = self.quilt_ops.get_auth_status()
+                catalog_url = auth_status.logged_in_url
+            except Exception:
+                pass
+
+        raise BackendError(
+            backend_name="elasticsearch",
+            cause=response["error"],
+            authenticated=self._session_available,
+            catalog_url=catalog_url,
+        )
+
+    @staticmethod
+    def _count_aggregations() -> Dict[str, Any]:
+        """Aggregations returned by count(include_aggregations=True)."""
+        return {
+            "buckets": {"terms": {"field": "_index", "size": COUNT_AGGREGATION_TERMS}},
+            "extensions": {"terms": {"field": "ext", "size": COUNT_AGGREGATION_TERMS}},
+            "size_histogram": {"range": {"field": "size", "keyed": False, "ranges": SIZE_HISTOGRAM_RANGES}},
+        }
+
+    @staticmethod
+    def _total_hits(response: Dict[str, Any]) -> int:
+        total = response.get("hits", {}).get("total", 0)
+        if isinstance(total, dict):
+            return int(total.get("value", 0))
+        return int(total or 0)
+
+    @classmethod
+    def _format_aggregations(cls, aggregations: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert raw aggregation buckets into plain counts.
+
+        Index names are folded into bucket names, so object and package
+        indices of the same bucket are counted together.
+        """
+        per_bucket: Dict[str, int] = {}
+        for entry in aggregations.get("buckets", {}).get("buckets", []):
+            name = cls.get_bucket_from_index(str(entry.get("key", "")))
+            per_bucket[name] = per_bucket.get(name, 0) + int(entry.get("doc_count", 0))
+
+        per_extension: Dict[str, int] = {}
+        for entry in aggregations.get("extensions", {}).get("buckets", []):
+            key = str(entry.get("key", ""))
+            per_extension[key] = per_extension.get(key, 0) + int(entry.get("doc_count", 0))
+
+        counts = {
+            str(entry.get("key")): int(entry.get("doc_count", 0))
+            for entry in aggregations.get("size_histogram", {}).get("buckets", [])
+        }
+        size_histogram = [
+            {**size_range, "count": counts.get(size_range["key"], 0)} for size_range in SIZE_HISTOGRAM_RANGES
+        ]
+
+        return {
+            "buckets": dict(sorted(per_bucket.items(), key=lambda item: item[1], reverse=True)),
+            "extensions": dict(sorted(per_extension.items(), key=lambda item: item[1], reverse=True)),
+            "size_histogram": size_histogram,
+        }
+
+    @classmethod
+    def _merge_count_responses(cls, responses: List[Dict[str, Any]], limit: int) -> Dict[str, Any]:
+        """Merge shard count responses: totals and aggregation buckets are summed."""
+        total = sum(cls._total_hits(response) for response in responses)
+        merged_aggs: Dict[str, Dict[Any, Dict[str, Any]]] = {}
+        for response in responses:
+            for name, aggregation in response.get("aggregations", {}).items():
+                merged = merged_aggs.setdefault(name, {})
+                for entry in aggregation.get("buckets", []):
+                    key = entry.get("key")
+                    if key in merged:
+                        merged[key]["doc_count"] += int(entry.get("doc_count", 0))
+                    else:
+                        merged[key] = {**entry, "doc_count": int(entry.get("doc_count", 0))}
+
+        return {
+            "hits": {"total": {"value": total, "relation": "eq"}, "hits": []},
+            "aggregations": {name: {"buckets": list(entries.values())} for name, entries in merged_aggs.items()},
+        }
+
+    @staticmethod
+    def _merge_top_hits(responses: List[Dict[str, Any]], limit: int) -> Dict[str, Any]:
+        """Merge shard search responses into a global top-K by score."""
+        hits = (hit for response in responses for hit in response.get("hits", {}).get("hits", []))
+        return {"hits": {"hits": heapq.nlargest(limit, hits, key=lambda hit: hit.get("_score") or 0.0)}}
+
+    async def _search_all_buckets(
+        self,
+        dsl_query: Dict[str, Any],
+        scope: str,
+        index_pattern: str,
+        limit: int,
+        merge: Optional[Callable[[List[Dict[str, Any]], int], Dict[str, Any]]] = None,
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Search every available bucket, fanning out when one request cannot cover them.
+
+        The full pattern is tried first unless this catalog is already known to
+        reject patterns that large. A 403 on a multi-bucket pattern (too many
+        indices) switches to a fan-out over bucket shards that fit the limit.
+
+        Returns:
+            Tuple of (search API response, shard report or None if not sharded)
+        """
+        limits = get_index_pattern_limits()
+        catalog = await asyncio.to_thread(self._catalog_key)
+        pattern_buckets = self._pattern_bucket_count(index_pattern)
+        available_buckets = await asyncio.to_thread(self._get_available_buckets)
+
+        if 0 < pattern_buckets < len(available_buckets):
+            # The pattern was capped at the size this catalog last accepted.
+            return await self._fan_out_search(dsl_query, scope, available_buckets, limit, pattern_buckets, merge=merge)
+
+        try:
+            response = await self._aexecute_search_api(dsl_query, index_pattern, limit)
+        except Exception as search_error:
+            # 403 on a multi-bucket pattern likely means too many indices
+            shard_size = next((size for size in SHARD_SIZES if size < pattern_buckets), None)
+            if "403" not in str(search_error) or "," not in index_pattern or shard_size is None:
+                raise
+            limits.record_rejected(catalog, pattern_buckets)
+            logger.info(
+                f"Got 403 error with {len(index_pattern.split(','))} indices, fanning out in shards of {shard_size}"
+            )
+            buckets = available_buckets or list(
+                dict.fromkeys(self.get_bucket_from_index(index) for index in index_pattern.split(","))
+            )
+            return await self._fan_out_search(dsl_query, scope, buckets, limit, shard_size, merge=merge)
+
+        limits.record_accepted(catalog, pattern_buckets)
+        return response, None
+
+    async def _fan_out_search(
+        self,
+        dsl_query: Dict[str, Any],
+        scope: str,
+        buckets: List[str],
+        limit: int,
+        shard_size: int,
+        merge: Optional[Callable[[List[Dict[str, Any]], int], Dict[str, Any]]] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Query bucket shards concurrently and merge their responses.
+
+        By default hits are merged into a global top-K by score; each shard
+        asks for ``limit`` hits so the merged top-K is exact. Shards
+        rejected with a 403 are split at the next smaller size and retried;
+        shards that time out or fail are reported rather than dropped silently.
+
+        Args:
+            dsl_query: Elasticsearch query DSL
+            scope: Search scope used to build each shard's index pattern
+            buckets: Every bucket to search
+            limit: Number of hits to return
+            shard_size: Initial number of buckets per shard
+            merge: Combines successful shard responses (default: top-K hits)
+
+        Returns:
+            Tuple of (merged search API response, shard report)
+
+        Raises:
+            Exception: If no shard succeeded
+        """
+        limits = get_index_pattern_limits()
+        catalog = await asyncio.to_thread(self._catalog_key)
+        concurrency = max(1, int(os.getenv("QUILT_SEARCH_FANOUT_CONCURRENCY", str(DEFAULT_FANOUT_CONCURRENCY))))
+        timeout = float(os.getenv("QUILT_SEARCH_SHARD_TIMEOUT", str(DEFAULT_SHARD_TIMEOUT_SECONDS)))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_shard(shard: List[str]) -> Dict[str, Any]:
+            pattern = self.build_index_pattern_for_scope(scope, shard)
+            async with semaphore:
+                return await asyncio.wait_for(self._aexecute_search_api(dsl_query, pattern, limit), timeout=timeout)
+
+        def split(shard_buckets: List[str], size: int) -> List[List[str]]:
+            return [shard_buckets[i : i + size] for i in range(0, len(shard_buckets), size)]
+
+        report: Dict[str, Any] = {"total": 0, "succeeded": 0, "timed_out": [], "failed": []}
+        responses: List[Dict[str, Any]] = []
+        first_error: Optional[BaseException] = None
+        pending = split(buckets, shard_size)
+
+        while pending:
+            outcomes = await asyncio.gather(*(run_shard(shard) for shard in pending), return_exceptions=True)
+            retry: List[List[str]] = []
+            for shard, outcome in zip(pending, outcomes, strict=True):
+                if isinstance(outcome, TimeoutError):
+                    report["total"] += 1
+                    report["timed_out"].append({"buckets": shard})
+                elif isinstance(outcome, BaseException):
+                    smaller = next((size for size in SHARD_SIZES if size < len(shard)), None)
+                    if "403" in str(outcome) and smaller is not None:
+                        limits.record_rejected(catalog, len(shard))
+                        retry.extend(split(shard, smaller))
+                        continue
+                    report["total"] += 1
+                    report["failed"].append({"buckets": shard, "error": str(outcome)})
+                    first_error = first_error or outcome
+                elif "error" in outcome:
+                    report["total"] += 1
+                    report["failed"].append({"buckets": shard, "error": str(outcome["error"])})
+                    first_error = first_error or Exception(str(outcome["error"]))
+                else:
+                    report["total"] += 1
+                    report["succeeded"] += 1
+                    limits.record_accepted(catalog, len(shard))
+                    responses.append(outcome)
+            pending = retry
+
+        if report["succeeded"] == 0:
+            if first_error is not None:
+                raise first_error
+            raise TimeoutError(f"All {report['total']} search shards timed out")
+
+        if report["timed_out"] or report["failed"]:
+            logger.warning(
+                "Search fan-out incomplete: %d/%d shards succeeded (%d timed out, %d failed)",
+                report["succeeded"],
+                report["total"],
+                len(report["timed_out"]),
+                len(report["failed"]),
             )
 
+        return (merge or self._merge_top_hits)(responses, limit), report
+
     def _normalize_results(self, hits: List[Dict[str, Any]], scope: str) -> List[SearchResult]:
         """Normalize Elasticsearch results to standard format using scope handler.
 
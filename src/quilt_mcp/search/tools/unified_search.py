@@ -4,12 +4,17 @@ This is the main user-facing search interface that provides natural language
 query processing and intelligent backend selection.
 """
 
+import os
+import threading
 import time
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 
 from ..core.query_parser import parse_query
-from ..backends.base import BackendRegistry, BackendType, BackendStatus
+from ..backends.base import BackendRegistry, BackendType, BackendStatus, SearchBackend
 from ..backends.elasticsearch import Quilt3ElasticsearchBackend
+from ..utils.backend_status import BackendStatusSnapshot
+from ..utils.identity import search_identity
 from ..exceptions import (
     AuthenticationRequired,
     SearchNotAvailable,
@@ -22,6 +27,7 @@ class UnifiedSearchEngine:
     def __init__(self):
         self.registry = BackendRegistry()
         self._initialize_backends()
+        self.status_snapshot = BackendStatusSnapshot(self.registry)
 
     def _initialize_backends(self):
         """Initialize and register all available backends."""
@@ -62,59 +68,11 @@ class UnifiedSearchEngine:
         combined_filters = analysis.filters
 
         # Determine which backend to use
-        if backend is None or backend == "auto":
-            selected_backend = self.registry._select_primary_backend()
-        else:
-            selected_backend = self.registry.get_backend_by_name(backend)
+        selected_backend = await self._select_backend(backend)
 
         # Check if we have a backend available
         if selected_backend is None:
-            # Get backend statuses for detailed error message
-            backend_statuses = self.registry.get_backend_statuses()
-
-            # Check if this is authentication failure or no backends available
-            all_backends = list(self.registry._backends.values())
-            has_auth_error = any(hasattr(b, "_auth_error") for b in all_backends)
-
-            if has_auth_error:
-                # Authentication required
-                auth_exception = AuthenticationRequired()
-                error_response = auth_exception.to_response()
-                error_response.update(
-                    {
-                        "query": query,
-                        "scope": scope,
-                        "bucket": bucket,
-                        "results": [],
-                        "total_results": 0,
-                        "query_time_ms": (time.time() - start_time) * 1000,
-                        "backend_used": None,
-                        "backend_status": backend_statuses,
-                    }
-                )
-                return error_response
-            else:
-                # No backends available (authenticated but search not available)
-                search_not_available = SearchNotAvailable(
-                    authenticated=True,
-                    catalog_url=None,
-                    cause="No search backends available",
-                    backend_statuses=backend_statuses,
-                )
-                error_response = search_not_available.to_response()
-                error_response.update(
-                    {
-                        "query": query,
-                        "scope": scope,
-                        "bucket": bucket,
-                        "results": [],
-                        "total_results": 0,
-                        "query_time_ms": (time.time() - start_time) * 1000,
-                        "backend_used": None,
-                        "backend_status": backend_statuses,
-                    }
-                )
-                return error_response
+            return self._no_backend_response(query, scope, bucket, start_time)
 
         # Execute search on selected backend
         backend_response = await selected_backend.search(query, scope, bucket, combined_filters, limit)
@@ -133,7 +91,7 @@ class UnifiedSearchEngine:
         # Determine success based on backend response
         overall_success = backend_response.status == BackendStatus.AVAILABLE
 
-        response = {
+        response: Dict[str, Any] = {
             "success": overall_success,
             "query": query,
             "scope": scope,
@@ -170,14 +128,133 @@ class UnifiedSearchEngine:
             "result_count": len(backend_response.results),
             "error": backend_response.error_message,
         }
+        if backend_response.shards:
+            response["backend_status"]["shards"] = backend_response.shards
+
+        # Add comprehensive backend status for debugging (cached snapshot)
+        response["backend_info"] = self.status_snapshot.get()
+
+        return response
+
+    async def count(
+        self,
+        query: str,
+        scope: str = "global",
+        bucket: str = "",
+        backend: Optional[str] = None,
+        include_aggregations: bool = False,
+    ) -> Dict[str, Any]:
+        """Count matching documents without fetching result payloads.
+
+        Args:
+            query: Natural language search query
+            scope: Search scope (global, package, file)
+            bucket: S3 bucket to search in (empty = all buckets)
+            backend: Preferred backend (auto, elasticsearch)
+            include_aggregations: Include per-bucket, per-extension and size
+                histogram counts from the same request
+
+        Returns:
+            Dictionary with ``total_count`` (index hit count) and, when
+            requested, ``aggregations``
+        """
+        start_time = time.time()
+        analysis = parse_query(query, scope, bucket)
 
-        # Add comprehensive backend status for debugging
-        from ..utils import get_search_backend_status
+        selected_backend = await self._select_backend(backend)
+        if selected_backend is None:
+            return self._no_backend_response(query, scope, bucket, start_time)
 
-        response["backend_info"] = get_search_backend_status()
+        backend_response = await selected_backend.count(
+            query, scope, bucket, analysis.filters, include_aggregations=include_aggregations
+        )
+        success = backend_response.status == BackendStatus.AVAILABLE
 
+        response: Dict[str, Any] = {
+            "success": success,
+            "query": query,
+            "scope": scope,
+            "bucket": bucket,
+            "count_only": True,
+            "total_count": (backend_response.total or 0) if success else 0,
+            "query_time_ms": (time.time() - start_time) * 1000,
+            "backend_used": backend_response.backend_type.value if success else None,
+        }
+        if include_aggregations and backend_response.aggregations is not None:
+            response["aggregations"] = backend_response.aggregations
+        if backend_response.shards:
+            response["shards"] = backend_response.shards
+        if not success:
+            response["error"] = backend_response.error_message or "Backend query failed"
         return response
 
+    async def _select_backend(self, backend: Optional[str]) -> Optional[SearchBackend]:
+        """Pick the backend for a request, re-checking unavailable backends once."""
+        if backend is None or backend == "auto":
+            selected_backend = self.registry._select_primary_backend()
+        else:
+            selected_backend = self.registry.get_backend_by_name(backend)
+
+        needs_recheck = selected_backend is None or selected_backend.status != BackendStatus.AVAILABLE
+        if needs_recheck and self.registry._backends:
+            # The engine is long-lived: backends may have recovered since they were
+            # initialized (e.g. the user logged in), so re-check before using them.
+            await self.status_snapshot.recheck()
+            if backend is None or backend == "auto":
+                selected_backend = self.registry._select_primary_backend()
+            else:
+                selected_backend = self.registry.get_backend_by_name(backend)
+        return selected_backend
+
+    def _no_backend_response(self, query: str, scope: str, bucket: str, start_time: float) -> Dict[str, Any]:
+        """Build the error response returned when no backend can serve a request."""
+        # Get backend statuses for detailed error message
+        backend_statuses = self.registry.get_backend_statuses()
+
+        # Check if this is authentication failure or no backends available
+        all_backends = list(self.registry._backends.values())
+        has_auth_error = any(getattr(b, "_auth_error", None) is not None for b in all_backends)
+
+        if has_auth_error:
+            # Authentication required
+            auth_exception = AuthenticationRequired()
+            error_response = auth_exception.to_response()
+            error_response.update(
+                {
+                    "query": query,
+                    "scope": scope,
+                    "bucket": bucket,
+                    "results": [],
+                    "total_results": 0,
+                    "query_time_ms": (time.time() - start_time) * 1000,
+                    "backend_used": None,
+                    "backend_status": backend_statuses,
+                }
+            )
+            return error_response
+        else:
+            # No backends available (authenticated but search not available)
+            search_not_available = SearchNotAvailable(
+                authenticated=True,
+                catalog_url=None,
+                cause="No search backends available",
+                backend_statuses=backend_statuses,
+            )
+            error_response = search_not_available.to_response()
+            error_response.update(
+                {
+                    "query": query,
+                    "scope": scope,
+                    "bucket": bucket,
+                    "results": [],
+                    "total_results": 0,
+                    "query_time_ms": (time.time() - start_time) * 1000,
+                    "backend_used": None,
+                    "backend_status": backend_statuses,
+                }
+            )
+            return error_response
+
     def _process_backend_results(self, backend_response, limit: int) -> List[Dict[str, Any]]:
         """Process results from a single backend response.
 
@@ -305,6 +382,70 @@ class UnifiedSearchEngine:
         }
 
 
+DEFAULT_ENGINE_CACHE_SIZE = 64
+DEFAULT_ENGINE_IDLE_TTL_SECONDS = 1800
+
+_engines: "OrderedDict[str, Tuple[UnifiedSearchEngine, float]]" = OrderedDict()
+_engine_inflight: Dict[str, threading.Lock] = {}
+_engines_lock = threading.Lock()
+
+
+def get_search_engine() -> UnifiedSearchEngine:
+    """Return the long-lived search engine for the current identity.
+
+    Engines keep their backends, QuiltOps instance and HTTP sessions warm
+    across calls. At most ``QUILT_SEARCH_ENGINE_CACHE_SIZE`` engines are kept
+    (least recently used first out), and engines idle for longer than
+    ``QUILT_SEARCH_ENGINE_IDLE_TTL`` seconds are rebuilt.
+    """
+    key = search_identity()
+    idle_ttl = float(os.getenv("QUILT_SEARCH_ENGINE_IDLE_TTL", str(DEFAULT_ENGINE_IDLE_TTL_SECONDS)))
+
+    def lookup(now: float) -> Optional[UnifiedSearchEngine]:
+        entry = _engines.get(key)
+        if entry is None:
+            return None
+        engine, last_used = entry
+        if now - last_used > idle_ttl:
+            del _engines[key]
+            return None
+        _engines[key] = (engine, now)
+        _engines.move_to_end(key)
+        return engine
+
+    with _engines_lock:
+        engine = lookup(time.time())
+        if engine is not None:
+            return engine
+        flight = _engine_inflight.setdefault(key, threading.Lock())
+
+    with flight:
+        with _engines_lock:
+            engine = lookup(time.time())
+            if engine is not None:
+                return engine
+        try:
+            engine = UnifiedSearchEngine()
+        finally:
+            with _engines_lock:
+                if _engine_inflight.get(key) is flight:
+                    del _engine_inflight[key]
+
+        max_entries = max(1, int(os.getenv("QUILT_SEARCH_ENGINE_CACHE_SIZE", str(DEFAULT_ENGINE_CACHE_SIZE))))
+        with _engines_lock:
+            _engines[key] = (engine, time.time())
+            _engines.move_to_end(key)
+            while len(_engines) > max_entries:
+                _engines.popitem(last=False)
+        return engine
+
+
+def reset_search_engines() -> None:
+    """Discard all cached search engines (primarily for tests)."""
+    with _engines_lock:
+        _engines.clear()
+
+
 # Note: UnifiedSearchEngine is exported for use by search.py
 # The unified_search() wrapper function has been removed - search.py now
-# calls UnifiedSearchEngine.search() directly
+# calls get_search_engine().search() directly
@@ -1,8 +1,15 @@
 """Search utilities."""
 
-from .backend_status import get_search_backend_status, get_backend_capabilities
+from .backend_status import (
+    BackendStatusSnapshot,
+    build_backend_status,
+    get_search_backend_status,
+    get_backend_capabilities,
+)
 
 __all__ = [
+    "BackendStatusSnapshot",
+    "build_backend_status",
     "get_search_backend_status",
     "get_backend_capabilities",
 ]
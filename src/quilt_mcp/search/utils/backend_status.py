@@ -5,8 +5,21 @@ reports on search backend availability, capabilities, and status for
 integration into catalog_info resources and search_catalog responses.
 """
 
-from typing import Dict, List, Any, Optional
-from ..backends.base import BackendType, BackendStatus, SearchBackend
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
+
+from ..backends.base import BackendType, BackendStatus
+
+if TYPE_CHECKING:
+    from ..backends.base import BackendRegistry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATUS_TTL_SECONDS = 60
 
 
 def get_backend_capabilities(backend_type: BackendType) -> List[str]:
@@ -31,51 +44,16 @@ def get_backend_capabilities(backend_type: BackendType) -> List[str]:
     return capabilities_map.get(backend_type, [])
 
 
-def get_search_backend_status() -> Dict[str, Any]:
-    """Get comprehensive status of all search backends.
+def build_backend_status(registry: "BackendRegistry") -> Dict[str, Any]:
+    """Build the status report for the backends registered in ``registry``.
 
-    This function checks all registered search backends and returns their
-    availability, capabilities, and status. It's used for:
-    1. catalog_info resource - discovery
-    2. search_catalog responses - debugging
+    Args:
+        registry: Backend registry of a search engine
 
     Returns:
-        Dict with the following structure:
-        {
-            "available": bool,  # True if elasticsearch is available
-            "backend": str,     # Primary backend name ("elasticsearch")
-            "capabilities": List[str],  # Capabilities of primary backend
-            "status": str,      # Overall status ("ready", "unavailable", "error")
-            "backends": {       # Detailed status per backend
-                "elasticsearch": {
-                    "available": bool,
-                    "status": str,
-                    "capabilities": List[str],
-                    "error": Optional[str]
-                }
-            }
-        }
-
-    Example:
-        ```python
-        from quilt_mcp.search.utils.backend_status import get_search_backend_status
-
-        status = get_search_backend_status()
-        if status["available"]:
-            print(f"Search ready using {status['backend']}")
-            print(f"Capabilities: {', '.join(status['capabilities'])}")
-        else:
-            print(f"Search unavailable: {status['status']}")
-        ```
+        Status dictionary in the shape documented on get_search_backend_status()
     """
     try:
-        # Import here to avoid circular dependency
-        from ..tools.unified_search import UnifiedSearchEngine
-
-        # Get the search engine and its registry
-        engine = UnifiedSearchEngine()
-        registry = engine.registry
-
         # Ensure all backends are initialized before checking status
         for backend_type in [BackendType.ELASTICSEARCH]:
             backend = registry.get_backend(backend_type)
@@ -125,7 +103,7 @@ def get_search_backend_status() -> Dict[str, Any]:
 
             # Check if it's an auth error or just unavailable
             has_auth_error = any(
-                backend and hasattr(backend, "_auth_error")
+                backend and getattr(backend, "_auth_error", None) is not None
                 for backend in [
                     registry.get_backend(BackendType.ELASTICSEARCH),
                 ]
@@ -142,25 +120,143 @@ def get_search_backend_status() -> Dict[str, Any]:
         }
 
     except Exception as e:
-        # Fallback error response
-        return {
-            "available": False,
-            "backend": None,
-            "capabilities": [],
-            "status": "error",
-            "error": f"Failed to get backend status: {e}",
-            "backends": {
-                "elasticsearch": {
-                    "available": False,
-                    "status": "error",
-                    "capabilities": [],
-                    "error": str(e),
-                },
+        return _error_status(e)
+
+
+def _error_status(error: Exception) -> Dict[str, Any]:
+    """Fallback status report used when the status check itself fails."""
+    return {
+        "available": False,
+        "backend": None,
+        "capabilities": [],
+        "status": "error",
+        "error": f"Failed to get backend status: {error}",
+        "backends": {
+            "elasticsearch": {
+                "available": False,
+                "status": "error",
+                "capabilities": [],
+                "error": str(error),
             },
+        },
+    }
+
+
+class BackendStatusSnapshot:
+    """Cached backend status report for one search engine.
+
+    The first call builds the report synchronously. Afterwards callers always
+    get the cached report immediately; once it is older than the TTL a single
+    background thread re-checks backend health and replaces it.
+
+    Args:
+        registry: Backend registry of the owning search engine
+        ttl_seconds: Snapshot lifetime (default: ``QUILT_SEARCH_STATUS_TTL`` or 60s)
+    """
+
+    def __init__(self, registry: "BackendRegistry", *, ttl_seconds: Optional[float] = None) -> None:
+        self._registry = registry
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("QUILT_SEARCH_STATUS_TTL", str(DEFAULT_STATUS_TTL_SECONDS)))
+        self._ttl = max(0.0, float(ttl_seconds))
+        self._value: Optional[Dict[str, Any]] = None
+        self._updated_at = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    @property
+    def updated_at(self) -> float:
+        """POSIX timestamp of the last refresh (0 if never built)."""
+        return self._updated_at
+
+    def get(self) -> Dict[str, Any]:
+        """Return the cached report, scheduling a background refresh when stale."""
+        with self._lock:
+            value = self._value
+            stale = time.time() - self._updated_at >= self._ttl
+            start_refresh = value is not None and stale and not self._refreshing
+            if start_refresh:
+                self._refreshing = True
+
+        if value is None:
+            return self.refresh()
+        if start_refresh:
+            threading.Thread(target=self._refresh_in_background, name="search-status-refresh", daemon=True).start()
+        return value
+
+    def refresh(self) -> Dict[str, Any]:
+        """Rebuild the report from the backends' current state."""
+        value = build_backend_status(self._registry)
+        with self._lock:
+            self._value = value
+            self._updated_at = time.time()
+        return value
+
+    async def recheck(self) -> Dict[str, Any]:
+        """Re-run backend health checks, then rebuild the report."""
+        await self._registry.health_check_all()
+        return self.refresh()
+
+    def _refresh_in_background(self) -> None:
+        try:
+            asyncio.run(self.recheck())
+        except Exception as e:
+            logger.debug("Background search status refresh failed: %s", e)
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+
+def get_search_backend_status() -> Dict[str, Any]:
+    """Get comprehensive status of all search backends.
+
+    This function reports the availability, capabilities, and status of the
+    search backends of the current identity's search engine. The report is
+    served from the engine's cached health snapshot. It's used for:
+    1. catalog_info resource - discovery
+    2. search_catalog responses - debugging
+
+    Returns:
+        Dict with the following structure:
+        {
+            "available": bool,  # True if elasticsearch is available
+            "backend": str,     # Primary backend name ("elasticsearch")
+            "capabilities": List[str],  # Capabilities of primary backend
+            "status": str,      # Overall status ("ready", "unavailable", "error")
+            "backends": {       # Detailed status per backend
+                "elasticsearch": {
+                    "available": bool,
+                    "status": str,
+                    "capabilities": List[str],
+                    "error": Optional[str]
+                }
+            }
         }
 
+    Example:
+        ```python
+        from quilt_mcp.search.utils.backend_status import get_search_backend_status
+
+        status = get_search_backend_status()
+        if status["available"]:
+            print(f"Search ready using {status['backend']}")
+            print(f"Capabilities: {', '.join(status['capabilities'])}")
+        else:
+            print(f"Search unavailable: {status['status']}")
+        ```
+    """
+    try:
+        # Import here to avoid circular dependency
+        from ..tools.unified_search import get_search_engine
+
+        return get_search_engine().status_snapshot.get()
+    except Exception as e:
+        return _error_status(e)
+
 
 __all__ = [
+    "BackendStatusSnapshot",
+    "build_backend_status",
     "get_search_backend_status",
     "get_backend_capabilities",
 ]
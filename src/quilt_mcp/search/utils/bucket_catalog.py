@@ -0,0 +1,256 @@
+"""Process-wide caches backing unscoped (all-bucket) Elasticsearch searches.
+
+Searching without a bucket needs the catalog's bucket list to build an
+explicit index pattern. The list changes rarely, so it is cached per
+(identity, catalog) with stale-while-revalidate semantics: fresh entries are
+served directly, stale entries are served while one background thread
+refreshes them, and only missing or expired entries block on a fetch.
+
+The catalog's search API rejects index patterns that are too large with a
+403. ``IndexPatternLimits`` remembers, per catalog, the largest bucket count
+the server accepted after such a rejection so later searches start from a
+working size instead of rediscovering it.
+"""
+
+import contextvars
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKET_TTL_SECONDS = 300
+DEFAULT_BUCKET_MAX_STALE_SECONDS = 3600
+DEFAULT_MAX_ENTRIES = 256
+
+CatalogKey = Tuple[str, str]
+
+
+@dataclass
+class _BucketEntry:
+    buckets: List[str]
+    fetched_at: float
+
+
+class BucketCatalogCache:
+    """TTL cache of bucket names with stale-while-revalidate refresh.
+
+    Args:
+        ttl_seconds: Age after which an entry is refreshed in the background
+        max_stale_seconds: Age after which an entry is no longer served at all
+        max_entries: Maximum number of (identity, catalog) entries kept
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_BUCKET_TTL_SECONDS,
+        max_stale_seconds: float = DEFAULT_BUCKET_MAX_STALE_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._ttl = max(0.0, float(ttl_seconds))
+        self._max_stale = max(self._ttl, float(max_stale_seconds))
+        self._max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[CatalogKey, _BucketEntry] = OrderedDict()
+        self._inflight: Dict[CatalogKey, threading.Lock] = {}
+        self._refreshing: Set[CatalogKey] = set()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+
+    def get(self, key: CatalogKey, fetch: Callable[[], List[str]]) -> List[str]:
+        """Return the bucket list for ``key``, fetching or refreshing as needed.
+
+        Empty results are returned but not cached, since the fetchers report
+        failures as an empty list.
+        """
+        start_refresh = False
+        with self._lock:
+            entry = self._entries.get(key)
+            age = time.time() - entry.fetched_at if entry else None
+            if entry is not None and age is not None and age < self._max_stale:
+                self._entries.move_to_end(key)
+                if age < self._ttl:
+                    self._hits += 1
+                    return list(entry.buckets)
+                self._stale_hits += 1
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    start_refresh = True
+                buckets = list(entry.buckets)
+            else:
+                buckets = None
+                flight = self._inflight.setdefault(key, threading.Lock())
+
+        if buckets is not None:
+            if start_refresh:
+                context = contextvars.copy_context()
+                threading.Thread(
+                    target=context.run,
+                    args=(self._refresh, key, fetch),
+                    name="search-bucket-refresh",
+                    daemon=True,
+                ).start()
+            return buckets
+
+        with flight:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and time.time() - entry.fetched_at < self._ttl:
+                    self._hits += 1
+                    return list(entry.buckets)
+                self._misses += 1
+            try:
+                buckets = fetch()
+            finally:
+                with self._lock:
+                    if self._inflight.get(key) is flight:
+                        del self._inflight[key]
+            self._store(key, buckets)
+            return list(buckets)
+
+    def invalidate(self, key: Optional[CatalogKey] = None) -> None:
+        """Drop one entry, or every entry when ``key`` is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+            }
+
+    def _refresh(self, key: CatalogKey, fetch: Callable[[], List[str]]) -> None:
+        try:
+            self._store(key, fetch())
+        except Exception as e:
+            logger.debug("Background bucket list refresh failed: %s", e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _store(self, key: CatalogKey, buckets: List[str]) -> None:
+        if not buckets:
+            return
+        with self._lock:
+            self._entries[key] = _BucketEntry(buckets=list(buckets), fetched_at=time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+@dataclass
+class _PatternLimit:
+    max_accepted: int = 0
+    min_rejected: Optional[int] = None
+
+
+class IndexPatternLimits:
+    """Largest accepted / smallest rejected index-pattern size per catalog.
+
+    Sizes are measured in buckets, matching how the retry ladder shrinks the
+    pattern.
+    """
+
+    def __init__(self) -> None:
+        self._limits: Dict[str, _PatternLimit] = {}
+        self._lock = threading.Lock()
+
+    def start_size(self, catalog: str, bucket_count: int) -> int:
+        """Return how many buckets to search first out of ``bucket_count``."""
+        with self._lock:
+            limit = self._limits.get(catalog)
+            if limit is None or limit.min_rejected is None or bucket_count < limit.min_rejected:
+                return bucket_count
+            if limit.max_accepted:
+                return min(bucket_count, limit.max_accepted)
+            return bucket_count
+
+    def max_accepted(self, catalog: str) -> int:
+        """Return the largest bucket count the catalog accepted (0 if unknown)."""
+        with self._lock:
+            limit = self._limits.get(catalog)
+            return limit.max_accepted if limit else 0
+
+    def record_accepted(self, catalog: str, bucket_count: int) -> None:
+        """Remember that a pattern covering ``bucket_count`` buckets worked."""
+        with self._lock:
+            limit = self._limits.setdefault(catalog, _PatternLimit())
+            limit.max_accepted = max(limit.max_accepted, bucket_count)
+            if limit.min_rejected is not None and bucket_count >= limit.min_rejected:
+                # The server's limit went up; forget the old rejection.
+                limit.min_rejected = None
+
+    def record_rejected(self, catalog: str, bucket_count: int) -> None:
+        """Remember that a pattern covering ``bucket_count`` buckets was rejected."""
+        with self._lock:
+            limit = self._limits.setdefault(catalog, _PatternLimit())
+            if limit.min_rejected is None or bucket_count < limit.min_rejected:
+                limit.min_rejected = bucket_count
+            if limit.max_accepted >= bucket_count:
+                limit.max_accepted = 0
+
+    def clear(self) -> None:
+        """Forget every remembered limit."""
+        with self._lock:
+            self._limits.clear()
+
+
+_bucket_cache: Optional[BucketCatalogCache] = None
+_pattern_limits: Optional[IndexPatternLimits] = None
+_singleton_lock = threading.Lock()
+
+
+def get_bucket_catalog_cache() -> BucketCatalogCache:
+    """Return the process-wide bucket list cache, creating it on first use."""
+    global _bucket_cache
+    if _bucket_cache is None:
+        with _singleton_lock:
+            if _bucket_cache is None:
+                _bucket_cache = BucketCatalogCache(
+                    ttl_seconds=float(os.getenv("QUILT_SEARCH_BUCKET_CACHE_TTL", str(DEFAULT_BUCKET_TTL_SECONDS))),
+                    max_stale_seconds=float(
+                        os.getenv("QUILT_SEARCH_BUCKET_CACHE_MAX_STALE", str(DEFAULT_BUCKET_MAX_STALE_SECONDS))
+                    ),
+                )
+    return _bucket_cache
+
+
+def get_index_pattern_limits() -> IndexPatternLimits:
+    """Return the process-wide index-pattern limits, creating them on first use."""
+    global _pattern_limits
+    if _pattern_limits is None:
+        with _singleton_lock:
+            if _pattern_limits is None:
+                _pattern_limits = IndexPatternLimits()
+    return _pattern_limits
+
+
+def reset_bucket_catalog() -> None:
+    """Discard the bucket list cache and remembered limits (primarily for tests)."""
+    global _bucket_cache, _pattern_limits
+    with _singleton_lock:
+        _bucket_cache = None
+        _pattern_limits = None
+
+
+__all__ = [
+    "BucketCatalogCache",
+    "IndexPatternLimits",
+    "get_bucket_catalog_cache",
+    "get_index_pattern_limits",
+    "reset_bucket_catalog",
+]
@@ -0,0 +1,23 @@
+"""Identity keys for process-wide search caches."""
+
+import hashlib
+import os
+
+
+def search_identity() -> str:
+    """Return the key identifying whose credentials a search runs with.
+
+    Requests carrying a JWT are keyed per (registry, token); everything else
+    (local quilt3 sessions) shares the ``"local"`` identity. Raw tokens are
+    never used as keys.
+    """
+    from ...context.runtime_context import get_runtime_access_token
+
+    token = get_runtime_access_token()
+    if not token:
+        return "local"
+    material = f"{os.getenv('QUILT_REGISTRY_URL', '')}\0{token}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+__all__ = ["search_identity"]
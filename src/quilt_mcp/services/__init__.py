@@ -1,10 +1,22 @@
 """Service layer package for Quilt MCP.
 
 Modules should be imported directly (e.g., ``quilt_mcp.services.auth_service``)
-to avoid importing optional dependencies at package import time.
+to avoid importing optional dependencies at package import time. The classes
+below are resolved lazily for the same reason.
 """
 
-from .athena_service import AthenaQueryService
-from .permission_discovery import AWSPermissionDiscovery
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "AthenaQueryService": "quilt_mcp.services.athena_service",
+    "AWSPermissionDiscovery": "quilt_mcp.services.permission_discovery",
+}
 
 __all__ = ["AthenaQueryService", "AWSPermissionDiscovery"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'quilt_mcp.services' has no attribute '{name}'")
+    return getattr(import_module(_EXPORTS[name]), name)
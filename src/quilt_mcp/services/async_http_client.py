@@ -0,0 +1,187 @@
+"""Process-wide asyncio HTTP client for catalog GraphQL and search requests.
+
+Search and GraphQL calls used to run synchronous ``requests`` calls through
+``asyncio.to_thread``, so concurrent searches were capped by the default
+executor's thread count and each call held a thread while waiting on the
+network. This module shares one ``httpx.AsyncClient`` (per event loop) with
+bounded connection limits and keep-alive, and HTTP/2 when the optional ``h2``
+package is installed.
+
+Synchronous tools run their coroutines on one long-lived background event
+loop (``run_sync``) rather than a fresh ``asyncio.run`` loop per call, so the
+client's pooled connections survive between tool calls. The caller's
+``contextvars`` (runtime auth context) are carried into the coroutine.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import os
+import threading
+import weakref
+from typing import Any, Coroutine, Dict, Optional, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+DEFAULT_TIMEOUT_SECONDS = 60.0
+
+T = TypeVar("T")
+
+
+def http2_available() -> bool:
+    """Return True if the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class AsyncHTTPClientRegistry:
+    """Shares ``httpx.AsyncClient`` instances per event loop and owns a background loop.
+
+    Args:
+        max_connections: Maximum concurrent connections per client
+        max_keepalive_connections: Idle connections kept open for reuse
+        keepalive_expiry: Seconds an idle connection is kept
+        http2: Negotiate HTTP/2 (defaults to whether ``h2`` is installed)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+        http2: Optional[bool] = None,
+    ) -> None:
+        self._limits = httpx.Limits(
+            max_connections=max(1, int(max_connections)),
+            max_keepalive_connections=max(0, int(max_keepalive_connections)),
+            keepalive_expiry=max(0.0, float(keepalive_expiry)),
+        )
+        self._http2 = http2_available() if http2 is None else http2
+        # httpx clients are bound to the loop that opened their connections.
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._created = 0
+
+    def client(self) -> httpx.AsyncClient:
+        """Return the shared client for the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    limits=self._limits,
+                    http2=self._http2,
+                    timeout=DEFAULT_TIMEOUT_SECONDS,
+                )
+                self._clients[loop] = client
+                self._created += 1
+            return client
+
+    def run_sync(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Run ``coro`` on the background loop and wait for its result.
+
+        Must not be called from the background loop itself. The loop is shared
+        by every caller, so ``coro`` must not block it: blocking work (auth,
+        session checks, sync HTTP) belongs in ``asyncio.to_thread``.
+
+        Raises:
+            TimeoutError: If ``timeout`` elapses (the coroutine is cancelled)
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._background_loop())
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def close(self) -> None:
+        """Close the background loop's client and stop the loop (best effort)."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+            client = self._clients.pop(loop, None) if loop is not None else None
+        if loop is None:
+            return
+        if client is not None and not client.is_closed:
+            try:
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=5)
+            except Exception as exc:
+                logger.debug(f"Closing background HTTP client failed: {exc}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        if not loop.is_running():
+            loop.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return configuration and client counts."""
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "created": self._created,
+                "http2": self._http2,
+                "max_connections": self._limits.max_connections,
+                "max_keepalive_connections": self._limits.max_keepalive_connections,
+                "background_loop": self._loop is not None,
+            }
+
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="quilt-async-http", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+
+_registry: Optional[AsyncHTTPClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_async_http_registry() -> AsyncHTTPClientRegistry:
+    """Return the process-wide async HTTP client registry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = AsyncHTTPClientRegistry(
+                    max_connections=int(os.getenv("QUILT_HTTP_MAX_CONNECTIONS", str(DEFAULT_MAX_CONNECTIONS))),
+                    max_keepalive_connections=int(
+                        os.getenv("QUILT_HTTP_MAX_KEEPALIVE_CONNECTIONS", str(DEFAULT_MAX_KEEPALIVE_CONNECTIONS))
+                    ),
+                    keepalive_expiry=float(
+                        os.getenv("QUILT_HTTP_KEEPALIVE_EXPIRY", str(DEFAULT_KEEPALIVE_EXPIRY_SECONDS))
+                    ),
+                )
+    return _registry
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Return the shared ``httpx.AsyncClient`` for the running event loop."""
+    return get_async_http_registry().client()
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """Run ``coro`` on the shared background event loop from synchronous code."""
+    return get_async_http_registry().run_sync(coro, timeout=timeout)
+
+
+def reset_async_http_registry() -> None:
+    """Close and discard the process-wide registry (primarily for tests)."""
+    global _registry
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is not None:
+        registry.close()
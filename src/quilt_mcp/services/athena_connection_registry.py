@@ -0,0 +1,253 @@
+"""Shared registry of Athena connections and SQLAlchemy engines.
+
+``AthenaQueryService`` is built per tool call, and every query used to open a
+fresh PyAthena connection (a new boto3 session and client) or SQLAlchemy
+engine. The registry keeps one connection or engine per (kind, region,
+workgroup, catalog, schema, credential identity) tuple and hands it to every
+service instance that asks for the same tuple. Entries are disposed when their
+credentials expire, when they go idle, or when the LRU bound is exceeded.
+
+PyAthena connections are stateless wrappers around a thread-safe boto3
+client, so one connection can serve concurrent cursors.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from quilt_mcp.services.credential_store import get_credential_store
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_IDLE_TTL_SECONDS = 1800
+# Stop handing out connections shortly before their credentials expire.
+EXPIRY_SKEW_SECONDS = 60
+
+ConnectionKey = Tuple[str, str, str, str, Optional[str], str]
+
+
+@dataclass
+class _Entry:
+    resource: Any
+    expires_at: Optional[float]
+    last_used: float
+
+
+def athena_credential_identity(credentials: Any) -> str:
+    """Return a stable, non-reversible identity for botocore-style credentials."""
+    if credentials is None:
+        return "default"
+    if hasattr(credentials, "get_frozen_credentials"):
+        credentials = credentials.get_frozen_credentials()
+    material = f"{credentials.access_key}\0{credentials.secret_key}\0{getattr(credentials, 'token', None) or ''}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def credential_expiry(credentials: Any) -> Optional[float]:
+    """Return the POSIX expiry the credential store recorded for these credentials, if any.
+
+    JWT-exchanged credentials are static to botocore, so their ``Expiration``
+    is only known to the credential store. Refreshable credentials need no
+    expiry here: ``get_frozen_credentials()`` rotates their keys, which changes
+    the registry key, so the stale entry idles out unused.
+    """
+    if credentials is None:
+        return None
+    if hasattr(credentials, "get_frozen_credentials"):
+        credentials = credentials.get_frozen_credentials()
+    access_key = getattr(credentials, "access_key", None)
+    if not access_key:
+        return None
+    return get_credential_store().expiration_for(access_key)
+
+
+def _dispose(resource: Any) -> None:
+    try:
+        if hasattr(resource, "dispose"):
+            resource.dispose()
+        elif hasattr(resource, "close"):
+            resource.close()
+    except Exception as e:
+        logger.debug("Failed to dispose Athena connection: %s", e)
+
+
+class AthenaConnectionRegistry:
+    """Thread-safe LRU registry of PyAthena connections and SQLAlchemy engines."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        idle_ttl_seconds: float = DEFAULT_IDLE_TTL_SECONDS,
+    ) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._idle_ttl = float(idle_ttl_seconds)
+        self._entries: OrderedDict[ConnectionKey, _Entry] = OrderedDict()
+        self._inflight: Dict[ConnectionKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(
+        self,
+        kind: str,
+        *,
+        region: str,
+        workgroup: str,
+        catalog: str,
+        schema: Optional[str],
+        credentials: Any,
+        factory: Callable[[], Any],
+        expires_at: Optional[float] = None,
+    ) -> Any:
+        """Return a shared connection or engine, creating it with ``factory`` on a miss.
+
+        Args:
+            kind: Resource kind, e.g. ``"connection"`` or ``"engine"``
+            region: AWS region of the Athena endpoint
+            workgroup: Athena workgroup queries run in
+            catalog: Data catalog name
+            schema: Default database, or None for the catalog default
+            credentials: botocore credentials the resource authenticates with
+                (None when the default credential chain is used)
+            factory: Callable building the resource on a miss
+            expires_at: POSIX expiry of ``credentials``; looked up with
+                ``credential_expiry`` when omitted
+
+        Returns:
+            The cached (or newly created) connection or engine
+        """
+        key: ConnectionKey = (kind, region, workgroup, catalog, schema, athena_credential_identity(credentials))
+
+        with self._lock:
+            resource, disposed = self._lookup(key, time.time())
+            if resource is not None:
+                self._hits += 1
+        self._dispose_all(disposed)
+        if resource is not None:
+            return resource
+
+        with self._lock:
+            flight = self._inflight.setdefault(key, threading.Lock())
+
+        with flight:
+            with self._lock:
+                resource, disposed = self._lookup(key, time.time())
+                if resource is None:
+                    self._misses += 1
+                else:
+                    self._hits += 1
+            self._dispose_all(disposed)
+            if resource is not None:
+                return resource
+
+            try:
+                resource = factory()
+            finally:
+                with self._lock:
+                    if self._inflight.get(key) is flight:
+                        del self._inflight[key]
+
+            now = time.time()
+            if expires_at is None:
+                expires_at = credential_expiry(credentials)
+            entry = _Entry(resource=resource, expires_at=expires_at, last_used=now)
+            if self._is_stale(entry, now):
+                # Credentials are about to expire; serve this call without caching.
+                return resource
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                disposed = self._evict_locked(now)
+            self._dispose_all(disposed)
+            return resource
+
+    def clear(self) -> None:
+        """Dispose every cached resource and reset counters."""
+        with self._lock:
+            disposed = [entry.resource for entry in self._entries.values()]
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+        self._dispose_all(disposed)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+            }
+
+    def _lookup(self, key: ConnectionKey, now: float) -> Tuple[Optional[Any], List[Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None, []
+        if self._is_stale(entry, now):
+            del self._entries[key]
+            self._evictions += 1
+            return None, [entry.resource]
+        entry.last_used = now
+        self._entries.move_to_end(key)
+        return entry.resource, []
+
+    def _is_stale(self, entry: _Entry, now: float) -> bool:
+        if entry.expires_at is not None and entry.expires_at - EXPIRY_SKEW_SECONDS <= now:
+            return True
+        return now - entry.last_used > self._idle_ttl
+
+    def _evict_locked(self, now: float) -> List[Any]:
+        disposed = []
+        for key in [k for k, entry in self._entries.items() if self._is_stale(entry, now)]:
+            disposed.append(self._entries.pop(key).resource)
+            self._evictions += 1
+        while len(self._entries) > self._max_entries:
+            _, entry = self._entries.popitem(last=False)
+            disposed.append(entry.resource)
+            self._evictions += 1
+        return disposed
+
+    @staticmethod
+    def _dispose_all(resources: List[Any]) -> None:
+        # Disposal may close sockets, so it runs outside the registry lock.
+        for resource in resources:
+            _dispose(resource)
+
+
+_registry: Optional[AthenaConnectionRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_athena_connection_registry() -> AthenaConnectionRegistry:
+    """Return the process-wide Athena connection registry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = AthenaConnectionRegistry(
+                    max_entries=int(os.getenv("QUILT_ATHENA_CONNECTION_CACHE_SIZE", str(DEFAULT_MAX_ENTRIES))),
+                    idle_ttl_seconds=float(
+                        os.getenv("QUILT_ATHENA_CONNECTION_IDLE_TTL", str(DEFAULT_IDLE_TTL_SECONDS))
+                    ),
+                )
+    return _registry
+
+
+def reset_athena_connection_registry() -> None:
+    """Dispose and discard the process-wide registry (primarily for tests)."""
+    global _registry
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is not None:
+        registry.clear()
@@ -386,6 +386,13 @@ def athena_query_execute(
             description="Output format for results",
         ),
     ] = "json",
+    use_cache: Annotated[
+        bool,
+        Field(
+            default=True,
+            description="Reuse results of an identical recent read-only query instead of re-running it",
+        ),
+    ] = True,
     service: Annotated[
         Optional[Any],
         Field(
@@ -409,6 +416,7 @@ def athena_query_execute(
         data_catalog_name: Data catalog to use (default: AwsDataCatalog)
         max_results: Maximum number of results to return
         output_format: Output format (json, csv, parquet, table)
+        use_cache: Serve repeated read-only queries from the result cache (set False to force a fresh run)
         service: Optional pre-configured AthenaQueryService for dependency injection/testing.
 
     Returns:
@@ -454,7 +462,7 @@ def athena_query_execute(
                 workgroup_name=workgroup_name,
                 data_catalog_name=data_catalog_name,
             )
-        result = service.execute_query(query, database_name, max_results)
+        result = service.execute_query(query, database_name, max_results, use_cache=use_cache)
 
         if not result.get("success"):
             return result
@@ -0,0 +1,214 @@
+"""Process-wide cache of Athena query results.
+
+Agents often re-run the same ``SHOW TABLES``, ``DESCRIBE`` or exploratory
+``SELECT`` several times in one conversation, and every run costs seconds of
+latency and Athena scan charges. This cache keeps the (row-limited) result of
+read-only statements keyed by credential identity, workgroup, catalog,
+database and normalized SQL, bounded by a byte budget and a TTL.
+
+Only statements that cannot modify data are cached. Results are stored with
+the row limit they were fetched with; a later request is served from the
+cache when the stored rows are complete or cover its own limit.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 300
+DEFAULT_REUSE_MINUTES = 0
+
+CACHEABLE_STATEMENTS = frozenset({"SELECT", "WITH", "SHOW", "DESCRIBE", "EXPLAIN", "VALUES"})
+
+ResultKey = Tuple[str, str, str, str, str]
+
+# Quoted literals/identifiers, line comments, block comments, or runs of whitespace.
+_SQL_TOKEN = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/|\s+", re.DOTALL)
+
+
+def normalize_sql(query: str) -> str:
+    """Collapse whitespace and drop comments and trailing semicolons outside quoted text."""
+    parts: List[str] = []
+    position = 0
+    for match in _SQL_TOKEN.finditer(query):
+        if match.start() > position:
+            parts.append(query[position : match.start()])
+        token = match.group(0)
+        if token[0] in "'\"":
+            parts.append(token)
+        elif not parts or not parts[-1].endswith(" "):
+            parts.append(" ")
+        position = match.end()
+    parts.append(query[position:])
+    return "".join(parts).strip().rstrip(";").strip()
+
+
+def is_cacheable_query(normalized_query: str) -> bool:
+    """Return True for read-only statements whose results may be reused."""
+    match = re.match(r"\(*\s*(\w+)", normalized_query)
+    return match is not None and match.group(1).upper() in CACHEABLE_STATEMENTS
+
+
+def result_size(result: Dict[str, Any]) -> int:
+    """Estimate the memory held by a query result, in bytes."""
+    data = result.get("data")
+    size = len(str(result.get("query", "")))
+    if data is not None and hasattr(data, "memory_usage"):
+        size += int(data.memory_usage(index=True, deep=True).sum())
+    return size
+
+
+@dataclass
+class _Entry:
+    result: Dict[str, Any]
+    max_results: int
+    size: int
+    stored_at: float
+
+
+class AthenaResultCache:
+    """Byte-bounded LRU of Athena query results with a TTL.
+
+    Args:
+        max_bytes: Total size budget for cached results; 0 disables the cache
+        ttl_seconds: Age after which a result is no longer served
+    """
+
+    def __init__(self, *, max_bytes: int = DEFAULT_MAX_BYTES, ttl_seconds: float = DEFAULT_TTL_SECONDS) -> None:
+        self._max_bytes = max(0, int(max_bytes))
+        self._ttl = max(0.0, float(ttl_seconds))
+        self._entries: OrderedDict[ResultKey, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0 and self._ttl > 0
+
+    @staticmethod
+    def make_key(
+        query: str, *, database: Optional[str], catalog: str, workgroup: str, identity: str
+    ) -> Optional[ResultKey]:
+        """Return the cache key for a query, or None if the statement is not cacheable."""
+        normalized = normalize_sql(query)
+        if not is_cacheable_query(normalized):
+            return None
+        return (identity, workgroup, catalog, database or "", normalized)
+
+    def get(self, key: ResultKey, max_results: int) -> Optional[Dict[str, Any]]:
+        """Return a cached result limited to ``max_results`` rows, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() - entry.stored_at >= self._ttl:
+                self._remove_locked(key)
+                entry = None
+            if entry is None or (entry.result.get("truncated") and max_results > entry.max_results):
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return _limit_result(entry.result, max_results)
+
+    def put(self, key: ResultKey, result: Dict[str, Any], max_results: int) -> bool:
+        """Store a successful result fetched with ``max_results``; returns False if it was not cached."""
+        if not self.enabled or not result.get("success"):
+            return False
+        size = result_size(result)
+        if size > self._max_bytes:
+            logger.debug("Not caching Athena result of %d bytes (budget %d)", size, self._max_bytes)
+            return False
+        with self._lock:
+            self._remove_locked(key)
+            self._entries[key] = _Entry(result=result, max_results=max_results, size=size, stored_at=time.time())
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove_locked(oldest)
+                self._evictions += 1
+        return True
+
+    def clear(self) -> None:
+        """Drop every cached result and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+            }
+
+    def _remove_locked(self, key: ResultKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+
+def _limit_result(result: Dict[str, Any], max_results: int) -> Dict[str, Any]:
+    limited = dict(result)
+    limited["cached"] = True
+    data = result.get("data")
+    if data is None or len(data) <= max_results:
+        return limited
+    limited["data"] = data.head(max_results)
+    limited["row_count"] = max_results
+    limited["truncated"] = True
+    if not result.get("truncated"):
+        # The cached rows are the complete result, so their count is exact.
+        limited["total_rows"] = len(data)
+    elif not isinstance(result.get("total_rows"), int):
+        limited["total_rows"] = f"{max_results}+"
+    return limited
+
+
+def result_reuse_minutes() -> int:
+    """Return how long Athena may reuse a previous execution's results (0 disables reuse)."""
+    try:
+        return max(0, int(os.getenv("QUILT_ATHENA_RESULT_REUSE_MINUTES", str(DEFAULT_REUSE_MINUTES))))
+    except ValueError:
+        return DEFAULT_REUSE_MINUTES
+
+
+_cache: Optional[AthenaResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_athena_result_cache() -> AthenaResultCache:
+    """Return the process-wide result cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = AthenaResultCache(
+                    max_bytes=int(os.getenv("QUILT_ATHENA_RESULT_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES))),
+                    ttl_seconds=float(os.getenv("QUILT_ATHENA_RESULT_CACHE_TTL", str(DEFAULT_TTL_SECONDS))),
+                )
+    return _cache
+
+
+def reset_athena_result_cache() -> None:
+    """Discard the process-wide result cache (primarily for tests)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
@@ -1,8 +1,9 @@
 """
 Athena Query Service Implementation
 
-This module provides the core Athena service that uses SQLAlchemy with PyAthena
-to execute queries against AWS Athena and manage Glue Data Catalog metadata.
+This module provides the core Athena service that uses PyAthena (directly and
+through SQLAlchemy) to execute queries against AWS Athena and manage Glue Data
+Catalog metadata.
 """
 
 from __future__ import annotations
@@ -11,13 +12,11 @@ import os
 import logging
 from typing import Dict, List, Any, Optional, TYPE_CHECKING
 from cachetools import TTLCache
-import boto3
-import pandas as pd
-from sqlalchemy import create_engine, MetaData, inspect
-from sqlalchemy.engine import Engine
-from sqlalchemy.exc import SQLAlchemyError
 
+# pandas and SQLAlchemy are imported on first use: they dominate import time
+# and most server sessions never run an Athena query.
 if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
     from mypy_boto3_glue import GlueClient  # type: ignore[import-not-found]
     from mypy_boto3_s3 import S3Client  # type: ignore[import-not-found]
     from mypy_boto3_athena import AthenaClient  # type: ignore[import-not-found]
@@ -30,9 +29,36 @@ else:
 
 from ..utils.common import format_error_response, suppress_stdout
 from ..ops.factory import QuiltOpsFactory
+from .athena_connection_registry import athena_credential_identity, get_athena_connection_registry
+from .athena_result_cache import (
+    AthenaResultCache,
+    get_athena_result_cache,
+    is_cacheable_query,
+    normalize_sql,
+    result_reuse_minutes,
+)
+from .aws_client_registry import get_pooled_client
 
 logger = logging.getLogger(__name__)
 
+# Athena's GetQueryResults returns at most 1000 rows per page.
+MAX_FETCH_PAGE_SIZE = 1000
+# Recent executions PyAthena scans for a reusable QueryExecutionId.
+RESULT_REUSE_HISTORY_SIZE = 50
+
+
+def _is_sql_error(exc: Exception) -> bool:
+    """Return True for errors raised by the database rather than by the service."""
+    from sqlalchemy.exc import SQLAlchemyError
+
+    if isinstance(exc, SQLAlchemyError):
+        return True
+    try:
+        from pyathena.error import DatabaseError
+    except ImportError:
+        return False
+    return isinstance(exc, DatabaseError)
+
 
 class AthenaQueryService:
     """Core service for Athena query execution and Glue catalog operations."""
@@ -55,7 +81,6 @@ class AthenaQueryService:
         self.backend = backend or QuiltOpsFactory.create()
         self.workgroup_name = workgroup_name
         self.data_catalog_name = data_catalog_name or "AwsDataCatalog"
-        self.query_cache: TTLCache[str, Any] = TTLCache(maxsize=100, ttl=3600)  # 1 hour cache
 
         # Initialize clients
         self._glue_client: Optional[GlueClient] = None
@@ -111,8 +136,23 @@ class AthenaQueryService:
                 )
 
             self._base_connection_string = connection_string
-            logger.info(f"Creating Athena engine with workgroup: {workgroup}, catalog: {self.data_catalog_name}")
-            return create_engine(connection_string, echo=False)
+
+            def factory() -> Engine:
+                from sqlalchemy import create_engine
+
+                logger.info(f"Creating Athena engine with workgroup: {workgroup}, catalog: {self.data_catalog_name}")
+                return create_engine(connection_string, echo=False)
+
+            engine: Engine = get_athena_connection_registry().get(
+                "engine",
+                region=region,
+                workgroup=workgroup,
+                catalog=self.data_catalog_name,
+                schema=None,
+                credentials=credentials,
+                factory=factory,
+            )
+            return engine
 
         except Exception as e:
             logger.error(f"Failed to create SQLAlchemy engine: {e}")
@@ -178,14 +218,14 @@ class AthenaQueryService:
         try:
             return self.backend.get_aws_client("glue", region="us-east-1")
         except Exception:
-            return boto3.client("glue", region_name="us-east-1")
+            return get_pooled_client(None, "glue", "us-east-1")
 
     def _create_s3_client(self) -> S3Client:
         """Create S3 client for result management."""
         try:
             return self.backend.get_aws_client("s3")
         except Exception:
-            return boto3.client("s3")
+            return get_pooled_client(None, "s3")
 
     def _get_athena_credentials(self, region: str) -> Any | None:
         """Extract credentials from backend-provided Athena client."""
@@ -295,6 +335,45 @@ class AthenaQueryService:
             logger.error(f"Failed to discover tables: {e}")
             return format_error_response(f"Failed to discover tables: {str(e)}")
 
+    def _connect(self, schema_name: str | None = None) -> Any:
+        """Return a shared PyAthena DB-API connection for the service's workgroup and credentials.
+
+        Connections are pooled process-wide per region, workgroup, catalog,
+        schema and credential identity, so repeated calls skip building a new
+        boto3 session and client.
+        """
+        from pyathena import connect
+
+        # PyAthena will use the workgroup's output location if we don't specify s3_staging_dir
+        region = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
+        workgroup = self._get_workgroup(region)
+
+        connect_kwargs: Dict[str, Any] = {
+            "region_name": region,
+            "work_group": workgroup,
+            "catalog_name": self.data_catalog_name,
+        }
+        if schema_name:
+            connect_kwargs["schema_name"] = schema_name
+        credentials = self._get_athena_credentials(region=region)
+        if credentials:
+            connect_kwargs.update(
+                {
+                    "aws_access_key_id": credentials.access_key,
+                    "aws_secret_access_key": credentials.secret_key,
+                    "aws_session_token": credentials.token,
+                }
+            )
+        return get_athena_connection_registry().get(
+            "connection",
+            region=region,
+            workgroup=workgroup,
+            catalog=self.data_catalog_name,
+            schema=schema_name,
+            credentials=credentials,
+            factory=lambda: connect(**connect_kwargs),
+        )
+
     def get_table_metadata(
         self, database_name: str, table_name: str, data_catalog_name: str = "AwsDataCatalog"
     ) -> Dict[str, Any]:
@@ -304,30 +383,7 @@ class AthenaQueryService:
         tab-separated values in a single column which pandas cannot parse correctly.
         """
         try:
-            from pyathena import connect
-
-            # Determine S3 staging location
-            # PyAthena will use the workgroup's output location if we don't specify s3_staging_dir
-            region = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
-            workgroup = self._get_workgroup(region)
-
-            # Create PyAthena connection
-            # Note: We rely on workgroup configuration for S3 output location
-            connect_kwargs: Dict[str, Any] = {
-                "region_name": region,
-                "schema_name": database_name,
-                "work_group": workgroup,
-            }
-            credentials = self._get_athena_credentials(region=region)
-            if credentials:
-                connect_kwargs.update(
-                    {
-                        "aws_access_key_id": credentials.access_key,
-                        "aws_secret_access_key": credentials.secret_key,
-                        "aws_session_token": credentials.token,
-                    }
-                )
-            cursor = connect(**connect_kwargs).cursor()
+            cursor = self._connect(database_name).cursor()
 
             # Execute DESCRIBE - use backticks for table names with special characters
             query = f'DESCRIBE `{table_name}`'
@@ -390,52 +446,140 @@ class AthenaQueryService:
             logger.error(f"Failed to get table metadata: {e}")
             return format_error_response(f"Failed to get table metadata: {str(e)}")
 
-    def execute_query(self, query: str, database_name: str | None = None, max_results: int = 1000) -> Dict[str, Any]:
-        """Execute query using SQLAlchemy with PyAthena and return results as DataFrame."""
+    def execute_query(
+        self,
+        query: str,
+        database_name: str | None = None,
+        max_results: int = 1000,
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
+        """Execute query with a PyAthena cursor, reading at most ``max_results`` rows.
+
+        Read-only statements are served from the process-wide result cache
+        when the same SQL ran recently against the same database, catalog and
+        workgroup with the same credentials; cached results carry
+        ``"cached": True``. Pass ``use_cache=False`` to always run the query.
+        """
+        cache = get_athena_result_cache()
+        cache_key = self._result_cache_key(query, database_name) if use_cache and cache.enabled else None
+        if cache_key is not None:
+            cached = cache.get(cache_key, max_results)
+            if cached is not None:
+                return cached
+
+        result = self._run_query(query, database_name, max_results, allow_reuse=use_cache)
+        if cache_key is not None:
+            cache.put(cache_key, result, max_results)
+        return result
+
+    def _result_cache_key(self, query: str, database_name: str | None) -> Any:
+        """Return the result cache key for ``query``, or None if it must not be cached."""
         try:
-            # Determine which engine to use
-            # If database_name is provided, create engine with schema_name in connection string
-            # This avoids the USE statement which doesn't work with quoted identifiers in Athena
-            if database_name:
-                from urllib.parse import quote_plus
-
-                # Ensure the base engine is created (triggers lazy initialization)
-                _ = self.engine
-                # Use stored base connection string and add schema_name
-                connection_string = f"{self._base_connection_string}&schema_name={quote_plus(database_name)}"
-                engine_to_use = create_engine(connection_string, echo=False)
-            else:
-                engine_to_use = self.engine
+            region = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
+            return AthenaResultCache.make_key(
+                query,
+                database=database_name,
+                catalog=self.data_catalog_name,
+                workgroup=self._get_workgroup(region),
+                identity=athena_credential_identity(self._get_athena_credentials(region=region)),
+            )
+        except Exception as e:
+            logger.debug(f"Not caching Athena query result: {e}")
+            return None
+
+    def _result_reuse_kwargs(self, query: str) -> Dict[str, Any]:
+        """Return PyAthena execute options that reuse a recent identical execution, if enabled."""
+        minutes = result_reuse_minutes()
+        if not minutes or not is_cacheable_query(normalize_sql(query)):
+            return {}
+        return {
+            # Look up a recent succeeded execution of the same SQL and read its stored results
+            "cache_size": RESULT_REUSE_HISTORY_SIZE,
+            "cache_expiration_time": minutes * 60,
+            # Athena engine v3 result reuse for queries that still reach StartQueryExecution
+            "result_reuse_enable": True,
+            "result_reuse_minutes": minutes,
+        }
+
+    def _run_query(
+        self, query: str, database_name: str | None, max_results: int, *, allow_reuse: bool = True
+    ) -> Dict[str, Any]:
+        """Run ``query`` on Athena, streaming at most ``max_results`` rows.
+
+        Result pages are fetched with ``fetchmany`` and reading stops once one
+        row past the limit has been seen, so memory is bounded by
+        ``max_results`` rather than by the size of the result set. When the
+        result is truncated, the true row count is taken from the query's
+        runtime statistics if Athena reports them.
+        """
+        cursor = None
+        try:
+            # schema_name on the connection avoids the USE statement, which
+            # doesn't work with quoted identifiers in Athena
+            cursor = self._connect(database_name).cursor()
+            cursor.arraysize = min(max_results + 1, MAX_FETCH_PAGE_SIZE)
 
-            # Execute query and load results into pandas DataFrame
             # Sanitize query to prevent string formatting issues
             safe_query = self._sanitize_query_for_pandas(query)
             with suppress_stdout():
-                df = pd.read_sql_query(safe_query, engine_to_use)
-
-            # Apply result limit
-            truncated = False
-            if len(df) > max_results:
-                df = df.head(max_results)
-                truncated = True
+                cursor.execute(safe_query, **(self._result_reuse_kwargs(query) if allow_reuse else {}))
+                columns = [column[0] for column in cursor.description or []]
+                rows: List[Any] = []
+                while len(rows) <= max_results:
+                    page = cursor.fetchmany(cursor.arraysize)
+                    if not page:
+                        break
+                    rows.extend(page)
+
+            truncated = len(rows) > max_results
+            del rows[max_results:]
+            import pandas as pd
+
+            df = pd.DataFrame.from_records(rows, columns=columns)
+
+            total_rows: int | str = len(df)
+            if truncated:
+                output_rows = self._get_output_row_count(getattr(cursor, "query_id", None))
+                total_rows = output_rows if output_rows is not None else f"{max_results}+"
 
             return {
                 "success": True,
                 "data": df,
                 "row_count": len(df),
-                "total_rows": len(df) if not truncated else f"{max_results}+",
+                "total_rows": total_rows,
                 "truncated": truncated,
                 "columns": list(df.columns),
                 "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
                 "query": query,
+                "query_execution_id": getattr(cursor, "query_id", None),
             }
 
-        except SQLAlchemyError as e:
-            logger.error(f"SQL execution error: {e}")
-            return format_error_response(f"SQL execution error: {str(e)}")
         except Exception as e:
+            if _is_sql_error(e):
+                logger.error(f"SQL execution error: {e}")
+                return format_error_response(f"SQL execution error: {str(e)}")
             logger.error(f"Failed to execute query: {e}")
             return format_error_response(f"Query execution failed: {str(e)}")
+        finally:
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+
+    def _get_output_row_count(self, query_execution_id: str | None) -> int | None:
+        """Return the total number of rows a finished query produced, if Athena reports it."""
+        if not query_execution_id:
+            return None
+        try:
+            region = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
+            athena_client = self.backend.get_aws_client("athena", region=region)
+            response = athena_client.get_query_runtime_statistics(QueryExecutionId=query_execution_id)
+            output_rows = response.get("QueryRuntimeStatistics", {}).get("Rows", {}).get("OutputRows")
+            return int(output_rows) if output_rows is not None else None
+        except Exception as e:
+            logger.debug(f"Could not read runtime statistics for {query_execution_id}: {e}")
+            return None
 
     def _sanitize_query_for_pandas(self, query: str) -> str:
         """Sanitize query to prevent string formatting issues with pandas/SQLAlchemy."""
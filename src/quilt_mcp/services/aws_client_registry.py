@@ -0,0 +1,262 @@
+"""Shared registry of boto3 clients keyed by credential identity.
+
+Building a boto3 client loads and parses the service model and allocates a new
+urllib3 connection pool, which costs tens of milliseconds per call. Tools used
+to pay that on every invocation. The registry hands out one client per
+(credentials, service, region) tuple and reuses it, together with its
+connection pool, until the credentials expire or the entry goes idle.
+
+boto3 clients are thread-safe; sessions are not, so client construction is
+serialized per key while lookups stay lock-light.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+import boto3
+
+from quilt_mcp.services.credential_store import parse_expiration
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_POOL_CONNECTIONS = 25
+DEFAULT_IDLE_TTL_SECONDS = 1800
+# Stop handing out clients shortly before their credentials expire.
+EXPIRY_SKEW_SECONDS = 60
+
+ClientKey = Tuple[str, str, Optional[str]]
+
+
+@dataclass
+class _Entry:
+    client: Any
+    expires_at: Optional[float]
+    last_used: float
+
+
+def credential_identity(session: boto3.Session) -> str:
+    """Return a stable, non-reversible identity for a session's credentials."""
+    credentials = session.get_credentials()
+    if credentials is None:
+        return "anonymous"
+    frozen = credentials.get_frozen_credentials()
+    material = f"{frozen.access_key}\0{frozen.secret_key}\0{frozen.token or ''}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _default_session() -> boto3.Session:
+    """Return boto3's default session, mirroring what ``boto3.client`` uses."""
+    if boto3.DEFAULT_SESSION is None:
+        boto3.setup_default_session()
+    return boto3.DEFAULT_SESSION
+
+
+class AWSClientRegistry:
+    """Thread-safe LRU registry of boto3 clients."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        idle_ttl_seconds: float = DEFAULT_IDLE_TTL_SECONDS,
+    ) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._max_pool_connections = max(1, int(max_pool_connections))
+        self._idle_ttl = float(idle_ttl_seconds)
+        self._entries: OrderedDict[ClientKey, _Entry] = OrderedDict()
+        self._inflight: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_pool_connections(self) -> int:
+        return self._max_pool_connections
+
+    def get_client(
+        self,
+        session: Optional[boto3.Session],
+        service_name: str,
+        region_name: Optional[str] = None,
+        *,
+        expires_at: Optional[float] = None,
+    ) -> Any:
+        """Return a shared client for ``session``'s credentials.
+
+        Args:
+            session: boto3 session providing credentials (default session if None)
+            service_name: AWS service name (e.g. 's3', 'athena')
+            region_name: Region override; falls back to the session region
+            expires_at: POSIX timestamp after which the credentials are invalid
+
+        Returns:
+            boto3 client, shared with other callers using the same credentials
+        """
+        if session is None:
+            session = _default_session()
+        if not isinstance(session, boto3.Session):
+            # Foreign session-like objects (tests, adapters) carry no identity we can key on.
+            if region_name is None:
+                return session.client(service_name)
+            return session.client(service_name, region_name=region_name)
+
+        region = region_name or session.region_name
+        key: ClientKey = (credential_identity(session), service_name, region)
+        return self._get_or_create(key, lambda: self._build(session, service_name, region), expires_at)
+
+    def get_client_for_credentials(
+        self,
+        credentials: Mapping[str, Any],
+        service_name: str,
+        region_name: Optional[str] = None,
+    ) -> Any:
+        """Return a shared client for AWS-style temporary credentials.
+
+        ``credentials`` uses the STS/``get_credentials`` shape (AccessKeyId,
+        SecretAccessKey, SessionToken, Expiration). The boto3 session is only
+        built when no client is cached yet.
+        """
+        access_key = credentials["AccessKeyId"]
+        secret_key = credentials["SecretAccessKey"]
+        token = credentials.get("SessionToken")
+        material = f"{access_key}\0{secret_key}\0{token or ''}"
+        identity = hashlib.sha256(material.encode("utf-8")).hexdigest()
+        region = region_name or os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION")
+        key: ClientKey = (identity, service_name, region)
+
+        def factory() -> Any:
+            session = boto3.Session(
+                aws_access_key_id=access_key,
+                aws_secret_access_key=secret_key,
+                aws_session_token=token,
+            )
+            return self._build(session, service_name, region)
+
+        return self._get_or_create(key, factory, parse_expiration(credentials.get("Expiration")))
+
+    def clear(self) -> None:
+        """Drop every cached client and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+                "max_pool_connections": self._max_pool_connections,
+            }
+
+    def _build(self, session: boto3.Session, service_name: str, region: Optional[str]) -> Any:
+        from botocore.config import Config
+
+        config = Config(max_pool_connections=self._max_pool_connections)
+        return session.client(service_name, region_name=region, config=config)
+
+    def _lookup(self, key: ClientKey, now: float) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._is_stale(entry, now):
+            del self._entries[key]
+            self._evictions += 1
+            return None
+        entry.last_used = now
+        self._entries.move_to_end(key)
+        return entry.client
+
+    def _is_stale(self, entry: _Entry, now: float) -> bool:
+        if entry.expires_at is not None and entry.expires_at - EXPIRY_SKEW_SECONDS <= now:
+            return True
+        return now - entry.last_used > self._idle_ttl
+
+    def _get_or_create(self, key: ClientKey, factory: Callable[[], Any], expires_at: Optional[float]) -> Any:
+        with self._lock:
+            client = self._lookup(key, time.time())
+            if client is not None:
+                self._hits += 1
+                return client
+            flight = self._inflight.setdefault(key, threading.Lock())
+
+        with flight:
+            with self._lock:
+                client = self._lookup(key, time.time())
+                if client is not None:
+                    self._hits += 1
+                    return client
+                self._misses += 1
+
+            try:
+                client = factory()
+            finally:
+                with self._lock:
+                    if self._inflight.get(key) is flight:
+                        del self._inflight[key]
+
+            now = time.time()
+            with self._lock:
+                self._entries[key] = _Entry(client=client, expires_at=expires_at, last_used=now)
+                self._entries.move_to_end(key)
+                self._evict_locked(now)
+            return client
+
+    def _evict_locked(self, now: float) -> None:
+        for key in [k for k, entry in self._entries.items() if self._is_stale(entry, now)]:
+            del self._entries[key]
+            self._evictions += 1
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+_registry: Optional[AWSClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> AWSClientRegistry:
+    """Return the process-wide client registry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = AWSClientRegistry(
+                    max_entries=int(os.getenv("QUILT_AWS_CLIENT_CACHE_SIZE", str(DEFAULT_MAX_ENTRIES))),
+                    max_pool_connections=int(
+                        os.getenv("QUILT_AWS_MAX_POOL_CONNECTIONS", str(DEFAULT_MAX_POOL_CONNECTIONS))
+                    ),
+                )
+    return _registry
+
+
+def reset_client_registry() -> None:
+    """Discard the process-wide registry (primarily for tests)."""
+    global _registry
+    with _registry_lock:
+        _registry = None
+
+
+def get_pooled_client(
+    session: Optional[boto3.Session],
+    service_name: str,
+    region_name: Optional[str] = None,
+    *,
+    expires_at: Optional[float] = None,
+) -> Any:
+    """Shortcut for ``get_client_registry().get_client(...)``."""
+    return get_client_registry().get_client(session, service_name, region_name, expires_at=expires_at)
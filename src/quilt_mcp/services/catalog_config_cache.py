@@ -0,0 +1,270 @@
+"""Process-wide cache of catalog ``config.json`` documents.
+
+``get_auth_status`` fetches ``<catalog>/config.json`` to enrich the auth
+status with region, registry and tabulator settings, and ``auth_status``,
+``catalog_info``, the ``auth://status`` resource and search backend status
+probes all go through it. The document changes only when a stack is
+redeployed, so this cache keeps the parsed config per URL for a TTL and then
+revalidates it with ``If-None-Match`` / ``If-Modified-Since``; an unchanged
+config costs a ``304`` without a body.
+
+``config.json`` is public (the catalog serves it to anonymous browsers), so
+entries are shared across identities. Callers may pass an authenticated
+session; otherwise one shared ``requests.Session`` keeps connections warm.
+If revalidation fails, the last good config is served for up to
+``max_stale_seconds`` past its TTL.
+
+With a shared cache (``QUILT_SHARED_CACHE_PATH``), validated configs are also
+written through to it, so other worker processes on the host reuse them (or
+their validators) instead of each fetching the document.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import requests
+
+from quilt_mcp.services.shared_cache import SharedCacheStore, get_shared_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300
+DEFAULT_MAX_STALE_SECONDS = 3600
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_TIMEOUT_SECONDS = 10
+SHARED_NAMESPACE = "catalog-config"
+
+
+@dataclass
+class _Entry:
+    config: Dict[str, Any]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    validated_at: float
+
+
+class CatalogConfigCache:
+    """Thread-safe TTL cache of parsed ``config.json`` documents with HTTP revalidation.
+
+    Args:
+        ttl_seconds: Age after which a cached config is revalidated; 0 disables caching
+        max_stale_seconds: How long past the TTL a config may be served when revalidation fails
+        max_entries: Maximum number of cached catalog URLs
+        shared: Optional store shared with other processes; read on a local miss, written on validation
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_stale_seconds: float = DEFAULT_MAX_STALE_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        shared: Optional[SharedCacheStore] = None,
+    ) -> None:
+        self._ttl = max(0.0, float(ttl_seconds))
+        self._max_stale = max(0.0, float(max_stale_seconds))
+        self._max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._shared = shared if self._ttl > 0 else None
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._stale_hits = 0
+        self._shared_hits = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def fetch(
+        self, config_url: str, *, session: Any = None, timeout: float = DEFAULT_TIMEOUT_SECONDS
+    ) -> Dict[str, Any]:
+        """Return the parsed config at ``config_url``, from cache when fresh.
+
+        The returned dict is shared between callers and must not be mutated.
+
+        Raises:
+            requests.exceptions.RequestException: If the config cannot be fetched and no
+                usable cached copy exists (HTTP errors come from ``raise_for_status``)
+        """
+        with self._lock:
+            entry = self._fresh_locked(config_url)
+            if entry is not None:
+                self._hits += 1
+                return entry.config
+            url_lock = self._url_locks.setdefault(config_url, threading.Lock())
+
+        # One request per URL at a time; concurrent callers reuse its result.
+        with url_lock:
+            with self._lock:
+                entry = self._fresh_locked(config_url)
+                if entry is not None:
+                    self._hits += 1
+                    return entry.config
+                entry = self._entries.get(config_url)
+            shared_entry = self._read_shared(config_url)
+            if shared_entry is not None and (entry is None or shared_entry.validated_at > entry.validated_at):
+                # Another process validated it more recently: adopt it, and its validators.
+                entry = shared_entry
+                with self._lock:
+                    self._install_locked(config_url, entry)
+                    if self._fresh_locked(config_url) is not None:
+                        self._shared_hits += 1
+                        return entry.config
+            return self._revalidate(config_url, entry, session, timeout)
+
+    def invalidate(self, config_url: Optional[str] = None) -> None:
+        """Forget one cached config (or all of them) so the next fetch goes to the network."""
+        with self._lock:
+            if config_url is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(config_url, None)
+
+    def clear(self) -> None:
+        """Drop every cached config and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._revalidations = self._stale_hits = self._shared_hits = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/revalidation counters and current size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "revalidations": self._revalidations,
+                "stale_hits": self._stale_hits,
+                "shared_hits": self._shared_hits,
+                "size": len(self._entries),
+            }
+
+    def _fresh_locked(self, config_url: str) -> Optional[_Entry]:
+        entry = self._entries.get(config_url)
+        if entry is None or not self.enabled or time.monotonic() - entry.validated_at >= self._ttl:
+            return None
+        self._entries.move_to_end(config_url)
+        return entry
+
+    def _revalidate(self, config_url: str, entry: Optional[_Entry], session: Any, timeout: float) -> Dict[str, Any]:
+        headers: Dict[str, str] = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        kwargs: Dict[str, Any] = {"timeout": timeout}
+        if headers:
+            kwargs["headers"] = headers
+
+        try:
+            response = (session or self._shared_session()).get(config_url, **kwargs)
+            if entry is not None and getattr(response, "status_code", None) == 304:
+                with self._lock:
+                    entry.validated_at = time.monotonic()
+                    self._revalidations += 1
+                self._write_shared(config_url, entry)
+                return entry.config
+            response.raise_for_status()
+            config: Dict[str, Any] = response.json()
+        except Exception as exc:
+            if entry is not None and time.monotonic() - entry.validated_at < self._ttl + self._max_stale:
+                logger.warning(f"Serving cached catalog config for {config_url} after refresh failed: {exc}")
+                with self._lock:
+                    self._stale_hits += 1
+                return entry.config
+            raise
+
+        response_headers = getattr(response, "headers", None) or {}
+        entry = _Entry(
+            config=config,
+            etag=response_headers.get("ETag"),
+            last_modified=response_headers.get("Last-Modified"),
+            validated_at=time.monotonic(),
+        )
+        with self._lock:
+            self._misses += 1
+            if self.enabled:
+                self._install_locked(config_url, entry)
+        self._write_shared(config_url, entry)
+        return config
+
+    def _install_locked(self, config_url: str, entry: _Entry) -> None:
+        self._entries[config_url] = entry
+        self._entries.move_to_end(config_url)
+        while len(self._entries) > self._max_entries:
+            evicted_url, _ = self._entries.popitem(last=False)
+            self._url_locks.pop(evicted_url, None)
+
+    def _read_shared(self, config_url: str) -> Optional[_Entry]:
+        if self._shared is None:
+            return None
+        stored = self._shared.get(SHARED_NAMESPACE, config_url)
+        if not isinstance(stored, dict):
+            return None
+        # Wall-clock validation time from the writer, mapped onto this process's monotonic clock.
+        age = max(0.0, time.time() - stored["validated_at"])
+        return _Entry(
+            config=stored["config"],
+            etag=stored["etag"],
+            last_modified=stored["last_modified"],
+            validated_at=time.monotonic() - age,
+        )
+
+    def _write_shared(self, config_url: str, entry: _Entry) -> None:
+        if self._shared is None:
+            return
+        validated_at = time.time() - (time.monotonic() - entry.validated_at)
+        self._shared.set(
+            SHARED_NAMESPACE,
+            config_url,
+            {
+                "config": entry.config,
+                "etag": entry.etag,
+                "last_modified": entry.last_modified,
+                "validated_at": validated_at,
+            },
+            expires_at=validated_at + self._ttl + self._max_stale,
+        )
+
+    def _shared_session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                self._session = requests.Session()
+            return self._session
+
+
+_cache: Optional[CatalogConfigCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_catalog_config_cache() -> CatalogConfigCache:
+    """Return the process-wide catalog config cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = CatalogConfigCache(
+                    ttl_seconds=float(os.getenv("QUILT_CATALOG_CONFIG_TTL", str(DEFAULT_TTL_SECONDS))),
+                    max_stale_seconds=float(
+                        os.getenv("QUILT_CATALOG_CONFIG_MAX_STALE", str(DEFAULT_MAX_STALE_SECONDS))
+                    ),
+                    shared=get_shared_cache(),
+                )
+    return _cache
+
+
+def reset_catalog_config_cache() -> None:
+    """Discard the process-wide catalog config cache (primarily for tests)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
@@ -0,0 +1,219 @@
+"""Process-wide cache of JWT-exchanged AWS credentials.
+
+``JWTAuthService`` instances are created per request, so credentials cached on
+the instance never outlive a single tool call. This store keeps exchanged
+credentials at process scope, keyed by a hash of the registry URL and token,
+so every request presenting the same JWT shares one credential exchange.
+Credentials are never written to the shared worker cache
+(``QUILT_SHARED_CACHE_PATH``): that would put secret keys on disk, and one
+exchange per identity per worker is cheap.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_REFRESH_BUFFER_SECONDS = 300
+
+CredentialFetcher = Callable[[str], Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class CachedCredentials:
+    """Credentials returned by a JWT exchange plus their absolute expiry."""
+
+    credentials: Dict[str, Any]
+    expires_at: float
+
+
+def parse_expiration(expiration: Any) -> Optional[float]:
+    """Convert an AWS ``Expiration`` value into a POSIX timestamp."""
+    if not expiration:
+        return None
+    if isinstance(expiration, datetime):
+        return expiration.timestamp()
+    if isinstance(expiration, (int, float)):
+        return float(expiration)
+    try:
+        return datetime.fromisoformat(str(expiration).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class JWTCredentialStore:
+    """Bounded LRU store of AWS credentials with single-flight refresh.
+
+    Entries are considered fresh until ``refresh_buffer_seconds`` before their
+    ``Expiration``; after that the next caller refreshes them proactively.
+    Concurrent callers for the same token wait on one in-flight exchange
+    instead of each hitting ``/api/auth/get_credentials``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        refresh_buffer_seconds: float = DEFAULT_REFRESH_BUFFER_SECONDS,
+    ) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._refresh_buffer = max(0.0, float(refresh_buffer_seconds))
+        self._entries: OrderedDict[str, CachedCredentials] = OrderedDict()
+        # Expiry of each cached access key, for consumers that only see the key (e.g. Athena connections).
+        self._expiry_by_access_key: Dict[str, float] = {}
+        self._inflight: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._evictions = 0
+
+    @staticmethod
+    def cache_key(access_token: str, registry_url: Optional[str] = None) -> str:
+        """Return the store key for a token; raw tokens are never kept as keys."""
+        material = f"{registry_url or ''}\0{access_token}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        access_token: str,
+        fetch: CredentialFetcher,
+        *,
+        registry_url: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Return cached credentials for ``access_token`` or fetch fresh ones.
+
+        Args:
+            access_token: JWT presented by the caller
+            fetch: Callable performing the actual exchange for a token
+            registry_url: Registry the credentials were issued by
+
+        Returns:
+            Dictionary with AWS credentials (AccessKeyId, SecretAccessKey,
+            SessionToken, Expiration)
+        """
+        key = self.cache_key(access_token, registry_url)
+
+        with self._lock:
+            cached = self._lookup_fresh(key)
+            if cached is not None:
+                self._hits += 1
+                return cached
+            flight = self._inflight.setdefault(key, threading.Lock())
+
+        with flight:
+            # Another caller may have completed the exchange while we waited.
+            with self._lock:
+                cached = self._lookup_fresh(key)
+                if cached is not None:
+                    self._hits += 1
+                    return cached
+                self._misses += 1
+                if key in self._entries:
+                    self._refreshes += 1
+
+            try:
+                credentials = fetch(access_token)
+            finally:
+                with self._lock:
+                    if self._inflight.get(key) is flight:
+                        del self._inflight[key]
+
+            self._store(key, credentials)
+            return credentials
+
+    def invalidate(self, access_token: str, *, registry_url: Optional[str] = None) -> None:
+        """Drop cached credentials for a token (e.g. after an auth failure)."""
+        key = self.cache_key(access_token, registry_url)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._expiry_by_access_key.pop(entry.credentials.get("AccessKeyId", ""), None)
+
+    def clear(self) -> None:
+        """Remove every cached entry and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._expiry_by_access_key.clear()
+            self._hits = self._misses = self._refreshes = self._evictions = 0
+
+    def expiration_for(self, access_key_id: str) -> Optional[float]:
+        """Return the POSIX expiry of cached credentials with ``access_key_id``, or None if unknown."""
+        with self._lock:
+            return self._expiry_by_access_key.get(access_key_id)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "refreshes": self._refreshes,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+            }
+
+    def _lookup_fresh(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at - time.time() <= self._refresh_buffer:
+            return None
+        self._entries.move_to_end(key)
+        return entry.credentials
+
+    def _store(self, key: str, credentials: Dict[str, Any]) -> None:
+        expires_at = parse_expiration(credentials.get("Expiration"))
+        if expires_at is None:
+            logger.debug("Not caching JWT credentials without a parseable Expiration")
+            return
+
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None:
+                self._expiry_by_access_key.pop(previous.credentials.get("AccessKeyId", ""), None)
+            self._entries[key] = CachedCredentials(credentials=credentials, expires_at=expires_at)
+            self._entries.move_to_end(key)
+            if credentials.get("AccessKeyId"):
+                self._expiry_by_access_key[credentials["AccessKeyId"]] = expires_at
+            while len(self._entries) > self._max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._expiry_by_access_key.pop(evicted.credentials.get("AccessKeyId", ""), None)
+                self._evictions += 1
+
+
+_store: Optional[JWTCredentialStore] = None
+_store_lock = threading.Lock()
+
+
+def get_credential_store() -> JWTCredentialStore:
+    """Return the process-wide credential store, creating it on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = JWTCredentialStore(
+                    max_entries=int(os.getenv("QUILT_CREDENTIAL_CACHE_SIZE", str(DEFAULT_MAX_ENTRIES))),
+                    refresh_buffer_seconds=float(
+                        os.getenv("QUILT_CREDENTIAL_REFRESH_BUFFER", str(DEFAULT_REFRESH_BUFFER_SECONDS))
+                    ),
+                )
+    return _store
+
+
+def reset_credential_store() -> None:
+    """Discard the process-wide store (primarily for tests)."""
+    global _store
+    with _store_lock:
+        _store = None
@@ -7,10 +7,21 @@ administration.
 
 These tools require administrative privileges in the Quilt catalog and provide
 secure access to governance capabilities.
+
+The tools are ``async`` but the ``QuiltOps.admin`` calls they make are
+blocking GraphQL requests, so each call runs on a small dedicated thread pool
+(``QUILT_ADMIN_MAX_WORKERS``) instead of on the event loop. Admin traffic is
+bounded by that pool and cannot starve the default executor used elsewhere.
 """
 
+import asyncio
+import contextvars
+import functools
 import logging
-from typing import Annotated, Dict, List, Any, Optional
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Callable, Dict, List, Any, Optional, TypeVar
 from pydantic import Field
 from ..utils.common import format_error_response
 from quilt_mcp.utils.formatting import format_users_as_table, format_roles_as_table
@@ -20,6 +31,10 @@ from ..context.request_context import RequestContext
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_ADMIN_MAX_WORKERS = 4
+
+T = TypeVar("T")
+
 # Check admin availability and import modules directly for backward compatibility
 try:
     import quilt3.admin.users
@@ -58,6 +73,40 @@ else:
     admin_tabulator = None
 
 
+_admin_executor: Optional[ThreadPoolExecutor] = None
+_admin_executor_lock = threading.Lock()
+
+
+def get_admin_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor for blocking admin calls, creating it on first use."""
+    global _admin_executor
+    if _admin_executor is None:
+        with _admin_executor_lock:
+            if _admin_executor is None:
+                max_workers = int(os.getenv("QUILT_ADMIN_MAX_WORKERS", str(DEFAULT_ADMIN_MAX_WORKERS)))
+                _admin_executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="quilt-admin")
+    return _admin_executor
+
+
+def reset_admin_executor() -> None:
+    """Shut down and discard the process-wide admin executor (primarily for tests)."""
+    global _admin_executor
+    with _admin_executor_lock:
+        executor, _admin_executor = _admin_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+async def _run_admin(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking admin call on the admin executor without blocking the event loop.
+
+    The caller's ``contextvars`` (runtime auth context) are carried into the worker thread.
+    """
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(get_admin_executor(), call)
+
+
 class GovernanceService:
     """Service for managing Quilt governance and administration."""
 
@@ -229,7 +278,7 @@ async def admin_users_list(*, quilt_ops: Optional[QuiltOps] = None, context: Req
 
         # Use QuiltOps.admin interface
         quilt_ops_instance = service._get_quilt_ops()
-        domain_users = quilt_ops_instance.admin.list_users()
+        domain_users = await _run_admin(quilt_ops_instance.admin.list_users)
 
         # Transform domain users to response format
         users_data = [service._transform_domain_user_to_response(user) for user in domain_users]
@@ -295,7 +344,7 @@ async def admin_user_get(
 
         # Use QuiltOps.admin interface
         quilt_ops_instance = service._get_quilt_ops()
-        domain_user = quilt_ops_instance.admin.get_user(name)
+        domain_user = await _run_admin(quilt_ops_instance.admin.get_user, name)
 
         user_data = service._transform_domain_user_to_detailed_response(domain_user)
 
@@ -390,8 +439,8 @@ async def admin_user_create(
 
         # Use QuiltOps.admin interface
         quilt_ops_instance = service._get_quilt_ops()
-        domain_user = quilt_ops_instance.admin.create_user(
-            name=name, email=email, role=role, extra_roles=extra_roles or []
+        domain_user = await _run_admin(
+            quilt_ops_instance.admin.create_user, name=name, email=email, role=role, extra_roles=extra_roles or []
         )
 
         user_data = service._transform_domain_user_to_response(domain_user)
@@ -451,7 +500,7 @@ async def admin_user_delete(
 
         # Use QuiltOps.admin interface
         quilt_ops_instance = service._get_quilt_ops()
-        quilt_ops_instance.admin.delete_user(name)
+        await _run_admin(quilt_ops_instance.admin.delete_user, name)
 
         return {"success": True, "message": f"Successfully deleted user '{name}'"}
 
@@ -519,7 +568,7 @@ async def admin_user_set_email(
 
         # Use QuiltOps.admin interface
         quilt_ops_instance = service._get_quilt_ops()
-        domain_user = quilt_ops_instance.admin.set_user_email(name, email)
+        domain_user = await _run_admin(quilt_ops_instance.admin.set_user_email, name, email)
 
         return {
             "success": True,
@@ -585,7 +634,7 @@ async def admin_user_set_admin(
 
         # Use QuiltOps.admin interface
         quilt_ops_instance = service._get_quilt_ops()
-        domain_user = quilt_ops_instance.admin.set_user_admin(name, admin)
+        domain_user = await _run_admin(quilt_ops_instance.admin.set_user_admin, name, admin)
 
         return {
             "success": True,
@@ -651,7 +700,7 @@ async def admin_user_set_active(
 
         # Use QuiltOps.admin interface
         quilt_ops_instance = service._get_quilt_ops()
-        domain_user = quilt_ops_instance.admin.set_user_active(name, active)
+        domain_user = await _run_admin(quilt_ops_instance.admin.set_user_active, name, active)
 
         return {
             "success": True,
@@ -708,7 +757,7 @@ async def admin_user_reset_password(
 
         # Use QuiltOps.admin interface
         quilt_ops_instance = service._get_quilt_ops()
-        quilt_ops_instance.admin.reset_user_password(name)
+        await _run_admin(quilt_ops_instance.admin.reset_user_password, name)
 
         return {
             "success": True,
@@ -792,8 +841,8 @@ async def admin_user_set_role(
 
         # Use QuiltOps.admin interface
         quilt_ops_instance = service._get_quilt_ops()
-        domain_user = quilt_ops_instance.admin.set_user_role(
-            name=name, role=role, extra_roles=extra_roles or [], append=append
+        domain_user = await _run_admin(
+            quilt_ops_instance.admin.set_user_role, name=name, role=role, extra_roles=extra_roles or [], append=append
         )
 
         return {
@@ -866,7 +915,7 @@ async def admin_user_add_roles(
 
         # Use QuiltOps.admin interface
         quilt_ops_instance = service._get_quilt_ops()
-        domain_user = quilt_ops_instance.admin.add_user_roles(name, roles)
+        domain_user = await _run_admin(quilt_ops_instance.admin.add_user_roles, name, roles)
 
         return {
             "success": True,
@@ -950,7 +999,7 @@ async def admin_user_remove_roles(
 
         # Use QuiltOps.admin interface
         quilt_ops_instance = service._get_quilt_ops()
-        domain_user = quilt_ops_instance.admin.remove_user_roles(name, roles, fallback)
+        domain_user = await _run_admin(quilt_ops_instance.admin.remove_user_roles, name, roles, fallback)
 
         return {
             "success": True,
@@ -1001,7 +1050,7 @@ async def admin_roles_list(*, quilt_ops: Optional[QuiltOps] = None, context: Req
 
         # Use QuiltOps.admin interface
         quilt_ops_instance = service._get_quilt_ops()
-        domain_roles = quilt_ops_instance.admin.list_roles()
+        domain_roles = await _run_admin(quilt_ops_instance.admin.list_roles)
 
         # Transform domain roles to response format
         roles_data = [service._transform_domain_role_to_response(role) for role in domain_roles]
@@ -1053,7 +1102,7 @@ async def admin_sso_config_get(*, quilt_ops: Optional[QuiltOps] = None, context:
 
         # Use QuiltOps.admin interface
         quilt_ops_instance = service._get_quilt_ops()
-        domain_sso_config = quilt_ops_instance.admin.get_sso_config()
+        domain_sso_config = await _run_admin(quilt_ops_instance.admin.get_sso_config)
 
         if domain_sso_config is None:
             return {
@@ -1122,7 +1171,7 @@ async def admin_sso_config_set(
 
         # Use QuiltOps.admin interface (backend handles JSON serialization)
         quilt_ops_instance = service._get_quilt_ops()
-        domain_sso_config = quilt_ops_instance.admin.set_sso_config(config)
+        domain_sso_config = await _run_admin(quilt_ops_instance.admin.set_sso_config, config)
 
         config_data = service._transform_domain_sso_config_to_response(domain_sso_config)
 
@@ -1165,7 +1214,7 @@ async def admin_sso_config_remove(*, quilt_ops: Optional[QuiltOps] = None, conte
         # Use QuiltOps.admin interface
         # Note: quilt3 uses set_sso_config(None) to remove config, there is no separate remove method
         quilt_ops_instance = service._get_quilt_ops()
-        quilt_ops_instance.admin.set_sso_config(None)
+        await _run_admin(quilt_ops_instance.admin.set_sso_config, None)
 
         return {"success": True, "message": "Successfully removed SSO configuration"}
 
@@ -1205,7 +1254,7 @@ async def admin_tabulator_open_query_get(
             return error_check
 
         quilt_ops_instance = service._get_quilt_ops()
-        open_query_result = quilt_ops_instance.get_open_query_status()
+        open_query_result = await quilt_ops_instance.aget_open_query_status()
         if not open_query_result.get("success"):
             return format_error_response(open_query_result.get("message", "Failed to get tabulator open query status"))
         open_query_enabled = bool(open_query_result.get("open_query_enabled", False))
@@ -1260,7 +1309,7 @@ async def admin_tabulator_open_query_set(
             return error_check
 
         quilt_ops_instance = service._get_quilt_ops()
-        set_result = quilt_ops_instance.set_open_query(enabled)
+        set_result = await _run_admin(quilt_ops_instance.set_open_query, enabled)
         if not set_result.get("success"):
             return format_error_response(set_result.get("message", "Failed to set tabulator open query status"))
 
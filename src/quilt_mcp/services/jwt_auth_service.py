@@ -3,15 +3,13 @@
 from __future__ import annotations
 
 import os
-import time
-import threading
-from datetime import datetime, timezone
 from typing import Any, Dict, Literal, Optional, cast
 
 from quilt_mcp.context.runtime_context import (
     get_runtime_auth,
 )
 from quilt_mcp.auth.jwt_discovery import JWTDiscovery
+from quilt_mcp.services.credential_store import get_credential_store
 
 
 class JwtAuthServiceError(RuntimeError):
@@ -33,10 +31,6 @@ class JWTAuthService:
 
     auth_type: Literal["jwt"] = "jwt"
 
-    def __init__(self) -> None:
-        self._cached_credentials: Optional[Dict[str, Any]] = None
-        self._credentials_lock = threading.Lock()
-
     def _resolve_access_token(self) -> Optional[str]:
         """Resolve JWT token from runtime context first, then discovery fallbacks."""
         runtime_auth = get_runtime_auth()
@@ -91,9 +85,32 @@ class JWTAuthService:
             aws_session_token=credentials['SessionToken'],
         )
 
+    def get_aws_client(self, service_name: str, region: Optional[str] = None) -> Any:
+        """Return a pooled boto3 client for the JWT-exchanged credentials.
+
+        Clients are shared through the AWS client registry and dropped once
+        the underlying credentials expire.
+
+        Raises:
+            JwtAuthServiceError: If JWT token is missing or credential exchange fails.
+        """
+        from quilt_mcp.services.aws_client_registry import get_client_registry
+
+        access_token = self._resolve_access_token()
+        if not access_token:
+            raise JwtAuthServiceError(
+                "JWT authentication required. Provide Authorization: Bearer header.",
+                code="missing_jwt",
+            )
+        credentials = self._get_or_refresh_credentials(access_token)
+        return get_client_registry().get_client_for_credentials(credentials, service_name, region)
+
     def _get_or_refresh_credentials(self, access_token: str) -> Dict[str, Any]:
         """Get cached credentials or fetch new ones if expired.
 
+        Credentials live in the process-wide credential store so that the
+        per-request service instances share one exchange per token.
+
         Args:
             access_token: JWT access token for authentication
 
@@ -101,39 +118,11 @@ class JWTAuthService:
             Dictionary with AWS credentials (AccessKeyId, SecretAccessKey,
             SessionToken, Expiration)
         """
-        with self._credentials_lock:
-            # Check if we have cached credentials that are still valid
-            if self._cached_credentials and self._are_credentials_valid():
-                return self._cached_credentials
-
-            # Fetch new credentials
-            self._cached_credentials = self._fetch_temporary_credentials(access_token)
-            return self._cached_credentials
-
-    def _are_credentials_valid(self) -> bool:
-        """Check if cached credentials are still valid.
-
-        Returns:
-            True if credentials exist and haven't expired (with 5 minute buffer)
-        """
-        if not self._cached_credentials:
-            return False
-
-        expiration = self._cached_credentials.get('Expiration')
-        if not expiration:
-            return False
-
-        # Parse expiration time (ISO 8601 format from AWS)
-        if isinstance(expiration, str):
-            expiration_dt = datetime.fromisoformat(expiration.replace('Z', '+00:00'))
-        else:
-            # Already a datetime object
-            expiration_dt = expiration
-
-        # Add 5 minute buffer before expiration
-        now = datetime.now(timezone.utc)
-        buffer_seconds = 300  # 5 minutes
-        return (expiration_dt.timestamp() - now.timestamp()) > buffer_seconds
+        return get_credential_store().get(
+            access_token,
+            self._fetch_temporary_credentials,
+            registry_url=os.getenv("QUILT_REGISTRY_URL"),
+        )
 
     def _fetch_temporary_credentials(self, access_token: str) -> Dict[str, Any]:
         """Exchange JWT token for temporary AWS credentials.
@@ -0,0 +1,298 @@
+"""Process-wide cache of parsed package manifests and directory listings.
+
+Package revisions are content-addressed: the manifest stored under a given
+``top_hash`` never changes. Browsing, diffing and reading metadata of the same
+revision several times in one agent session therefore only needs the manifest
+to be fetched and parsed once. This cache keeps parsed manifests (backend
+package objects, entry maps and directory listings) keyed by registry bucket,
+``top_hash`` and a section name, bounded by a byte budget.
+
+Callers must resolve ``latest`` (or an abbreviated hash) to a full top hash
+before using the cache; mutable tags are never cached. Cached values are
+shared between callers and must be treated as read-only.
+
+Entries evicted from memory can optionally be spilled to a local directory
+(``QUILT_MANIFEST_CACHE_DIR``), which mostly helps long stdio sessions on one
+machine. The directory is capped at ``QUILT_MANIFEST_CACHE_DIR_MAX_BYTES``
+(oldest files are deleted first), and a spill file is removed once its entry is
+loaded back into memory. Spill files are written with pickle, so the directory
+must only be writable by the server's own user.
+
+With a shared cache (``QUILT_SHARED_CACHE_PATH``), new entries are also written
+through to it, so worker processes on one host parse each revision once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from quilt_mcp.services.shared_cache import SharedCacheStore, get_shared_cache
+from quilt_mcp.utils.helpers import extract_bucket_from_registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+DEFAULT_SPILL_MAX_BYTES = 1024 * 1024 * 1024
+# Rough per-entry cost of a parsed manifest row (dict/object overhead, hashes, physical keys).
+ENTRY_OVERHEAD_BYTES = 512
+SHARED_NAMESPACE = "manifests"
+# Manifests never change; the TTL only lets the shared store reclaim space.
+SHARED_TTL_SECONDS = 24 * 60 * 60
+
+ManifestKey = Tuple[str, str, str]
+
+_TOP_HASH = re.compile(r"[0-9a-f]{64}")
+
+
+def is_top_hash(value: Any) -> bool:
+    """Return True if ``value`` is a full (64 hex digit) package top hash."""
+    return isinstance(value, str) and bool(_TOP_HASH.fullmatch(value))
+
+
+def manifest_key(registry: str, top_hash: str, section: str) -> ManifestKey:
+    """Build the cache key for one section of a package revision."""
+    return (extract_bucket_from_registry(registry), top_hash, section)
+
+
+def entries_size(logical_keys: Iterable[str], metadata: Any = None) -> int:
+    """Estimate the memory held by a parsed manifest with the given logical keys."""
+    size = len(repr(metadata)) if metadata else 0
+    for logical_key in logical_keys:
+        size += len(logical_key) + ENTRY_OVERHEAD_BYTES
+    return size
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+
+
+class ManifestCache:
+    """Byte-bounded LRU of immutable manifest data with optional disk spill.
+
+    Args:
+        max_bytes: Total in-memory size budget; 0 disables the cache
+        spill_dir: Optional directory that receives entries evicted from memory
+        spill_max_bytes: Total size budget of the spill files; 0 disables spilling
+        shared: Optional store shared with other processes; read on a miss, written on put
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        spill_dir: Optional[str] = None,
+        spill_max_bytes: int = DEFAULT_SPILL_MAX_BYTES,
+        shared: Optional[SharedCacheStore] = None,
+    ) -> None:
+        self._max_bytes = max(0, int(max_bytes))
+        self._spill_max_bytes = max(0, int(spill_max_bytes))
+        self._spill_dir = Path(spill_dir) if spill_dir and self._spill_max_bytes else None
+        self._shared = shared
+        self._entries: OrderedDict[ManifestKey, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._shared_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    def get(self, key: ManifestKey) -> Optional[Any]:
+        """Return the cached value for ``key``, or None on a miss."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.value
+
+        spilled = self._read_spill(key)
+        if spilled is not None:
+            with self._lock:
+                self._disk_hits += 1
+        else:
+            spilled = self._read_shared(key)
+            with self._lock:
+                if spilled is None:
+                    self._misses += 1
+                    return None
+                self._shared_hits += 1
+        value, size = spilled
+        self._store(key, value, size)
+        return value
+
+    def put(self, key: ManifestKey, value: Any, size: int) -> bool:
+        """Store ``value`` with an estimated ``size`` in bytes; returns False if it was not cached."""
+        if not self.enabled or value is None:
+            return False
+        if size > self._max_bytes:
+            logger.debug("Not caching manifest %s of %d bytes (budget %d)", key[1], size, self._max_bytes)
+            return False
+        self._store(key, value, size)
+        if self._shared is not None:
+            self._shared.set(
+                SHARED_NAMESPACE, self._digest(key), (key, value, size), expires_at=time.time() + SHARED_TTL_SECONDS
+            )
+        return True
+
+    def clear(self) -> None:
+        """Drop every in-memory entry and spill file and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = self._disk_hits = self._shared_hits = self._misses = self._evictions = 0
+        for path, _size, _mtime in self._spill_files():
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "shared_hits": self._shared_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "spill_dir": str(self._spill_dir) if self._spill_dir else None,
+                "spill_max_bytes": self._spill_max_bytes,
+            }
+
+    def _store(self, key: ManifestKey, value: Any, size: int) -> None:
+        evicted = []
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = _Entry(value=value, size=size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                oldest_key, oldest = self._entries.popitem(last=False)
+                self._bytes -= oldest.size
+                self._evictions += 1
+                evicted.append((oldest_key, oldest))
+        for evicted_key, evicted_entry in evicted:
+            self._write_spill(evicted_key, evicted_entry)
+
+    @staticmethod
+    def _digest(key: ManifestKey) -> str:
+        return hashlib.sha256("\0".join(key).encode("utf-8")).hexdigest()
+
+    def _spill_path(self, key: ManifestKey) -> Optional[Path]:
+        if self._spill_dir is None:
+            return None
+        return self._spill_dir / f"{self._digest(key)}.pickle"
+
+    def _read_shared(self, key: ManifestKey) -> Optional[Tuple[Any, int]]:
+        if self._shared is None:
+            return None
+        stored = self._shared.get(SHARED_NAMESPACE, self._digest(key))
+        if not isinstance(stored, tuple) or len(stored) != 3 or tuple(stored[0]) != key:
+            return None
+        return stored[1], stored[2]
+
+    def _write_spill(self, key: ManifestKey, entry: _Entry) -> None:
+        path = self._spill_path(key)
+        if path is None or path.exists():
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp:
+                pickle.dump((key, entry.value, entry.size), tmp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp.name, path)
+        except Exception as exc:
+            logger.debug("Could not spill manifest %s to %s: %s", key[1], path, exc)
+            return
+        self._trim_spill()
+
+    def _spill_files(self) -> List[Tuple[Path, int, float]]:
+        if self._spill_dir is None:
+            return []
+        files = []
+        for path in self._spill_dir.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((path, stat.st_size, stat.st_mtime))
+        return files
+
+    def _trim_spill(self) -> None:
+        """Delete the oldest spill files until the directory fits ``spill_max_bytes``."""
+        files = sorted(self._spill_files(), key=lambda item: item[2])
+        total = sum(size for _path, size, _mtime in files)
+        for path, size, _mtime in files:
+            if total <= self._spill_max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.debug("Could not delete manifest spill file %s: %s", path, exc)
+                continue
+            total -= size
+
+    def _read_spill(self, key: ManifestKey) -> Optional[Tuple[Any, int]]:
+        path = self._spill_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            with path.open("rb") as fh:
+                stored_key, value, size = pickle.load(fh)
+        except Exception as exc:
+            logger.debug("Discarding unreadable manifest spill file %s: %s", path, exc)
+            path.unlink(missing_ok=True)
+            return None
+        if tuple(stored_key) != key:
+            return None
+        # The entry is promoted back into memory; it is spilled again if evicted.
+        path.unlink(missing_ok=True)
+        return value, size
+
+
+_cache: Optional[ManifestCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_manifest_cache() -> ManifestCache:
+    """Return the process-wide manifest cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ManifestCache(
+                    max_bytes=int(os.getenv("QUILT_MANIFEST_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES))),
+                    spill_dir=os.getenv("QUILT_MANIFEST_CACHE_DIR") or None,
+                    spill_max_bytes=int(os.getenv("QUILT_MANIFEST_CACHE_DIR_MAX_BYTES", str(DEFAULT_SPILL_MAX_BYTES))),
+                    shared=get_shared_cache(),
+                )
+    return _cache
+
+
+def reset_manifest_cache() -> None:
+    """Discard the process-wide manifest cache (primarily for tests)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
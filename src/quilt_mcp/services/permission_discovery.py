@@ -3,13 +3,28 @@
 This module provides comprehensive AWS permission discovery functionality,
 including bucket access level detection, user identity discovery, and
 intelligent permission caching.
+
+Discovery objects are created per request, so their TTL caches live at process
+scope (one set per TTL) and are keyed by caller: identities by credential
+fingerprint, bucket results by identity ARN. Buckets are checked concurrently
+(``QUILT_PERMISSION_BUCKET_CONCURRENCY``), and each S3 probe runs on a shared,
+bounded executor. A probe's timeout (``QUILT_PERMISSION_PROBE_TIMEOUT``) counts
+from when it starts running, so time spent queued behind other callers' probes
+does not use it up; the queue wait has its own, longer bound
+(``QUILT_PERMISSION_PROBE_QUEUE_TIMEOUT``). A bucket whose list or read probe
+timed out is reported as ``UNKNOWN`` and not cached.
 """
 
-from typing import Dict, List, Any, Optional, NamedTuple, Set, Callable
+from typing import Dict, List, Any, Optional, NamedTuple, Sequence, Set, Callable, TypeVar
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from enum import Enum
 import logging
 from datetime import datetime, timezone
+import functools
 import json
+import threading
+import time
+import uuid
 
 import boto3
 import quilt3
@@ -20,9 +35,19 @@ import requests
 from urllib.parse import urljoin
 
 from quilt_mcp.config import get_mode_config, http_config
+from quilt_mcp.services.aws_client_registry import _default_session, credential_identity, get_pooled_client
+from quilt_mcp.services.catalog_config_cache import get_catalog_config_cache
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BUCKET_CONCURRENCY = 8
+DEFAULT_PROBE_MAX_WORKERS = 24
+DEFAULT_PROBE_TIMEOUT_SECONDS = 10.0
+DEFAULT_PROBE_QUEUE_TIMEOUT_SECONDS = 60.0
+PROBE_TIMEOUT_MESSAGE = "Permission probe timed out"
+
+T = TypeVar("T")
+
 
 class PermissionLevel(Enum):
     """S3 bucket access permission levels."""
@@ -32,6 +57,7 @@ class PermissionLevel(Enum):
     READ_ONLY = "read_only"
     LIST_ONLY = "list_only"
     NO_ACCESS = "no_access"
+    UNKNOWN = "unknown"  # a deciding probe timed out
 
 
 class BucketInfo(NamedTuple):
@@ -57,21 +83,133 @@ class UserIdentity(NamedTuple):
     user_name: Optional[str] = None
 
 
+class PermissionCaches:
+    """TTL caches shared by every discovery object in the process that uses the same TTL."""
+
+    def __init__(self, cache_ttl: int) -> None:
+        self.permission_cache: TTLCache[str, BucketInfo] = TTLCache(maxsize=10000, ttl=cache_ttl)
+        self.identity_cache: TTLCache[str, UserIdentity] = TTLCache(maxsize=1000, ttl=cache_ttl)
+        self.bucket_list_cache: TTLCache[str, List[BucketInfo]] = TTLCache(
+            maxsize=1000, ttl=cache_ttl // 2
+        )  # Shorter TTL for bucket lists
+
+
+# TTLCache is not thread-safe; every access from this module holds this lock.
+_cache_lock = threading.RLock()
+_caches: Dict[int, PermissionCaches] = {}
+
+
+def get_permission_caches(cache_ttl: int = 3600) -> PermissionCaches:
+    """Return the process-wide permission caches for ``cache_ttl``, creating them on first use."""
+    with _cache_lock:
+        caches = _caches.get(cache_ttl)
+        if caches is None:
+            caches = _caches[cache_ttl] = PermissionCaches(cache_ttl)
+        return caches
+
+
+def reset_permission_caches() -> None:
+    """Discard the process-wide permission caches (primarily for tests)."""
+    with _cache_lock:
+        _caches.clear()
+
+
+_probe_executor: Optional[ThreadPoolExecutor] = None
+_probe_executor_lock = threading.Lock()
+
+
+def get_permission_probe_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor for S3 permission probes, creating it on first use."""
+    global _probe_executor
+    if _probe_executor is None:
+        with _probe_executor_lock:
+            if _probe_executor is None:
+                max_workers = int(os.getenv("QUILT_PERMISSION_PROBE_MAX_WORKERS", str(DEFAULT_PROBE_MAX_WORKERS)))
+                _probe_executor = ThreadPoolExecutor(
+                    max_workers=max(1, max_workers), thread_name_prefix="quilt-permission-probe"
+                )
+    return _probe_executor
+
+
+def reset_permission_probe_executor() -> None:
+    """Shut down and discard the process-wide probe executor (primarily for tests)."""
+    global _probe_executor
+    with _probe_executor_lock:
+        executor, _probe_executor = _probe_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+class _Probe:
+    """One S3 call queued on the probe executor; its timeout starts when the call does."""
+
+    def __init__(self, executor: ThreadPoolExecutor, func: Callable[..., Any], kwargs: Dict[str, Any]) -> None:
+        self._started = threading.Event()
+        self._started_at = 0.0
+        self._future: Future[Any] = executor.submit(self._run, func, kwargs)
+
+    def _run(self, func: Callable[..., Any], kwargs: Dict[str, Any]) -> Any:
+        self._started_at = time.monotonic()
+        self._started.set()
+        return func(**kwargs)
+
+    def result(self, timeout: float, queue_timeout: float) -> Any:
+        """Return the call's result, raising ``FutureTimeoutError`` if it ran or queued too long.
+
+        A probe that times out is cancelled, which frees its slot if it never started.
+        """
+        if not self._started.wait(queue_timeout):
+            self._future.cancel()
+            raise FutureTimeoutError()
+        try:
+            return self._future.result(timeout=max(0.0, self._started_at + timeout - time.monotonic()))
+        except FutureTimeoutError:
+            self._future.cancel()
+            raise
+
+
+def map_buckets(
+    func: Callable[[str], T], bucket_names: Sequence[str], on_error: Callable[[str, Exception], T]
+) -> List[T]:
+    """Apply ``func`` to every bucket concurrently, keeping input order.
+
+    A bucket whose call raises gets ``on_error(bucket_name, exc)`` instead.
+    """
+
+    def call(bucket_name: str) -> T:
+        try:
+            return func(bucket_name)
+        except Exception as exc:
+            return on_error(bucket_name, exc)
+
+    concurrency = min(
+        len(bucket_names), int(os.getenv("QUILT_PERMISSION_BUCKET_CONCURRENCY", str(DEFAULT_BUCKET_CONCURRENCY)))
+    )
+    if concurrency <= 1:
+        return [call(bucket_name) for bucket_name in bucket_names]
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="permission-discovery") as executor:
+        return list(executor.map(call, bucket_names))
+
+
 class AWSPermissionDiscovery:
     """AWS permission discovery and caching engine."""
 
+    # Defaults for instances built without __init__; __init__ sets per-instance values.
+    _credential_key = "default"
+    _identity_scope: Optional[str] = None
+
     def __init__(self, cache_ttl: int = 3600, *, session: Optional[boto3.Session] = None):
         """Initialize the permission discovery engine.
 
         Args:
             cache_ttl: Cache TTL in seconds (default: 1 hour)
+            session: boto3 session to discover permissions for (default credential chain if None)
         """
         self.cache_ttl = cache_ttl
-        self.permission_cache: TTLCache[str, BucketInfo] = TTLCache(maxsize=1000, ttl=cache_ttl)
-        self.identity_cache: TTLCache[str, UserIdentity] = TTLCache(maxsize=10, ttl=cache_ttl)
-        self.bucket_list_cache: TTLCache[str, List[BucketInfo]] = TTLCache(
-            maxsize=10, ttl=cache_ttl // 2
-        )  # Shorter TTL for bucket lists
+        caches = get_permission_caches(cache_ttl)
+        self.permission_cache = caches.permission_cache
+        self.identity_cache = caches.identity_cache
+        self.bucket_list_cache = caches.bucket_list_cache
 
         # Initialize AWS clients
         try:
@@ -94,6 +232,14 @@ class AWSPermissionDiscovery:
                 except Exception:
                     session = None
 
+            if session is None:
+                # Fingerprint the credentials boto3.client will use, so instances share cached identities.
+                self._credential_key = credential_identity(_default_session())
+            elif isinstance(session, boto3.Session):
+                self._credential_key = credential_identity(session)
+            else:
+                # No credentials to fingerprint: keep the identity private to this instance.
+                self._credential_key = uuid.uuid4().hex
             self._initialize_aws_clients(session)
         except NoCredentialsError:
             logger.error("AWS credentials not found")
@@ -103,7 +249,8 @@ class AWSPermissionDiscovery:
         """Initialize required and optional AWS clients from session or default boto3."""
         if session is not None:
             logger.info("Using provided boto3 session for permission discovery")
-            client_factory: Callable[[str], Any] = session.client
+            # Pooled clients reuse connections across requests and size the pool for concurrent probes.
+            client_factory: Callable[[str], Any] = functools.partial(get_pooled_client, session)
         else:
             logger.info("Using default boto3 clients for permission discovery")
             client_factory = boto3.client
@@ -134,29 +281,29 @@ class AWSPermissionDiscovery:
             error_message=str(error),
         )
 
-    def _append_bucket_permission_result(self, buckets: List[BucketInfo], bucket_name: str) -> None:
-        """Append discovered permission record, falling back to no-access on errors."""
-        try:
-            buckets.append(self.discover_bucket_permissions(bucket_name))
-        except Exception as error:
-            buckets.append(self._build_no_access_bucket(bucket_name, error))
-
-    def _add_bucket_if_new(
-        self, buckets: List[BucketInfo], discovered_bucket_names: Set[str], bucket_name: str
-    ) -> None:
-        """Track and append bucket permission details only once per bucket name."""
+    def discover_buckets_permissions(self, bucket_names: Sequence[str]) -> List[BucketInfo]:
+        """Discover permissions for several buckets concurrently, in input order.
+
+        A bucket whose check raises is reported as no-access with the error message.
+        """
+        if bucket_names:
+            self._scope()  # resolve the identity once, before fanning out
+        return map_buckets(self.discover_bucket_permissions, bucket_names, self._build_no_access_bucket)
+
+    def _add_bucket_if_new(self, bucket_names: List[str], discovered_bucket_names: Set[str], bucket_name: str) -> None:
+        """Track a candidate bucket name only once."""
         if bucket_name and bucket_name not in discovered_bucket_names:
             discovered_bucket_names.add(bucket_name)
-            self._append_bucket_permission_result(buckets, bucket_name)
+            bucket_names.append(bucket_name)
 
-    def _discover_from_owned_buckets(self, buckets: List[BucketInfo], discovered_bucket_names: Set[str]) -> bool:
+    def _discover_from_owned_buckets(self, bucket_names: List[str], discovered_bucket_names: Set[str]) -> bool:
         """Discover buckets from ListBuckets. Returns True when access is denied."""
         try:
             response = self.s3_client.list_buckets()
             owned_buckets = response.get("Buckets", [])
             logger.info(f"Found {len(owned_buckets)} owned buckets")
             for bucket_info in owned_buckets:
-                self._add_bucket_if_new(buckets, discovered_bucket_names, bucket_info["Name"])
+                self._add_bucket_if_new(bucket_names, discovered_bucket_names, bucket_info["Name"])
             return False
         except ClientError as e:
             if e.response["Error"]["Code"] == "AccessDenied":
@@ -165,14 +312,14 @@ class AWSPermissionDiscovery:
             logger.error(f"Error listing buckets: {e}")
             return False
 
-    def _discover_from_fallback_sources(self, buckets: List[BucketInfo], discovered_bucket_names: Set[str]) -> None:
+    def _discover_from_fallback_sources(self, bucket_names: List[str], discovered_bucket_names: Set[str]) -> None:
         """Discover bucket candidates from GraphQL, Glue, and Athena when list-buckets is unavailable."""
         try:
             graphql_buckets = self._discover_buckets_via_graphql()
             if graphql_buckets:
                 logger.info(f"GraphQL discovered {len(graphql_buckets)} buckets")
                 for bkt in graphql_buckets:
-                    self._add_bucket_if_new(buckets, discovered_bucket_names, bkt)
+                    self._add_bucket_if_new(bucket_names, discovered_bucket_names, bkt)
         except Exception as e:
             logger.debug(f"GraphQL discovery skipped/failed: {e}")
 
@@ -180,18 +327,18 @@ class AWSPermissionDiscovery:
             try:
                 glue_buckets = self._discover_buckets_via_glue()
                 for bkt in glue_buckets:
-                    self._add_bucket_if_new(buckets, discovered_bucket_names, bkt)
+                    self._add_bucket_if_new(bucket_names, discovered_bucket_names, bkt)
             except Exception as e:
                 logger.debug(f"Glue discovery skipped/failed: {e}")
 
         try:
             athena_buckets = self._discover_buckets_via_athena()
             for bkt in athena_buckets:
-                self._add_bucket_if_new(buckets, discovered_bucket_names, bkt)
+                self._add_bucket_if_new(bucket_names, discovered_bucket_names, bkt)
         except Exception as e:
             logger.debug(f"Athena discovery skipped/failed: {e}")
 
-    def _discover_from_env_candidates(self, buckets: List[BucketInfo], discovered_bucket_names: Set[str]) -> None:
+    def _discover_from_env_candidates(self, bucket_names: List[str], discovered_bucket_names: Set[str]) -> None:
         """Discover buckets from QUILT_KNOWN_BUCKETS env var hints."""
         known_env = os.getenv("QUILT_KNOWN_BUCKETS", "")
         for raw in known_env.split(","):
@@ -199,14 +346,16 @@ class AWSPermissionDiscovery:
             if not raw:
                 continue
             bucket_name = self._extract_bucket_from_s3_uri(raw) if raw.startswith("s3://") else raw
-            self._add_bucket_if_new(buckets, discovered_bucket_names, bucket_name)
+            self._add_bucket_if_new(bucket_names, discovered_bucket_names, bucket_name)
 
     def discover_user_identity(self) -> UserIdentity:
         """Discover current AWS identity and basic info."""
-        cache_key = "user_identity"
+        cache_key = f"user_identity_{self._credential_key}"
 
-        if cache_key in self.identity_cache:
-            return self.identity_cache[cache_key]
+        with _cache_lock:
+            cached_identity = self.identity_cache.get(cache_key)
+        if cached_identity is not None:
+            return cached_identity
 
         try:
             response = self.sts_client.get_caller_identity()
@@ -237,7 +386,8 @@ class AWSPermissionDiscovery:
                 user_name=user_name,
             )
 
-            self.identity_cache[cache_key] = identity
+            with _cache_lock:
+                self.identity_cache[cache_key] = identity
             logger.info(f"Discovered user identity: {user_type} {user_name} in account {account_id}")
 
             return identity
@@ -248,15 +398,17 @@ class AWSPermissionDiscovery:
 
     def discover_accessible_buckets(self, include_cross_account: bool = False) -> List[BucketInfo]:
         """Discover all buckets user has any level of access to."""
-        cache_key = f"accessible_buckets_{include_cross_account}"
+        cache_key = f"accessible_buckets_{self._scope()}_{include_cross_account}"
 
-        if cache_key in self.bucket_list_cache:
-            return self.bucket_list_cache[cache_key]
+        with _cache_lock:
+            cached_buckets = self.bucket_list_cache.get(cache_key)
+        if cached_buckets is not None:
+            return cached_buckets
 
-        buckets: List[BucketInfo] = []
+        bucket_names: List[str] = []
         discovered_bucket_names: Set[str] = set()
 
-        list_buckets_denied = self._discover_from_owned_buckets(buckets, discovered_bucket_names)
+        list_buckets_denied = self._discover_from_owned_buckets(bucket_names, discovered_bucket_names)
 
         # TODO: If include_cross_account, attempt to discover cross-account buckets
         # This would require additional logic to infer bucket names from policies
@@ -264,19 +416,24 @@ class AWSPermissionDiscovery:
         # Fallback discovery paths only when ListBuckets is explicitly denied, or when enabled via env flag
         fallback_enabled = bool(os.getenv("QUILT_ENABLE_FALLBACK_DISCOVERY"))
         if (list_buckets_denied or fallback_enabled) and not discovered_bucket_names:
-            self._discover_from_fallback_sources(buckets, discovered_bucket_names)
+            self._discover_from_fallback_sources(bucket_names, discovered_bucket_names)
             # Note: DEFAULT_BUCKET was removed in v0.10.0 - no longer checked
-            self._discover_from_env_candidates(buckets, discovered_bucket_names)
+            self._discover_from_env_candidates(bucket_names, discovered_bucket_names)
 
-        self.bucket_list_cache[cache_key] = buckets
+        buckets = self.discover_buckets_permissions(bucket_names)
+        if not any((bucket.error_message or "").startswith(PROBE_TIMEOUT_MESSAGE) for bucket in buckets):
+            with _cache_lock:
+                self.bucket_list_cache[cache_key] = buckets
         return buckets
 
     def discover_bucket_permissions(self, bucket_name: str) -> BucketInfo:
         """Discover permission level for specific bucket."""
-        cache_key = f"bucket_permissions_{bucket_name}"
+        cache_key = f"bucket_permissions_{self._scope()}_{bucket_name}"
 
-        if cache_key in self.permission_cache:
-            return self.permission_cache[cache_key]
+        with _cache_lock:
+            cached_info = self.permission_cache.get(cache_key)
+        if cached_info is not None:
+            return cached_info
 
         logger.debug(f"Discovering permissions for bucket: {bucket_name}")
 
@@ -286,22 +443,14 @@ class AWSPermissionDiscovery:
         can_write = False
         region = "unknown"
         error_message = None
+        timed_out: List[str] = []
 
         try:
             # Test 1: Try to list objects first (most important for Quilt)
             # This is more reliable with Quilt's STS tokens than get_bucket_location
             try:
-                self.s3_client.list_objects_v2(Bucket=bucket_name, MaxKeys=1)
+                self._wait(self._probe(self.s3_client.list_objects_v2, Bucket=bucket_name, MaxKeys=1))
                 can_list = True
-                # Try to get bucket location for region info (but don't fail if this doesn't work)
-                try:
-                    location_response = self.s3_client.get_bucket_location(Bucket=bucket_name)
-                    region = location_response.get("LocationConstraint") or "us-east-1"
-                except ClientError:
-                    # If get_bucket_location fails but list_objects works,
-                    # we still have access - just use unknown region
-                    region = "unknown"
-                    logger.debug(f"Could not get bucket location for {bucket_name}, but list access confirmed")
             except ClientError as e:
                 if e.response["Error"]["Code"] in ["AccessDenied", "NoSuchBucket"]:
                     error_message = f"Cannot access bucket: {e.response['Error']['Code']}"
@@ -318,53 +467,77 @@ class AWSPermissionDiscovery:
                 else:
                     raise
 
-            # Test 2: Since we already confirmed list access, proceed to read test
+            # With list access confirmed, the remaining probes are independent: run them together.
+            # Reading a non-existent key gives 404 with read permission and 403 without.
+            test_key = f"__permission_test_{datetime.now(timezone.utc).timestamp()}.tmp"
+            location_probe = self._probe(self.s3_client.get_bucket_location, Bucket=bucket_name)
+            read_probe = self._probe(self.s3_client.head_object, Bucket=bucket_name, Key=test_key)
+            acl_probe = self._probe(self.s3_client.get_bucket_acl, Bucket=bucket_name)
+
+            # Test 2: Bucket location for region info (but don't fail if this doesn't work)
+            try:
+                location_response = self._wait(location_probe)
+                region = location_response.get("LocationConstraint") or "us-east-1"
+            except FutureTimeoutError:
+                timed_out.append("GetBucketLocation")
+            except ClientError:
+                # If get_bucket_location fails but list_objects works,
+                # we still have access - just use unknown region
+                logger.debug(f"Could not get bucket location for {bucket_name}, but list access confirmed")
 
             # Test 3: Try to read a non-existent object (tests read permission safely)
-            if can_list:
-                try:
-                    # Try to read a non-existent key - should get 404 if we have read permission,
-                    # 403 if we don't
-                    test_key = f"__permission_test_{datetime.now(timezone.utc).timestamp()}.tmp"
-                    self.s3_client.head_object(Bucket=bucket_name, Key=test_key)
-                except ClientError as e:
-                    if e.response["Error"]["Code"] == "NotFound":
-                        can_read = True  # 404 means we have read permission
-                    elif e.response["Error"]["Code"] == "AccessDenied":
-                        can_read = False  # 403 means no read permission
-                    else:
-                        # Other errors might still indicate read permission
-                        can_read = True
+            try:
+                self._wait(read_probe)
+            except FutureTimeoutError:
+                timed_out.append("HeadObject")
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "NotFound":
+                    can_read = True  # 404 means we have read permission
+                elif e.response["Error"]["Code"] == "AccessDenied":
+                    can_read = False  # 403 means no read permission
+                else:
+                    # Other errors might still indicate read permission
+                    can_read = True
 
             # Test 4: Improved write permission detection for Quilt buckets
-            if can_list:
-                # For Quilt buckets, if we can list objects, we likely have write access
-                # This is because Quilt's permission model typically grants read/write together
-                can_write = True
+            # For Quilt buckets, if we can list objects, we likely have write access
+            # This is because Quilt's permission model typically grants read/write together
+            can_write = True
 
-                # Try to confirm with additional tests, but don't fail if they don't work
-                try:
-                    self.s3_client.get_bucket_acl(Bucket=bucket_name)
-                    logger.debug(f"Confirmed write access via bucket ACL for {bucket_name}")
-                except ClientError as e:
-                    if e.response["Error"]["Code"] == "AccessDenied":
-                        # For Quilt buckets, lack of ACL access doesn't necessarily mean no write access
-                        # Keep can_write=True based on list access
-                        logger.debug(
-                            f"No ACL access for {bucket_name}, but assuming write access based on list capability"
-                        )
-                    else:
-                        # Other errors might still indicate write access
-                        logger.debug(f"ACL test had non-access error for {bucket_name}: {e}")
-                except Exception as e:
-                    logger.debug(f"ACL test failed for {bucket_name}: {e}")
+            # Try to confirm with additional tests, but don't fail if they don't work
+            try:
+                self._wait(acl_probe)
+                logger.debug(f"Confirmed write access via bucket ACL for {bucket_name}")
+            except FutureTimeoutError:
+                timed_out.append("GetBucketAcl")
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "AccessDenied":
+                    # For Quilt buckets, lack of ACL access doesn't necessarily mean no write access
+                    # Keep can_write=True based on list capability
+                    logger.debug(
+                        f"No ACL access for {bucket_name}, but assuming write access based on list capability"
+                    )
+                else:
+                    # Other errors might still indicate write access
+                    logger.debug(f"ACL test had non-access error for {bucket_name}: {e}")
+            except Exception as e:
+                logger.debug(f"ACL test failed for {bucket_name}: {e}")
 
+        except FutureTimeoutError:
+            timed_out.append("ListObjectsV2")
         except Exception as e:
             logger.error(f"Unexpected error checking permissions for {bucket_name}: {e}")
             error_message = str(e)
 
+        if timed_out:
+            logger.warning(f"Permission probes timed out for {bucket_name}: {', '.join(timed_out)}")
+            error_message = f"{PROBE_TIMEOUT_MESSAGE}: {', '.join(timed_out)}"
+
         # Determine permission level
-        if can_write and can_read and can_list:
+        if {"ListObjectsV2", "HeadObject"} & set(timed_out):
+            # Not knowing whether a call would succeed is not evidence that it would fail.
+            permission_level = PermissionLevel.UNKNOWN
+        elif can_write and can_read and can_list:
             permission_level = PermissionLevel.FULL_ACCESS
         elif can_write and can_read:
             permission_level = PermissionLevel.READ_WRITE
@@ -386,13 +559,41 @@ class AWSPermissionDiscovery:
             error_message=error_message,
         )
 
-        self.permission_cache[cache_key] = bucket_info
+        if not timed_out:
+            with _cache_lock:
+                self.permission_cache[cache_key] = bucket_info
         logger.info(
             f"Bucket {bucket_name}: {permission_level.value} (read:{can_read}, write:{can_write}, list:{can_list})"
         )
 
         return bucket_info
 
+    def _probe(self, func: Callable[..., Any], **kwargs: Any) -> _Probe:
+        """Queue one S3 probe on the shared probe executor."""
+        return _Probe(get_permission_probe_executor(), func, kwargs)
+
+    @staticmethod
+    def _wait(probe: _Probe) -> Any:
+        return probe.result(
+            timeout=float(os.getenv("QUILT_PERMISSION_PROBE_TIMEOUT", str(DEFAULT_PROBE_TIMEOUT_SECONDS))),
+            queue_timeout=float(
+                os.getenv("QUILT_PERMISSION_PROBE_QUEUE_TIMEOUT", str(DEFAULT_PROBE_QUEUE_TIMEOUT_SECONDS))
+            ),
+        )
+
+    def _scope(self) -> str:
+        """Return the identity ARN that bucket cache keys are scoped to.
+
+        Falls back to the credential fingerprint when the identity cannot be resolved.
+        """
+        if self._identity_scope is None:
+            try:
+                self._identity_scope = self.discover_user_identity().arn
+            except Exception as exc:
+                logger.debug(f"Scoping permission cache by credentials; identity lookup failed: {exc}")
+                self._identity_scope = self._credential_key
+        return self._identity_scope
+
     def test_bucket_operations(self, bucket_name: str, operations: List[str]) -> Dict[str, bool]:
         """Safely test specific operations on bucket."""
         results = {}
@@ -445,10 +646,11 @@ class AWSPermissionDiscovery:
         return results
 
     def clear_cache(self) -> None:
-        """Clear all cached permission data."""
-        self.permission_cache.clear()
-        self.identity_cache.clear()
-        self.bucket_list_cache.clear()
+        """Clear all cached permission data (shared by every discovery object with this TTL)."""
+        with _cache_lock:
+            self.permission_cache.clear()
+            self.identity_cache.clear()
+            self.bucket_list_cache.clear()
         logger.info("Permission cache cleared")
 
     def _extract_bucket_from_s3_uri(self, s3_uri: str) -> str:
@@ -546,9 +748,7 @@ class AWSPermissionDiscovery:
             config_url = f"{normalized_catalog}/config.json"
 
             try:
-                config_response = session.get(config_url, timeout=10)
-                config_response.raise_for_status()
-                config_data = config_response.json()
+                config_data = get_catalog_config_cache().fetch(config_url, session=session)
                 registry_url = config_data.get("registryUrl")
 
                 if not registry_url:
@@ -745,9 +945,10 @@ class AWSPermissionDiscovery:
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        return {
-            "permission_cache_size": len(self.permission_cache),
-            "identity_cache_size": len(self.identity_cache),
-            "bucket_list_cache_size": len(self.bucket_list_cache),
-            "cache_ttl": self.cache_ttl,
-        }
+        with _cache_lock:
+            return {
+                "permission_cache_size": len(self.permission_cache),
+                "identity_cache_size": len(self.identity_cache),
+                "bucket_list_cache_size": len(self.bucket_list_cache),
+                "cache_ttl": self.cache_ttl,
+            }
@@ -12,7 +12,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from quilt_mcp.services.permission_discovery import AWSPermissionDiscovery, PermissionLevel
+from quilt_mcp.services.permission_discovery import AWSPermissionDiscovery, PermissionLevel, map_buckets
 from quilt_mcp.services.auth_service import create_auth_service
 from quilt_mcp.services.protocols.auth import AuthServiceProtocol
 from quilt_mcp.context.request_context import RequestContext
@@ -138,20 +138,20 @@ def _discover_permissions(
     identity = discovery.discover_user_identity()
 
     if check_buckets:
-        bucket_permissions = []
-        for bucket_name in check_buckets:
-            try:
-                bucket_info = discovery.discover_bucket_permissions(bucket_name)
-                bucket_permissions.append(bucket_info._asdict())
-            except Exception as exc:  # pragma: no cover - defensive logging
-                logger.warning("Failed to check bucket %s: %s", bucket_name, exc)
-                bucket_permissions.append(
-                    {
-                        "name": bucket_name,
-                        "permission_level": PermissionLevel.NO_ACCESS.value,
-                        "error_message": str(exc),
-                    }
-                )
+
+        def _failed_bucket(bucket_name: str, exc: Exception) -> Dict[str, Any]:  # pragma: no cover - defensive
+            logger.warning("Failed to check bucket %s: %s", bucket_name, exc)
+            return {
+                "name": bucket_name,
+                "permission_level": PermissionLevel.NO_ACCESS.value,
+                "error_message": str(exc),
+            }
+
+        bucket_permissions = map_buckets(
+            lambda bucket_name: discovery.discover_bucket_permissions(bucket_name)._asdict(),
+            check_buckets,
+            _failed_bucket,
+        )
     else:
         accessible_buckets = discovery.discover_accessible_buckets(include_cross_account)
         bucket_permissions = [bucket._asdict() for bucket in accessible_buckets]
@@ -162,6 +162,7 @@ def _discover_permissions(
         "read_only": [],
         "list_only": [],
         "no_access": [],
+        "unknown": [],
     }
 
     for bucket in bucket_permissions:
@@ -209,6 +210,8 @@ def _check_bucket_access(
         )
     elif bucket_info.permission_level == PermissionLevel.NO_ACCESS:
         guidance.append("No access detected. Check your AWS permissions or verify the bucket name.")
+    elif bucket_info.permission_level == PermissionLevel.UNKNOWN:
+        guidance.append("Permission checks timed out, so access could not be determined. Try again shortly.")
 
     if bucket_info.can_write:
         guidance.append("✅ This bucket can be used for Quilt package creation.")
@@ -0,0 +1,192 @@
+"""Byte-range reads for ``bucket_object_fetch`` and ``bucket_object_text``.
+
+Every read maps to an HTTP ``Range`` request, so a slice from the middle or
+end of a multi-gigabyte object transfers only the bytes returned. Forward reads
+ask for one byte more than requested to learn whether more data follows
+without a separate HEAD call. The result carries a ``next_offset`` cursor for
+paging. Text is decoded chunk by chunk with an incremental decoder. If a page
+ends inside a multi-byte character, those bytes are left for the next page
+rather than replaced.
+"""
+
+from __future__ import annotations
+
+import codecs
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+READ_CHUNK_SIZE = 64 * 1024
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+@dataclass(frozen=True)
+class RangeSlice:
+    """Bytes read from one range of an object.
+
+    ``next_offset`` is where the following page starts, or None when the slice
+    reaches the end of the object. ``object_size`` is None when the server did
+    not report it.
+    """
+
+    data: bytes
+    offset: int
+    next_offset: Optional[int]
+    object_size: Optional[int]
+    content_type: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TextSlice:
+    """Decoded text read from one range of an object; ``bytes_read`` counts the bytes it covers."""
+
+    text: str
+    offset: int
+    bytes_read: int
+    next_offset: Optional[int]
+    object_size: Optional[int]
+
+
+def parse_content_range(value: Optional[str]) -> Optional[Tuple[int, int, Optional[int]]]:
+    """Parse ``bytes start-end/total`` into ``(start, end, total)``; total is None when ``*``."""
+    match = _CONTENT_RANGE.fullmatch(value.strip()) if value else None
+    if match is None:
+        return None
+    total = match.group(3)
+    return int(match.group(1)), int(match.group(2)), None if total == "*" else int(total)
+
+
+def read_range(
+    client: Any,
+    params: Dict[str, Any],
+    *,
+    offset: int = 0,
+    length: int,
+    tail: Optional[int] = None,
+) -> RangeSlice:
+    """Read ``length`` bytes from ``offset`` of the object in ``params``.
+
+    When ``tail`` is given, the last ``tail`` bytes are read instead and
+    ``offset`` and ``length`` are ignored.
+
+    Raises:
+        Exception: Whatever ``get_object`` raised, e.g. ``InvalidRange`` for an offset past the end
+    """
+    stream, start, total, content_type = _open(client, params, offset, length, tail)
+    if tail is not None:
+        length = tail
+    limit = length if tail is not None else length + 1
+    data = b"".join(_iter_chunks(stream, limit))
+    more = tail is None and len(data) > length
+    return RangeSlice(
+        data=data[:length],
+        offset=start,
+        next_offset=start + length if more else None,
+        object_size=total,
+        content_type=content_type,
+    )
+
+
+def read_text_range(
+    client: Any,
+    params: Dict[str, Any],
+    *,
+    offset: int = 0,
+    length: int,
+    tail: Optional[int] = None,
+    encoding: str = "utf-8",
+) -> TextSlice:
+    """Like ``read_range`` but decode the bytes as they stream in; undecodable bytes are replaced.
+
+    Raises:
+        LookupError: If ``encoding`` is unknown (checked before any request is made)
+        Exception: Whatever ``get_object`` raised
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    stream, start, total, _content_type = _open(client, params, offset, length, tail)
+    if tail is not None:
+        length = tail
+    limit = length if tail is not None else length + 1
+
+    pieces = []
+    seen = 0
+    for chunk in _iter_chunks(stream, limit):
+        usable = chunk[: max(0, length - seen)]
+        seen += len(chunk)
+        if usable:
+            pieces.append(decoder.decode(usable))
+    more = seen > length
+    consumed = min(seen, length)
+    pending = len(decoder.getstate()[0]) if more else 0
+    if pending == 0 or pending >= consumed:
+        # End of object, or a page too short to hold one whole character: flush what is left.
+        pieces.append(decoder.decode(b"", final=True))
+        pending = 0
+    bytes_read = consumed - pending
+    return TextSlice(
+        text="".join(pieces),
+        offset=start,
+        bytes_read=bytes_read,
+        next_offset=start + bytes_read if more else None,
+        object_size=total,
+    )
+
+
+def decode_prefix(data: bytes, encoding: str, *, final: bool) -> Tuple[str, int]:
+    """Strictly decode ``data``, returning the text and how many bytes it used.
+
+    Unless ``final``, a trailing incomplete character is left undecoded so the
+    caller can start the next page at it.
+
+    Raises:
+        UnicodeDecodeError: If ``data`` is not valid ``encoding``
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="strict")
+    text = decoder.decode(data, final=final)
+    pending = 0 if final else len(decoder.getstate()[0])
+    if pending and pending == len(data):
+        text, pending = decoder.decode(b"", final=True), 0
+    return text, len(data) - pending
+
+
+def _open(
+    client: Any, params: Dict[str, Any], offset: int, length: int, tail: Optional[int]
+) -> Tuple[Any, int, Optional[int], Optional[str]]:
+    # One byte past the requested length tells us whether more data follows.
+    header = f"bytes=-{tail}" if tail is not None else f"bytes={offset}-{offset + length}"
+    try:
+        obj = client.get_object(Range=header, **params)
+    except Exception as exc:
+        # S3 rejects every range on an empty object; read it whole instead.
+        if offset != 0 or _error_code(exc) != "InvalidRange":
+            raise
+        obj = client.get_object(**params)
+    parsed = parse_content_range(obj.get("ContentRange"))
+    start, total = (parsed[0], parsed[2]) if parsed else (offset if tail is None else 0, None)
+    return obj["Body"], start, total, obj.get("ContentType")
+
+
+def _iter_chunks(stream: Any, limit: int) -> Iterator[bytes]:
+    """Yield at most ``limit`` bytes from ``stream`` in ``READ_CHUNK_SIZE`` pieces, then close it."""
+    remaining = limit
+    try:
+        while remaining > 0:
+            chunk = stream.read(min(READ_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            chunk = chunk[:remaining]
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
+
+
+def _error_code(exc: Exception) -> Optional[str]:
+    response = getattr(exc, "response", None)
+    if isinstance(response, dict):
+        code = response.get("Error", {}).get("Code")
+        return str(code) if code is not None else None
+    return None
@@ -0,0 +1,160 @@
+"""Concurrent S3 uploads for ``bucket_objects_put``.
+
+Items are uploaded concurrently (``QUILT_UPLOAD_MAX_CONCURRENCY``). Bodies of at
+least ``QUILT_UPLOAD_MULTIPART_THRESHOLD`` bytes use a multipart upload whose
+parts (``QUILT_UPLOAD_PART_SIZE`` bytes each) are sent in parallel on one
+process-wide, bounded executor, so a few large objects upload as fast as many
+small ones. Each part is copied out of the body only when its worker sends it,
+so splitting a body holds at most one part per worker in extra memory. A failed
+multipart upload is aborted so no parts are left behind.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+MIB = 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_PART_WORKERS = 16
+DEFAULT_MULTIPART_THRESHOLD = 8 * MIB
+DEFAULT_PART_SIZE = 8 * MIB
+# S3 limits: every part but the last is at least 5 MiB, and an upload has at most 10,000 parts.
+MIN_PART_SIZE = 5 * MIB
+MAX_PARTS = 10000
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class UploadConfig:
+    """Upload tuning; ``from_env`` reads the ``QUILT_UPLOAD_*`` variables."""
+
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    multipart_threshold: int = DEFAULT_MULTIPART_THRESHOLD
+    part_size: int = DEFAULT_PART_SIZE
+
+    @classmethod
+    def from_env(cls) -> UploadConfig:
+        return cls(
+            max_concurrency=max(1, int(os.getenv("QUILT_UPLOAD_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY)))),
+            multipart_threshold=max(
+                MIN_PART_SIZE, int(os.getenv("QUILT_UPLOAD_MULTIPART_THRESHOLD", str(DEFAULT_MULTIPART_THRESHOLD)))
+            ),
+            part_size=max(MIN_PART_SIZE, int(os.getenv("QUILT_UPLOAD_PART_SIZE", str(DEFAULT_PART_SIZE)))),
+        )
+
+    def part_size_for(self, size: int) -> int:
+        """Return the part size for a ``size``-byte body, grown if needed to stay within ``MAX_PARTS``."""
+        return max(self.part_size, -(-size // MAX_PARTS))
+
+
+@dataclass(frozen=True)
+class UploadedObject:
+    """Outcome of one successful upload; ``parts`` is None for a single ``put_object``."""
+
+    etag: Optional[str]
+    size: int
+    parts: Optional[int] = None
+
+
+_part_executor: Optional[ThreadPoolExecutor] = None
+_part_executor_lock = threading.Lock()
+
+
+def get_part_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor for multipart upload parts, creating it on first use."""
+    global _part_executor
+    if _part_executor is None:
+        with _part_executor_lock:
+            if _part_executor is None:
+                max_workers = int(os.getenv("QUILT_UPLOAD_PART_WORKERS", str(DEFAULT_PART_WORKERS)))
+                _part_executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="quilt-upload")
+    return _part_executor
+
+
+def reset_part_executor() -> None:
+    """Shut down and discard the process-wide part executor (primarily for tests)."""
+    global _part_executor
+    with _part_executor_lock:
+        executor, _part_executor = _part_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+def map_concurrently(func: Callable[[T], R], items: Sequence[T], max_concurrency: int) -> List[R]:
+    """Apply ``func`` to every item with up to ``max_concurrency`` threads, keeping input order."""
+    concurrency = min(len(items), max_concurrency)
+    if concurrency <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="upload-item") as executor:
+        return list(executor.map(func, items))
+
+
+def upload_bytes(
+    client: Any,
+    bucket: str,
+    key: str,
+    body: bytes,
+    *,
+    content_type: Optional[str] = None,
+    metadata: Optional[Dict[str, str]] = None,
+    config: Optional[UploadConfig] = None,
+) -> UploadedObject:
+    """Upload ``body`` to ``s3://bucket/key``, using multipart upload for large bodies.
+
+    Raises:
+        Exception: Whatever the S3 client raised; a failed multipart upload is aborted first
+    """
+    config = config or UploadConfig()
+    extra: Dict[str, Any] = {}
+    if content_type:
+        extra["ContentType"] = content_type
+    if metadata:
+        extra["Metadata"] = metadata
+
+    if len(body) < config.multipart_threshold:
+        response = client.put_object(Bucket=bucket, Key=key, Body=body, **extra)
+        return UploadedObject(etag=response.get("ETag"), size=len(body))
+    return _upload_multipart(client, bucket, key, body, extra, config.part_size_for(len(body)))
+
+
+def _upload_multipart(
+    client: Any, bucket: str, key: str, body: bytes, extra: Dict[str, Any], part_size: int
+) -> UploadedObject:
+    upload_id = client.create_multipart_upload(Bucket=bucket, Key=key, **extra)["UploadId"]
+    view = memoryview(body)
+    executor = get_part_executor()
+    futures: List[Future[Any]] = []
+    try:
+        for number, offset in enumerate(range(0, len(body), part_size), start=1):
+            futures.append(
+                executor.submit(
+                    _upload_part, client, bucket, key, upload_id, number, view[offset : offset + part_size]
+                )
+            )
+        parts = [{"ETag": future.result()["ETag"], "PartNumber": number} for number, future in enumerate(futures, 1)]
+        response = client.complete_multipart_upload(
+            Bucket=bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+        )
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        try:
+            client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+        except Exception as exc:
+            logger.warning(f"Failed to abort multipart upload of s3://{bucket}/{key}: {exc}")
+        raise
+    return UploadedObject(etag=response.get("ETag"), size=len(body), parts=len(parts))
+
+
+def _upload_part(client: Any, bucket: str, key: str, upload_id: str, number: int, chunk: memoryview) -> Any:
+    # botocore needs bytes or a file; copy the slice only now that it is being sent.
+    return client.upload_part(Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=number, Body=chunk.tobytes())
@@ -0,0 +1,255 @@
+"""Optional SQLite store that lets server worker processes share cache entries.
+
+With ``--workers N`` every uvicorn worker has its own process-wide caches, so
+without sharing each worker repeats every cold manifest fetch and
+``config.json`` request. When ``QUILT_SHARED_CACHE_PATH`` names a local file,
+the manifest cache and catalog config cache consult this store on a local miss
+and write new entries through to it. JWT-exchanged AWS credentials are kept
+out of it: each worker does its own exchange rather than leaving secret keys
+on disk.
+
+The store is a single SQLite database in WAL mode (one connection per
+thread), so it works across processes on one host without a separate
+service. It is best effort: errors are logged and treated as misses. The
+stored values are bounded by ``QUILT_SHARED_CACHE_MAX_BYTES``; past that, the
+least recently used entries are deleted. Values are pickled, so the file is
+created with ``0600`` permissions and must live on a local disk only the
+server's user can write to.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUSY_TIMEOUT_SECONDS = 5.0
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Expired rows are purged every this many writes.
+PURGE_INTERVAL = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+_COLUMNS = {"namespace", "key", "value", "size", "expires_at", "accessed_at"}
+
+
+class SharedCacheStore:
+    """Process-safe key/value store with per-entry expiry, backed by SQLite.
+
+    Args:
+        path: Database file; created (with ``0600`` permissions) if missing
+        busy_timeout: Seconds to wait for another process's write lock
+        max_bytes: Total size of the pickled values; least recently used entries are evicted past it
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self._path = Path(path)
+        self._busy_timeout = busy_timeout
+        self._max_bytes = max(0, int(max_bytes))
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._errors = 0
+        self._evictions = 0
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        os.close(os.open(self._path, os.O_CREAT | os.O_RDWR, 0o600))
+        connection = self._connection()
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(entries)")}
+        if columns and columns != _COLUMNS:
+            # Written by an older version; the contents are only a cache.
+            connection.execute("DROP TABLE entries")
+        connection.execute(_SCHEMA)
+        connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Return the unexpired value stored under ``namespace``/``key``, or None."""
+        now = time.time()
+        try:
+            connection = self._connection()
+            row = connection.execute(
+                "SELECT value FROM entries WHERE namespace = ? AND key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, key, now),
+            ).fetchone()
+            value = pickle.loads(row[0]) if row is not None else None
+            if value is not None:
+                connection.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?", (now, namespace, key)
+                )
+        except Exception as exc:
+            self._record_error("read", namespace, exc)
+            return None
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def set(self, namespace: str, key: str, value: Any, *, expires_at: Optional[float] = None) -> bool:
+        """Store ``value`` until the POSIX timestamp ``expires_at`` (None keeps it until evicted or cleared).
+
+        Returns False if the value could not be stored, including when it is larger than ``max_bytes``.
+        """
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            if len(blob) > self._max_bytes:
+                logger.debug("Not sharing %s/%s of %d bytes (budget %d)", namespace, key, len(blob), self._max_bytes)
+                return False
+            connection = self._connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, size, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, blob, len(blob), expires_at, time.time()),
+            )
+            with self._lock:
+                self._writes += 1
+                purge = self._writes % PURGE_INTERVAL == 0
+            (total,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+            if purge or total > self._max_bytes:
+                connection.execute(
+                    "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+                )
+            if total > self._max_bytes:
+                self._evict(connection)
+            return True
+        except Exception as exc:
+            self._record_error("write", namespace, exc)
+            return False
+
+    def delete(self, namespace: str, key: str) -> None:
+        """Remove one entry."""
+        try:
+            self._connection().execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+        except Exception as exc:
+            self._record_error("delete", namespace, exc)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Remove every entry (or every entry in ``namespace``) and reset counters."""
+        try:
+            if namespace is None:
+                self._connection().execute("DELETE FROM entries")
+            else:
+                self._connection().execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+        except Exception as exc:
+            self._record_error("clear", namespace or "*", exc)
+        with self._lock:
+            self._hits = self._misses = self._writes = self._errors = self._evictions = 0
+
+    def close(self) -> None:
+        """Close every connection opened by this store."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            try:
+                connection.close()
+            except Exception:
+                pass
+        self._local = threading.local()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/write/eviction counters."""
+        with self._lock:
+            return {
+                "path": str(self._path),
+                "hits": self._hits,
+                "misses": self._misses,
+                "writes": self._writes,
+                "errors": self._errors,
+                "evictions": self._evictions,
+                "max_bytes": self._max_bytes,
+            }
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete the least recently used entries that do not fit in ``max_bytes``."""
+        cursor = connection.execute(
+            """
+            DELETE FROM entries WHERE rowid IN (
+                SELECT rowid FROM (
+                    SELECT rowid, SUM(size) OVER (ORDER BY accessed_at DESC, rowid DESC) AS kept FROM entries
+                ) WHERE kept > ?
+            )
+            """,
+            (self._max_bytes,),
+        )
+        with self._lock:
+            self._evictions += max(0, cursor.rowcount)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is None:
+            # Autocommit: every statement is its own short transaction.
+            connection = sqlite3.connect(
+                self._path, timeout=self._busy_timeout, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _record_error(self, operation: str, namespace: str, exc: Exception) -> None:
+        with self._lock:
+            self._errors += 1
+        logger.debug("Shared cache %s failed for %s in %s: %s", operation, namespace, self._path, exc)
+
+
+_store: Optional[SharedCacheStore] = None
+_store_lock = threading.Lock()
+
+
+def get_shared_cache() -> Optional[SharedCacheStore]:
+    """Return the process-wide shared store, or None when ``QUILT_SHARED_CACHE_PATH`` is unset."""
+    global _store
+    if _store is None:
+        path = os.getenv("QUILT_SHARED_CACHE_PATH", "").strip()
+        if not path:
+            return None
+        with _store_lock:
+            if _store is None:
+                try:
+                    _store = SharedCacheStore(
+                        path, max_bytes=int(os.getenv("QUILT_SHARED_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES)))
+                    )
+                except Exception as exc:
+                    logger.warning(f"Shared cache at {path} unavailable, using per-process caches: {exc}")
+                    return None
+    return _store
+
+
+def reset_shared_cache() -> None:
+    """Close and discard the process-wide shared store (primarily for tests)."""
+    global _store
+    with _store_lock:
+        store, _store = _store, None
+    if store is not None:
+        store.close()
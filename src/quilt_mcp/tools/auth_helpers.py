@@ -14,6 +14,7 @@ import boto3
 
 from quilt_mcp.context.request_context import RequestContext
 from quilt_mcp.services.auth_service import AuthServiceError, create_auth_service
+from quilt_mcp.services.aws_client_registry import get_pooled_client
 from quilt_mcp.services.protocols.auth import AuthServiceProtocol
 from quilt_mcp.services.jwt_auth_service import JwtAuthServiceError
 
@@ -45,7 +46,7 @@ class AuthorizationContext:
 
 def _build_s3_client(session: boto3.Session) -> Optional[Any]:
     try:
-        return session.client("s3")
+        return get_pooled_client(session, "s3")
     except Exception as exc:  # pragma: no cover - unexpected boto3 failure
         logger.error("Failed to build s3 client from session: %s", exc)
     return None
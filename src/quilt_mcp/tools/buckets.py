@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Annotated, Any
+from typing import Annotated, Any, Optional
 
 from pydantic import Field
 
@@ -29,7 +29,8 @@ from .responses import (
     S3Object,
     UploadResult,
 )
-from ..utils.common import generate_signed_url, parse_s3_uri
+from ..utils.common import parse_s3_uri
+from ..utils.presign import S3Presigner
 from .auth_helpers import AuthorizationContext, check_s3_authorization
 
 # Helpers
@@ -100,6 +101,14 @@ def bucket_objects_list(
             description="Include presigned download URLs for each object",
         ),
     ] = True,
+    signed_url_limit: Annotated[
+        int,
+        Field(
+            default=0,
+            ge=0,
+            description="Only presign the first N objects when include_signed_urls is true (0 for all)",
+        ),
+    ] = 0,
 ) -> BucketObjectsListResponse:
     """List objects in an S3 bucket with optional prefix filtering - S3 bucket exploration and object retrieval tasks
 
@@ -109,6 +118,7 @@ def bucket_objects_list(
         max_keys: Maximum number of objects to return (1-1000)
         continuation_token: Token for paginating through large result sets (from previous response)
         include_signed_urls: Include presigned download URLs for each object
+        signed_url_limit: Only presign the first N objects when include_signed_urls is true (0 for all)
 
     Returns:
         BucketObjectsListSuccess on success with bucket info and objects list,
@@ -156,14 +166,16 @@ def bucket_objects_list(
             prefix=prefix or None,
         )
 
+    contents = resp.get("Contents", []) or []
+    s3_uris = [f"s3://{bkt}/{item.get('Key')}" for item in contents]
+    signed_urls: list[str | None] = [None] * len(s3_uris)
+    if include_signed_urls:
+        # Sign locally with the request's client instead of resolving one per key.
+        signed_urls = S3Presigner(client).sign_many(s3_uris, limit=signed_url_limit or None)
+
     objects: list[S3Object] = []
-    for item in resp.get("Contents", []) or []:
+    for item, s3_uri, signed_url in zip(contents, s3_uris, signed_urls, strict=True):
         key = item.get("Key")
-        s3_uri = f"s3://{bkt}/{key}"
-        signed_url = None
-        if include_signed_urls:
-            signed_url = generate_signed_url(s3_uri)
-
         objects.append(
             S3Object(
                 key=key,
@@ -316,6 +328,32 @@ def bucket_object_text(
             examples=["utf-8", "latin-1", "ascii"],
         ),
     ] = "utf-8",
+    offset: Annotated[
+        int,
+        Field(
+            default=0,
+            ge=0,
+            description="Byte offset to start reading at; pass a previous response's next_offset to read the next page",
+        ),
+    ] = 0,
+    length: Annotated[
+        Optional[int],
+        Field(
+            default=None,
+            ge=1,
+            le=10485760,  # 10MB
+            description="Bytes to read from offset (defaults to max_bytes)",
+        ),
+    ] = None,
+    tail: Annotated[
+        Optional[int],
+        Field(
+            default=None,
+            ge=1,
+            le=10485760,  # 10MB
+            description="Read the last N bytes of the object instead of reading from offset",
+        ),
+    ] = None,
 ) -> BucketObjectTextResponse:
     """Read text content from an S3 object - S3 bucket exploration and object retrieval tasks
 
@@ -323,15 +361,19 @@ def bucket_object_text(
         s3_uri: Full S3 URI to the object
         max_bytes: Maximum bytes to read (1 byte to 10MB)
         encoding: Text encoding to use for decoding
+        offset: Byte offset to start reading at
+        length: Bytes to read from offset (defaults to max_bytes)
+        tail: Read the last N bytes of the object instead of reading from offset
 
     Returns:
-        BucketObjectTextSuccess on success with decoded text content,
-        BucketObjectTextError on failure with error details.
+        BucketObjectTextSuccess on success with decoded text content and a next_offset
+        cursor for the following page, BucketObjectTextError on failure with error details.
 
     Version-specific Error Responses:
         - InvalidVersionId: Generic error with operation details
         - NoSuchVersion: "Version {versionId} not found for {s3_uri}"
         - AccessDenied (with versionId): "Access denied for version {versionId} of {s3_uri}"
+        - InvalidRange: "Offset {offset} is beyond the end of {s3_uri}"
 
     Next step:
         Use the returned S3 metadata to answer the user's question or pass identifiers into the next bucket tool.
@@ -344,10 +386,14 @@ def bucket_object_text(
         # Next step: Use the returned S3 metadata to answer the user's question or pass identifiers into the next bucket tool.
         ```
     """
+    from ..services.s3_range import read_text_range
+
     try:
         bucket, key, version_id = parse_s3_uri(s3_uri)
     except ValueError as e:
         return BucketObjectTextError(error=str(e))
+    if tail is not None and offset:
+        return BucketObjectTextError(error="offset and tail cannot be combined", bucket=bucket, key=key)
 
     auth_ctx, error = _authorize_s3(
         "bucket_object_text",
@@ -369,12 +415,25 @@ def bucket_object_text(
         get_params = {"Bucket": bucket, "Key": key}
         if version_id:
             get_params["VersionId"] = version_id
-        obj = client.get_object(**get_params)
-        body = obj["Body"].read(max_bytes + 1)
+        page = read_text_range(
+            client, get_params, offset=offset, length=length or max_bytes, tail=tail, encoding=encoding
+        )
+    except LookupError as e:
+        return BucketObjectTextError(
+            error=f"Decode failed: {e}",
+            bucket=bucket,
+            key=key,
+        )
     except Exception as e:
-        # Handle version-specific errors
+        # Handle version- and range-specific errors
         if hasattr(e, "response") and "Error" in e.response:
             error_code = e.response["Error"]["Code"]
+            if error_code == "InvalidRange":
+                return BucketObjectTextError(
+                    error=f"Offset {offset} is beyond the end of {s3_uri}",
+                    bucket=bucket,
+                    key=key,
+                )
             if error_code == "NoSuchVersion":
                 return BucketObjectTextError(
                     error=f"Version {version_id} not found for {s3_uri}",
@@ -393,27 +452,17 @@ def bucket_object_text(
             key=key,
         )
 
-    truncated = len(body) > max_bytes
-    if truncated:
-        body = body[:max_bytes]
-
-    try:
-        text = body.decode(encoding, errors="replace")
-    except Exception as e:
-        return BucketObjectTextError(
-            error=f"Decode failed: {e}",
-            bucket=bucket,
-            key=key,
-        )
-
     return BucketObjectTextSuccess(
         bucket=bucket,
         key=key,
         s3_uri=s3_uri,
-        text=text,
+        text=page.text,
         encoding=encoding,
-        bytes_read=len(body),
-        truncated=truncated,
+        bytes_read=page.bytes_read,
+        truncated=page.next_offset is not None,
+        offset=page.offset,
+        next_offset=page.next_offset,
+        object_size=page.object_size,
         auth_type=auth_ctx.auth_type if auth_ctx else None,
     )
 
@@ -479,8 +528,8 @@ def bucket_objects_put(
         items: List of objects to upload, each with key and content
 
     Returns:
-        BucketObjectsPutSuccess on success with upload results,
-        BucketObjectsPutError on failure with error details.
+        BucketObjectsPutSuccess on success with per-item results (in input order) and
+        aggregate throughput stats, BucketObjectsPutError on failure with error details.
 
     Next step:
         Use the returned S3 metadata to answer the user's question or pass identifiers into the next bucket tool.
@@ -495,6 +544,9 @@ def bucket_objects_put(
         ```
     """
     import base64
+    import time
+
+    from ..services.s3_upload import MIB, UploadConfig, map_concurrently, upload_bytes
 
     bkt = _normalize_bucket(bucket)
     auth_ctx, error = _authorize_s3(
@@ -511,8 +563,9 @@ def bucket_objects_put(
     assert auth_ctx is not None, "auth_ctx should not be None after error check"
     client = auth_ctx.s3_client
     assert client is not None, "s3_client should not be None after authorization"
-    results: list[UploadResult] = []
-    for item in items:
+    config = UploadConfig.from_env()
+
+    def upload(item: dict[str, Any]) -> UploadResult:
         # Get item key (validated by Pydantic already)
         key = item["key"]
 
@@ -520,46 +573,47 @@ def bucket_objects_put(
         text = item.get("text")
         data = item.get("data")
 
-        # Encode the body
+        # Encode the body; each worker decodes only the item it is uploading
         if text is not None:
             encoding = item.get("encoding", "utf-8")
             try:
                 body = text.encode(encoding)
             except Exception as e:
-                results.append(UploadResult(key=key, error=f"encode failed: {e}"))
-                continue
+                return UploadResult(key=key, error=f"encode failed: {e}")
         else:
             try:
                 body = base64.b64decode(str(data), validate=True)
             except Exception as e:
-                results.append(UploadResult(key=key, error=f"base64 decode failed: {e}"))
-                continue
+                return UploadResult(key=key, error=f"base64 decode failed: {e}")
 
-        # Build put_object kwargs
-        put_kwargs: dict[str, Any] = {"Bucket": bkt, "Key": key, "Body": body}
         content_type = item.get("content_type")
-        if content_type:
-            put_kwargs["ContentType"] = content_type
-        metadata = item.get("metadata")
-        if metadata:
-            put_kwargs["Metadata"] = metadata
-
-        # Upload the object
         try:
-            resp = client.put_object(**put_kwargs)
-            results.append(
-                UploadResult(
-                    key=key,
-                    etag=resp.get("ETag"),
-                    size=len(body),
-                    content_type=put_kwargs.get("ContentType"),
-                )
+            uploaded = upload_bytes(
+                client,
+                bkt,
+                key,
+                body,
+                content_type=content_type,
+                metadata=item.get("metadata"),
+                config=config,
             )
         except Exception as e:
-            results.append(UploadResult(key=key, error=str(e)))
+            return UploadResult(key=key, error=str(e))
+        return UploadResult(
+            key=key,
+            etag=uploaded.etag,
+            size=uploaded.size,
+            content_type=content_type or None,
+            parts=uploaded.parts,
+        )
+
+    start = time.perf_counter()
+    results = map_concurrently(upload, items, config.max_concurrency)
+    elapsed = time.perf_counter() - start
 
     successes = sum(1 for r in results if r.etag is not None)
     failed = len(results) - successes
+    bytes_uploaded = sum(r.size or 0 for r in results if r.etag is not None)
 
     return BucketObjectsPutSuccess(
         bucket=bkt,
@@ -567,6 +621,9 @@ def bucket_objects_put(
         uploaded=successes,
         failed=failed,
         results=results,
+        bytes_uploaded=bytes_uploaded,
+        elapsed_ms=round(elapsed * 1000, 1),
+        throughput_mib_per_s=round(bytes_uploaded / MIB / elapsed, 2) if elapsed > 0 else None,
         auth_type=auth_ctx.auth_type if auth_ctx else None,
     )
 
@@ -596,6 +653,32 @@ def bucket_object_fetch(
             description="Return binary data as base64 (true) or attempt text decoding (false)",
         ),
     ] = True,
+    offset: Annotated[
+        int,
+        Field(
+            default=0,
+            ge=0,
+            description="Byte offset to start reading at; pass a previous response's next_offset to read the next page",
+        ),
+    ] = 0,
+    length: Annotated[
+        Optional[int],
+        Field(
+            default=None,
+            ge=1,
+            le=10485760,  # 10MB
+            description="Bytes to read from offset (defaults to max_bytes)",
+        ),
+    ] = None,
+    tail: Annotated[
+        Optional[int],
+        Field(
+            default=None,
+            ge=1,
+            le=10485760,  # 10MB
+            description="Read the last N bytes of the object instead of reading from offset",
+        ),
+    ] = None,
 ) -> BucketObjectFetchResponse:
     """Fetch binary or text data from an S3 object - S3 bucket exploration and object retrieval tasks
 
@@ -603,15 +686,19 @@ def bucket_object_fetch(
         s3_uri: Full S3 URI to the object
         max_bytes: Maximum bytes to read (1 byte to 10MB)
         base64_encode: Return binary data as base64 (true) or attempt text decoding (false)
+        offset: Byte offset to start reading at
+        length: Bytes to read from offset (defaults to max_bytes)
+        tail: Read the last N bytes of the object instead of reading from offset
 
     Returns:
-        BucketObjectFetchSuccess on success with object data (base64 or text),
-        BucketObjectFetchError on failure with error details.
+        BucketObjectFetchSuccess on success with object data (base64 or text) and a
+        next_offset cursor for the following page, BucketObjectFetchError on failure with error details.
 
     Version-specific Error Responses:
         - InvalidVersionId: Generic error with operation details
         - NoSuchVersion: "Version {versionId} not found for {s3_uri}"
         - AccessDenied (with versionId): "Access denied for version {versionId} of {s3_uri}"
+        - InvalidRange: "Offset {offset} is beyond the end of {s3_uri}"
 
     Next step:
         Use the returned S3 metadata to answer the user's question or pass identifiers into the next bucket tool.
@@ -626,10 +713,14 @@ def bucket_object_fetch(
     """
     import base64
 
+    from ..services.s3_range import decode_prefix, read_range
+
     try:
         bucket, key, version_id = parse_s3_uri(s3_uri)
     except ValueError as e:
         return BucketObjectFetchError(error=str(e))
+    if tail is not None and offset:
+        return BucketObjectFetchError(error="offset and tail cannot be combined", bucket=bucket, key=key)
 
     auth_ctx, error = _authorize_s3(
         "bucket_object_fetch",
@@ -651,13 +742,17 @@ def bucket_object_fetch(
         get_params = {"Bucket": bucket, "Key": key}
         if version_id:
             get_params["VersionId"] = version_id
-        obj = client.get_object(**get_params)
-        body = obj["Body"].read(max_bytes + 1)
-        content_type = obj.get("ContentType")
+        page = read_range(client, get_params, offset=offset, length=length or max_bytes, tail=tail)
     except Exception as e:
-        # Handle version-specific errors
+        # Handle version- and range-specific errors
         if hasattr(e, "response") and "Error" in e.response:
             error_code = e.response["Error"]["Code"]
+            if error_code == "InvalidRange":
+                return BucketObjectFetchError(
+                    error=f"Offset {offset} is beyond the end of {s3_uri}",
+                    bucket=bucket,
+                    key=key,
+                )
             if error_code == "NoSuchVersion":
                 return BucketObjectFetchError(
                     error=f"Version {version_id} not found for {s3_uri}",
@@ -676,9 +771,14 @@ def bucket_object_fetch(
             key=key,
         )
 
-    truncated = len(body) > max_bytes
-    if truncated:
-        body = body[:max_bytes]
+    body = page.data
+    next_offset = page.next_offset
+    page_fields: dict[str, Any] = {
+        "content_type": page.content_type,
+        "offset": page.offset,
+        "object_size": page.object_size,
+        "auth_type": auth_ctx.auth_type if auth_ctx else None,
+    }
 
     # Return base64-encoded or text data
     if base64_encode:
@@ -688,26 +788,29 @@ def bucket_object_fetch(
             key=key,
             s3_uri=s3_uri,
             data=data,
-            content_type=content_type,
             bytes_read=len(body),
-            truncated=truncated,
+            truncated=next_offset is not None,
+            next_offset=next_offset,
             is_base64=True,
-            auth_type=auth_ctx.auth_type if auth_ctx else None,
+            **page_fields,
         )
 
-    # Try to decode as text
+    # Try to decode as text, leaving a character split by the page boundary for the next page
     try:
-        text = body.decode("utf-8")
+        text, consumed = decode_prefix(body, "utf-8", final=next_offset is None)
+        if consumed < len(body):
+            body = body[:consumed]
+            next_offset = page.offset + consumed
         return BucketObjectFetchSuccess(
             bucket=bucket,
             key=key,
             s3_uri=s3_uri,
             data=text,
-            content_type=content_type,
             bytes_read=len(body),
-            truncated=truncated,
+            truncated=next_offset is not None,
+            next_offset=next_offset,
             is_base64=False,
-            auth_type=auth_ctx.auth_type if auth_ctx else None,
+            **page_fields,
         )
     except Exception:
         # Fallback to base64 if text decode fails
@@ -717,11 +820,11 @@ def bucket_object_fetch(
             key=key,
             s3_uri=s3_uri,
             data=data,
-            content_type=content_type,
             bytes_read=len(body),
-            truncated=truncated,
+            truncated=next_offset is not None,
+            next_offset=next_offset,
             is_base64=True,
-            auth_type=auth_ctx.auth_type if auth_ctx else None,
+            **page_fields,
         )
 
 
@@ -793,11 +896,7 @@ def bucket_object_link(
     client = auth_ctx.s3_client
     assert client is not None, "s3_client should not be None after authorization"
     try:
-        # Build params dict and conditionally add VersionId
-        url_params = {"Bucket": bucket, "Key": key}
-        if version_id:
-            url_params["VersionId"] = version_id
-        url = client.generate_presigned_url("get_object", Params=url_params, ExpiresIn=expiration)
+        url = S3Presigner(client, expiration=expiration).sign(bucket, key, version_id)
 
         # Calculate expiration timestamp
         expires_at = datetime.now(timezone.utc) + timedelta(seconds=expiration)
@@ -31,6 +31,7 @@ from .validation import (
     validate_s3_uris_required,
 )
 from ..ops.factory import QuiltOpsFactory
+from ..utils.presign import S3Presigner
 
 
 def _authorize_package(
@@ -172,10 +173,24 @@ def package_browse(
     max_depth: Annotated[
         int, Field(default=0, ge=0, description="Maximum directory depth to show (0 for unlimited)")
     ] = 0,
-    top: Annotated[int, Field(default=0, ge=0, description="Limit number of entries returned (0 for unlimited)")] = 0,
+    top: Annotated[
+        int, Field(default=0, ge=0, description="Maximum entries per page; use next_cursor for more (0 for all)")
+    ] = 0,
     include_signed_urls: Annotated[
         bool, Field(default=True, description="Include presigned download URLs for S3 objects")
     ] = True,
+    path: Annotated[
+        str,
+        Field(
+            default="",
+            description="Directory or file path within the package to browse (empty for the root)",
+            examples=["", "data/", "data/raw/"],
+        ),
+    ] = "",
+    cursor: Annotated[
+        str,
+        Field(default="", description="Cursor from a previous response's next_cursor to fetch the next page"),
+    ] = "",
 ) -> PackageBrowseSuccess | ErrorResponse:
     ok_registry, registry_error, registry_actions = validate_registry_required(registry, "package_browse")
     if not ok_registry:
@@ -194,11 +209,10 @@ def package_browse(
 
         quilt_ops = QuiltOpsFactory.create()
         with suppress_stdout():
-            content_infos = quilt_ops.browse_content(package_name, registry=normalized_registry, path="")
-            try:
-                pkg_metadata = quilt_ops.get_package_metadata(package_name, registry=normalized_registry)
-            except Exception:
-                pkg_metadata = None
+            # One backend round trip returns the page and the package metadata together.
+            listing = quilt_ops.browse_package(
+                package_name, registry=normalized_registry, path=path, limit=top, cursor=cursor or None
+            )
     except Exception as e:
         return ErrorResponse(error=f"Failed to browse package '{package_name}'", cause=str(e))
 
@@ -206,7 +220,9 @@ def package_browse(
     file_tree: dict[str, Any] | None = {} if recursive else None
     total_size = 0
     file_types = set()
-    content_list = content_infos[:top] if top > 0 else content_infos
+    content_list = listing.entries
+    # One client signs every entry locally; it is only resolved if something needs signing.
+    presigner = S3Presigner() if include_signed_urls else None
 
     for content_info in content_list:
         logical_key = content_info.path
@@ -225,13 +241,18 @@ def package_browse(
             "file_type": file_ext,
             "is_directory": is_directory,
         }
-        if include_file_info and content_info.download_url:
-            entry_data["physical_key"] = content_info.download_url
+        physical_key = content_info.physical_key or content_info.download_url
+        if include_file_info and physical_key:
+            entry_data["physical_key"] = physical_key
             if content_info.modified_date:
                 entry_data["last_modified"] = content_info.modified_date
-        if include_signed_urls and content_info.download_url:
-            entry_data["download_url"] = content_info.download_url
-            entry_data["s3_uri"] = content_info.download_url
+        if presigner is not None and physical_key:
+            download_url = content_info.download_url
+            if not download_url and not is_directory:
+                download_url = presigner.sign_uri(physical_key)
+            if download_url:
+                entry_data["download_url"] = download_url
+                entry_data["s3_uri"] = physical_key
         entries.append(entry_data)
         if recursive and file_tree is not None:
             _add_to_file_tree(file_tree, logical_key, entry_data, max_depth)
@@ -247,12 +268,15 @@ def package_browse(
     return PackageBrowseSuccess(
         package_name=package_name,
         registry=registry,
-        total_entries=len(entries),
+        total_entries=listing.total_entries,
         summary=summary,
         view_type="recursive" if recursive else "flat",
         file_tree=file_tree if recursive and file_tree else None,
         entries=entries,
-        metadata=pkg_metadata,
+        metadata=listing.metadata,
+        path=listing.path,
+        top_hash=listing.top_hash,
+        next_cursor=listing.next_cursor,
     )
 
 
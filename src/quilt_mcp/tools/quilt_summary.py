@@ -11,9 +11,6 @@ import io
 import base64
 from datetime import datetime, timezone
 from pathlib import Path
-import matplotlib.pyplot as plt
-import matplotlib
-import numpy as np
 from collections import defaultdict
 
 from .responses import (
@@ -27,9 +24,6 @@ from .responses import (
 
 logger = logging.getLogger(__name__)
 
-# Configure matplotlib for non-interactive backend
-matplotlib.use("Agg")
-
 # Color schemes for visualizations
 COLOR_SCHEMES = {
     "default": ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd"],
@@ -231,6 +225,14 @@ def generate_package_visualizations(
         # Next step: Write the generated summary artifacts or share their locations with the user.
         ```
     """
+    # matplotlib and numpy are imported on first use to keep server start-up fast.
+    import matplotlib
+
+    # Configure matplotlib for non-interactive backend
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     try:
         # Normalize incoming file_types to simple counts
         normalized_file_types: Dict[str, int] = {}
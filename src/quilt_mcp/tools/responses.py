@@ -147,6 +147,9 @@ class BucketObjectTextSuccess(SuccessResponse):
     encoding: str
     bytes_read: int
     truncated: bool
+    offset: int = 0
+    next_offset: Optional[int] = None  # Pass as offset to read the next page; None at end of object
+    object_size: Optional[int] = None
     auth_type: Optional[str] = None
 
 
@@ -169,6 +172,9 @@ class BucketObjectFetchSuccess(SuccessResponse):
     bytes_read: int
     truncated: bool
     is_base64: bool
+    offset: int = 0
+    next_offset: Optional[int] = None  # Pass as offset to read the next page; None at end of object
+    object_size: Optional[int] = None
     auth_type: Optional[str] = None
 
 
@@ -187,6 +193,7 @@ class UploadResult(BaseModel):
     etag: Optional[str] = None
     size: Optional[int] = None
     content_type: Optional[str] = None
+    parts: Optional[int] = None
     error: Optional[str] = None
 
 
@@ -198,6 +205,9 @@ class BucketObjectsPutSuccess(SuccessResponse):
     uploaded: int
     failed: int
     results: list[UploadResult]
+    bytes_uploaded: int = 0
+    elapsed_ms: Optional[float] = None
+    throughput_mib_per_s: Optional[float] = None
     auth_type: Optional[str] = None
 
 
@@ -271,12 +281,15 @@ class PackageBrowseSuccess(SuccessResponse):
 
     package_name: str
     registry: str
-    total_entries: int
+    total_entries: int  # Entries under path across all pages
     summary: PackageSummary
     view_type: Literal["recursive", "flat"]
     file_tree: Optional[dict] = None  # Recursive tree structure
     entries: list[dict]  # List of entry data with logical_key, physical_key, size, etc.
     metadata: Optional[dict] = None  # Package metadata if available
+    path: str = ""  # Path within the package that was browsed
+    top_hash: Optional[str] = None  # Revision the listing (and next_cursor) refers to
+    next_cursor: Optional[str] = None  # Pass as cursor to fetch the next page
 
 
 class PackageCreateSuccess(SuccessResponse):
@@ -945,6 +958,7 @@ class SearchBackendStatus(BaseModel):
     query_time_ms: Optional[float] = None
     result_count: Optional[int] = None
     error: Optional[str] = None
+    shards: Optional[dict[str, Any]] = None  # Fan-out shard report when buckets were searched in shards
 
 
 class SearchCatalogSuccess(SuccessResponse):
@@ -3,9 +3,8 @@
 This module exposes the unified search functionality as MCP tools.
 """
 
-import asyncio
 import re
-from typing import Annotated, Any, Dict, List, Literal, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional, cast
 from urllib.parse import urlparse
 
 import requests
@@ -22,7 +21,8 @@ from .responses import (
 )
 from ..search.tools.search_explain import search_explain as _search_explain
 from ..search.tools.search_suggest import search_suggest as _search_suggest
-from ..search.tools.unified_search import UnifiedSearchEngine
+from ..search.tools.unified_search import get_search_engine
+from ..services.async_http_client import run_sync
 
 _DOCS_SITEMAP_URL = "https://docs.quilt.bio/sitemap.xml"
 _DOCS_VERSION_PREFIX = "/version-"
@@ -167,6 +167,13 @@ def search_catalog(
             description="Return aggregated counts only (skips fetching full result payloads) when True.",
         ),
     ] = False,
+    include_aggregations: Annotated[
+        bool,
+        Field(
+            default=False,
+            description="With count_only, also return per-bucket, per-extension and size histogram counts.",
+        ),
+    ] = False,
 ) -> Dict[str, Any]:  # Returns dict on success, raises exception on failure
     """Intelligent unified search across Quilt catalog using Elasticsearch - Catalog and package search experiences
 
@@ -190,6 +197,7 @@ def search_catalog(
         include_metadata: Include rich metadata in results (default: True)
         explain_query: Include query execution explanation and backend selection reasoning (default: False)
         count_only: Return aggregated counts only (skips fetching full result payloads) when True.
+        include_aggregations: With count_only, also return per-bucket, per-extension and size histogram counts.
 
     Returns:
         Unified search results with metadata, explanations, and suggestions
@@ -201,6 +209,7 @@ def search_catalog(
         search_catalog("genomics/data", scope="package")  # Package-centric search with collapsed results
         search_catalog("README files", scope="global")  # Global search (files and packages)
         search_catalog("Parquet files", bucket="s3://other-bucket")  # Specific bucket with s3:// URI
+        search_catalog("*", count_only=True, include_aggregations=True)  # Exact hit count plus breakdowns
 
     Next step:
         Summarize the search insight or refine the query with another search helper.
@@ -224,36 +233,20 @@ def search_catalog(
         if bucket and bucket.startswith("s3://"):
             bucket = bucket[5:].split("/")[0]
 
-        # Handle count-only mode by running search and extracting count
-        if count_only:
-            engine = UnifiedSearchEngine()
+        # Get the long-lived search engine for this identity and execute search
+        engine = get_search_engine()
 
-            async def _get_count():
-                results = await engine.search(
+        # Handle async execution properly for MCP tools
+        async def _execute_search():
+            if count_only:
+                # Count-only mode asks the index for hit totals (size 0) instead of fetching results
+                return await engine.count(
                     query=query,
                     scope=scope,
                     bucket=bucket,
                     backend=backend,
-                    limit=0,  # Don't need results
-                    include_metadata=False,
-                    explain_query=False,
+                    include_aggregations=include_aggregations,
                 )
-                return {
-                    "success": True,
-                    "total_count": results.get("total_results", 0),
-                    "query": query,
-                    "scope": scope,
-                    "bucket": bucket,
-                    "count_only": True,
-                }
-
-            return asyncio.run(_get_count())
-
-        # Get search engine and execute search
-        engine = UnifiedSearchEngine()
-
-        # Handle async execution properly for MCP tools
-        async def _execute_search():
             return await engine.search(
                 query=query,
                 scope=scope,
@@ -264,19 +257,12 @@ def search_catalog(
                 explain_query=explain_query,
             )
 
-        try:
-            # Try to get the current event loop
-            asyncio.get_running_loop()
-            # We're in an async context, need to handle this carefully
-            import concurrent.futures
+        # Run on the shared background loop so pooled HTTP connections outlive the call.
+        # Increased timeout to 120s for large Elasticsearch searches across many buckets
+        result = run_sync(_execute_search(), timeout=120)
 
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, _execute_search())
-                # Increased timeout to 120s for large Elasticsearch searches across many buckets
-                result = future.result(timeout=120)
-        except RuntimeError:
-            # No event loop running, we can use asyncio.run directly
-            result = asyncio.run(_execute_search())
+        if count_only:
+            return cast(Dict[str, Any], result)
 
         # Convert result dict to proper response model, then serialize to dict
         if result.get("success", False):
@@ -305,7 +291,7 @@ def search_catalog(
             )
             # Return error dict instead of raising
             return error_model.model_dump()
-    except asyncio.TimeoutError as e:
+    except TimeoutError as e:
         raise RuntimeError(f"Search timeout: {e}")
     except OSError as e:
         raise RuntimeError(f"Search I/O error: {e}")
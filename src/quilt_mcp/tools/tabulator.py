@@ -5,6 +5,7 @@ the backend layer, replacing the deprecated TabulatorService.
 """
 
 from typing import List, Dict, Any, Optional, Literal
+import asyncio
 import logging
 
 from quilt_mcp.ops.factory import QuiltOpsFactory
@@ -24,7 +25,7 @@ async def tabulator_tables_list(bucket: str) -> Dict[str, Any]:
     """
     try:
         backend = QuiltOpsFactory.create()
-        tables = backend.list_tabulator_tables(bucket)
+        tables = await backend.alist_tabulator_tables(bucket)
 
         # Enrich tables with parsed config info
         import yaml
@@ -115,7 +116,7 @@ async def tabulator_table_create(
         config_yaml = yaml.dump(config_dict, default_flow_style=False)
 
         backend = QuiltOpsFactory.create()
-        result = backend.create_tabulator_table(bucket_name, table_name, config_yaml)
+        result = await asyncio.to_thread(backend.create_tabulator_table, bucket_name, table_name, config_yaml)
 
         return {
             "success": True,
@@ -147,7 +148,7 @@ async def tabulator_table_delete(bucket_name: str, table_name: str) -> Dict[str,
     """
     try:
         backend = QuiltOpsFactory.create()
-        backend.delete_tabulator_table(bucket_name, table_name)
+        await asyncio.to_thread(backend.delete_tabulator_table, bucket_name, table_name)
 
         return {
             "success": True,
@@ -174,7 +175,7 @@ async def tabulator_table_rename(bucket_name: str, table_name: str, new_table_na
     """
     try:
         backend = QuiltOpsFactory.create()
-        backend.rename_tabulator_table(bucket_name, table_name, new_table_name)
+        await asyncio.to_thread(backend.rename_tabulator_table, bucket_name, table_name, new_table_name)
 
         return {
             "success": True,
@@ -197,7 +198,7 @@ async def tabulator_open_query_status() -> Dict[str, Any]:
     """
     try:
         backend = QuiltOpsFactory.create()
-        return backend.get_open_query_status()
+        return await backend.aget_open_query_status()
 
     except Exception as e:
         logger.error(f"Error in tabulator_open_query_status: {e}")
@@ -215,7 +216,7 @@ async def tabulator_open_query_toggle(enabled: bool) -> Dict[str, Any]:
     """
     try:
         backend = QuiltOpsFactory.create()
-        return backend.set_open_query(enabled)
+        return await asyncio.to_thread(backend.set_open_query, enabled)
 
     except Exception as e:
         logger.error(f"Error in tabulator_open_query_toggle: {e}")
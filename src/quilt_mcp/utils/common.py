@@ -395,23 +395,18 @@ def _runtime_boto3_session() -> Optional[boto3.Session]:
     return None
 
 
-def get_s3_client():
-    """Get an S3 client instance.
+def _get_aws_client(service_name: str) -> Any:
+    """Resolve a pooled AWS client using the standard credential priority."""
+    from quilt_mcp.services.aws_client_registry import get_pooled_client
 
-    Credential priority:
-    1. Runtime context session/credentials
-    2. quilt3 authenticated session
-    3. Default boto3 environment/role credentials
-    """
     session = _runtime_boto3_session()
     if session:
-        return session.client("s3")
+        return get_pooled_client(session, service_name)
 
     try:
         from quilt_mcp.services.jwt_auth_service import JWTAuthService
 
-        session = JWTAuthService().get_boto3_session()
-        return session.client("s3")
+        return JWTAuthService().get_aws_client(service_name)
     except Exception:
         pass
 
@@ -423,48 +418,40 @@ def get_s3_client():
             if hasattr(quilt3, "get_boto3_session"):
                 session = quilt3.get_boto3_session()
                 if session is not None:
-                    return session.client("s3")
+                    return get_pooled_client(session, service_name)
     except Exception:
         pass
 
-    # Fallback to default boto3 client
-    return boto3.client("s3")
+    # Fallback to the default boto3 session
+    return get_pooled_client(None, service_name)
 
 
-def get_sts_client():
-    """Get an STS client instance.
+def get_s3_client():
+    """Get an S3 client instance.
+
+    Clients are shared across calls through the AWS client registry.
 
     Credential priority:
     1. Runtime context session/credentials
-    2. quilt3 authenticated session
-    3. Default boto3 environment/role credentials
+    2. JWT-exchanged credentials
+    3. quilt3 authenticated session
+    4. Default boto3 environment/role credentials
     """
-    session = _runtime_boto3_session()
-    if session:
-        return session.client("sts")
-
-    try:
-        from quilt_mcp.services.jwt_auth_service import JWTAuthService
+    return _get_aws_client("s3")
 
-        session = JWTAuthService().get_boto3_session()
-        return session.client("sts")
-    except Exception:
-        pass
 
-    try:
-        import quilt3
+def get_sts_client():
+    """Get an STS client instance.
 
-        # Check if we have Quilt session available
-        if hasattr(quilt3, "logged_in") and quilt3.logged_in():
-            if hasattr(quilt3, "get_boto3_session"):
-                session = quilt3.get_boto3_session()
-                if session is not None:
-                    return session.client("sts")
-    except Exception:
-        pass
+    Clients are shared across calls through the AWS client registry.
 
-    # Fallback to default boto3 client
-    return boto3.client("sts")
+    Credential priority:
+    1. Runtime context session/credentials
+    2. JWT-exchanged credentials
+    3. quilt3 authenticated session
+    4. Default boto3 environment/role credentials
+    """
+    return _get_aws_client("sts")
 
 
 def validate_package_name(package_name: str) -> bool:
@@ -609,48 +596,8 @@ def build_http_app(mcp: FastMCP, transport: Literal["http", "sse", "streamable-h
         logger.error("HTTP transport requested but FastMCP does not expose http_app(): %s", exc)
         raise
 
-    try:
-        from starlette.middleware.base import BaseHTTPMiddleware
-        from starlette.datastructures import MutableHeaders
-    except ImportError as exc:  # pragma: no cover
-        logger.error("Starlette HTTP middleware unavailable: %s", exc)
-        return app
-
-    class QuiltAcceptHeaderMiddleware(BaseHTTPMiddleware):
-        """Middleware that fixes Accept headers for SSE compatibility."""
-
-        HEALTH_PATHS = {"/health", "/healthz", "/"}
-
-        async def dispatch(self, request, call_next):
-            # Skip Accept header modification for health check endpoints
-            if request.url.path in self.HEALTH_PATHS:
-                return await call_next(request)
-
-            headers = MutableHeaders(scope=request.scope)
-            accept_header = headers.get("accept", "")
-
-            # For MCP protocol endpoints, ensure both application/json and text/event-stream are present
-            if request.url.path.startswith("/mcp"):
-                needs_json = "application/json" not in accept_header
-                needs_sse = "text/event-stream" not in accept_header
-
-                if needs_json and needs_sse:
-                    # No Accept header or missing both - add both
-                    headers["accept"] = "application/json, text/event-stream"
-                elif needs_json:
-                    # Has SSE but not JSON
-                    headers["accept"] = f"application/json, {accept_header}"
-                elif needs_sse:
-                    # Has JSON but not SSE
-                    headers["accept"] = f"{accept_header}, text/event-stream"
-            elif "application/json" in accept_header and "text/event-stream" not in accept_header:
-                # For other endpoints, add SSE if JSON is present
-                headers["accept"] = f"{accept_header}, text/event-stream"
-
-            return await call_next(request)
-
-    app.add_middleware(QuiltAcceptHeaderMiddleware)
-
+    # All middleware is plain ASGI: BaseHTTPMiddleware adds a task and stream per
+    # request and buffers streaming (SSE) responses.
     try:
         from starlette.middleware.cors import CORSMiddleware
 
@@ -665,14 +612,13 @@ def build_http_app(mcp: FastMCP, transport: Literal["http", "sse", "streamable-h
     except ImportError:  # pragma: no cover - starlette optional guard
         logger.warning("CORS middleware unavailable; continuing without CORS configuration")
 
-    mode_config = get_mode_config()
-
     try:
         from quilt_mcp.middleware.jwt_extraction import JwtExtractionMiddleware
 
         # Add last so it runs first in Starlette's middleware stack.
-        # This middleware only extracts JWT - GraphQL backend validates it.
-        app.add_middleware(JwtExtractionMiddleware, require_jwt=mode_config.requires_jwt)
+        # This middleware only extracts JWT - GraphQL backend validates it - and
+        # fixes Accept headers for SSE compatibility in the same pass.
+        app.add_middleware(JwtExtractionMiddleware, require_jwt=mode_config.requires_jwt, normalize_accept=True)
         if mode_config.requires_jwt:
             logger.info("JWT extraction middleware enabled for HTTP transport (validation at GraphQL)")
         else:
@@ -684,6 +630,50 @@ def build_http_app(mcp: FastMCP, transport: Literal["http", "sse", "streamable-h
     return app
 
 
+HTTP_APP_FACTORY = "quilt_mcp.utils.common:create_http_app"
+
+
+def create_http_app():
+    """Build the configured HTTP app; the factory each uvicorn worker process calls."""
+    set_default_environment("web-service")
+    transport = os.environ.get("FASTMCP_TRANSPORT", "http")
+    if transport not in ("http", "sse", "streamable-http"):
+        transport = "http"
+    return build_http_app(create_configured_server(), transport=transport)  # type: ignore[arg-type]
+
+
+def get_http_workers() -> int:
+    """Return the number of HTTP worker processes to run (``FASTMCP_WORKERS``, default 1).
+
+    Several workers need stateless HTTP sessions, which only multiuser mode
+    uses, and must resolve the same mode from the environment; otherwise this
+    logs a warning and returns 1. ``run_server`` hands the resolved deployment
+    to the workers.
+    """
+    import logging
+
+    logger = logging.getLogger(__name__)
+
+    try:
+        workers = int(os.environ.get("FASTMCP_WORKERS", "1"))
+    except ValueError:
+        logger.warning("Ignoring invalid FASTMCP_WORKERS=%r", os.environ.get("FASTMCP_WORKERS"))
+        return 1
+    if workers <= 1:
+        return 1
+
+    from quilt_mcp.config import get_mode_config
+
+    mode_config = get_mode_config()
+    if not mode_config.is_multiuser:
+        logger.warning("FASTMCP_WORKERS=%d ignored: sessions are per-process outside multiuser mode", workers)
+        return 1
+    if mode_config.backend_selection_source == "cli":
+        logger.warning("FASTMCP_WORKERS=%d ignored: worker processes cannot see --backend; use --deployment", workers)
+        return 1
+    return workers
+
+
 def run_server(skip_banner: bool = False) -> None:
     """Run the MCP server with proper error handling.
 
@@ -715,12 +705,23 @@ def run_server(skip_banner: bool = False) -> None:
         set_default_environment("web-service")
 
         if transport in ["http", "sse", "streamable-http"]:
-            app = build_http_app(mcp, transport=transport)
-
             import uvicorn
 
             host = os.environ.get("FASTMCP_ADDR") or os.environ.get("FASTMCP_HOST") or "127.0.0.1"
             port = int(os.environ.get("FASTMCP_PORT", "8000"))
+            workers = get_http_workers()
+            if workers > 1:
+                from quilt_mcp.config import get_mode_config
+
+                # Each worker builds its own app; the server created above only validated startup.
+                # Workers are fresh interpreters that resolve transport and mode from the environment,
+                # so pass both on explicitly (a --deployment flag is otherwise invisible to them).
+                os.environ["FASTMCP_TRANSPORT"] = transport
+                os.environ["QUILT_DEPLOYMENT"] = get_mode_config().deployment_mode.value
+                uvicorn.run(HTTP_APP_FACTORY, factory=True, workers=workers, host=host, port=port, log_level="info")
+                return
+
+            app = build_http_app(mcp, transport=transport)
             uvicorn.run(app, host=host, port=port, log_level="info")
             return
 
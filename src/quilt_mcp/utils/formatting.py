@@ -6,10 +6,13 @@ with a focus on making tabular data more readable and user-friendly.
 
 from __future__ import annotations
 
-import pandas as pd
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 import logging
 
+# pandas is imported on first use to keep server start-up fast.
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +31,8 @@ def format_as_table(
     Returns:
         Formatted table string
     """
+    import pandas as pd
+
     try:
         # Convert input to DataFrame
         if isinstance(data, pd.DataFrame):
@@ -104,6 +109,8 @@ def should_use_table_format(data: Any, output_format: str = "auto", min_rows: in
         return False
 
     try:
+        import pandas as pd
+
         # Check if data is tabular
         if isinstance(data, pd.DataFrame):
             return len(data) >= min_rows and len(data.columns) <= max_cols
@@ -185,6 +192,8 @@ def format_athena_results_as_table(result: Dict[str, Any]) -> Dict[str, Any]:
                 # Parse CSV string back to DataFrame for table formatting
                 import io
 
+                import pandas as pd
+
                 df = pd.read_csv(io.StringIO(data))
                 table_str = format_as_table(df)
                 result["formatted_data_table"] = table_str
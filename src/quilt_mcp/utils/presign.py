@@ -0,0 +1,82 @@
+"""Batch presigned-URL generation for S3 objects.
+
+Presigning is a local HMAC computation once credentials are resolved, so the
+expensive part of ``generate_signed_url`` is resolving a client per key. The
+``S3Presigner`` resolves one client per request and signs any number of keys
+with it, without further network calls.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Iterable, List, Optional
+
+from quilt_mcp.utils.common import parse_s3_uri
+
+logger = logging.getLogger(__name__)
+
+MIN_EXPIRATION_SECONDS = 1
+MAX_EXPIRATION_SECONDS = 604800  # 7 days
+
+
+class S3Presigner:
+    """Sign S3 GET URLs for many objects with a single client.
+
+    Args:
+        client: boto3 S3 client to sign with; resolved via ``get_s3_client()``
+            on first use when omitted
+        expiration: URL lifetime in seconds, clamped to 1 second .. 7 days
+    """
+
+    def __init__(self, client: Any = None, *, expiration: int = 3600) -> None:
+        self._client = client
+        self._client_failed = False
+        self.expiration = max(MIN_EXPIRATION_SECONDS, min(int(expiration), MAX_EXPIRATION_SECONDS))
+
+    @property
+    def client(self) -> Any:
+        """Return the signing client, resolving it lazily (at most once)."""
+        if self._client is None and not self._client_failed:
+            try:
+                from quilt_mcp.utils.common import get_s3_client
+
+                self._client = get_s3_client()
+            except Exception as exc:
+                logger.debug("Could not resolve S3 client for presigning: %s", exc)
+                self._client_failed = True
+        return self._client
+
+    def sign(self, bucket: str, key: str, version_id: Optional[str] = None) -> str:
+        """Return a presigned GET URL, raising the client's error on failure."""
+        client = self.client
+        if client is None:
+            raise RuntimeError("No S3 client available for presigning")
+        params = {"Bucket": bucket, "Key": key}
+        if version_id:
+            params["VersionId"] = version_id
+        return str(client.generate_presigned_url("get_object", Params=params, ExpiresIn=self.expiration))
+
+    def sign_uri(self, s3_uri: str) -> Optional[str]:
+        """Return a presigned URL for an ``s3://`` URI, or None if it cannot be signed."""
+        if not s3_uri or not s3_uri.startswith("s3://"):
+            return None
+        try:
+            bucket, key, version_id = parse_s3_uri(s3_uri)
+            return self.sign(bucket, key, version_id)
+        except Exception as exc:
+            logger.debug("Failed to presign %s: %s", s3_uri, exc)
+            return None
+
+    def sign_many(self, s3_uris: Iterable[str], *, limit: Optional[int] = None) -> List[Optional[str]]:
+        """Presign URIs in order, signing only the first ``limit`` entries.
+
+        Entries past ``limit`` (and entries that fail) are returned as None so
+        the result always lines up with the input.
+        """
+        results: List[Optional[str]] = []
+        for index, s3_uri in enumerate(s3_uris):
+            if limit is not None and index >= limit:
+                results.append(None)
+                continue
+            results.append(self.sign_uri(s3_uri))
+        return results
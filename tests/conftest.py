@@ -38,6 +38,21 @@ if app_dir not in sys.path:
 
 # Removed unused README test framework imports
 
+from quilt_mcp.ops.backend_pool import reset_backend_pool
+from quilt_mcp.search.tools.unified_search import reset_search_engines
+from quilt_mcp.search.utils.bucket_catalog import reset_bucket_catalog
+from quilt_mcp.services.async_http_client import reset_async_http_registry
+from quilt_mcp.services.athena_connection_registry import reset_athena_connection_registry
+from quilt_mcp.services.athena_result_cache import reset_athena_result_cache
+from quilt_mcp.services.aws_client_registry import reset_client_registry
+from quilt_mcp.services.catalog_config_cache import reset_catalog_config_cache
+from quilt_mcp.services.credential_store import reset_credential_store
+from quilt_mcp.services.governance_service import reset_admin_executor
+from quilt_mcp.services.manifest_cache import reset_manifest_cache
+from quilt_mcp.services.permission_discovery import reset_permission_caches, reset_permission_probe_executor
+from quilt_mcp.services.s3_upload import reset_part_executor
+from quilt_mcp.services.shared_cache import reset_shared_cache
+
 
 # ============================================================================
 # Test-Only Configuration (NEVER used in production code)
@@ -168,9 +183,44 @@ def test_env():
     yield
 
 
+# Process-wide caches keyed by credentials or identity; every test starts and ends with them empty.
+_PROCESS_CACHE_RESETS: tuple[Callable[[], None], ...] = (
+    reset_credential_store,
+    reset_client_registry,
+    reset_search_engines,
+    reset_bucket_catalog,
+    reset_athena_connection_registry,
+    reset_athena_result_cache,
+    reset_backend_pool,
+    reset_manifest_cache,
+    reset_catalog_config_cache,
+    reset_async_http_registry,
+    reset_admin_executor,
+    reset_permission_caches,
+    reset_permission_probe_executor,
+    reset_part_executor,
+    reset_shared_cache,
+)
+
+
+def _reset_process_caches() -> None:
+    """Drop process-wide caches that are keyed by credentials or identity."""
+    for reset in _PROCESS_CACHE_RESETS:
+        reset()
+
+
+@pytest.fixture(autouse=True)
+def isolate_process_caches():
+    """Keep process-wide credential/identity caches from leaking between tests."""
+    _reset_process_caches()
+    yield
+    _reset_process_caches()
+
+
 @pytest.fixture
 def clean_auth():
     """Ensure runtime auth state doesn't leak between tests (opt-in)."""
+    _reset_process_caches()
     try:
         from quilt_mcp.context.runtime_context import clear_runtime_auth, update_runtime_metadata
 
@@ -205,6 +255,8 @@ def clean_auth():
     except Exception:
         pass
 
+    _reset_process_caches()
+
 
 @pytest.fixture(params=_backend_mode_params())
 def backend_mode(request, monkeypatch, clean_auth, test_env):
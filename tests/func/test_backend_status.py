@@ -7,6 +7,7 @@ integration into catalog_info and search_catalog responses.
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from quilt_mcp.search.utils.backend_status import (
+    BackendStatusSnapshot,
     get_search_backend_status,
     get_backend_capabilities,
 )
@@ -57,7 +58,7 @@ class TestBackendStatusHelper:
 
     def test_backend_status_when_available(self):
         """Test backend status when a backend is available."""
-        with patch("quilt_mcp.search.tools.unified_search.UnifiedSearchEngine") as mock_engine:
+        with patch("quilt_mcp.search.tools.unified_search.get_search_engine") as mock_engine:
             # Create mock backend that is available
             mock_backend = Mock()
             mock_backend.backend_type = BackendType.ELASTICSEARCH
@@ -73,6 +74,7 @@ class TestBackendStatusHelper:
             # Setup engine mock
             mock_engine_instance = Mock()
             mock_engine_instance.registry = mock_registry
+            mock_engine_instance.status_snapshot = BackendStatusSnapshot(mock_registry)
             mock_engine.return_value = mock_engine_instance
 
             status = get_search_backend_status()
@@ -84,7 +86,7 @@ class TestBackendStatusHelper:
 
     def test_backend_status_when_unavailable(self):
         """Test backend status when no backends are available."""
-        with patch("quilt_mcp.search.tools.unified_search.UnifiedSearchEngine") as mock_engine:
+        with patch("quilt_mcp.search.tools.unified_search.get_search_engine") as mock_engine:
             # Create mock backend that is unavailable
             mock_backend = Mock()
             mock_backend.backend_type = BackendType.ELASTICSEARCH
@@ -100,6 +102,7 @@ class TestBackendStatusHelper:
             # Setup engine mock
             mock_engine_instance = Mock()
             mock_engine_instance.registry = mock_registry
+            mock_engine_instance.status_snapshot = BackendStatusSnapshot(mock_registry)
             mock_engine.return_value = mock_engine_instance
 
             status = get_search_backend_status()
@@ -110,8 +113,8 @@ class TestBackendStatusHelper:
 
     def test_backend_status_error_handling(self):
         """Test that backend status handles errors gracefully."""
-        with patch("quilt_mcp.search.tools.unified_search.UnifiedSearchEngine") as mock_engine:
-            # Make UnifiedSearchEngine raise an exception
+        with patch("quilt_mcp.search.tools.unified_search.get_search_engine") as mock_engine:
+            # Make engine construction raise an exception
             mock_engine.side_effect = Exception("Test error")
 
             status = get_search_backend_status()
@@ -45,19 +45,20 @@ async def test_func_search_retry_on_403_then_success(monkeypatch):
     backend._initialized = True
     backend._session_available = True
 
+    buckets = [f"bucket-{i}" for i in range(60)]
     with (
-        patch.object(backend, "_build_index_pattern", return_value="a,b,c"),
-        patch.object(backend, "_get_available_buckets", return_value=["a", "b", "c", "d"]),
+        patch.object(backend, "_build_index_pattern", return_value=",".join(buckets)),
+        patch.object(backend, "_get_available_buckets", return_value=buckets),
     ):
         calls = {"n": 0}
 
-        async def fake_to_thread(fn, *args):
+        async def fake_search_api(*args):
             calls["n"] += 1
             if calls["n"] == 1:
                 raise Exception("403 forbidden")
             return {"hits": {"hits": []}}
 
-        monkeypatch.setattr("quilt_mcp.search.backends.elasticsearch.asyncio.to_thread", fake_to_thread)
+        monkeypatch.setattr(backend, "_aexecute_search_api", fake_search_api)
         result = await backend.search("query", scope="file", bucket="", limit=5)
 
     assert result.status == BackendStatus.AVAILABLE
@@ -71,10 +72,10 @@ async def test_func_search_returns_error_response_on_backend_error(monkeypatch):
 
     with patch.object(backend, "_build_index_pattern", return_value="bucket"):
 
-        async def fake_to_thread(fn, *args):
+        async def fake_search_api(*args):
             return {"error": "functional failure"}
 
-        monkeypatch.setattr("quilt_mcp.search.backends.elasticsearch.asyncio.to_thread", fake_to_thread)
+        monkeypatch.setattr(backend, "_aexecute_search_api", fake_search_api)
         result = await backend.search("query", scope="global", filters={"size_min": 10}, limit=5)
 
     assert result.status == BackendStatus.ERROR
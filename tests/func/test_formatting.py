@@ -1,7 +1,7 @@
 """Integration tests for table formatting with MCP tools."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import pandas as pd
 
 from quilt_mcp.services.athena_read_service import (
@@ -178,13 +178,15 @@ class TestTabulatorTableFormatIntegration:
         mock_backend = Mock()
         mock_create.return_value = mock_backend
 
-        # Mock list_tabulator_tables to return tabular data
-        mock_backend.list_tabulator_tables.return_value = [
-            {
-                "name": "table1",
-                "config": "schema:\n- name: col1\n  type: STRING\n- name: col2\n  type: INT\n",
-            }
-        ]
+        # Mock alist_tabulator_tables to return tabular data
+        mock_backend.alist_tabulator_tables = AsyncMock(
+            return_value=[
+                {
+                    "name": "table1",
+                    "config": "schema:\n- name: col1\n  type: STRING\n- name: col2\n  type: INT\n",
+                }
+            ]
+        )
 
         # Call the async function
         result = await tabulator_tables_list("test-bucket")
@@ -195,7 +197,7 @@ class TestTabulatorTableFormatIntegration:
         assert result["tables"][0]["name"] == "table1"
         assert result["bucket_name"] == "test-bucket"
         # Verify backend was called
-        mock_backend.list_tabulator_tables.assert_called_once_with("test-bucket")
+        mock_backend.alist_tabulator_tables.assert_awaited_once_with("test-bucket")
 
 
 class TestTableFormatErrorHandling:
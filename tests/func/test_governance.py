@@ -1,7 +1,7 @@
 """Functional tests for governance workflows using mocked admin backends."""
 
 import pytest
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 from quilt_mcp.context.request_context import RequestContext
 from quilt_mcp.domain.role import Role
@@ -47,6 +47,7 @@ def mock_quilt_ops():
     mock_admin.get_sso_config.return_value = SSOConfig("config", "2023-01-01T00:00:00Z", user)
 
     mock_ops.admin = mock_admin
+    mock_ops.aget_open_query_status = AsyncMock(return_value={"success": True, "open_query_enabled": True})
     return mock_ops
 
 
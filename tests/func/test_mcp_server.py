@@ -25,11 +25,15 @@ def test_quilt_tools(mock_browse, mock_search, mock_quilt3, mock_search_ops_crea
     mock_auth_status = Mock()
     mock_auth_status.registry_url = "s3://quilt-ernest-staging"
     mock_quilt_ops.get_auth_status.return_value = mock_auth_status
-    mock_quilt_ops.browse_content.return_value = [
-        Mock(path="README.md", size=123, type="file", download_url=None, modified_date=None)
-    ]
-    # package_browse now uses QuiltOps public metadata API
-    mock_quilt_ops.get_package_metadata.return_value = {}
+    # package_browse fetches entries and metadata with a single QuiltOps call
+    mock_quilt_ops.browse_package.return_value = Mock(
+        entries=[Mock(path="README.md", size=123, type="file", download_url=None, modified_date=None)],
+        metadata={},
+        path="",
+        top_hash=None,
+        total_entries=1,
+        next_cursor=None,
+    )
     mock_search_ops_create.return_value = mock_quilt_ops
     mock_packages_ops_create.return_value = mock_quilt_ops
 
@@ -30,16 +30,16 @@ class _StubAuthService:
         return {"user_id": f"user-{self._session.label}"}
 
 
-def test_permission_cache_isolated_between_instances():
+def test_permission_cache_isolated_between_identities():
     service_a = PermissionDiscoveryService(_StubAuthService(_StubSession("a")))
     service_b = PermissionDiscoveryService(_StubAuthService(_StubSession("b")))
 
-    service_a._discovery.permission_cache["bucket-a"] = "value-a"
-    service_b._discovery.permission_cache["bucket-b"] = "value-b"
+    # Stub sessions carry no identity, so each discovery scopes its entries to itself.
+    scope_a = service_a._discovery._scope()
+    scope_b = service_b._discovery._scope()
 
-    assert "bucket-a" in service_a._discovery.permission_cache
-    assert "bucket-a" not in service_b._discovery.permission_cache
-    assert "bucket-b" in service_b._discovery.permission_cache
+    assert service_a._discovery.permission_cache is service_b._discovery.permission_cache
+    assert scope_a != scope_b
 
 
 def test_permission_service_uses_correct_session_clients():
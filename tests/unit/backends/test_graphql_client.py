@@ -1,8 +1,14 @@
+import json
 from unittest.mock import Mock
 
+import httpx
 import pytest
 
-from quilt_mcp.backends.platform_graphql_client import PlatformGraphQLClient
+from quilt_mcp.backends.platform_graphql_client import (
+    GraphQLRequest,
+    PlatformGraphQLClient,
+    track_graphql_requests,
+)
 
 
 def _mock_response(*, payload, raise_exc=None):
@@ -62,3 +68,138 @@ def test_execute_propagates_http_errors():
 
     with pytest.raises(RuntimeError, match="http error"):
         client.execute("query Test { ok }")
+
+
+def test_execute_batch_merges_operations_into_one_aliased_request():
+    session = Mock()
+    session.post.return_value = _mock_response(
+        payload={
+            "data": {"b0_package": {"name": "team/a"}, "b1_bucketConfigs": [{"name": "b"}], "b1_me": {"name": "u"}},
+        }
+    )
+    client = PlatformGraphQLClient(session, "https://example.invalid/graphql", "Bearer token")
+
+    results = client.execute_batch(
+        [
+            GraphQLRequest(
+                'query Pkg($name: String!) { package(bucket: "$x", name: $name) { name } }',
+                {"name": "team/a"},
+            ),
+            GraphQLRequest("query Info { bucketConfigs { name } me { name } }"),
+        ]
+    )
+
+    assert results == [
+        {"data": {"package": {"name": "team/a"}}},
+        {"data": {"bucketConfigs": [{"name": "b"}], "me": {"name": "u"}}},
+    ]
+    session.post.assert_called_once()
+    payload = session.post.call_args.kwargs["json"]
+    assert payload["variables"] == {"b0_name": "team/a"}
+    assert "query Batched($b0_name: String!)" in payload["query"]
+    assert 'b0_package: package(bucket: "$x", name: $b0_name)' in payload["query"]
+    assert "b1_bucketConfigs: bucketConfigs" in payload["query"]
+    assert "b1_me: me" in payload["query"]
+
+
+def test_execute_batch_keeps_existing_aliases_and_routes_errors():
+    session = Mock()
+    session.post.return_value = _mock_response(
+        payload={
+            "data": {"b0_first": {"hash": "h1"}, "b1_second": None},
+            "errors": [
+                {"message": "not found", "path": ["b1_second", "hash"]},
+                {"message": "rate limited"},
+            ],
+        }
+    )
+    client = PlatformGraphQLClient(session, "https://example.invalid/graphql", "Bearer token")
+
+    results = client.execute_batch(
+        [
+            GraphQLRequest("{ first: revision(hash: 1) { hash } }"),
+            GraphQLRequest("{ second : revision(hash: 2) { hash } }"),
+        ]
+    )
+
+    query = session.post.call_args.kwargs["json"]["query"]
+    assert "b0_first: revision" in query
+    assert "b1_second : revision" in query
+    assert results[0] == {"data": {"first": {"hash": "h1"}}, "errors": [{"message": "rate limited"}]}
+    assert results[1]["data"] == {"second": None}
+    assert results[1]["errors"] == [
+        {"message": "not found", "path": ["second", "hash"]},
+        {"message": "rate limited"},
+    ]
+
+
+def test_execute_batch_rejects_mixed_operation_types():
+    client = PlatformGraphQLClient(Mock(), "https://example.invalid/graphql", "Bearer token")
+
+    with pytest.raises(ValueError, match="cannot be batched together"):
+        client.execute_batch([GraphQLRequest("query A { a }"), GraphQLRequest("mutation B { b }")])
+
+
+def test_execute_batch_uses_array_batching_when_enabled():
+    session = Mock()
+    session.post.return_value = _mock_response(payload=[{"data": {"a": 1}}, {"data": {"b": 2}}])
+    client = PlatformGraphQLClient(session, "https://example.invalid/graphql", "Bearer token", array_batching=True)
+
+    results = client.execute_batch([GraphQLRequest("query A { a }", {"x": 1}), GraphQLRequest("query B { b }")])
+
+    assert results == [{"data": {"a": 1}}, {"data": {"b": 2}}]
+    assert session.post.call_args.kwargs["json"] == [
+        {"query": "query A { a }", "variables": {"x": 1}},
+        {"query": "query B { b }"},
+    ]
+
+
+def test_track_graphql_requests_counts_round_trips():
+    session = Mock()
+    session.post.side_effect = [
+        _mock_response(payload={"data": {"ok": True}}),
+        _mock_response(payload={"data": {"b0_a": 1, "b1_b": 2}}),
+    ]
+    client = PlatformGraphQLClient(session, "https://example.invalid/graphql", "Bearer token")
+
+    with track_graphql_requests() as counter:
+        client.execute("query Test { ok }")
+        client.execute_batch([GraphQLRequest("{ a }"), GraphQLRequest("{ b }")])
+
+    assert (counter.requests, counter.operations) == (2, 3)
+    client.execute_batch([])
+    assert counter.requests == 2
+
+
+async def test_aexecute_and_aexecute_batch_use_shared_async_client(monkeypatch):
+    seen = []
+
+    def handler(request):
+        payload = json.loads(request.content)
+        seen.append((request.headers["Authorization"], payload))
+        if "b0_a" in payload["query"]:
+            return httpx.Response(200, json={"data": {"b0_a": 1, "b1_b": 2}})
+        return httpx.Response(200, json={"data": {"ok": True}})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr("quilt_mcp.backends.platform_graphql_client.get_async_http_client", lambda: client)
+    graphql = PlatformGraphQLClient(Mock(), "https://example.invalid/graphql", "Bearer token")
+
+    with track_graphql_requests() as counter:
+        assert await graphql.aexecute("query Test { ok }", {"x": 1}) == {"data": {"ok": True}}
+        batched = await graphql.aexecute_batch([GraphQLRequest("{ a }"), GraphQLRequest("{ b }")])
+
+    assert batched == [{"data": {"a": 1}}, {"data": {"b": 2}}]
+    assert seen[0] == ("Bearer token", {"query": "query Test { ok }", "variables": {"x": 1}})
+    assert (counter.requests, counter.operations) == (2, 3)
+    await client.aclose()
+
+
+async def test_aexecute_propagates_http_status_errors(monkeypatch):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(502)))
+    monkeypatch.setattr("quilt_mcp.backends.platform_graphql_client.get_async_http_client", lambda: client)
+    graphql = PlatformGraphQLClient(Mock(), "https://example.invalid/graphql", "Bearer token")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await graphql.aexecute("query Test { ok }")
+    await client.aclose()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 
+from quilt_mcp.backends.graphql_queries import GET_PACKAGE_QUERY
 from quilt_mcp.ops.exceptions import NotFoundError, BackendError
 from quilt_mcp.context.runtime_context import (
     RuntimeAuthState,
@@ -243,6 +244,185 @@ def test_browse_content_transforms_types(monkeypatch):
     assert dir_entry.type == "directory"
 
 
+def test_list_package_dir_fetches_listing_and_metadata_in_one_query(monkeypatch):
+    """browse_package issues one revision query without the flat manifest."""
+    backend = _make_backend(monkeypatch)
+    calls = []
+
+    def fake_execute(query, variables=None):
+        calls.append((query, variables))
+        return {
+            "data": {
+                "package": {
+                    "revision": {
+                        "hash": "rev-1",
+                        "userMeta": '{"description": "d"}',
+                        "dir": {
+                            "path": "data",
+                            "children": [
+                                {
+                                    "__typename": "PackageFile",
+                                    "path": f"data/f{i}",
+                                    "size": i,
+                                    "physicalKey": "s3://b/k",
+                                }
+                                for i in range(3)
+                            ],
+                        },
+                        "file": None,
+                    }
+                }
+            }
+        }
+
+    backend.execute_graphql_query = fake_execute
+
+    first = backend.browse_package("user/pkg", "s3://test-bucket", "data", limit=2)
+    second = backend.browse_package("user/pkg", "s3://test-bucket", "data", limit=2, cursor=first.next_cursor)
+
+    assert len(calls) == 2
+    assert "contentsFlatMap" not in calls[0][0]
+    assert calls[0][1] == {"bucket": "test-bucket", "name": "user/pkg", "hash": "latest", "path": "data"}
+    assert calls[1][1]["hash"] == "rev-1"
+    assert [e.path for e in first.entries] == ["data/f0", "data/f1"]
+    assert [e.path for e in second.entries] == ["data/f2"]
+    assert first.metadata == {"description": "d"}
+    assert first.total_entries == 3
+    assert second.next_cursor is None
+
+
+def test_list_package_dir_missing_path(monkeypatch):
+    backend = _make_backend(monkeypatch)
+    backend.execute_graphql_query = lambda *args, **kwargs: {
+        "data": {"package": {"revision": {"hash": "h", "userMeta": None, "dir": None, "file": None}}}
+    }
+
+    with pytest.raises(NotFoundError):
+        backend.browse_package("user/pkg", "s3://test-bucket", "missing")
+
+
+def _tree_backend(monkeypatch, tree):
+    """Backend whose dir() queries are answered from a {dir_path: [children]} tree."""
+    backend = _make_backend(monkeypatch)
+    calls = []
+
+    def fake_execute(query, variables=None):
+        calls.append(variables)
+        children = tree.get(variables["path"])
+        return {
+            "data": {
+                "package": {
+                    "revision": {
+                        "hash": "rev-1",
+                        "dir": None if children is None else {"children": children},
+                    }
+                }
+            }
+        }
+
+    backend.execute_graphql_query = fake_execute
+    return backend, calls
+
+
+def _file(path):
+    return {"__typename": "PackageFile", "path": path, "size": 1, "physicalKey": f"s3://b/{path}"}
+
+
+def _dir(path):
+    return {"__typename": "PackageDir", "path": path}
+
+
+PACKAGE_TREE = {
+    "": [_file("z.txt"), _dir("a/"), _file("a.txt"), _dir("b/")],
+    "a/": [_file("a/2.csv"), _dir("a/sub/"), _file("a/1.csv")],
+    "a/sub/": [_file("a/sub/x")],
+    "b/": [_file("b/y")],
+}
+
+
+def test_iter_package_entries_walks_directories_in_walk_order(monkeypatch):
+    """Entries stream in quilt3 walk order, one dir() query per directory."""
+    backend, calls = _tree_backend(monkeypatch, PACKAGE_TREE)
+
+    entries = list(backend.iter_package_entries("user/pkg", "s3://test-bucket"))
+
+    assert [e["logicalKey"] for e in entries] == ["a/1.csv", "a/2.csv", "a/sub/x", "a.txt", "b/y", "z.txt"]
+    assert entries[0] == {
+        "logicalKey": "a/1.csv",
+        "physicalKey": "s3://b/a/1.csv",
+        "size": 1,
+        "hash": None,
+        "meta": None,
+    }
+    assert [c["path"] for c in calls] == ["", "a/", "a/sub/", "b/"]
+    assert calls[0]["hash"] == "latest"
+    assert {c["hash"] for c in calls[1:]} == {"rev-1"}
+
+
+def test_iter_package_entries_prunes_directories_outside_prefix(monkeypatch):
+    backend, calls = _tree_backend(monkeypatch, PACKAGE_TREE)
+
+    entries = list(backend.iter_package_entries("user/pkg", "s3://test-bucket", "h1", prefix="a/s"))
+
+    assert [e["logicalKey"] for e in entries] == ["a/sub/x"]
+    assert [c["path"] for c in calls] == ["a/", "a/sub/"]
+    assert calls[0]["hash"] == "h1"
+
+
+def test_get_package_entries_uses_flat_manifest_without_dir_queries(monkeypatch):
+    """A package under the contentsFlatMap cap needs no further queries and keeps hash/meta."""
+    backend, calls = _tree_backend(monkeypatch, PACKAGE_TREE)
+    flat = {"a/x.csv": {"physicalKey": "s3://b/a/x.csv", "size": 3, "hash": {"type": "SHA256"}, "meta": {"k": 1}}}
+    package = {"bucket": "test-bucket", "name": "user/pkg", "revision": {"hash": "rev-1", "contentsFlatMap": flat}}
+
+    entries = backend._backend_get_package_entries(package)
+
+    assert calls == []
+    assert entries["a/x.csv"]["hash"] == {"type": "SHA256"}
+    assert entries["a/x.csv"]["meta"] == {"k": 1}
+    assert "contentsFlatMap(max: 10000)" in GET_PACKAGE_QUERY
+
+
+def test_get_package_entries_streams_without_flat_manifest(monkeypatch):
+    """Over the contentsFlatMap cap (null map), entries come from directory paging."""
+    backend, calls = _tree_backend(monkeypatch, PACKAGE_TREE)
+    package = {
+        "bucket": "test-bucket",
+        "name": "user/pkg",
+        "revision": {"hash": "rev-1", "userMeta": None, "contentsFlatMap": None},
+    }
+
+    entries = backend._backend_get_package_entries(package)
+
+    assert len(entries) == 6
+    assert calls[0]["hash"] == "rev-1"
+
+
+def test_get_package_entries_cached_per_revision_hash(monkeypatch):
+    """A revision's directory walk is done once; later loads of that hash hit the manifest cache."""
+    backend, calls = _tree_backend(monkeypatch, PACKAGE_TREE)
+    top_hash = "a" * 64
+    package = {
+        "bucket": "test-bucket",
+        "name": "user/pkg",
+        "revision": {"hash": top_hash, "userMeta": None, "contentsFlatMap": None},
+    }
+
+    first = backend._backend_get_package_entries(package)
+    second = backend._backend_get_package_entries(package)
+
+    assert second == first
+    assert len(calls) == len(PACKAGE_TREE)
+
+
+def test_iter_package_entries_missing_package(monkeypatch):
+    backend = _make_backend(monkeypatch)
+    backend.execute_graphql_query = lambda *args, **kwargs: {"data": {"package": None}}
+
+    with pytest.raises(NotFoundError):
+        list(backend.iter_package_entries("user/missing", "s3://test-bucket"))
+
+
 # ---------------------------------------------------------------------
 # Content URL Generation
 # ---------------------------------------------------------------------
@@ -124,6 +124,57 @@ def test_execute_graphql_query_graphql_error(monkeypatch):
         backend.execute_graphql_query("query { ok }")
 
 
+async def test_aexecute_graphql_query_maps_errors(monkeypatch):
+    import json
+
+    import httpx
+
+    backend = _make_backend(monkeypatch)
+    responses = {
+        "ok": httpx.Response(200, json={"data": {"ok": True}}),
+        "gql": httpx.Response(200, json={"errors": [{"message": "boom"}]}),
+        "denied": httpx.Response(403, text="forbidden"),
+    }
+
+    def handler(request):
+        operation_name = json.loads(request.content)["query"].split()[1]
+        return responses[operation_name]
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr("quilt_mcp.backends.platform_graphql_client.get_async_http_client", lambda: client)
+
+    assert (await backend.aexecute_graphql_query("query ok { ok }"))["data"]["ok"] is True
+    with pytest.raises(BackendError, match="boom"):
+        await backend.aexecute_graphql_query("query gql { ok }")
+    with pytest.raises(AuthenticationError):
+        await backend.aexecute_graphql_query("query denied { ok }")
+    await client.aclose()
+
+
+async def test_async_tabulator_reads_await_async_client(monkeypatch):
+    import httpx
+
+    backend = _make_backend(monkeypatch)
+
+    def handler(request):
+        if b"ListTabulatorTables" in request.content:
+            return httpx.Response(
+                200, json={"data": {"bucketConfig": {"tabulatorTables": [{"name": "t", "config": ""}]}}}
+            )
+        return httpx.Response(200, json={"data": {"admin": {"tabulatorOpenQuery": True}}})
+
+    def blocking_query(*args, **kwargs):
+        raise AssertionError("async callers must not use the requests session")
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr("quilt_mcp.backends.platform_graphql_client.get_async_http_client", lambda: client)
+    backend.execute_graphql_query = blocking_query
+
+    assert await backend.alist_tabulator_tables("bucket") == [{"name": "t", "config": ""}]
+    assert await backend.aget_open_query_status() == {"success": True, "open_query_enabled": True}
+    await client.aclose()
+
+
 def test_get_auth_status(monkeypatch):
     backend = _make_backend(monkeypatch)
     backend.execute_graphql_query = lambda *args, **kwargs: {
@@ -196,7 +247,7 @@ def test_diff_packages_detects_changes(monkeypatch):
                 }
             }
 
-    backend._backend_get_package = mock_get_package
+    backend._backend_get_packages = lambda packages, registry: [mock_get_package(n, registry, h) for n, h in packages]
 
     diff = backend.diff_packages("team/a", "team/b", "s3://bucket")
     assert diff["added"] == ["b.txt"]
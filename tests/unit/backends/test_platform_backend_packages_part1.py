@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
 from types import SimpleNamespace
 import sys
+import threading
+import time
 from unittest.mock import Mock
 
 import pytest
@@ -288,7 +292,7 @@ def test_diff_packages_detects_added_files(monkeypatch):
                 }
             }
 
-    backend._backend_get_package = mock_get_package
+    backend._backend_get_packages = lambda packages, registry: [mock_get_package(n, registry, h) for n, h in packages]
 
     diff = backend.diff_packages("team/pkg1", "team/pkg2", "s3://test-bucket")
     assert diff["added"] == ["b.txt"]
@@ -308,7 +312,7 @@ def test_diff_packages_detects_modified_files(monkeypatch):
                 "revision": {"contentsFlatMap": {"a.txt": {"size": 200, "hash": "h2", "physicalKey": "s3://b/a2"}}}
             }
 
-    backend._backend_get_package = mock_get_package
+    backend._backend_get_packages = lambda packages, registry: [mock_get_package(n, registry, h) for n, h in packages]
 
     diff = backend.diff_packages("team/pkg1", "team/pkg2", "s3://test-bucket")
     assert diff["added"] == []
@@ -333,7 +337,7 @@ def test_diff_packages_detects_removed_files(monkeypatch):
         else:  # team/pkg2
             return {"revision": {"contentsFlatMap": {"a.txt": {"size": 100, "hash": "h1", "physicalKey": "s3://b/a"}}}}
 
-    backend._backend_get_package = mock_get_package
+    backend._backend_get_packages = lambda packages, registry: [mock_get_package(n, registry, h) for n, h in packages]
 
     diff = backend.diff_packages("team/pkg1", "team/pkg2", "s3://test-bucket")
     assert diff["added"] == []
@@ -348,7 +352,7 @@ def test_diff_packages_identical_packages(monkeypatch):
     def mock_get_package(package_name, registry, top_hash=None):
         return {"revision": {"contentsFlatMap": {"a.txt": {"size": 100, "hash": "h1", "physicalKey": "s3://b/a"}}}}
 
-    backend._backend_get_package = mock_get_package
+    backend._backend_get_packages = lambda packages, registry: [mock_get_package(n, registry, h) for n, h in packages]
 
     diff = backend.diff_packages("team/pkg1", "team/pkg1", "s3://test-bucket")
     assert diff["added"] == []
@@ -382,7 +386,7 @@ def test_diff_packages_complex_scenario(monkeypatch):
                 }
             }
 
-    backend._backend_get_package = mock_get_package
+    backend._backend_get_packages = lambda packages, registry: [mock_get_package(n, registry, h) for n, h in packages]
 
     diff = backend.diff_packages("team/pkg1", "team/pkg2", "s3://test-bucket")
     assert diff["added"] == ["add.txt"]
@@ -390,6 +394,43 @@ def test_diff_packages_complex_scenario(monkeypatch):
     assert diff["deleted"] == ["delete.txt"]
 
 
+def test_get_packages_batches_lookups_into_one_request(monkeypatch):
+    """Fetch both diff sides with one aliased GraphQL POST."""
+    from quilt_mcp.backends.platform_graphql_client import track_graphql_requests
+
+    backend = _make_backend(monkeypatch)
+    response = Mock()
+    response.json.return_value = {
+        "data": {
+            "b0_package": {"revision": {"hash": "h1", "userMeta": None}},
+            "b1_package": {"revision": {"hash": "h2", "userMeta": {"k": "v"}}},
+        }
+    }
+    backend._graphql_client._session = Mock(post=Mock(return_value=response))
+
+    with track_graphql_requests() as counter:
+        packages = backend._backend_get_packages([("team/a", None), ("team/b", "h2")], "s3://test-bucket")
+
+    assert counter.requests == 1
+    assert counter.operations == 2
+    assert [pkg["name"] for pkg in packages] == ["team/a", "team/b"]
+    assert packages[1]["revision"]["userMeta"] == {"k": "v"}
+    variables = backend._graphql_client._session.post.call_args.kwargs["json"]["variables"]
+    assert variables["b0_hash"] == "latest"
+    assert variables["b1_hash"] == "h2"
+
+
+def test_get_packages_raises_not_found_for_missing_side(monkeypatch):
+    """A missing package in a batch raises NotFoundError for that package."""
+    backend = _make_backend(monkeypatch)
+    backend.execute_graphql_batch = Mock(
+        return_value=[{"data": {"package": {"revision": {"hash": "h1"}}}}, {"data": {"package": None}}]
+    )
+
+    with pytest.raises(NotFoundError, match="team/b"):
+        backend._backend_get_packages([("team/a", None), ("team/b", None)], "s3://test-bucket")
+
+
 # ---------------------------------------------------------------------
 # Package Deletion
 # ---------------------------------------------------------------------
@@ -477,6 +518,109 @@ def test_delete_package_returns_false_when_no_revisions(monkeypatch):
     backend.execute_graphql_query.assert_called_once()
 
 
+class _StubGraphQLServer:
+    """Local GraphQL endpoint that lists revisions and counts concurrent deletes."""
+
+    def __init__(self, hashes, failing=(), delay=0.05):
+        self.hashes = list(hashes)
+        self.failing = set(failing)
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                self._send(stub.handle(payload))
+
+            def _send(self, body):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *_args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}/graphql"
+
+    def handle(self, payload):
+        query = payload["query"]
+        with self._lock:
+            self.requests.append(query)
+        if "PackageRevisionsForDelete" in query:
+            page = [{"hash": h} for h in self.hashes]
+            return {"data": {"package": {"revisions": {"total": len(page), "page": page}}}}
+
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        if payload["variables"]["hash"] in self.failing:
+            return {"data": {"packageRevisionDelete": {"__typename": "OperationError", "message": "denied"}}}
+        return {"data": {"packageRevisionDelete": {"__typename": "PackageRevisionDeleteSuccess"}}}
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _make_stub_backend(monkeypatch, server):
+    backend = _make_backend(monkeypatch)
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    backend._graphql_client._endpoint = server.url
+    return backend
+
+
+def test_delete_package_deletes_revisions_concurrently(monkeypatch):
+    """Issue one mutation per revision, bounded by QUILT_DELETE_CONCURRENCY."""
+    monkeypatch.setenv("QUILT_DELETE_CONCURRENCY", "4")
+    hashes = [f"{i:064x}" for i in range(12)]
+
+    with _StubGraphQLServer(hashes) as server:
+        backend = _make_stub_backend(monkeypatch, server)
+        result = backend.delete_package(bucket="s3://test-bucket", name="team/data")
+
+    assert result is True
+    assert len(server.requests) == 1 + len(hashes)
+    assert sum("DeleteRevision" in query for query in server.requests) == len(hashes)
+    assert 1 < server.max_in_flight <= 4
+
+
+def test_delete_package_aggregates_revision_failures(monkeypatch):
+    """Report every failed revision instead of stopping at the first one."""
+    hashes = [f"{i:064x}" for i in range(6)]
+    failing = {hashes[1], hashes[4]}
+
+    with _StubGraphQLServer(hashes, failing=failing, delay=0) as server:
+        backend = _make_stub_backend(monkeypatch, server)
+        result = backend._try_graphql_delete("test-bucket", "team/data")
+
+    assert result.success is False
+    assert result.revision_count == len(hashes)
+    assert result.failures == dict.fromkeys(failing, "denied")
+    assert result.error == "GraphQL revision deletion failed for 2 revision(s)"
+    assert len(server.requests) == 1 + len(hashes)
+
+
 # ---------------------------------------------------------------------
 # Package Creation
 # ---------------------------------------------------------------------
@@ -162,7 +162,7 @@ def test_backend_browse_package_content_file_fallback(monkeypatch):
     }
 
     result = backend._backend_browse_package_content({"name": "team/pkg", "bucket": "bucket"}, "only.csv")
-    assert result == [{"path": "only.csv", "size": 7, "type": "file"}]
+    assert result == [{"path": "only.csv", "size": 7, "type": "file", "physicalKey": "s3://b/only.csv"}]
 
 
 def test_backend_browse_package_content_path_not_found(monkeypatch):
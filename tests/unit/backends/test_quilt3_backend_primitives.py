@@ -8,11 +8,14 @@ the quilt3 library, particularly handling varying return types and ensuring
 proper serialization to domain objects.
 """
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from typing import Any
 
 from quilt_mcp.backends.quilt3_backend import Quilt3_Backend
+from quilt_mcp.ops.exceptions import NotFoundError
 
 
 @pytest.fixture
@@ -621,3 +624,164 @@ class TestDeletePackage:
         result = backend.delete_package(bucket="s3://test-bucket", name="team/data")
 
         assert result is False
+
+
+class TestBackendListPackageDir:
+    """Test _backend_list_package_dir() loads the manifest once."""
+
+    def test_lists_path_with_metadata_from_one_browse(self, backend):
+        entry = Mock(size=10, modified=None, meta=None, physical_key="s3://b/data/a.csv", is_dir=False)
+        subtree = Mock()
+        subtree.walk.return_value = [("data/a.csv", entry)]
+        package = MagicMock(meta={"description": "d"}, top_hash="rev-1")
+        package.__getitem__.return_value = subtree
+        backend.quilt3.Package.browse = Mock(return_value=package)
+
+        entries, metadata, top_hash = backend._backend_list_package_dir("test/pkg", "s3://bucket", "data")
+
+        backend.quilt3.Package.browse.assert_called_once_with("test/pkg", registry="s3://bucket")
+        package.__getitem__.assert_called_once_with("data")
+        assert [e.path for e in entries] == ["data/a.csv"]
+        assert metadata == {"description": "d"}
+        assert top_hash == "rev-1"
+
+    def test_lists_single_file_path(self, backend):
+        entry = Mock(spec=["size", "modified", "meta", "physical_key", "is_dir"])
+        entry.configure_mock(size=10, modified=None, meta=None, physical_key="s3://b/data/a.csv", is_dir=False)
+        package = MagicMock(meta=None, top_hash="rev-1")
+        package.__getitem__.return_value = entry
+        backend.quilt3.Package.browse = Mock(return_value=package)
+
+        entries, _metadata, _top_hash = backend._backend_list_package_dir("test/pkg", "s3://bucket", "data/a.csv")
+
+        assert [(e.path, e.size) for e in entries] == [("data/a.csv", 10)]
+
+    def test_missing_path_raises_not_found(self, backend):
+        package = MagicMock(meta=None, top_hash="rev-1")
+        package.__getitem__.side_effect = KeyError("nope")
+        backend.quilt3.Package.browse = Mock(return_value=package)
+
+        with pytest.raises(NotFoundError):
+            backend._backend_list_package_dir("test/pkg", "s3://bucket", "nope")
+
+
+class _ManifestBody:
+    def __init__(self, lines):
+        self._lines = [json.dumps(line).encode() for line in lines]
+        self.closed = False
+
+    def iter_lines(self, chunk_size=1024):
+        yield from self._lines
+
+    def read(self):
+        return b"".join(self._lines)
+
+    def close(self):
+        self.closed = True
+
+
+class TestBackendIterPackageEntries:
+    """Test _backend_iter_package_entries() streams the JSONL manifest."""
+
+    TOP_HASH = "f" * 64
+
+    def _s3(self, objects):
+        s3 = Mock()
+        s3.exceptions.NoSuchKey = KeyError
+        s3.get_object.side_effect = lambda Bucket, Key: {"Body": objects[Key]}
+        return s3
+
+    def test_streams_manifest_lines_for_latest(self, backend):
+        body = _ManifestBody(
+            [
+                {"version": "v0", "user_meta": {"k": "v"}},
+                {
+                    "logical_key": "data/a.csv",
+                    "physical_keys": ["s3://b/data/a.csv?versionId=1"],
+                    "size": 3,
+                    "hash": {"type": "SHA256", "value": "abc"},
+                    "meta": {"user_meta": {"row": 1}},
+                },
+                {"logical_key": "readme.md", "physical_keys": ["s3://b/readme.md"], "size": 1, "hash": None},
+            ]
+        )
+        pointer = Mock()
+        pointer.read.return_value = f"{self.TOP_HASH}\n".encode()
+        s3 = self._s3({".quilt/named_packages/test/pkg/latest": pointer, f".quilt/packages/{self.TOP_HASH}": body})
+        backend.get_aws_client = Mock(return_value=s3)
+
+        entries = list(backend._backend_iter_package_entries("test/pkg", "s3://bucket", prefix="data/"))
+
+        assert entries == [
+            {
+                "logicalKey": "data/a.csv",
+                "physicalKey": "s3://b/data/a.csv?versionId=1",
+                "size": 3,
+                "hash": "abc",
+                "meta": {"row": 1},
+            }
+        ]
+        assert body.closed
+        backend._mock_quilt3.Package.browse.assert_not_called()
+
+    def test_missing_manifest_raises_not_found(self, backend):
+        backend.get_aws_client = Mock(return_value=self._s3({}))
+
+        with pytest.raises(NotFoundError):
+            list(backend._backend_iter_package_entries("test/pkg", "s3://bucket", self.TOP_HASH))
+
+    def test_short_hash_uses_package_browse(self, backend):
+        entry = Mock(physical_key="s3://b/a", size=1, hash="h", meta=None)
+        package = Mock()
+        package.walk.return_value = [("a", entry)]
+        backend.quilt3.Package.browse = Mock(return_value=package)
+
+        entries = list(backend._backend_iter_package_entries("test/pkg", "s3://bucket", "abc123"))
+
+        backend.quilt3.Package.browse.assert_called_once_with("test/pkg", registry="s3://bucket", top_hash="abc123")
+        assert [e["logicalKey"] for e in entries] == ["a"]
+
+
+class TestManifestCaching:
+    """Test package loads are served from the manifest cache per resolved top hash."""
+
+    TOP_HASH = "e" * 64
+
+    def _registry(self, backend, top_hash):
+        package_registry = Mock()
+        backend.quilt3.backends.get_package_registry = Mock(return_value=package_registry)
+        backend.quilt3.data_transfer.get_bytes = Mock(return_value=f"{top_hash}\n".encode())
+        return package_registry
+
+    def test_latest_resolves_pointer_and_parses_manifest_once(self, backend):
+        self._registry(backend, self.TOP_HASH)
+        package = MagicMock(meta={"description": "d"}, top_hash=self.TOP_HASH)
+        package.walk.return_value = []
+        package.get_url.return_value = "https://signed"
+        backend.quilt3.Package.browse = Mock(return_value=package)
+
+        assert backend.get_package_metadata("test/pkg", "s3://bucket") == {"description": "d"}
+        assert backend.get_package_metadata("test/pkg", "s3://bucket") == {"description": "d"}
+        assert backend.get_content_url("test/pkg", "s3://bucket", "a.csv") == "https://signed"
+
+        backend.quilt3.Package.browse.assert_called_once_with(
+            "test/pkg", registry="s3://bucket", top_hash=self.TOP_HASH
+        )
+        assert backend.quilt3.data_transfer.get_bytes.call_count == 3
+
+    def test_full_hash_needs_no_resolution_request(self, backend):
+        self._registry(backend, "unused")
+
+        assert backend._backend_resolve_top_hash("test/pkg", "s3://bucket", self.TOP_HASH) == self.TOP_HASH
+        backend.quilt3.data_transfer.get_bytes.assert_not_called()
+
+    def test_unresolvable_revision_bypasses_cache(self, backend):
+        backend.quilt3.data_transfer.get_bytes = Mock(side_effect=RuntimeError("no pointer access"))
+        package = MagicMock(meta={})
+        backend.quilt3.Package.browse = Mock(return_value=package)
+
+        backend.get_package_metadata("test/pkg", "s3://bucket")
+        backend.get_package_metadata("test/pkg", "s3://bucket")
+
+        assert backend.quilt3.Package.browse.call_count == 2
+        backend.quilt3.Package.browse.assert_called_with("test/pkg", registry="s3://bucket")
@@ -84,6 +84,29 @@ def test_get_and_transform_catalog_config(monkeypatch):
         backend._transform_catalog_config({"region": "x"})
 
 
+def test_catalog_config_fetched_once_per_ttl(monkeypatch):
+    backend = _make_backend()
+    response = SimpleNamespace(
+        status_code=200,
+        headers={"ETag": '"v1"'},
+        raise_for_status=lambda: None,
+        json=lambda: {
+            "region": "us-east-1",
+            "apiGatewayEndpoint": "https://api.example.com",
+            "registryUrl": "https://registry.example.com",
+            "analyticsBucket": "quilt-staging-analyticsbucket-abc",
+        },
+    )
+    session = SimpleNamespace(get=MagicMock(return_value=response))
+    backend.quilt3.session.get_session.return_value = session
+
+    first = backend.get_catalog_config("https://example.quiltdata.com")
+    second = backend.get_catalog_config("https://example.quiltdata.com")
+
+    assert second == first
+    session.get.assert_called_once_with("https://example.quiltdata.com/config.json", timeout=10)
+
+
 def test_configure_catalog_and_graphql_endpoint(monkeypatch):
     backend = _make_backend()
     backend.configure_catalog("https://example.quiltdata.com")
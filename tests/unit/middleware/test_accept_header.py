@@ -0,0 +1,24 @@
+"""Unit tests for MCP Accept header normalization."""
+
+from __future__ import annotations
+
+import pytest
+
+from quilt_mcp.middleware.accept_header import normalize_accept_header
+
+
+@pytest.mark.parametrize(
+    ("path", "accept", "expected"),
+    [
+        ("/mcp", "", "application/json, text/event-stream"),
+        ("/mcp/", "*/*", "application/json, text/event-stream"),
+        ("/mcp", "text/event-stream", "application/json, text/event-stream"),
+        ("/mcp", "application/json", "application/json, text/event-stream"),
+        ("/mcp", "application/json, text/event-stream", None),
+        ("/other", "application/json", "application/json, text/event-stream"),
+        ("/other", "text/html", None),
+        ("/other", "", None),
+    ],
+)
+def test_normalize_accept_header(path, accept, expected):
+    assert normalize_accept_header(path, accept) == expected
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from starlette.applications import Starlette
 from starlette.responses import JSONResponse
 from starlette.routing import Route
@@ -98,3 +100,70 @@ def test_require_jwt_false_bypasses_jwt_requirement(monkeypatch):
 
     assert response.status_code == 200
     assert response.json() == {"token": None}
+
+
+async def _accept_echo_endpoint(request):
+    return JSONResponse({"accept": request.headers.get("accept"), "token": get_runtime_access_token()})
+
+
+def test_normalize_accept_rewrites_headers_in_same_pass(monkeypatch):
+    monkeypatch.delenv("QUILT_FALLBACK_JWT", raising=False)
+    app = Starlette(routes=[Route("/mcp", _accept_echo_endpoint), Route("/other", _accept_echo_endpoint)])
+    app.add_middleware(JwtExtractionMiddleware, require_jwt=True, normalize_accept=True)
+    client = TestClient(app)
+    auth = {"Authorization": "Bearer header-token"}
+
+    response = client.get("/mcp", headers={**auth, "Accept": "application/json"})
+    assert response.json() == {"accept": "application/json, text/event-stream", "token": "header-token"}
+
+    response = client.get("/other", headers={**auth, "Accept": "application/json"})
+    assert response.json()["accept"] == "application/json, text/event-stream"
+
+    response = client.get("/other", headers={**auth, "Accept": "text/html"})
+    assert response.json()["accept"] == "text/html"
+
+    # Rejected requests are still rejected after the Accept rewrite.
+    assert client.get("/mcp", headers={"Accept": "application/json"}).status_code == 401
+
+
+def test_normalize_accept_without_jwt_requirement():
+    app = Starlette(routes=[Route("/mcp", _accept_echo_endpoint)])
+    app.add_middleware(JwtExtractionMiddleware, require_jwt=False, normalize_accept=True)
+    client = TestClient(app)
+
+    response = client.get("/mcp", headers={"Accept": "text/event-stream"})
+
+    assert response.json() == {"accept": "application/json, text/event-stream", "token": None}
+
+
+async def test_streaming_response_chunks_pass_through_unbuffered():
+    second_chunk = asyncio.Event()
+    sent = []
+
+    async def streaming_app(scope, receive, send):
+        await send(
+            {"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/event-stream")]}
+        )
+        await send({"type": "http.response.body", "body": b"data: 1\n\n", "more_body": True})
+        # A buffering middleware would hold the first event until the body is complete.
+        await asyncio.wait_for(second_chunk.wait(), timeout=2)
+        await send({"type": "http.response.body", "body": b"data: 2\n\n", "more_body": False})
+
+    async def record(message):
+        sent.append(message)
+        if message.get("body") == b"data: 1\n\n":
+            second_chunk.set()
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    middleware = JwtExtractionMiddleware(streaming_app, require_jwt=True, normalize_accept=True)
+    scope = {
+        "type": "http",
+        "path": "/mcp",
+        "method": "GET",
+        "headers": [(b"authorization", b"Bearer header-token")],
+    }
+    await middleware(scope, receive, record)
+
+    assert [message.get("body") for message in sent] == [None, b"data: 1\n\n", b"data: 2\n\n"]
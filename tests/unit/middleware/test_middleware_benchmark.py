@@ -0,0 +1,79 @@
+"""Benchmark: per-request overhead of the HTTP middleware stack.
+
+Sends requests through ``httpx.ASGITransport`` to a trivial Starlette app,
+with and without the middleware ``build_http_app`` installs (CORS plus the
+fused JWT extraction / Accept normalization layer), and reports p50/p99
+latency and overhead. Run with ``-s`` to see the report.
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+from typing import List
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from quilt_mcp.middleware.jwt_extraction import JwtExtractionMiddleware
+
+pytestmark = pytest.mark.performance
+
+REQUESTS = 300
+WARMUP = 30
+
+
+async def _ok(_request):
+    return JSONResponse({"ok": True})
+
+
+def _app(with_middleware: bool) -> Starlette:
+    app = Starlette(routes=[Route("/mcp", _ok, methods=["POST"])])
+    if with_middleware:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=["*"],
+            allow_methods=["GET", "POST", "OPTIONS"],
+            allow_headers=["*", "Authorization", "Mcp-Session-Id", "MCP-Protocol-Version"],
+            expose_headers=["mcp-session-id"],
+            allow_credentials=False,
+        )
+        app.add_middleware(JwtExtractionMiddleware, require_jwt=True, normalize_accept=True)
+    return app
+
+
+async def _latencies(app: Starlette) -> List[float]:
+    headers = {"Authorization": "Bearer token", "Accept": "application/json", "Origin": "https://example.com"}
+    latencies = []
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        for i in range(WARMUP + REQUESTS):
+            start = time.perf_counter()
+            response = await client.post("/mcp", headers=headers, json={})
+            elapsed = time.perf_counter() - start
+            assert response.status_code == 200
+            if i >= WARMUP:
+                latencies.append(elapsed * 1_000_000)
+    return latencies
+
+
+def _percentile(values: List[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100)[percent - 1]
+
+
+async def test_middleware_overhead_per_request():
+    off = await _latencies(_app(with_middleware=False))
+    on = await _latencies(_app(with_middleware=True))
+
+    p50_off, p99_off = _percentile(off, 50), _percentile(off, 99)
+    p50_on, p99_on = _percentile(on, 50), _percentile(on, 99)
+    print(
+        f"\n{REQUESTS} requests: middleware off p50 {p50_off:.0f} us / p99 {p99_off:.0f} us, "
+        f"on p50 {p50_on:.0f} us / p99 {p99_on:.0f} us; "
+        f"overhead p50 {p50_on - p50_off:.0f} us / p99 {p99_on - p99_off:.0f} us"
+    )
+    # Plain ASGI middleware only inspects headers; it should cost well under a millisecond.
+    assert p50_on - p50_off < 1000
@@ -0,0 +1,200 @@
+"""Tests for the process-wide QuiltOps backend pool."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import jwt as pyjwt
+import pytest
+
+from quilt_mcp.backends.platform_backend import Platform_Backend
+from quilt_mcp.backends.quilt3_backend import Quilt3_Backend
+from quilt_mcp.config import set_test_mode_config
+from quilt_mcp.context.runtime_context import RuntimeAuthState, push_runtime_context, reset_runtime_context
+from quilt_mcp.ops.backend_pool import BackendPool, get_backend_pool
+from quilt_mcp.ops.factory import QuiltOpsFactory
+
+
+def _token(subject: str = "user-1", expires_in: float = 3600) -> str:
+    return pyjwt.encode({"sub": subject, "exp": int(time.time() + expires_in)}, "secret", algorithm="HS256")
+
+
+@pytest.fixture
+def platform_env(monkeypatch: pytest.MonkeyPatch):
+    set_test_mode_config(multiuser_mode=True)
+    monkeypatch.setenv("QUILT_CATALOG_URL", "https://example.quiltdata.com")
+    monkeypatch.setenv("QUILT_REGISTRY_URL", "https://registry.example.com")
+    monkeypatch.setenv("QUILT_GRAPHQL_ENDPOINT", "https://registry.example.com/graphql")
+    yield monkeypatch
+    set_test_mode_config(multiuser_mode=False)
+
+
+def _with_token(token: str, fn):
+    handle = push_runtime_context(
+        environment="web-service", auth=RuntimeAuthState(scheme="Bearer", access_token=token)
+    )
+    try:
+        return fn()
+    finally:
+        reset_runtime_context(handle)
+
+
+def test_pool_reuses_backend_for_same_key():
+    pool = BackendPool()
+    built = []
+
+    def factory():
+        built.append(1)
+        return object()
+
+    assert pool.get(("graphql", "a"), factory) is pool.get(("graphql", "a"), factory)
+    pool.get(("graphql", "b"), factory)
+    assert len(built) == 2
+    assert pool.stats()["hits"] == 1
+
+
+def test_pool_evicts_idle_expired_and_lru_entries():
+    pool = BackendPool(max_entries=1, idle_ttl_seconds=0.01)
+    first = pool.get(("t", "a"), object)
+    pool.get(("t", "b"), object)
+    assert pool.get(("t", "a"), object) is not first
+
+    time.sleep(0.02)
+    assert pool.stats()["size"] == 1
+    pool.get(("t", "a"), object)
+    assert pool.stats()["evictions"] == 3
+
+    expiring = BackendPool()
+    backend = expiring.get(("t", "x"), object, expires_at=time.time() + 30)
+    assert expiring.get(("t", "x"), object) is not backend
+    assert expiring.stats()["size"] == 1
+
+
+def test_pool_resolves_callable_expiry_only_when_building():
+    pool = BackendPool()
+    resolved = []
+
+    def expiry():
+        resolved.append(1)
+        return time.time() + 3600
+
+    first = pool.get(("t", "k"), object, expires_at=expiry)
+    assert pool.get(("t", "k"), object, expires_at=expiry) is first
+    assert len(resolved) == 1
+
+
+def test_pool_single_flight_for_concurrent_callers():
+    pool = BackendPool()
+    built = []
+
+    def factory():
+        built.append(1)
+        time.sleep(0.05)
+        return object()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(pool.get(("t", "k"), factory))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_factory_pools_quilt3_backend():
+    set_test_mode_config(multiuser_mode=False)
+
+    first = QuiltOpsFactory.create()
+    assert isinstance(first, Quilt3_Backend)
+    assert QuiltOpsFactory.create() is first
+    assert QuiltOpsFactory.create(pooled=False) is not first
+
+
+def test_factory_pools_platform_backend_per_token(platform_env):
+    token_a, token_b = _token("a"), _token("b")
+
+    first = _with_token(token_a, QuiltOpsFactory.create)
+    again = _with_token(token_a, QuiltOpsFactory.create)
+    other = _with_token(token_b, QuiltOpsFactory.create)
+
+    assert isinstance(first, Platform_Backend)
+    assert first is again
+    assert other is not first
+
+    platform_env.setenv("QUILT_CATALOG_URL", "https://other.quiltdata.com")
+    assert _with_token(token_a, QuiltOpsFactory.create) is not first
+
+
+def test_factory_does_not_pool_backend_with_expiring_token(platform_env):
+    token = _token(expires_in=30)
+    first = _with_token(token, QuiltOpsFactory.create)
+    assert _with_token(token, QuiltOpsFactory.create) is not first
+    assert get_backend_pool().stats()["size"] == 0
+
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({"data": {"ok": True}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+def test_microbenchmark_pooled_backend_setup_and_connection_reuse(platform_env, capsys):
+    """Per-call factory cost and TCP connections, unpooled vs pooled."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CountingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    platform_env.setenv("QUILT_GRAPHQL_ENDPOINT", f"http://127.0.0.1:{server.server_port}/graphql")
+    token = _token()
+    calls = 50
+
+    def run(pooled: bool) -> tuple[float, int]:
+        _CountingHandler.connections = 0
+
+        def body():
+            setup = 0.0
+            for _ in range(calls):
+                start = time.perf_counter()
+                backend = QuiltOpsFactory.create(pooled=pooled)
+                setup += time.perf_counter() - start
+                backend.execute_graphql_query("{ ok }")
+            return setup / calls
+
+        return _with_token(token, body), _CountingHandler.connections
+
+    try:
+        unpooled_setup, unpooled_connections = run(pooled=False)
+        pooled_setup, pooled_connections = run(pooled=True)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    with capsys.disabled():
+        print(
+            f"\nbackend setup per call: unpooled {unpooled_setup * 1e6:.1f}us "
+            f"({unpooled_connections} connections), pooled {pooled_setup * 1e6:.1f}us "
+            f"({pooled_connections} connections) over {calls} calls"
+        )
+
+    assert unpooled_connections == calls
+    assert pooled_connections == 1
+    assert pooled_setup < unpooled_setup
@@ -865,6 +865,179 @@ class TestBrowseContent:
         assert "Browse content failed:" in str(exc_info.value)
 
 
+# =========================================================================
+# browse_package Workflow Tests
+# =========================================================================
+
+
+class TestBrowsePackage:
+    """Test browse_package pagination over a single backend listing."""
+
+    @pytest.fixture
+    def listed_ops(self, ops):
+        ops._mock_browse_package_content.return_value = [
+            {"path": f"file{i}.txt", "type": "file", "size": i} for i in range(5)
+        ]
+        ops._mock_get_package_metadata.return_value = {"description": "d"}
+        return ops
+
+    def test_default_listing_loads_package_once(self, listed_ops):
+        """Test the default primitive reuses one package load for entries and metadata."""
+        listing = listed_ops.browse_package("user/package", "s3://test-registry", "data/")
+
+        listed_ops._mock_get_package.assert_called_once_with("user/package", "s3://test-registry", None)
+        assert listed_ops._mock_browse_package_content.call_args[0][1] == "data/"
+        assert [entry.path for entry in listing.entries] == [f"file{i}.txt" for i in range(5)]
+        assert listing.metadata == {"description": "d"}
+        assert listing.total_entries == 5
+        assert listing.next_cursor is None
+
+    def test_pages_follow_cursor_and_pin_revision(self, listed_ops):
+        """Test limit/cursor paging and that the cursor pins the listed revision."""
+        entries = [
+            Content_Info(path=f"f{i}", size=i, type="file", modified_date=None, download_url=None) for i in range(5)
+        ]
+        listed_ops._backend_list_package_dir = Mock(
+            side_effect=lambda name, registry, path, top_hash: (entries, None, top_hash or "rev-1")
+        )
+
+        first = listed_ops.browse_package("user/package", "s3://test-registry", limit=2)
+        second = listed_ops.browse_package("user/package", "s3://test-registry", limit=2, cursor=first.next_cursor)
+        last = listed_ops.browse_package("user/package", "s3://test-registry", limit=2, cursor=second.next_cursor)
+
+        assert [e.path for e in first.entries + second.entries + last.entries] == [f"f{i}" for i in range(5)]
+        assert last.next_cursor is None
+        assert listed_ops._backend_list_package_dir.call_args_list[1][0][3] == "rev-1"
+        assert {first.top_hash, second.top_hash, last.top_hash} == {"rev-1"}
+
+    def test_invalid_cursor_and_limit_raise_validation_error(self, listed_ops):
+        """Test malformed cursors and negative limits are rejected before the backend is called."""
+        with pytest.raises(ValidationError):
+            listed_ops.browse_package("user/package", "s3://test-registry", cursor="not-a-cursor")
+        with pytest.raises(ValidationError):
+            listed_ops.browse_package("user/package", "s3://test-registry", limit=-1)
+
+        listed_ops._mock_get_package.assert_not_called()
+
+    def test_backend_error_wrapped(self, ops):
+        """Test backend exceptions are wrapped in BackendError."""
+        ops._mock_get_package.side_effect = Exception("boom")
+
+        with pytest.raises(BackendError) as exc_info:
+            ops.browse_package("user/package", "s3://test-registry")
+
+        assert "Browse package failed:" in str(exc_info.value)
+
+
+# =========================================================================
+# iter_package_entries Workflow Tests
+# =========================================================================
+
+
+class TestIterPackageEntries:
+    """Test iter_package_entries streaming and its default primitive."""
+
+    def test_default_streams_entries_matching_prefix(self, ops):
+        """Test the default primitive filters loaded entries by prefix."""
+        ops._mock_get_package_entries.return_value = {
+            key: PackageEntry(logicalKey=key, physicalKey=f"s3://b/{key}") for key in ["a.txt", "data/x", "data/y"]
+        }
+
+        entries = list(ops.iter_package_entries("user/package", "s3://test-registry", "h" * 64, prefix="data/"))
+
+        ops._mock_get_package.assert_called_once_with("user/package", "s3://test-registry", "h" * 64)
+        assert [entry["logicalKey"] for entry in entries] == ["data/x", "data/y"]
+
+    def test_validation_is_eager(self, ops):
+        """Test invalid inputs raise before iteration starts."""
+        with pytest.raises(ValidationError):
+            ops.iter_package_entries("invalid", "s3://test-registry")
+
+        ops._mock_get_package.assert_not_called()
+
+    def test_backend_errors_wrapped_during_iteration(self, ops):
+        """Test backend failures surface as BackendError while iterating."""
+        ops._mock_get_package.side_effect = Exception("boom")
+        entries = ops.iter_package_entries("user/package", "s3://test-registry")
+
+        with pytest.raises(BackendError) as exc_info:
+            next(entries)
+
+        assert "Iterate package entries failed:" in str(exc_info.value)
+
+    def test_diff_falls_back_to_physical_key_without_hashes(self, ops):
+        """Test diff compares physical key and size when entries carry no hash."""
+        ops._mock_get_package_entries.side_effect = [
+            {
+                "same": PackageEntry(logicalKey="same", physicalKey="s3://b/1", size=1, hash=None),
+                "moved": PackageEntry(logicalKey="moved", physicalKey="s3://b/2", size=1, hash=None),
+            },
+            {
+                "same": PackageEntry(logicalKey="same", physicalKey="s3://b/1", size=1, hash=None),
+                "moved": PackageEntry(logicalKey="moved", physicalKey="s3://b/2?versionId=v2", size=1, hash=None),
+            },
+        ]
+
+        diff = QuiltOps._backend_diff_packages(ops, Mock(), Mock())
+
+        assert diff == {"added": [], "deleted": [], "modified": ["moved"]}
+
+
+# =========================================================================
+# Manifest Cache Tests
+# =========================================================================
+
+
+class TestManifestCache:
+    """Test template methods reuse manifests cached per resolved top hash."""
+
+    TOP_HASH = "c" * 64
+
+    @pytest.fixture
+    def cached_ops(self, ops):
+        ops._backend_resolve_top_hash = Mock(return_value=self.TOP_HASH)
+        ops._mock_get_package_metadata.return_value = {"description": "d"}
+        return ops
+
+    def test_repeated_calls_load_package_once(self, cached_ops):
+        """Test metadata, browse and diff of one revision share a single package load."""
+        cached_ops.get_package_metadata("user/package", "s3://test-registry")
+        cached_ops.browse_content("user/package", "s3://test-registry")
+        QuiltOps.diff_packages(cached_ops, "user/package", "user/package", "s3://test-registry")
+
+        cached_ops._mock_get_package.assert_called_once_with("user/package", "s3://test-registry", self.TOP_HASH)
+        assert cached_ops._backend_resolve_top_hash.call_count == 4
+
+    def test_directory_listing_cached_per_path(self, cached_ops):
+        """Test browse_package serves a repeated path listing from the cache."""
+        cached_ops._mock_browse_package_content.return_value = [{"path": "a.txt", "type": "file", "size": 1}]
+
+        first = cached_ops.browse_package("user/package", "s3://test-registry", "data/")
+        second = cached_ops.browse_package("user/package", "s3://test-registry", "data/")
+        cached_ops.browse_package("user/package", "s3://test-registry", "other/")
+
+        assert second.entries == first.entries
+        assert second.top_hash == self.TOP_HASH
+        assert cached_ops._mock_browse_package_content.call_count == 2
+        cached_ops._mock_get_package.assert_called_once()
+
+    def test_unresolved_revision_bypasses_cache(self, ops):
+        """Test backends without cheap hash resolution load the package every time."""
+        ops.get_package_metadata("user/package", "s3://test-registry")
+        ops.get_package_metadata("user/package", "s3://test-registry")
+
+        assert ops._mock_get_package.call_count == 2
+
+    def test_resolution_not_found_propagates(self, cached_ops):
+        """Test a missing package found during resolution is not masked."""
+        cached_ops._backend_resolve_top_hash.side_effect = NotFoundError("Package not found")
+
+        with pytest.raises(NotFoundError):
+            cached_ops.browse_content("user/package", "s3://test-registry")
+
+        cached_ops._mock_get_package.assert_not_called()
+
+
 # =========================================================================
 # Error Handling Tests
 # =========================================================================
@@ -5,7 +5,7 @@ from unittest.mock import Mock, patch
 import pytest
 import requests
 
-from quilt_mcp.ops.exceptions import AuthenticationError, BackendError
+from quilt_mcp.ops.exceptions import AuthenticationError, BackendError, ValidationError
 from quilt_mcp.ops.tabulator_mixin import TabulatorMixin
 
 
@@ -104,6 +104,29 @@ def test_get_open_query_status_wraps_backend_error():
         backend.get_open_query_status()
 
 
+async def test_async_reads_run_sync_query_in_worker_thread():
+    import threading
+
+    backend = ConcreteBackend()
+    threads = []
+
+    def execute(query, variables=None):
+        threads.append(threading.current_thread())
+        if variables:
+            return {"data": {"bucketConfig": {"tabulatorTables": [{"name": "t", "config": ""}]}}}
+        return {"data": {"admin": {"tabulatorOpenQuery": True}}}
+
+    backend.execute_graphql_query = Mock(side_effect=execute)
+
+    assert await backend.alist_tabulator_tables("bucket") == [{"name": "t", "config": ""}]
+    assert await backend.aget_open_query_status() == {"success": True, "open_query_enabled": True}
+    assert threading.main_thread() not in threads
+
+    backend.execute_graphql_query = Mock(return_value={"data": {"bucketConfig": None}})
+    with pytest.raises(ValidationError, match="Bucket not found"):
+        await backend.alist_tabulator_tables("missing")
+
+
 def test_set_open_query_formats_enabled_and_disabled_messages():
     backend = ConcreteBackend()
     backend.execute_graphql_query = Mock(
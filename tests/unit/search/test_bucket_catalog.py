@@ -0,0 +1,102 @@
+"""Tests for the bucket list cache and index-pattern limits."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from quilt_mcp.search.utils.bucket_catalog import BucketCatalogCache, IndexPatternLimits
+
+KEY = ("local", "https://registry.example.com")
+
+
+def test_fresh_entries_are_served_from_cache():
+    cache = BucketCatalogCache(ttl_seconds=60)
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return ["a", "b"]
+
+    assert cache.get(KEY, fetch) == ["a", "b"]
+    assert cache.get(KEY, fetch) == ["a", "b"]
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_entries_are_keyed_by_identity_and_catalog():
+    cache = BucketCatalogCache()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return ["a"]
+
+    cache.get(("local", "https://one"), fetch)
+    cache.get(("local", "https://two"), fetch)
+    cache.get(("user-hash", "https://one"), fetch)
+    assert len(calls) == 3
+
+
+def test_stale_entries_are_served_while_refreshing_in_background():
+    cache = BucketCatalogCache(ttl_seconds=0, max_stale_seconds=60)
+    responses = [["old"], ["new"]]
+    refreshed = threading.Event()
+
+    def fetch():
+        value = responses.pop(0)
+        if value == ["new"]:
+            refreshed.set()
+        return value
+
+    assert cache.get(KEY, fetch) == ["old"]
+    assert cache.get(KEY, fetch) == ["old"]
+    assert refreshed.wait(2)
+
+    deadline = time.time() + 2
+    while cache.get(KEY, lambda: ["unused"]) != ["new"]:
+        assert time.time() < deadline
+        time.sleep(0.01)
+    assert cache.stats()["stale_hits"] >= 1
+
+
+def test_expired_entries_block_on_fetch():
+    cache = BucketCatalogCache(ttl_seconds=0, max_stale_seconds=0)
+    responses = [["old"], ["new"]]
+
+    assert cache.get(KEY, lambda: responses.pop(0)) == ["old"]
+    assert cache.get(KEY, lambda: responses.pop(0)) == ["new"]
+
+
+def test_empty_results_are_not_cached():
+    cache = BucketCatalogCache()
+    responses = [[], ["a"]]
+
+    assert cache.get(KEY, lambda: responses.pop(0)) == []
+    assert cache.get(KEY, lambda: responses.pop(0)) == ["a"]
+
+
+def test_pattern_limits_start_from_largest_accepted_size():
+    limits = IndexPatternLimits()
+    catalog = "https://registry.example.com"
+
+    assert limits.start_size(catalog, 80) == 80
+    limits.record_rejected(catalog, 80)
+    limits.record_rejected(catalog, 50)
+    limits.record_accepted(catalog, 40)
+
+    assert limits.start_size(catalog, 80) == 40
+    assert limits.start_size(catalog, 45) == 45  # below the smallest rejected size
+    assert limits.start_size("https://other.example.com", 80) == 80
+
+
+def test_pattern_limits_forget_rejection_when_larger_size_is_accepted():
+    limits = IndexPatternLimits()
+    catalog = "https://registry.example.com"
+
+    limits.record_rejected(catalog, 50)
+    limits.record_accepted(catalog, 40)
+    limits.record_accepted(catalog, 60)
+
+    assert limits.start_size(catalog, 70) == 70
+    assert limits.max_accepted(catalog) == 60
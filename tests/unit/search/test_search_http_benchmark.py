@@ -0,0 +1,117 @@
+"""Benchmark: threaded vs asyncio search API transport at 50 concurrent searches.
+
+Runs against a local stub of the registry ``/api/search`` endpoint that sleeps
+for a fixed latency, so the numbers reflect how many searches each transport
+keeps in flight rather than Elasticsearch speed. Run with ``-s`` to see the
+requests-per-second report.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+
+from quilt_mcp.search.backends.elasticsearch import Quilt3ElasticsearchBackend
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow, pytest.mark.search]
+
+CONCURRENT_SEARCHES = 50
+LATENCY_SECONDS = 0.05
+
+
+class _StubSearchServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with server.lock:
+                    server.requests += 1
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                time.sleep(LATENCY_SECONDS)
+                with server.lock:
+                    server.in_flight -= 1
+                body = json.dumps({"hits": {"hits": []}}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_args):
+                pass
+
+        super().__init__(("127.0.0.1", 0), Handler)
+
+    def reset(self) -> None:
+        with self.lock:
+            self.in_flight = self.max_in_flight = self.requests = 0
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    server = _StubSearchServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _make_backend(registry_url: str) -> Quilt3ElasticsearchBackend:
+    from quilt_mcp.backends.quilt3_backend import Quilt3_Backend
+
+    mock_backend = Mock(spec=Quilt3_Backend)
+    mock_backend.get_registry_url.return_value = registry_url
+    mock_backend.get_graphql_auth_headers.return_value = {"Authorization": "Bearer token"}
+    return Quilt3ElasticsearchBackend(backend=mock_backend)
+
+
+async def _requests_per_second(search) -> float:
+    start = time.perf_counter()
+    results = await asyncio.gather(*(search(i) for i in range(CONCURRENT_SEARCHES)))
+    elapsed = time.perf_counter() - start
+    assert all(result == {"hits": {"hits": []}} for result in results)
+    return CONCURRENT_SEARCHES / elapsed
+
+
+async def test_async_transport_keeps_all_searches_in_flight(stub_server):
+    backend = _make_backend(f"http://127.0.0.1:{stub_server.server_address[1]}")
+    dsl = {"query": {"match_all": {}}}
+
+    # Previous transport: synchronous requests in the default thread pool.
+    threaded_rps = await _requests_per_second(
+        lambda i: asyncio.to_thread(backend._execute_search_api, dsl, f"bucket-{i}", 10)
+    )
+    threaded_peak = stub_server.max_in_flight
+
+    stub_server.reset()
+    async_rps = await _requests_per_second(lambda i: backend._aexecute_search_api(dsl, f"bucket-{i}", 10))
+    async_peak = stub_server.max_in_flight
+
+    print(
+        f"\n{CONCURRENT_SEARCHES} concurrent searches, {LATENCY_SECONDS * 1000:.0f} ms latency: "
+        f"threaded {threaded_rps:.0f} req/s (peak {threaded_peak} in flight), "
+        f"async {async_rps:.0f} req/s (peak {async_peak} in flight)"
+    )
+    assert stub_server.requests == CONCURRENT_SEARCHES
+    # The thread pool caps in-flight searches at its worker count; the async
+    # transport is only bounded by the connection limit (100 by default).
+    assert async_peak > threaded_peak or async_peak == CONCURRENT_SEARCHES
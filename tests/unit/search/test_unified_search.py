@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import threading
+import time
 from types import SimpleNamespace
 
 import pytest
 
-from quilt_mcp.search.backends.base import BackendResponse, BackendStatus, BackendType, SearchResult
-from quilt_mcp.search.tools.unified_search import UnifiedSearchEngine
+from quilt_mcp.context.runtime_context import RuntimeAuthState, push_runtime_context, reset_runtime_context
+from quilt_mcp.search.backends.base import (
+    BackendRegistry,
+    BackendResponse,
+    BackendStatus,
+    BackendType,
+    SearchBackend,
+    SearchResult,
+)
+from quilt_mcp.search.tools import unified_search
+from quilt_mcp.search.tools.unified_search import UnifiedSearchEngine, get_search_engine
+from quilt_mcp.search.utils.backend_status import BackendStatusSnapshot
 
 
 class StubBackend:
@@ -48,7 +60,7 @@ async def test_search_success_with_explanation_and_filters(monkeypatch):
     stub = StubBackend()
     monkeypatch.setattr(engine.registry, "_select_primary_backend", lambda: stub)
     monkeypatch.setattr(engine.registry, "get_backend_statuses", lambda: {"elasticsearch": "available"})
-    monkeypatch.setattr("quilt_mcp.search.utils.get_search_backend_status", lambda: {"ok": True})
+    monkeypatch.setattr(engine.status_snapshot, "get", lambda: {"ok": True})
 
     response = await engine.search(
         query="find csv files larger than 5b",
@@ -152,3 +164,160 @@ def test_generate_explanation_for_error_backend():
     explanation = engine._generate_explanation(analysis, backend_response, selected_backend)
     assert explanation["execution_summary"]["success"] is False
     assert explanation["execution_summary"]["error"] == "boom"
+
+
+class HealthBackend:
+    backend_type = BackendType.ELASTICSEARCH
+
+    def __init__(self, available: bool):
+        self.status = BackendStatus.AVAILABLE if available else BackendStatus.UNAVAILABLE
+        self.last_error = None
+        self.health_checks = 0
+
+    def ensure_initialized(self):
+        pass
+
+    async def health_check(self):
+        self.health_checks += 1
+        self.status = BackendStatus.AVAILABLE
+        return True
+
+
+def test_get_search_engine_reuses_engine_per_identity(monkeypatch):
+    monkeypatch.setattr(UnifiedSearchEngine, "_initialize_backends", lambda self: None)
+
+    local_engine = get_search_engine()
+    assert get_search_engine() is local_engine
+
+    handles = []
+    try:
+        handles.append(push_runtime_context(environment="web", auth=RuntimeAuthState("Bearer", "token-a")))
+        engine_a = get_search_engine()
+        assert get_search_engine() is engine_a
+        reset_runtime_context(handles.pop())
+
+        handles.append(push_runtime_context(environment="web", auth=RuntimeAuthState("Bearer", "token-b")))
+        engine_b = get_search_engine()
+    finally:
+        for handle in reversed(handles):
+            reset_runtime_context(handle)
+
+    assert len({id(local_engine), id(engine_a), id(engine_b)}) == 3
+    assert get_search_engine() is local_engine
+
+
+def test_get_search_engine_rebuilds_idle_engines(monkeypatch):
+    monkeypatch.setattr(UnifiedSearchEngine, "_initialize_backends", lambda self: None)
+    monkeypatch.setenv("QUILT_SEARCH_ENGINE_IDLE_TTL", "0")
+
+    first = get_search_engine()
+    time.sleep(0.01)
+    assert get_search_engine() is not first
+
+
+def test_get_search_engine_builds_once_under_concurrency(monkeypatch):
+    created = []
+
+    def slow_init(self):
+        created.append(self)
+        time.sleep(0.05)
+
+    monkeypatch.setattr(UnifiedSearchEngine, "_initialize_backends", slow_init)
+
+    engines = []
+    threads = [threading.Thread(target=lambda: engines.append(get_search_engine())) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(engine is engines[0] for engine in engines)
+
+
+def test_status_snapshot_serves_cached_value_and_refreshes_in_background():
+    registry = BackendRegistry()
+    backend = HealthBackend(available=False)
+    registry.register(backend)
+    snapshot = BackendStatusSnapshot(registry, ttl_seconds=0)
+
+    first = snapshot.get()
+    assert first["available"] is False
+
+    # Stale snapshot: the cached value is returned immediately while a
+    # background thread re-checks health.
+    assert snapshot.get() is first
+    deadline = time.time() + 2
+    while backend.health_checks == 0 or snapshot.get()["available"] is False:
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+    assert snapshot.get()["status"] == "ready"
+
+
+def test_status_snapshot_does_not_rebuild_while_fresh():
+    registry = BackendRegistry()
+    registry.register(HealthBackend(available=True))
+    snapshot = BackendStatusSnapshot(registry, ttl_seconds=3600)
+
+    first = snapshot.get()
+    updated_at = snapshot.updated_at
+    assert snapshot.get() is first
+    assert snapshot.updated_at == updated_at
+
+
+@pytest.mark.asyncio
+async def test_search_rechecks_unavailable_backend_before_failing(monkeypatch):
+    monkeypatch.setattr(UnifiedSearchEngine, "_initialize_backends", lambda self: None)
+    engine = UnifiedSearchEngine()
+    backend = HealthBackend(available=False)
+    backend.search = StubBackend().search
+    engine.registry.register(backend)
+
+    response = await engine.search("csv", backend="elasticsearch")
+
+    assert backend.health_checks == 1
+    assert response["success"] is True
+    assert response["backend_info"]["status"] == "ready"
+
+
+def test_reset_search_engines_clears_cache(monkeypatch):
+    monkeypatch.setattr(UnifiedSearchEngine, "_initialize_backends", lambda self: None)
+    first = get_search_engine()
+    unified_search.reset_search_engines()
+    assert get_search_engine() is not first
+
+
+@pytest.mark.asyncio
+async def test_count_reports_index_total_not_result_length(monkeypatch):
+    monkeypatch.setattr(UnifiedSearchEngine, "_initialize_backends", lambda self: None)
+    engine = UnifiedSearchEngine()
+    backend = HealthBackend(available=True)
+    calls = {}
+
+    async def count(query, scope, bucket, filters, include_aggregations=False):
+        calls["include_aggregations"] = include_aggregations
+        return BackendResponse(
+            backend_type=BackendType.ELASTICSEARCH,
+            status=BackendStatus.AVAILABLE,
+            results=[],
+            total=1_000_000,
+            aggregations={"extensions": {"csv": 1_000_000}},
+        )
+
+    backend.count = count
+    engine.registry.register(backend)
+
+    response = await engine.count("csv files", backend="elasticsearch", include_aggregations=True)
+
+    assert response["success"] is True
+    assert response["total_count"] == 1_000_000
+    assert response["aggregations"] == {"extensions": {"csv": 1_000_000}}
+    assert calls["include_aggregations"] is True
+
+
+@pytest.mark.asyncio
+async def test_default_backend_count_falls_back_to_search():
+    stub = StubBackend()
+    response = await SearchBackend.count(stub, "csv")
+    assert response.total == 2
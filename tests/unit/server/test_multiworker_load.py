@@ -0,0 +1,169 @@
+"""Load test: HTTP throughput with one worker process versus several.
+
+Starts the server in remote mode (stateless HTTP, fallback JWT) with
+``--workers 1`` and then ``--workers N``, drives concurrent ``tools/list``
+requests at each for a fixed time, and checks that throughput grows close to
+linearly with the worker count. Run with ``-s`` to see the report.
+
+``test_blocking_requests_scale_with_workers`` makes every request hold its
+worker's event loop for ``BLOCK_SECONDS`` (a ``sitecustomize`` hook wraps the
+app in each worker), standing in for a CPU-bound tool call. One worker then
+serves one such request at a time however many cores there are, so the ratio
+is meaningful on any host, including single-core CI runners.
+``test_throughput_scales_with_workers`` measures plain ``tools/list`` across
+cores: ``N`` is the CPU count, capped at ``QUILT_LOAD_TEST_WORKERS``
+(default 4), and it needs at least two CPUs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+import pytest
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+DURATION_SECONDS = 5.0
+CONCURRENCY = 32
+REQUEST = {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+# Cheap enough that the blocking test measures the blocked time, not the host's CPU.
+PING = {"jsonrpc": "2.0", "id": 1, "method": "ping"}
+HEADERS = {"Accept": "application/json, text/event-stream", "Authorization": "Bearer load-test"}
+BLOCK_SECONDS = 0.2
+BLOCKING_WORKERS = 4
+
+# Imported at startup by the server and every worker process it spawns.
+_BLOCKING_HOOK = f"""
+import time
+
+import quilt_mcp.utils.common as common
+
+_build_http_app = common.build_http_app
+
+
+def _blocking_build_http_app(*args, **kwargs):
+    app = _build_http_app(*args, **kwargs)
+
+    async def blocking_app(scope, receive, send):
+        if scope["type"] == "http":
+            time.sleep({BLOCK_SECONDS})
+        await app(scope, receive, send)
+
+    return blocking_app
+
+
+common.build_http_app = _blocking_build_http_app
+"""
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(workers: int, port: int, tmp_path, *, blocking: bool = False) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "QUILT_DEPLOYMENT": "remote",
+        "QUILT_CATALOG_URL": "https://example.quiltdata.com",
+        "QUILT_REGISTRY_URL": "https://registry.example.com",
+        "QUILT_FALLBACK_JWT": "load-test",
+        "QUILT_SHARED_CACHE_PATH": str(tmp_path / "shared-cache.db"),
+        "FASTMCP_TRANSPORT": "http",
+        "FASTMCP_PORT": str(port),
+        "MCP_SKIP_BANNER": "true",
+    }
+    if blocking:
+        hooks = tmp_path / "hooks"
+        hooks.mkdir(exist_ok=True)
+        (hooks / "sitecustomize.py").write_text(_BLOCKING_HOOK)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(hooks), env.get("PYTHONPATH")]))
+    return subprocess.Popen(
+        [sys.executable, "-m", "quilt_mcp.main", "--workers", str(workers)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def _wait_ready(client: httpx.AsyncClient, workers: int) -> None:
+    deadline = time.monotonic() + 120
+    ready = 0
+    while time.monotonic() < deadline:
+        try:
+            response = await client.post("/mcp", json=REQUEST, headers=HEADERS)
+            ready = ready + 1 if response.status_code == 200 else 0
+            # A few consecutive successes so late-starting workers have bound too.
+            if ready >= 4 * workers:
+                return
+        except httpx.TransportError:
+            ready = 0
+        await asyncio.sleep(0.25)
+    raise TimeoutError(f"server with {workers} workers did not become ready")
+
+
+async def _drive(port: int, workers: int, request: dict) -> float:
+    """Return completed requests per second over ``DURATION_SECONDS``."""
+    limits = httpx.Limits(max_connections=CONCURRENCY, max_keepalive_connections=CONCURRENCY)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30) as client:
+        await _wait_ready(client, workers)
+        completed = 0
+        deadline = time.monotonic() + DURATION_SECONDS
+
+        async def worker() -> None:
+            nonlocal completed
+            while time.monotonic() < deadline:
+                response = await client.post("/mcp", json=request, headers=HEADERS)
+                assert response.status_code == 200
+                completed += 1
+
+        start = time.monotonic()
+        await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+        return completed / (time.monotonic() - start)
+
+
+def _throughput(workers: int, tmp_path, *, blocking: bool = False) -> float:
+    port = _free_port()
+    server = _start_server(workers, port, tmp_path, blocking=blocking)
+    try:
+        return asyncio.run(_drive(port, workers, PING if blocking else REQUEST))
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def test_blocking_requests_scale_with_workers(tmp_path):
+    single = _throughput(1, tmp_path, blocking=True)
+    multi = _throughput(BLOCKING_WORKERS, tmp_path, blocking=True)
+
+    speedup = multi / single
+    print(
+        f"\nblocking ping: 1 worker {single:.1f} req/s, {BLOCKING_WORKERS} workers {multi:.1f} req/s ({speedup:.2f}x)"
+    )
+    assert single <= 1.1 / BLOCK_SECONDS  # one worker really serves one blocked request at a time
+    assert speedup >= 0.6 * BLOCKING_WORKERS
+
+
+def test_throughput_scales_with_workers(tmp_path):
+    cpus = os.cpu_count() or 1
+    if cpus < 2:
+        pytest.skip("multi-worker scaling needs at least two CPUs")
+    workers = min(cpus, int(os.getenv("QUILT_LOAD_TEST_WORKERS", "4")))
+
+    single = _throughput(1, tmp_path)
+    multi = _throughput(workers, tmp_path)
+
+    speedup = multi / single
+    print(f"\ntools/list: 1 worker {single:.0f} req/s, {workers} workers {multi:.0f} req/s ({speedup:.2f}x)")
+    # The load generator shares the host's CPUs, so allow well below perfect scaling.
+    assert speedup >= max(1.3, 0.6 * workers)
@@ -0,0 +1,95 @@
+"""Unit tests for the process-wide async HTTP client registry."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+
+import httpx
+import pytest
+
+from quilt_mcp.services import async_http_client as module
+from quilt_mcp.services.async_http_client import AsyncHTTPClientRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = AsyncHTTPClientRegistry(max_connections=10, max_keepalive_connections=5, http2=False)
+    yield registry
+    registry.close()
+
+
+def test_client_is_shared_per_event_loop(registry):
+    async def get_clients():
+        return registry.client(), registry.client()
+
+    first, again = asyncio.run(get_clients())
+    other, _ = asyncio.run(get_clients())
+
+    assert first is again
+    assert other is not first
+    assert isinstance(first, httpx.AsyncClient)
+    assert registry.stats()["created"] == 2
+
+
+def test_run_sync_reuses_background_loop_and_client(registry):
+    async def current():
+        return asyncio.get_running_loop(), threading.current_thread().name, registry.client()
+
+    loop1, thread1, client1 = registry.run_sync(current())
+    loop2, thread2, client2 = registry.run_sync(current())
+
+    assert loop1 is loop2
+    assert thread1 == thread2 == "quilt-async-http"
+    assert client1 is client2
+    assert registry.stats()["background_loop"] is True
+
+
+def test_run_sync_carries_caller_context(registry):
+    var: contextvars.ContextVar[str] = contextvars.ContextVar("var", default="unset")
+    var.set("caller")
+
+    async def read():
+        return var.get()
+
+    assert registry.run_sync(read()) == "caller"
+
+
+def test_run_sync_timeout_cancels_coroutine(registry):
+    cancelled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        registry.run_sync(slow(), timeout=0.05)
+    assert cancelled.wait(timeout=2)
+
+
+def test_close_stops_background_loop(registry):
+    async def client():
+        return registry.client()
+
+    shared = registry.run_sync(client())
+    registry.close()
+
+    assert shared.is_closed
+    assert registry.stats()["background_loop"] is False
+
+
+def test_get_registry_reads_limits_from_env(monkeypatch):
+    monkeypatch.setenv("QUILT_HTTP_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("QUILT_HTTP_MAX_KEEPALIVE_CONNECTIONS", "3")
+    module.reset_async_http_registry()
+
+    stats = module.get_async_http_registry().stats()
+
+    assert stats["max_connections"] == 7
+    assert stats["max_keepalive_connections"] == 3
+    assert stats["http2"] == module.http2_available()
+    assert module.get_async_http_registry() is module.get_async_http_registry()
@@ -0,0 +1,183 @@
+"""Unit tests for the process-wide Athena connection registry."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from quilt_mcp.services import athena_connection_registry as registry_module
+from quilt_mcp.services.athena_connection_registry import (
+    AthenaConnectionRegistry,
+    athena_credential_identity,
+    credential_expiry,
+    get_athena_connection_registry,
+)
+from quilt_mcp.services.athena_service import AthenaQueryService
+from quilt_mcp.services.credential_store import get_credential_store
+
+
+class _Resource:
+    def __init__(self, name: str = "conn"):
+        self.name = name
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _creds(key: str = "AKIA") -> SimpleNamespace:
+    return SimpleNamespace(access_key=key, secret_key="secret", token="token")
+
+
+def _get(registry: AthenaConnectionRegistry, factory, *, schema=None, credentials=None, kind="connection"):
+    return registry.get(
+        kind,
+        region="us-east-1",
+        workgroup="wg",
+        catalog="AwsDataCatalog",
+        schema=schema,
+        credentials=credentials,
+        factory=factory,
+    )
+
+
+def test_registry_reuses_connection_for_same_key():
+    registry = AthenaConnectionRegistry()
+    factory = Mock(side_effect=lambda: _Resource())
+
+    first = _get(registry, factory, schema="db", credentials=_creds())
+    second = _get(registry, factory, schema="db", credentials=_creds())
+
+    assert first is second
+    assert factory.call_count == 1
+    assert registry.stats()["hits"] == 1
+
+
+def test_registry_keys_by_schema_kind_and_credentials():
+    registry = AthenaConnectionRegistry()
+    factory = Mock(side_effect=lambda: _Resource())
+
+    _get(registry, factory, schema="a", credentials=_creds())
+    _get(registry, factory, schema="b", credentials=_creds())
+    _get(registry, factory, schema="a", credentials=_creds(key="OTHER"))
+    _get(registry, factory, schema="a", credentials=_creds(), kind="engine")
+
+    assert factory.call_count == 4
+    assert "AKIA" not in athena_credential_identity(_creds())
+
+
+def test_registry_disposes_entries_when_credentials_expire(monkeypatch: pytest.MonkeyPatch):
+    registry = AthenaConnectionRegistry()
+    now = time.time()
+    expiring = _creds()
+    # JWT-exchanged credentials: the expiry is known only to the credential store.
+    get_credential_store().get(
+        "jwt-token",
+        lambda _token: {
+            "AccessKeyId": "AKIA",
+            "SecretAccessKey": "secret",
+            "SessionToken": "token",
+            "Expiration": datetime.fromtimestamp(now + 120, tz=UTC).isoformat(),
+        },
+    )
+    assert credential_expiry(expiring) == pytest.approx(now + 120)
+    first = _get(registry, lambda: _Resource("old"), credentials=expiring)
+    assert _get(registry, lambda: _Resource("unused"), credentials=expiring) is first
+
+    monkeypatch.setattr(registry_module, "time", SimpleNamespace(time=lambda: now + 90))
+    second = _get(registry, lambda: _Resource("new"), credentials=expiring)
+
+    assert second.name == "new"
+    assert first.closed is True
+    assert second.closed is False
+    assert registry.stats()["size"] == 0
+
+
+def test_credential_expiry_uses_public_frozen_credentials():
+    class Refreshable:
+        def get_frozen_credentials(self):
+            return _creds(key="ROTATED")
+
+    assert credential_expiry(Refreshable()) is None
+    assert credential_expiry(None) is None
+
+    # An explicit expiry inside the skew window is served but never cached.
+    registry = AthenaConnectionRegistry()
+    registry.get(
+        "connection",
+        region="us-east-1",
+        workgroup="wg",
+        catalog="AwsDataCatalog",
+        schema=None,
+        credentials=Refreshable(),
+        factory=lambda: _Resource(),
+        expires_at=time.time() + 30,
+    )
+    assert registry.stats()["size"] == 0
+
+
+def test_registry_disposes_idle_and_lru_entries():
+    registry = AthenaConnectionRegistry(max_entries=1, idle_ttl_seconds=0.01)
+    first = _get(registry, lambda: _Resource(), schema="a")
+    second = _get(registry, lambda: _Resource(), schema="b")
+    assert first.closed is True
+
+    time.sleep(0.02)
+    third = _get(registry, lambda: _Resource(), schema="b")
+    assert third is not second
+    assert second.closed is True
+    assert registry.stats()["evictions"] == 2
+
+
+def test_registry_disposes_engines_and_clears():
+    registry = AthenaConnectionRegistry()
+    engine = Mock(spec=["dispose"])
+    _get(registry, lambda: engine, kind="engine")
+
+    registry.clear()
+
+    engine.dispose.assert_called_once_with()
+    assert registry.stats()["size"] == 0
+
+
+def test_registry_single_flight_for_concurrent_callers():
+    registry = AthenaConnectionRegistry()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return _Resource()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(_get(registry, factory))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_service_instances_share_connections(monkeypatch: pytest.MonkeyPatch):
+    connects = []
+    monkeypatch.setitem(sys.modules, "pyathena", SimpleNamespace(connect=lambda **kw: connects.append(kw) or object()))
+
+    def make_service() -> AthenaQueryService:
+        svc = AthenaQueryService(backend=Mock())
+        svc._get_workgroup = lambda _region: "wg"  # type: ignore[method-assign]
+        svc._get_athena_credentials = lambda **_k: _creds()  # type: ignore[method-assign]
+        return svc
+
+    assert make_service()._connect("db") is make_service()._connect("db")
+    make_service()._connect("other")
+
+    assert len(connects) == 2
+    assert get_athena_connection_registry().stats()["hits"] == 1
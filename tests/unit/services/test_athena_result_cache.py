@@ -0,0 +1,101 @@
+"""Unit tests for the process-wide Athena result cache."""
+
+from __future__ import annotations
+
+import time
+
+import pandas as pd
+
+from quilt_mcp.services.athena_result_cache import (
+    AthenaResultCache,
+    is_cacheable_query,
+    normalize_sql,
+    result_size,
+)
+
+
+def _result(rows: int, *, truncated: bool = False, total_rows: int | str | None = None) -> dict:
+    df = pd.DataFrame({"a": list(range(rows))})
+    return {
+        "success": True,
+        "data": df,
+        "row_count": rows,
+        "total_rows": total_rows if total_rows is not None else rows,
+        "truncated": truncated,
+        "query": "SELECT a FROM t",
+    }
+
+
+def _key(query: str = "SELECT a FROM t", **overrides):
+    params = {"database": "db", "catalog": "AwsDataCatalog", "workgroup": "wg", "identity": "id"}
+    params.update(overrides)
+    return AthenaResultCache.make_key(query, **params)
+
+
+def test_normalize_sql_preserves_quoted_text():
+    query = "SELECT  \"My  Col\"\n  FROM t -- trailing\nWHERE x = 'a  b' /* note */ ;"
+    assert normalize_sql(query) == "SELECT \"My  Col\" FROM t WHERE x = 'a  b'"
+
+
+def test_only_read_only_statements_are_cacheable():
+    for query in ["select 1", "WITH x AS (SELECT 1) SELECT * FROM x", "SHOW TABLES", "DESCRIBE t", "(SELECT 1)"]:
+        assert is_cacheable_query(normalize_sql(query)), query
+    for query in ["INSERT INTO t VALUES (1)", "CREATE TABLE t AS SELECT 1", "DROP TABLE t", "MSCK REPAIR TABLE t"]:
+        assert not is_cacheable_query(normalize_sql(query)), query
+    assert _key("DELETE FROM t") is None
+
+
+def test_key_includes_identity_database_and_workgroup():
+    assert _key() == _key("SELECT a\n  FROM t;")
+    assert _key() != _key(identity="other")
+    assert _key() != _key(database="other")
+    assert _key() != _key(workgroup="other")
+
+
+def test_get_serves_smaller_limits_and_complete_results():
+    cache = AthenaResultCache()
+    cache.put(_key(), _result(5), max_results=10)
+
+    smaller = cache.get(_key(), 2)
+    assert smaller["row_count"] == 2
+    assert smaller["truncated"] is True
+    assert smaller["total_rows"] == 5
+    assert cache.get(_key(), 100)["row_count"] == 5
+
+
+def test_truncated_result_does_not_serve_larger_limit():
+    cache = AthenaResultCache()
+    cache.put(_key(), _result(3, truncated=True, total_rows="3+"), max_results=3)
+
+    assert cache.get(_key(), 10) is None
+    assert cache.get(_key(), 2)["total_rows"] == "2+"
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_expires_entries():
+    cache = AthenaResultCache(ttl_seconds=0.01)
+    cache.put(_key(), _result(1), max_results=10)
+    time.sleep(0.02)
+    assert cache.get(_key(), 10) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_byte_budget_evicts_least_recently_used():
+    entry_bytes = result_size(_result(100))
+    cache = AthenaResultCache(max_bytes=int(entry_bytes * 2.5))
+    cache.put(_key("SELECT 1"), _result(100), max_results=100)
+    cache.put(_key("SELECT 2"), _result(100), max_results=100)
+    cache.get(_key("SELECT 1"), 100)
+    cache.put(_key("SELECT 3"), _result(100), max_results=100)
+
+    assert cache.get(_key("SELECT 2"), 100) is None
+    assert cache.get(_key("SELECT 1"), 100) is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] <= cache.stats()["max_bytes"]
+
+
+def test_oversized_and_failed_results_are_not_cached():
+    cache = AthenaResultCache(max_bytes=10)
+    assert cache.put(_key(), _result(100), max_results=100) is False
+    assert AthenaResultCache().put(_key(), {"success": False}, max_results=1) is False
+    assert AthenaResultCache(ttl_seconds=0).enabled is False
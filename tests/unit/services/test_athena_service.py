@@ -9,6 +9,7 @@ import pandas as pd
 import pytest
 from sqlalchemy.exc import SQLAlchemyError
 
+from quilt_mcp.services.athena_connection_registry import reset_athena_connection_registry
 from quilt_mcp.services.athena_service import AthenaQueryService
 
 
@@ -55,7 +56,7 @@ def test_client_creation_fallbacks(monkeypatch: pytest.MonkeyPatch):
     backend.get_aws_client.side_effect = RuntimeError("backend unavailable")
     svc = _service_with_backend(backend)
 
-    monkeypatch.setattr("quilt_mcp.services.athena_service.boto3.client", lambda name, **_k: f"{name}-client")
+    monkeypatch.setattr("boto3.DEFAULT_SESSION", SimpleNamespace(client=lambda name, **_k: f"{name}-client"))
     assert svc._create_glue_client() == "glue-client"
     assert svc._create_s3_client() == "s3-client"
 
@@ -78,9 +79,7 @@ def test_create_sqlalchemy_engine_with_and_without_credentials(monkeypatch: pyte
     svc = _service_with_backend()
     monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
     svc._get_workgroup = lambda _region: "wg"  # type: ignore[method-assign]
-    monkeypatch.setattr(
-        "quilt_mcp.services.athena_service.create_engine", lambda cs, echo=False: {"cs": cs, "echo": echo}
-    )
+    monkeypatch.setattr("sqlalchemy.create_engine", lambda cs, echo=False: {"cs": cs, "echo": echo})
 
     svc._get_athena_credentials = lambda **_k: None  # type: ignore[method-assign]
     e1 = svc._create_sqlalchemy_engine()
@@ -142,6 +141,7 @@ def test_get_table_metadata_parsing_and_error(monkeypatch: pytest.MonkeyPatch):
     assert any(c["name"] == "id" for c in meta["columns"])
     assert any(p["name"] == "partition_date" for p in meta["partitions"])
 
+    reset_athena_connection_registry()
     monkeypatch.setitem(
         sys.modules, "pyathena", SimpleNamespace(connect=lambda **_k: (_ for _ in ()).throw(RuntimeError("x")))
     )
@@ -149,38 +149,183 @@ def test_get_table_metadata_parsing_and_error(monkeypatch: pytest.MonkeyPatch):
     assert err["success"] is False
 
 
-def test_execute_query_success_sqlalchemy_error_and_generic_error(monkeypatch: pytest.MonkeyPatch):
-    svc = _service_with_backend()
-    svc._base_connection_string = "awsathena://base"
-    svc._engine = object()
+class _PagedCursor:
+    """DB-API cursor stub that serves rows in pages and records fetches."""
+
+    def __init__(self, rows, *, error: Exception | None = None, query_id: str = "qid-1"):
+        self._rows = list(rows)
+        self._error = error
+        self.query_id = query_id
+        self.description = [("a",), ("b",)]
+        self.arraysize = 1
+        self.fetched = 0
+        self.closed = False
+        self.execute_kwargs: dict = {}
+
+    def execute(self, _query, **kwargs):
+        self.execute_kwargs = kwargs
+        if self._error is not None:
+            raise self._error
+
+    def fetchmany(self, size):
+        page = self._rows[self.fetched : self.fetched + size]
+        self.fetched += len(page)
+        return page
+
+    def close(self):
+        self.closed = True
+
+
+def _service_with_cursor(monkeypatch: pytest.MonkeyPatch, cursor: _PagedCursor, backend: Mock | None = None):
+    svc = _service_with_backend(backend)
+    connected: list[str | None] = []
+
+    def connect(schema_name=None):
+        connected.append(schema_name)
+        return SimpleNamespace(cursor=lambda: cursor)
+
+    svc._connect = connect  # type: ignore[method-assign]
+    svc._get_workgroup = lambda _region: "wg"  # type: ignore[method-assign]
+    svc._get_athena_credentials = lambda **_k: None  # type: ignore[method-assign]
     monkeypatch.setattr("quilt_mcp.services.athena_service.suppress_stdout", contextlib.nullcontext)
-    monkeypatch.setattr("quilt_mcp.services.athena_service.create_engine", lambda *_a, **_k: object())
+    return svc, connected
+
 
-    df = pd.DataFrame({"a": [1, 2, 3]})
-    monkeypatch.setattr("quilt_mcp.services.athena_service.pd.read_sql_query", lambda *_a, **_k: df)
-    ok = svc.execute_query("SELECT 1", database_name="db", max_results=2)
+def test_execute_query_returns_all_rows_under_limit(monkeypatch: pytest.MonkeyPatch):
+    cursor = _PagedCursor([(1, "x"), (2, "y")])
+    svc, connected = _service_with_cursor(monkeypatch, cursor)
+
+    ok = svc.execute_query("SELECT 1", database_name="db", max_results=5)
+
+    assert connected == ["db"]
     assert ok["success"] is True
-    assert ok["truncated"] is True
+    assert ok["truncated"] is False
     assert ok["row_count"] == 2
-    assert ok["total_rows"] == "2+"
+    assert ok["total_rows"] == 2
+    assert ok["columns"] == ["a", "b"]
+    assert ok["data"]["a"].tolist() == [1, 2]
+    assert cursor.closed is True
 
-    monkeypatch.setattr(
-        "quilt_mcp.services.athena_service.pd.read_sql_query",
-        lambda *_a, **_k: (_ for _ in ()).throw(SQLAlchemyError("sql-bad")),
-    )
+
+def test_execute_query_stops_fetching_at_limit_and_reports_true_total(monkeypatch: pytest.MonkeyPatch):
+    backend = Mock()
+    athena = backend.get_aws_client.return_value
+    athena.get_query_runtime_statistics.return_value = {"QueryRuntimeStatistics": {"Rows": {"OutputRows": 5000}}}
+    cursor = _PagedCursor([(i, str(i)) for i in range(5000)])
+    svc, _ = _service_with_cursor(monkeypatch, cursor, backend)
+
+    ok = svc.execute_query("SELECT * FROM big", max_results=10)
+
+    assert ok["success"] is True
+    assert ok["truncated"] is True
+    assert ok["row_count"] == 10
+    assert ok["total_rows"] == 5000
+    assert cursor.arraysize == 11
+    assert cursor.fetched == 11
+    athena.get_query_runtime_statistics.assert_called_once_with(QueryExecutionId="qid-1")
+
+
+def test_execute_query_large_limit_uses_max_page_size(monkeypatch: pytest.MonkeyPatch):
+    backend = Mock()
+    backend.get_aws_client.return_value.get_query_runtime_statistics.side_effect = RuntimeError("denied")
+    cursor = _PagedCursor([(i, str(i)) for i in range(3000)])
+    svc, _ = _service_with_cursor(monkeypatch, cursor, backend)
+
+    ok = svc.execute_query("SELECT * FROM big", max_results=1500)
+
+    assert cursor.arraysize == 1000
+    assert cursor.fetched == 2000
+    assert ok["row_count"] == 1500
+    assert ok["total_rows"] == "1500+"
+
+
+def test_execute_query_sql_error_and_generic_error(monkeypatch: pytest.MonkeyPatch):
+    from pyathena.error import OperationalError
+
+    cursor = _PagedCursor([], error=OperationalError("sql-bad"))
+    svc, _ = _service_with_cursor(monkeypatch, cursor)
     sql_err = svc.execute_query("SELECT 1")
     assert sql_err["success"] is False
     assert "SQL execution error" in sql_err["error"]
+    assert cursor.closed is True
 
-    monkeypatch.setattr(
-        "quilt_mcp.services.athena_service.pd.read_sql_query",
-        lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("boom")),
-    )
+    svc, _ = _service_with_cursor(monkeypatch, _PagedCursor([], error=SQLAlchemyError("sql-bad")))
+    assert "SQL execution error" in svc.execute_query("SELECT 1")["error"]
+
+    svc, _ = _service_with_cursor(monkeypatch, _PagedCursor([], error=RuntimeError("boom")))
     err = svc.execute_query("SELECT 1")
     assert err["success"] is False
     assert "Query execution failed" in err["error"]
 
 
+def test_execute_query_serves_repeated_reads_from_result_cache(monkeypatch: pytest.MonkeyPatch):
+    first_cursor = _PagedCursor([(1, "x"), (2, "y")])
+    svc, _ = _service_with_cursor(monkeypatch, first_cursor)
+    first = svc.execute_query("SELECT  *\nFROM t;", database_name="db")
+
+    second_cursor = _PagedCursor([(9, "z")])
+    other, connected = _service_with_cursor(monkeypatch, second_cursor)
+    cached = other.execute_query("SELECT * FROM t", database_name="db", max_results=1)
+
+    assert connected == []
+    assert cached["cached"] is True
+    assert cached["row_count"] == 1
+    assert cached["total_rows"] == 2
+    assert "cached" not in first
+
+    fresh = other.execute_query("SELECT * FROM t", database_name="db", use_cache=False)
+    assert fresh["data"]["a"].tolist() == [9]
+    assert second_cursor.execute_kwargs == {}
+
+
+def test_execute_query_does_not_cache_writes_or_other_databases(monkeypatch: pytest.MonkeyPatch):
+    cursor = _PagedCursor([(1, "x")])
+    svc, connected = _service_with_cursor(monkeypatch, cursor)
+
+    svc.execute_query("INSERT INTO t VALUES (1)")
+    svc.execute_query("INSERT INTO t VALUES (1)")
+    svc.execute_query("SELECT 1", database_name="a")
+    svc.execute_query("SELECT 1", database_name="b")
+
+    assert len(connected) == 4
+
+
+def test_execute_query_requests_result_reuse_when_enabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("QUILT_ATHENA_RESULT_REUSE_MINUTES", "15")
+    cursor = _PagedCursor([(1, "x")])
+    svc, _ = _service_with_cursor(monkeypatch, cursor)
+
+    svc.execute_query("SHOW TABLES")
+    assert cursor.execute_kwargs == {
+        "cache_size": 50,
+        "cache_expiration_time": 900,
+        "result_reuse_enable": True,
+        "result_reuse_minutes": 15,
+    }
+
+    svc.execute_query("DROP TABLE t")
+    assert cursor.execute_kwargs == {}
+
+
+def test_connect_passes_schema_catalog_and_credentials(monkeypatch: pytest.MonkeyPatch):
+    calls: list[dict] = []
+    monkeypatch.setitem(sys.modules, "pyathena", SimpleNamespace(connect=lambda **kwargs: calls.append(kwargs)))
+    svc = AthenaQueryService(backend=Mock(), data_catalog_name="other")
+    svc._get_workgroup = lambda _region: "wg"  # type: ignore[method-assign]
+    svc._get_athena_credentials = lambda **_k: SimpleNamespace(  # type: ignore[method-assign]
+        access_key="AK", secret_key="SK", token="TOK"
+    )
+
+    svc._connect("db")
+    svc._connect()
+
+    assert calls[0]["schema_name"] == "db"
+    assert calls[0]["catalog_name"] == "other"
+    assert calls[0]["work_group"] == "wg"
+    assert calls[0]["aws_session_token"] == "TOK"
+    assert "schema_name" not in calls[1]
+
+
 def test_format_results_formats_and_error(monkeypatch: pytest.MonkeyPatch):
     svc = _service_with_backend()
     df = pd.DataFrame({"a": [1], "b": ["x"]})
@@ -0,0 +1,104 @@
+"""Unit tests for the shared boto3 client registry."""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import boto3
+
+from quilt_mcp.services.aws_client_registry import AWSClientRegistry, credential_identity
+
+
+def _session(access_key: str = "AKIA1", region: str = "us-east-1") -> boto3.Session:
+    return boto3.Session(
+        aws_access_key_id=access_key,
+        aws_secret_access_key="secret",
+        aws_session_token="token",
+        region_name=region,
+    )
+
+
+def test_reuses_client_for_same_credentials_across_sessions():
+    registry = AWSClientRegistry()
+
+    first = registry.get_client(_session(), "s3")
+    second = registry.get_client(_session(), "s3")
+
+    assert first is second
+    assert registry.stats()["hits"] == 1
+    assert registry.stats()["misses"] == 1
+
+
+def test_keys_by_credentials_service_and_region():
+    registry = AWSClientRegistry()
+
+    base = registry.get_client(_session(), "s3")
+    assert registry.get_client(_session(access_key="AKIA2"), "s3") is not base
+    assert registry.get_client(_session(), "sts") is not base
+    assert registry.get_client(_session(), "s3", "us-west-2") is not base
+    assert registry.stats()["size"] == 4
+
+
+def test_applies_configured_pool_size():
+    registry = AWSClientRegistry(max_pool_connections=42)
+
+    client = registry.get_client(_session(), "s3")
+
+    assert client.meta.config.max_pool_connections == 42
+
+
+def test_credential_identity_hides_secrets():
+    identity = credential_identity(_session())
+    assert "AKIA1" not in identity
+    assert "secret" not in identity
+
+
+def test_evicts_clients_for_expired_credentials():
+    registry = AWSClientRegistry()
+    session = _session()
+
+    first = registry.get_client(session, "s3", expires_at=time.time() + 30)
+    second = registry.get_client(session, "s3", expires_at=time.time() + 3600)
+
+    assert first is not second
+    assert registry.stats()["evictions"] == 1
+
+
+def test_lru_bound():
+    registry = AWSClientRegistry(max_entries=2)
+
+    registry.get_client(_session("A"), "s3")
+    registry.get_client(_session("B"), "s3")
+    registry.get_client(_session("C"), "s3")
+
+    assert registry.stats()["size"] == 2
+    assert registry.stats()["evictions"] == 1
+
+
+def test_client_for_credentials_mapping():
+    registry = AWSClientRegistry()
+    credentials = {
+        "AccessKeyId": "AKIA",
+        "SecretAccessKey": "secret",
+        "SessionToken": "token",
+        "Expiration": (datetime.now(UTC) + timedelta(hours=1)).isoformat(),
+    }
+
+    first = registry.get_client_for_credentials(credentials, "s3", "us-east-1")
+    second = registry.get_client_for_credentials(dict(credentials), "s3", "us-east-1")
+
+    assert first is second
+    assert first.meta.region_name == "us-east-1"
+
+
+def test_passes_through_non_boto3_sessions():
+    registry = AWSClientRegistry()
+    calls = []
+    session = SimpleNamespace(client=lambda name, **kwargs: calls.append((name, kwargs)) or name)
+
+    assert registry.get_client(session, "s3") == "s3"
+    assert registry.get_client(session, "athena", "us-west-2") == "athena"
+    assert calls == [("s3", {}), ("athena", {"region_name": "us-west-2"})]
+    assert registry.stats()["size"] == 0
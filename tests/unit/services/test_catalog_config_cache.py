@@ -0,0 +1,162 @@
+"""Unit tests for the process-wide catalog config.json cache."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from quilt_mcp.services import catalog_config_cache as module
+from quilt_mcp.services.catalog_config_cache import CatalogConfigCache
+from quilt_mcp.services.shared_cache import SharedCacheStore
+
+CONFIG_URL = "https://example.quiltdata.com/config.json"
+CONFIG = {"region": "us-east-1", "registryUrl": "https://registry.example.com"}
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(module.time, "monotonic", clock)
+    return clock
+
+
+def _response(status: int = 200, body=None, headers=None) -> Mock:
+    response = Mock(status_code=status, headers=headers or {})
+    response.json.return_value = body if body is not None else CONFIG
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+    return response
+
+
+def test_fresh_config_served_without_request(clock):
+    session = Mock()
+    session.get.return_value = _response(headers={"ETag": '"v1"'})
+    cache = CatalogConfigCache(ttl_seconds=60)
+
+    assert cache.fetch(CONFIG_URL, session=session) == CONFIG
+    clock.now += 59
+    assert cache.fetch(CONFIG_URL, session=session) == CONFIG
+
+    session.get.assert_called_once_with(CONFIG_URL, timeout=10)
+    assert cache.stats()["hits"] == 1
+
+
+def test_expired_config_revalidated_with_validators(clock):
+    session = Mock()
+    session.get.side_effect = [
+        _response(headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2026 00:00:00 GMT"}),
+        _response(status=304),
+        _response(body={"region": "eu-west-1"}),
+    ]
+    cache = CatalogConfigCache(ttl_seconds=60)
+    cache.fetch(CONFIG_URL, session=session)
+
+    clock.now += 61
+    assert cache.fetch(CONFIG_URL, session=session) == CONFIG
+    assert session.get.call_args.kwargs["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2026 00:00:00 GMT",
+    }
+    assert cache.stats()["revalidations"] == 1
+
+    clock.now += 30  # a 304 restarts the TTL
+    assert cache.fetch(CONFIG_URL, session=session) == CONFIG
+    clock.now += 31
+    assert cache.fetch(CONFIG_URL, session=session) == {"region": "eu-west-1"}
+    assert session.get.call_count == 3
+
+
+def test_config_shared_between_caches(clock, tmp_path):
+    shared = SharedCacheStore(str(tmp_path / "cache.db"))
+    session = Mock()
+    session.get.side_effect = [_response(headers={"ETag": '"v1"'}), _response(status=304)]
+    first = CatalogConfigCache(ttl_seconds=60, shared=shared)
+    second = CatalogConfigCache(ttl_seconds=60, shared=shared)
+
+    first.fetch(CONFIG_URL, session=session)
+    assert second.fetch(CONFIG_URL, session=session) == CONFIG
+    assert session.get.call_count == 1
+    assert second.stats()["shared_hits"] == 1
+
+    # Once expired, a process without its own copy revalidates with the shared validators.
+    third = CatalogConfigCache(ttl_seconds=60, shared=shared)
+    stale = dict(shared.get(module.SHARED_NAMESPACE, CONFIG_URL))
+    stale["validated_at"] -= 61
+    shared.set(module.SHARED_NAMESPACE, CONFIG_URL, stale)
+    assert third.fetch(CONFIG_URL, session=session) == CONFIG
+    assert session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert third.stats()["revalidations"] == 1
+
+
+def test_stale_config_served_when_refresh_fails(clock):
+    session = Mock()
+    session.get.side_effect = [_response(), requests.exceptions.ConnectionError("down")]
+    cache = CatalogConfigCache(ttl_seconds=60, max_stale_seconds=600)
+    cache.fetch(CONFIG_URL, session=session)
+
+    clock.now += 120
+    assert cache.fetch(CONFIG_URL, session=session) == CONFIG
+    assert cache.stats()["stale_hits"] == 1
+
+    clock.now += 1000
+    session.get.side_effect = requests.exceptions.ConnectionError("still down")
+    with pytest.raises(requests.exceptions.ConnectionError):
+        cache.fetch(CONFIG_URL, session=session)
+
+
+def test_http_errors_propagate_and_are_not_cached(clock):
+    session = Mock()
+    session.get.side_effect = [_response(status=404), _response()]
+    cache = CatalogConfigCache()
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        cache.fetch(CONFIG_URL, session=session)
+    assert cache.fetch(CONFIG_URL, session=session) == CONFIG
+
+
+def test_concurrent_misses_share_one_request():
+    release = threading.Event()
+    session = Mock()
+
+    def slow_get(*args, **kwargs):
+        release.wait(timeout=5)
+        return _response()
+
+    session.get.side_effect = slow_get
+    cache = CatalogConfigCache()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.fetch(CONFIG_URL, session=session))) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [CONFIG] * 4
+    assert session.get.call_count == 1
+
+
+def test_default_session_is_shared(monkeypatch):
+    session = Mock()
+    session.get.return_value = _response()
+    monkeypatch.setattr(module.requests, "Session", Mock(return_value=session))
+    cache = CatalogConfigCache(ttl_seconds=0)
+
+    cache.fetch(CONFIG_URL)
+    cache.fetch(CONFIG_URL)
+
+    module.requests.Session.assert_called_once_with()
+    assert session.get.call_count == 2
@@ -0,0 +1,184 @@
+"""Unit tests for the process-wide JWT credential store."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+
+from quilt_mcp.context.runtime_context import RuntimeAuthState, push_runtime_context, reset_runtime_context
+from quilt_mcp.services.credential_store import JWTCredentialStore, get_credential_store, parse_expiration
+from quilt_mcp.services.jwt_auth_service import JWTAuthService
+from quilt_mcp.services.shared_cache import get_shared_cache
+
+
+def _credentials(expires_in: float = 3600, key_id: str = "AKIA") -> dict:
+    expiration = datetime.now(UTC) + timedelta(seconds=expires_in)
+    return {
+        "AccessKeyId": key_id,
+        "SecretAccessKey": "secret",
+        "SessionToken": "session",
+        "Expiration": expiration.isoformat().replace("+00:00", "Z"),
+    }
+
+
+def test_parse_expiration_handles_strings_and_datetimes():
+    now = datetime(2030, 1, 1, tzinfo=UTC)
+    assert parse_expiration("2030-01-01T00:00:00Z") == now.timestamp()
+    assert parse_expiration(now) == now.timestamp()
+    assert parse_expiration(None) is None
+    assert parse_expiration("not-a-date") is None
+
+
+def test_store_hits_after_first_fetch():
+    store = JWTCredentialStore()
+    calls = []
+
+    def fetch(token):
+        calls.append(token)
+        return _credentials()
+
+    first = store.get("token-a", fetch)
+    second = store.get("token-a", fetch)
+
+    assert first is second
+    assert calls == ["token-a"]
+    stats = store.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_store_refreshes_inside_buffer_window():
+    store = JWTCredentialStore(refresh_buffer_seconds=300)
+    responses = [_credentials(expires_in=120, key_id="old"), _credentials(key_id="new")]
+
+    def fetch(_token):
+        return responses.pop(0)
+
+    assert store.get("token", fetch)["AccessKeyId"] == "old"
+    assert store.get("token", fetch)["AccessKeyId"] == "new"
+    assert store.stats()["refreshes"] == 1
+
+
+def test_store_keys_by_registry_and_token():
+    store = JWTCredentialStore()
+    calls = []
+
+    def fetch(token):
+        calls.append(token)
+        return _credentials()
+
+    store.get("token", fetch, registry_url="https://a.example.com")
+    store.get("token", fetch, registry_url="https://b.example.com")
+    store.get("other", fetch, registry_url="https://a.example.com")
+
+    assert len(calls) == 3
+    assert "token" not in JWTCredentialStore.cache_key("token")
+
+
+def test_store_evicts_least_recently_used():
+    store = JWTCredentialStore(max_entries=2)
+    calls = []
+
+    def fetch(token):
+        calls.append(token)
+        return _credentials()
+
+    store.get("a", fetch)
+    store.get("b", fetch)
+    store.get("a", fetch)
+    store.get("c", fetch)  # evicts "b"
+    store.get("a", fetch)
+    store.get("b", fetch)
+
+    assert calls == ["a", "b", "c", "b"]
+    assert store.stats()["evictions"] == 2
+
+
+def test_store_reports_expiration_by_access_key():
+    store = JWTCredentialStore(max_entries=1)
+    credentials = store.get("token-a", lambda _t: _credentials(expires_in=600, key_id="KEY-A"))
+
+    assert store.expiration_for("KEY-A") == parse_expiration(credentials["Expiration"])
+    assert store.expiration_for("UNKNOWN") is None
+
+    store.get("token-b", lambda _t: _credentials(key_id="KEY-B"))
+    assert store.expiration_for("KEY-A") is None  # evicted with its entry
+    store.invalidate("token-b")
+    assert store.expiration_for("KEY-B") is None
+
+
+def test_store_single_flight_for_concurrent_callers():
+    store = JWTCredentialStore()
+    calls = []
+    started = threading.Event()
+
+    def fetch(token):
+        calls.append(token)
+        started.set()
+        time.sleep(0.05)
+        return _credentials()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(store.get("token", fetch))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["token"]
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+
+
+def test_store_does_not_cache_failed_fetch():
+    store = JWTCredentialStore()
+    attempts = []
+
+    def fetch(_token):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+        return _credentials()
+
+    try:
+        store.get("token", fetch)
+    except RuntimeError:
+        pass
+    assert store.get("token", fetch)["AccessKeyId"] == "AKIA"
+    assert len(attempts) == 2
+
+
+def test_jwt_auth_service_instances_share_store(monkeypatch):
+    monkeypatch.setenv("QUILT_REGISTRY_URL", "https://registry.example.com")
+    calls = []
+
+    def fake_fetch(self, token):
+        calls.append(token)
+        return _credentials()
+
+    monkeypatch.setattr(JWTAuthService, "_fetch_temporary_credentials", fake_fetch)
+
+    token_handle = push_runtime_context(
+        environment="web-service",
+        auth=RuntimeAuthState(scheme="Bearer", access_token="shared-token"),
+    )
+    try:
+        JWTAuthService().get_boto3_session()
+        JWTAuthService().get_boto3_session()
+    finally:
+        reset_runtime_context(token_handle)
+
+    assert calls == ["shared-token"]
+    assert get_credential_store().stats()["hits"] == 1
+
+
+def test_credentials_are_not_written_to_shared_cache(monkeypatch, tmp_path):
+    path = tmp_path / "cache.db"
+    monkeypatch.setenv("QUILT_SHARED_CACHE_PATH", str(path))
+    assert get_shared_cache() is not None
+
+    get_credential_store().get("token", lambda token: _credentials())
+
+    assert sqlite3.connect(path).execute("SELECT COUNT(*) FROM entries").fetchone() == (0,)
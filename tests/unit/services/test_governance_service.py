@@ -5,6 +5,10 @@ These tests mock the QuiltOps.admin API to test the governance functionality
 in isolation without requiring actual admin privileges.
 """
 
+import asyncio
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
@@ -586,12 +590,12 @@ async def test_sso_and_tabulator_paths(mock_admin_available, mock_context):
     assert sso_empty["success"] is False
 
     # tabulator get success/failure
-    mock_ops.get_open_query_status.return_value = {"success": True, "open_query_enabled": True}
+    mock_ops.aget_open_query_status.return_value = {"success": True, "open_query_enabled": True}
     result = await governance.admin_tabulator_open_query_get(quilt_ops=mock_ops, context=mock_context)
     assert result["success"] is True
     assert result["open_query_enabled"] is True
 
-    mock_ops.get_open_query_status.return_value = {"success": False, "message": "denied"}
+    mock_ops.aget_open_query_status.return_value = {"success": False, "message": "denied"}
     result = await governance.admin_tabulator_open_query_get(quilt_ops=mock_ops, context=mock_context)
     assert result["success"] is False
 
@@ -624,3 +628,68 @@ def test_governance_service_internal_paths(mock_admin_available, mock_quilt_ops)
     assert response["success"] is False
     response = service._handle_admin_error(NotFoundError("x", {"error_type": "other"}), "op")
     assert response["success"] is False
+
+
+@pytest.mark.asyncio
+async def test_admin_calls_do_not_block_event_loop(mock_admin_available, sample_users, mock_quilt_ops, mock_context):
+    """A slow admin GraphQL call must not stall other tasks on the event loop."""
+    call_seconds = 0.3
+
+    def slow_list_users():
+        time.sleep(call_seconds)
+        return sample_users
+
+    mock_quilt_ops.admin.list_users.side_effect = slow_list_users
+    max_lag = 0.0
+    stop = asyncio.Event()
+
+    async def heartbeat(interval: float = 0.01) -> None:
+        nonlocal max_lag
+        while not stop.is_set():
+            expected = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            max_lag = max(max_lag, time.perf_counter() - expected)
+
+    beat = asyncio.create_task(heartbeat())
+    results = await asyncio.gather(
+        *(governance.admin_users_list(quilt_ops=mock_quilt_ops, context=mock_context) for _ in range(3))
+    )
+    stop.set()
+    await beat
+
+    assert all(result["success"] for result in results)
+    assert mock_quilt_ops.admin.list_users.call_count == 3
+    # Blocking on the loop would delay the heartbeat by at least one full call.
+    assert max_lag < call_seconds / 3
+
+
+@pytest.mark.asyncio
+async def test_admin_executor_is_bounded(monkeypatch, mock_admin_available, mock_quilt_ops, mock_context):
+    """Admin calls run on the dedicated pool, at most QUILT_ADMIN_MAX_WORKERS at a time."""
+    monkeypatch.setenv("QUILT_ADMIN_MAX_WORKERS", "2")
+    governance.reset_admin_executor()
+    lock = threading.Lock()
+    in_flight = peak = 0
+    thread_names = set()
+
+    def reset_password(name):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            thread_names.add(threading.current_thread().name)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+
+    mock_quilt_ops.admin.reset_user_password.side_effect = reset_password
+    results = await asyncio.gather(
+        *(
+            governance.admin_user_reset_password(f"user-{i}", quilt_ops=mock_quilt_ops, context=mock_context)
+            for i in range(6)
+        )
+    )
+
+    assert all(result["success"] for result in results)
+    assert peak == 2
+    assert all(name.startswith("quilt-admin") for name in thread_names)
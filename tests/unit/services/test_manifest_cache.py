@@ -0,0 +1,122 @@
+"""Unit tests for the process-wide package manifest cache."""
+
+from __future__ import annotations
+
+import os
+import pickle
+
+from quilt_mcp.services.manifest_cache import (
+    ManifestCache,
+    entries_size,
+    get_manifest_cache,
+    is_top_hash,
+    manifest_key,
+    reset_manifest_cache,
+)
+from quilt_mcp.services.shared_cache import SharedCacheStore
+
+TOP_HASH = "0123456789abcdef" * 4
+
+
+def test_is_top_hash_accepts_only_full_hex_hashes():
+    assert is_top_hash(TOP_HASH)
+    assert not is_top_hash("latest")
+    assert not is_top_hash(TOP_HASH[:10])
+    assert not is_top_hash(TOP_HASH.upper())
+    assert not is_top_hash(None)
+
+
+def test_key_normalizes_registry_to_bucket():
+    assert manifest_key("s3://bucket", TOP_HASH, "entries") == manifest_key("s3://bucket/", TOP_HASH, "entries")
+    assert manifest_key("s3://bucket", TOP_HASH, "entries") != manifest_key("s3://other", TOP_HASH, "entries")
+
+
+def test_entries_size_grows_with_entry_count():
+    assert entries_size(["a"] * 10) > entries_size(["a"])
+    assert entries_size([], {"k": "v"}) > 0
+
+
+def test_lru_evicts_oldest_within_byte_budget():
+    cache = ManifestCache(max_bytes=100)
+    first, second, third = (manifest_key("s3://b", TOP_HASH, name) for name in ("one", "two", "three"))
+    cache.put(first, "1", 40)
+    cache.put(second, "2", 40)
+    assert cache.get(first) == "1"  # refresh: "two" is now least recently used
+
+    cache.put(third, "3", 40)
+
+    assert cache.get(second) is None
+    assert cache.get(first) == "1"
+    assert cache.get(third) == "3"
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == 80
+    assert stats["hits"] == 3 and stats["misses"] == 1
+
+
+def test_oversized_and_disabled_entries_are_not_cached():
+    key = manifest_key("s3://b", TOP_HASH, "entries")
+    assert not ManifestCache(max_bytes=10).put(key, "x", 11)
+
+    disabled = ManifestCache(max_bytes=0)
+    assert not disabled.enabled
+    assert not disabled.put(key, "x", 1)
+    assert disabled.get(key) is None
+
+
+def test_evicted_entries_spill_to_disk_and_reload(tmp_path):
+    cache = ManifestCache(max_bytes=50, spill_dir=str(tmp_path))
+    old, new = manifest_key("s3://b", TOP_HASH, "old"), manifest_key("s3://b", TOP_HASH, "new")
+    cache.put(old, {"a.csv": {"size": 1}}, 40)
+    cache.put(new, {"b.csv": {"size": 2}}, 40)
+
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+    assert ManifestCache(max_bytes=50, spill_dir=str(tmp_path)).get(old) == {"a.csv": {"size": 1}}
+    assert list(tmp_path.glob("*.pickle")) == []  # promoted back into memory
+
+    cache.put(manifest_key("s3://b", TOP_HASH, "newer"), {"c.csv": {"size": 3}}, 40)
+    assert cache.get(new) == {"b.csv": {"size": 2}}
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_spill_directory_is_capped_oldest_first(tmp_path):
+    keys = [manifest_key("s3://b", TOP_HASH, f"section-{i}") for i in range(4)]
+    file_size = len(pickle.dumps((keys[0], "x" * 200, 10), protocol=pickle.HIGHEST_PROTOCOL))
+    cache = ManifestCache(max_bytes=10, spill_dir=str(tmp_path), spill_max_bytes=2 * file_size)
+    for age, key in enumerate(keys):
+        cache.put(key, "x" * 200, 10)
+        for path in tmp_path.glob("*.pickle"):
+            if path.stat().st_mtime > 1000:
+                os.utime(path, (age, age))  # spilled just now; make the write order unambiguous
+
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) == "x" * 200
+
+    cache.clear()
+    assert list(tmp_path.glob("*.pickle")) == []
+
+
+def test_entries_shared_between_caches(tmp_path):
+    shared = SharedCacheStore(str(tmp_path / "cache.db"))
+    key = manifest_key("s3://b", TOP_HASH, "entries")
+    ManifestCache(max_bytes=100, shared=shared).put(key, {"a.csv": {"size": 1}}, 40)
+
+    other = ManifestCache(max_bytes=100, shared=shared)
+    assert other.get(key) == {"a.csv": {"size": 1}}
+    assert other.get(key) == {"a.csv": {"size": 1}}
+    assert other.stats()["shared_hits"] == 1
+    assert other.stats()["hits"] == 1
+    assert other.get(manifest_key("s3://b", TOP_HASH, "other")) is None
+
+
+def test_process_cache_reads_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("QUILT_MANIFEST_CACHE_MAX_BYTES", "1234")
+    monkeypatch.setenv("QUILT_MANIFEST_CACHE_DIR", str(tmp_path))
+    reset_manifest_cache()
+
+    stats = get_manifest_cache().stats()
+
+    assert stats["max_bytes"] == 1234
+    assert stats["spill_dir"] == str(tmp_path)
+    assert get_manifest_cache() is get_manifest_cache()
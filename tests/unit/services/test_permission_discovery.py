@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import threading
+import time
 from datetime import datetime, timezone
 
+import boto3
 import pytest
 from unittest.mock import Mock
 from botocore.exceptions import ClientError
@@ -12,6 +15,7 @@ from quilt_mcp.services.permission_discovery import (
     BucketInfo,
     PermissionLevel,
     UserIdentity,
+    get_permission_probe_executor,
 )
 
 
@@ -151,6 +155,28 @@ def test_discover_user_identity_parses_types_and_uses_cache():
     assert discovery3.discover_user_identity().user_type == "federated"
 
 
+def test_default_credential_discoveries_share_identity_cache(monkeypatch):
+    session = boto3.Session(aws_access_key_id="AKIDEXAMPLE", aws_secret_access_key="secret", region_name="us-east-1")
+    sts = Mock()
+    sts.get_caller_identity.return_value = {
+        "UserId": "u",
+        "Arn": "arn:aws:iam::123456789012:user/alice",
+        "Account": "123456789012",
+    }
+    monkeypatch.setattr("quilt_mcp.services.permission_discovery.quilt3", object())
+    monkeypatch.setattr("quilt_mcp.services.permission_discovery._default_session", lambda: session)
+    monkeypatch.setattr(
+        "quilt_mcp.services.permission_discovery.boto3.client", lambda name: sts if name == "sts" else Mock()
+    )
+
+    first = AWSPermissionDiscovery()
+    second = AWSPermissionDiscovery()
+
+    assert first._credential_key == second._credential_key
+    assert first.discover_user_identity() == second.discover_user_identity()
+    sts.get_caller_identity.assert_called_once()
+
+
 def test_discover_bucket_permissions_access_denied_short_circuit():
     discovery = _fresh_discovery()
     discovery.s3_client = _StubS3Permission(list_error=_client_error("AccessDenied"))
@@ -401,3 +427,107 @@ def test_discover_bucket_permissions_non_access_denied_error_path():
     result = discovery.discover_bucket_permissions("bucket-z")
     assert result.permission_level == PermissionLevel.NO_ACCESS
     assert result.error_message is not None
+
+
+class _SlowS3:
+    """S3 stub whose calls sleep, tracking peak concurrency."""
+
+    def __init__(self, delay: float = 0.05, hang: str | None = None):
+        self.delay = delay
+        self.hang = hang
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _call(self, name: str):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(5 if name == self.hang else self.delay)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def list_buckets(self):
+        return {"Buckets": [{"Name": f"bucket-{i:03d}"} for i in range(100)]}
+
+    def list_objects_v2(self, **_kwargs):
+        self._call("list_objects_v2")
+        return {}
+
+    def get_bucket_location(self, **_kwargs):
+        self._call("get_bucket_location")
+        return {"LocationConstraint": "us-west-2"}
+
+    def head_object(self, **_kwargs):
+        self._call("head_object")
+        raise _client_error("NotFound", "HeadObject")
+
+    def get_bucket_acl(self, **_kwargs):
+        self._call("get_bucket_acl")
+        return {}
+
+
+@pytest.mark.performance
+def test_discover_accessible_buckets_checks_buckets_concurrently(monkeypatch):
+    monkeypatch.setenv("QUILT_PERMISSION_BUCKET_CONCURRENCY", "8")
+    discovery = _fresh_discovery()
+    discovery.s3_client = _SlowS3()
+
+    start = time.perf_counter()
+    result = discovery.discover_accessible_buckets()
+    elapsed = time.perf_counter() - start
+
+    # Serially: 100 buckets x 4 probes x 50 ms = 20 s.
+    print(f"\n100 buckets in {elapsed:.2f} s (peak {discovery.s3_client.peak} concurrent probes)")
+    assert [bucket.name for bucket in result] == [f"bucket-{i:03d}" for i in range(100)]
+    assert all(bucket.permission_level == PermissionLevel.FULL_ACCESS for bucket in result)
+    assert elapsed < 5
+    assert discovery.s3_client.peak <= 8 * 3
+
+
+def test_timed_out_probe_is_reported_and_not_cached(monkeypatch):
+    monkeypatch.setenv("QUILT_PERMISSION_PROBE_TIMEOUT", "0.2")
+    discovery = _fresh_discovery()
+    discovery.s3_client = _SlowS3(delay=0, hang="head_object")
+
+    result = discovery.discover_bucket_permissions("slow-bucket")
+
+    assert result.can_list is True
+    assert result.permission_level == PermissionLevel.UNKNOWN
+    assert result.region == "us-west-2"
+    assert "HeadObject" in result.error_message
+    assert len(discovery.permission_cache) == 0
+
+
+def test_probe_timeout_does_not_count_queue_wait(monkeypatch):
+    monkeypatch.setenv("QUILT_PERMISSION_PROBE_MAX_WORKERS", "1")
+    monkeypatch.setenv("QUILT_PERMISSION_PROBE_TIMEOUT", "0.3")
+    discovery = _fresh_discovery()
+    discovery.s3_client = _SlowS3(delay=0.01)
+    get_permission_probe_executor().submit(time.sleep, 0.5)  # another caller's probe holds the only slot
+
+    result = discovery.discover_bucket_permissions("busy-bucket")
+
+    assert result.permission_level == PermissionLevel.FULL_ACCESS
+    assert result.error_message is None
+
+
+def test_probe_that_never_starts_is_cancelled_and_reported_unknown(monkeypatch):
+    monkeypatch.setenv("QUILT_PERMISSION_PROBE_MAX_WORKERS", "1")
+    monkeypatch.setenv("QUILT_PERMISSION_PROBE_QUEUE_TIMEOUT", "0.1")
+    discovery = _fresh_discovery()
+    discovery.s3_client = Mock()
+    release = threading.Event()
+    blocker = get_permission_probe_executor().submit(release.wait, 5)
+
+    result = discovery.discover_bucket_permissions("queued-bucket")
+    release.set()
+    blocker.result(timeout=5)
+    get_permission_probe_executor().submit(lambda: None).result(timeout=5)
+
+    assert result.permission_level == PermissionLevel.UNKNOWN
+    assert "ListObjectsV2" in result.error_message
+    discovery.s3_client.list_objects_v2.assert_not_called()
+    assert len(discovery.permission_cache) == 0
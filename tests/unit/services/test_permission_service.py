@@ -34,13 +34,33 @@ class _StubS3Client:
         return {}
 
 
-class _StubSessionWithS3:
+class _StubSTSClient:
+    def __init__(self, arn: str):
+        self.arn = arn
+
+    def get_caller_identity(self):
+        return {"UserId": "id", "Arn": self.arn, "Account": "123456789012"}
+
+
+class _CountingS3Client(_StubS3Client):
     def __init__(self):
-        self.s3 = _StubS3Client()
+        self.calls = 0
+
+    def list_objects_v2(self, **kwargs):
+        self.calls += 1
+        return {}
+
+
+class _StubSessionWithS3:
+    def __init__(self, arn: str | None = None):
+        self.s3 = _CountingS3Client()
+        self.sts = _StubSTSClient(arn) if arn else object()
 
     def client(self, name: str):
         if name == "s3":
             return self.s3
+        if name == "sts":
+            return self.sts
         return object()
 
 
@@ -70,13 +90,13 @@ def test_permission_service_initializes_clients_from_auth_session():
     assert discovery.s3_client is session.clients["s3"]
 
 
-def test_permission_service_cache_is_instance_scoped():
+def test_permission_service_cache_is_process_scoped():
     service_a = PermissionDiscoveryService(_StubAuthService(_StubSession()))
     service_b = PermissionDiscoveryService(_StubAuthService(_StubSession()))
 
-    assert service_a._discovery.permission_cache is not service_b._discovery.permission_cache
-    assert service_a._discovery.identity_cache is not service_b._discovery.identity_cache
-    assert service_a._discovery.bucket_list_cache is not service_b._discovery.bucket_list_cache
+    assert service_a._discovery.permission_cache is service_b._discovery.permission_cache
+    assert service_a._discovery.identity_cache is service_b._discovery.identity_cache
+    assert service_a._discovery.bucket_list_cache is service_b._discovery.bucket_list_cache
 
 
 def test_permission_cache_ttl_is_instance_specific():
@@ -87,17 +107,19 @@ def test_permission_cache_ttl_is_instance_specific():
     assert service_b._discovery.permission_cache.ttl == 10
 
 
-def test_permission_cache_invalidation_is_isolated():
-    service_a = PermissionDiscoveryService(_StubAuthService(_StubSession()))
-    service_b = PermissionDiscoveryService(_StubAuthService(_StubSession()))
-
-    service_a._discovery.permission_cache["bucket-a"] = "value-a"
-    service_b._discovery.permission_cache["bucket-b"] = "value-b"
+def test_permission_results_are_shared_per_identity():
+    alice = "arn:aws:iam::123456789012:user/alice"
+    first = PermissionDiscoveryService(_StubAuthService(_StubSessionWithS3(alice)))
+    same_identity = PermissionDiscoveryService(_StubAuthService(_StubSessionWithS3(alice)))
+    other_identity = PermissionDiscoveryService(_StubAuthService(_StubSessionWithS3("arn:aws:iam::1:user/bob")))
 
-    service_a._discovery.permission_cache.clear()
+    first._discovery.discover_bucket_permissions("example-bucket")
+    same_identity._discovery.discover_bucket_permissions("example-bucket")
+    other_identity._discovery.discover_bucket_permissions("example-bucket")
 
-    assert "bucket-a" not in service_a._discovery.permission_cache
-    assert "bucket-b" in service_b._discovery.permission_cache
+    assert first._discovery.s3_client.calls == 1
+    assert same_identity._discovery.s3_client.calls == 0
+    assert other_identity._discovery.s3_client.calls == 1
 
 
 def test_permission_service_singleton_accessor_removed():
@@ -150,10 +172,10 @@ def test_permission_wrappers_use_context_service():
 
 
 def test_permission_cache_key_generation():
-    discovery = AWSPermissionDiscovery(session=_StubSessionWithS3())
+    discovery = AWSPermissionDiscovery(session=_StubSessionWithS3("arn:aws:iam::123456789012:user/alice"))
     discovery.discover_bucket_permissions("example-bucket")
 
-    assert "bucket_permissions_example-bucket" in discovery.permission_cache
+    assert "bucket_permissions_arn:aws:iam::123456789012:user/alice_example-bucket" in discovery.permission_cache
 
 
 def test_permission_cache_expiration():
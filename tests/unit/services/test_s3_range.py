@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from quilt_mcp.services import s3_range
+from quilt_mcp.services.s3_range import decode_prefix, parse_content_range, read_range, read_text_range
+
+
+class _InvalidRange(Exception):
+    response = {"Error": {"Code": "InvalidRange"}}
+
+
+class _Client:
+    def __init__(self, payload: bytes, *, honour_range: bool = True):
+        self.payload = payload
+        self.honour_range = honour_range
+        self.calls: list[dict] = []
+
+    def get_object(self, **kwargs):
+        self.calls.append(kwargs)
+        if "Range" not in kwargs or not self.honour_range:
+            return {"Body": io.BytesIO(self.payload)}
+        if not self.payload:
+            raise _InvalidRange()
+        first, last = kwargs["Range"][len("bytes=") :].split("-")
+        size = len(self.payload)
+        start, end = (size - int(last), size - 1) if not first else (int(first), min(int(last), size - 1))
+        return {
+            "Body": io.BytesIO(self.payload[max(start, 0) : end + 1]),
+            "ContentRange": f"bytes {max(start, 0)}-{end}/{size}",
+        }
+
+
+def test_parse_content_range():
+    assert parse_content_range("bytes 0-9/100") == (0, 9, 100)
+    assert parse_content_range("bytes 5-9/*") == (5, 9, None)
+    assert parse_content_range(None) is None
+    assert parse_content_range("bytes */100") is None
+
+
+def test_read_range_requests_one_extra_byte_and_reports_cursor():
+    client = _Client(b"0123456789")
+
+    page = read_range(client, {"Bucket": "b", "Key": "k"}, offset=2, length=3)
+
+    assert client.calls[0]["Range"] == "bytes=2-5"
+    assert page.data == b"234"
+    assert page.offset == 2
+    assert page.next_offset == 5
+    assert page.object_size == 10
+
+
+def test_read_range_empty_object_falls_back_to_plain_get():
+    client = _Client(b"")
+
+    page = read_range(client, {"Bucket": "b", "Key": "k"}, length=10)
+
+    assert page.data == b""
+    assert page.next_offset is None
+    assert "Range" not in client.calls[1]
+
+
+def test_read_range_without_content_range_uses_probe_byte():
+    client = _Client(b"abcdef", honour_range=False)
+
+    page = read_range(client, {"Bucket": "b", "Key": "k"}, length=4)
+
+    assert page.data == b"abcd"
+    assert page.next_offset == 4
+    assert page.object_size is None
+
+
+def test_read_text_range_streams_in_chunks_and_holds_back_split_character(monkeypatch):
+    monkeypatch.setattr(s3_range, "READ_CHUNK_SIZE", 2)
+    payload = "añb€".encode()  # 61 c3b1 62 e282ac
+    client = _Client(payload)
+
+    first = read_text_range(client, {"Bucket": "b", "Key": "k"}, length=5)
+    assert first.text == "añb"
+    assert first.bytes_read == 4
+    assert first.next_offset == 4
+
+    second = read_text_range(client, {"Bucket": "b", "Key": "k"}, offset=first.next_offset, length=5)
+    assert second.text == "€"
+    assert second.next_offset is None
+
+
+def test_read_text_range_rejects_unknown_encoding_before_requesting():
+    client = _Client(b"abc")
+
+    with pytest.raises(LookupError):
+        read_text_range(client, {"Bucket": "b", "Key": "k"}, length=3, encoding="no-such-codec")
+    assert client.calls == []
+
+
+def test_decode_prefix():
+    assert decode_prefix("a€".encode()[:3], "utf-8", final=False) == ("a", 1)
+    assert decode_prefix("a€".encode(), "utf-8", final=True) == ("a€", 4)
+    with pytest.raises(UnicodeDecodeError):
+        decode_prefix(b"\xff", "utf-8", final=True)
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from quilt_mcp.services.s3_upload import (
+    MAX_PARTS,
+    MIB,
+    MIN_PART_SIZE,
+    UploadConfig,
+    map_concurrently,
+    upload_bytes,
+)
+
+
+class _MultipartClient:
+    """Records S3 calls; ``fail_part`` makes that part number raise."""
+
+    def __init__(self, fail_part: int | None = None, delay: float = 0.0):
+        self.fail_part = fail_part
+        self.delay = delay
+        self.calls: list[tuple[str, dict]] = []
+        self.parts: dict[int, bytes] = {}
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def _record(self, name, kwargs):
+        with self._lock:
+            self.calls.append((name, kwargs))
+
+    def put_object(self, **kwargs):
+        self._record("put_object", kwargs)
+        return {"ETag": "single"}
+
+    def create_multipart_upload(self, **kwargs):
+        self._record("create_multipart_upload", kwargs)
+        return {"UploadId": "up-1"}
+
+    def upload_part(self, **kwargs):
+        assert isinstance(kwargs["Body"], bytes)
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if kwargs["PartNumber"] == self.fail_part:
+                raise RuntimeError("part failed")
+            with self._lock:
+                self.parts[kwargs["PartNumber"]] = kwargs["Body"]
+            return {"ETag": f"etag-{kwargs['PartNumber']}"}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def complete_multipart_upload(self, **kwargs):
+        self._record("complete_multipart_upload", kwargs)
+        return {"ETag": "multi-3"}
+
+    def abort_multipart_upload(self, **kwargs):
+        self._record("abort_multipart_upload", kwargs)
+        return {}
+
+    def names(self):
+        return [name for name, _ in self.calls]
+
+
+CONFIG = UploadConfig(multipart_threshold=MIN_PART_SIZE, part_size=MIN_PART_SIZE)
+
+
+def test_small_body_uses_put_object():
+    client = _MultipartClient()
+    result = upload_bytes(client, "b", "k", b"hello", content_type="text/plain", metadata={"a": "1"}, config=CONFIG)
+
+    assert result.etag == "single"
+    assert result.size == 5
+    assert result.parts is None
+    assert client.names() == ["put_object"]
+    assert client.calls[0][1]["ContentType"] == "text/plain"
+    assert client.calls[0][1]["Metadata"] == {"a": "1"}
+
+
+def test_large_body_uploads_parts_in_order_and_completes():
+    body = bytes(range(256)) * (MIN_PART_SIZE * 2 // 256) + b"tail"
+    client = _MultipartClient(delay=0.01)
+
+    result = upload_bytes(client, "b", "k", body, content_type="application/x", config=CONFIG)
+
+    assert result.etag == "multi-3"
+    assert result.size == len(body)
+    assert result.parts == 3
+    assert client.names() == ["create_multipart_upload", "complete_multipart_upload"]
+    assert client.calls[0][1]["ContentType"] == "application/x"
+    assert b"".join(client.parts[n] for n in sorted(client.parts)) == body
+    completed = client.calls[1][1]["MultipartUpload"]["Parts"]
+    assert completed == [{"ETag": f"etag-{n}", "PartNumber": n} for n in (1, 2, 3)]
+    assert client.peak > 1
+
+
+def test_failed_part_aborts_upload():
+    client = _MultipartClient(fail_part=2)
+
+    with pytest.raises(RuntimeError, match="part failed"):
+        upload_bytes(client, "b", "k", b"x" * (MIN_PART_SIZE * 3), config=CONFIG)
+
+    assert client.names() == ["create_multipart_upload", "abort_multipart_upload"]
+    assert client.calls[1][1]["UploadId"] == "up-1"
+
+
+def test_part_size_grows_to_stay_within_part_limit():
+    config = UploadConfig(part_size=MIN_PART_SIZE)
+    assert config.part_size_for(10 * MIB) == MIN_PART_SIZE
+    huge = MIN_PART_SIZE * MAX_PARTS * 2
+    assert config.part_size_for(huge) == huge // MAX_PARTS
+
+
+def test_config_from_env_clamps_part_size(monkeypatch):
+    monkeypatch.setenv("QUILT_UPLOAD_MAX_CONCURRENCY", "0")
+    monkeypatch.setenv("QUILT_UPLOAD_PART_SIZE", "1024")
+    monkeypatch.setenv("QUILT_UPLOAD_MULTIPART_THRESHOLD", str(64 * MIB))
+
+    config = UploadConfig.from_env()
+
+    assert config.max_concurrency == 1
+    assert config.part_size == MIN_PART_SIZE
+    assert config.multipart_threshold == 64 * MIB
+
+
+def test_map_concurrently_keeps_order_and_runs_in_parallel():
+    def slow(item: int) -> int:
+        time.sleep(0.05 * (5 - item))
+        return item * 10
+
+    start = time.perf_counter()
+    assert map_concurrently(slow, [0, 1, 2, 3, 4], max_concurrency=5) == [0, 10, 20, 30, 40]
+    assert time.perf_counter() - start < 0.4
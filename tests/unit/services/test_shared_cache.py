@@ -0,0 +1,106 @@
+"""Unit tests for the SQLite store shared by worker processes."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sqlite3
+import stat
+import time
+
+from quilt_mcp.services import shared_cache as module
+from quilt_mcp.services.shared_cache import SharedCacheStore, get_shared_cache, reset_shared_cache
+
+
+def _write_from_child(path: str) -> None:
+    SharedCacheStore(path).set("ns", "child", {"pid": os.getpid()})
+
+
+def test_round_trip_expiry_and_namespaces(tmp_path):
+    store = SharedCacheStore(str(tmp_path / "cache.db"))
+
+    store.set("ns", "key", {"value": 1})
+    store.set("ns", "expired", "old", expires_at=time.time() - 1)
+    store.set("other", "key", "other")
+
+    assert store.get("ns", "key") == {"value": 1}
+    assert store.get("ns", "expired") is None
+    assert store.get("other", "key") == "other"
+
+    store.clear("ns")
+    assert store.get("ns", "key") is None
+    assert store.get("other", "key") == "other"
+    store.delete("other", "key")
+    assert store.get("other", "key") is None
+
+
+def test_file_is_private_and_unpicklable_values_are_skipped(tmp_path):
+    store = SharedCacheStore(str(tmp_path / "cache.db"))
+
+    assert stat.S_IMODE(os.stat(store.path).st_mode) == 0o600
+    assert store.set("ns", "lock", module.threading.Lock()) is False
+    assert store.get("ns", "lock") is None
+    assert store.stats()["errors"] == 1
+
+
+def test_least_recently_used_entries_are_evicted_past_max_bytes(tmp_path):
+    store = SharedCacheStore(str(tmp_path / "cache.db"), max_bytes=3000)
+    for name in ("a", "b", "c"):
+        store.set("ns", name, "x" * 900)
+    assert store.get("ns", "a") is not None  # "b" is now least recently used
+
+    store.set("ns", "d", "x" * 900)
+
+    assert store.get("ns", "b") is None
+    assert all(store.get("ns", name) is not None for name in ("a", "c", "d"))
+    assert store.set("ns", "huge", "x" * 4000) is False
+    assert store.stats()["evictions"] == 1
+
+
+def test_file_stays_bounded_under_max_bytes(tmp_path):
+    path = tmp_path / "cache.db"
+    store = SharedCacheStore(str(path), max_bytes=64 * 1024)
+    for i in range(500):
+        store.set("manifests", str(i), os.urandom(10 * 1024))
+    stored = store._connection().execute("SELECT COUNT(*), SUM(size) FROM entries").fetchone()
+    store.close()
+
+    assert stored[0] <= 6 and stored[1] <= 64 * 1024
+    assert path.stat().st_size < 512 * 1024  # ~5 MB of values were written
+
+
+def test_older_schema_is_replaced(tmp_path):
+    path = tmp_path / "cache.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "CREATE TABLE entries (namespace TEXT, key TEXT, value BLOB, expires_at REAL, PRIMARY KEY (namespace, key))"
+        )
+
+    store = SharedCacheStore(str(path))
+
+    assert store.set("ns", "key", 1) is True
+    assert store.get("ns", "key") == 1
+
+
+def test_entries_are_visible_across_processes(tmp_path):
+    path = str(tmp_path / "cache.db")
+    store = SharedCacheStore(path)
+    process = multiprocessing.get_context("spawn").Process(target=_write_from_child, args=(path,))
+    process.start()
+    process.join(timeout=60)
+
+    assert process.exitcode == 0
+    assert store.get("ns", "child")["pid"] == process.pid
+
+
+def test_process_store_requires_path(monkeypatch, tmp_path):
+    monkeypatch.delenv("QUILT_SHARED_CACHE_PATH", raising=False)
+    assert get_shared_cache() is None
+
+    monkeypatch.setenv("QUILT_SHARED_CACHE_PATH", str(tmp_path / "shared" / "cache.db"))
+    monkeypatch.setenv("QUILT_SHARED_CACHE_MAX_BYTES", "4096")
+    store = get_shared_cache()
+    assert store is not None and store is get_shared_cache()
+    assert store.stats()["max_bytes"] == 4096
+    reset_shared_cache()
+    assert get_shared_cache() is not store
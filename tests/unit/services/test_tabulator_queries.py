@@ -4,7 +4,7 @@ Tests for Quilt Tabulator management tools
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 from quilt_mcp.tools.tabulator import (
     tabulator_tables_list,
@@ -54,12 +54,14 @@ class TestTabulatorTablesList:
         mock_backend = Mock()
         mock_create.return_value = mock_backend
 
-        mock_backend.list_tabulator_tables.return_value = [
-            {
-                "name": "test_table",
-                "config": "schema:\n- name: col1\n  type: STRING\n",
-            }
-        ]
+        mock_backend.alist_tabulator_tables = AsyncMock(
+            return_value=[
+                {
+                    "name": "test_table",
+                    "config": "schema:\n- name: col1\n  type: STRING\n",
+                }
+            ]
+        )
 
         result = await tabulator_tables_list("test-bucket")
 
@@ -67,7 +69,7 @@ class TestTabulatorTablesList:
         assert len(result["tables"]) == 1
         assert result["tables"][0]["name"] == "test_table"
         assert result["bucket_name"] == "test-bucket"
-        mock_backend.list_tabulator_tables.assert_called_once_with("test-bucket")
+        mock_backend.alist_tabulator_tables.assert_awaited_once_with("test-bucket")
 
     @patch("quilt_mcp.ops.factory.QuiltOpsFactory.create")
     @pytest.mark.asyncio
@@ -75,7 +77,7 @@ class TestTabulatorTablesList:
         """Test table listing error handling."""
         mock_backend = Mock()
         mock_create.return_value = mock_backend
-        mock_backend.list_tabulator_tables.side_effect = Exception("Connection failed")
+        mock_backend.alist_tabulator_tables = AsyncMock(side_effect=Exception("Connection failed"))
 
         result = await tabulator_tables_list("test-bucket")
 
@@ -0,0 +1,90 @@
+"""Cold-start benchmark: server import time measured with ``python -X importtime``.
+
+Stdio clients spawn one server process per session, so import time is
+user-visible latency. Each check runs a fresh interpreter, parses its
+``-X importtime`` report and fails when startup pulls in a heavy dependency
+that tools only need on first use, or when total import time exceeds the
+budget (``QUILT_STARTUP_IMPORT_BUDGET_MS``). Run with ``-s`` to see the
+slowest top-level imports.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from typing import Dict, List, Set, Tuple
+
+import pytest
+
+pytestmark = pytest.mark.performance
+
+DEFAULT_BUDGET_MS = 3500
+
+# Imported by the server entry point and by registering every tool module.
+SERVER_STARTUP = """
+import importlib
+import quilt_mcp.main
+from quilt_mcp.tools import _MODULE_PATHS
+for module_path in _MODULE_PATHS.values():
+    importlib.import_module(module_path)
+import quilt_mcp.tools.resources
+"""
+
+DEFERRED_MODULES = ["matplotlib", "numpy", "pandas", "PIL", "pyathena", "sqlalchemy"]
+
+
+def _run(code: str) -> Tuple[Set[str], List[Tuple[str, int, int]]]:
+    """Run ``code`` in a fresh interpreter.
+
+    Returns the loaded module names and the (module, depth, cumulative_us)
+    entries of the ``-X importtime`` report.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code + "\nimport sys\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), depth, int(cumulative)))
+    return set(result.stdout.split()), entries
+
+
+def _top_level(entries: List[Tuple[str, int, int]]) -> Dict[str, int]:
+    return {name: cumulative for name, depth, cumulative in entries if depth == 0}
+
+
+def test_package_import_does_not_load_tools():
+    modules, _ = _run("import quilt_mcp")
+
+    assert "quilt_mcp" in modules
+    assert not any(name.startswith("quilt_mcp.tools.") for name in modules)
+    assert "fastmcp" not in modules
+
+
+def test_server_startup_defers_heavy_dependencies():
+    modules, _ = _run(SERVER_STARTUP)
+
+    assert "quilt_mcp.tools.quilt_summary" in modules
+    assert "quilt_mcp.services.athena_read_service" in modules
+    assert [name for name in DEFERRED_MODULES if name in modules] == []
+
+
+def test_server_startup_import_time_within_budget():
+    budget_ms = int(os.getenv("QUILT_STARTUP_IMPORT_BUDGET_MS", str(DEFAULT_BUDGET_MS)))
+    top_level = _top_level(_run(SERVER_STARTUP)[1])
+    total_ms = sum(top_level.values()) / 1000
+
+    slowest = sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:8]
+    print(
+        f"\nServer startup imports: {total_ms:.0f} ms (budget {budget_ms} ms); slowest: "
+        + ", ".join(f"{name} {cumulative / 1000:.0f} ms" for name, cumulative in slowest)
+    )
+    assert total_ms <= budget_ms
@@ -10,7 +10,7 @@ These tests verify:
 from __future__ import annotations
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from quilt_mcp.search.backends.elasticsearch import Quilt3ElasticsearchBackend
 from quilt_mcp.search.backends.base import BackendStatus
@@ -197,8 +197,11 @@ class TestIndexPatternBuilder:
         }
         mock_response.raise_for_status = Mock()
 
-        # Mock requests.get to return our mock response
-        with patch('quilt_mcp.search.backends.elasticsearch.requests.get', return_value=mock_response):
+        # Mock the shared async HTTP client to return our mock response
+        with patch(
+            'quilt_mcp.search.backends.elasticsearch.get_async_http_client',
+            return_value=Mock(get=AsyncMock(return_value=mock_response)),
+        ):
             # Execute search with empty bucket
             response = await self.backend.search(query="test", scope="file", bucket="", limit=10)
 
@@ -273,8 +276,11 @@ class TestIndexPatternBuilder:
         }
         mock_response.raise_for_status = Mock()
 
-        # Mock requests.get to return our mock response
-        with patch('quilt_mcp.search.backends.elasticsearch.requests.get', return_value=mock_response):
+        # Mock the shared async HTTP client to return our mock response
+        with patch(
+            'quilt_mcp.search.backends.elasticsearch.get_async_http_client',
+            return_value=Mock(get=AsyncMock(return_value=mock_response)),
+        ):
             # Execute search with empty bucket
             response = await self.backend.search(query="test", scope="packageEntry", bucket="", limit=10)
 
@@ -358,8 +364,11 @@ class TestIndexPatternBuilder:
         }
         mock_response.raise_for_status = Mock()
 
-        # Mock requests.get to return our mock response
-        with patch('quilt_mcp.search.backends.elasticsearch.requests.get', return_value=mock_response):
+        # Mock the shared async HTTP client to return our mock response
+        with patch(
+            'quilt_mcp.search.backends.elasticsearch.get_async_http_client',
+            return_value=Mock(get=AsyncMock(return_value=mock_response)),
+        ):
             # Execute search with empty bucket
             response = await self.backend.search(query="test", scope="global", bucket="", limit=10)
 
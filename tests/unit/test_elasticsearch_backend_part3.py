@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock, patch
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from quilt_mcp.domain.auth_status import Auth_Status
 from quilt_mcp.search.backends.base import BackendStatus
 from quilt_mcp.search.backends.elasticsearch import Quilt3ElasticsearchBackend
+from quilt_mcp.services.async_http_client import run_sync
 
 pytestmark = pytest.mark.anyio
 
 
-def _make_backend():
+def _make_backend(registry_url: str = "https://example-registry.quiltdata.com"):
     from quilt_mcp.backends.quilt3_backend import Quilt3_Backend
 
     mock_backend = Mock(spec=Quilt3_Backend)
@@ -21,9 +24,9 @@ def _make_backend():
         is_authenticated=True,
         logged_in_url="https://example.quiltdata.com",
         catalog_name="example.quiltdata.com",
-        registry_url="https://example-registry.quiltdata.com",
+        registry_url=registry_url,
     )
-    mock_backend.get_registry_url.return_value = "https://example-registry.quiltdata.com"
+    mock_backend.get_registry_url.return_value = registry_url
     mock_backend.get_graphql_auth_headers.return_value = {"Authorization": "Bearer token"}
     return Quilt3ElasticsearchBackend(backend=mock_backend), mock_backend
 
@@ -44,7 +47,7 @@ def test_execute_search_api_headers_fallback_and_search_api_fallback(monkeypatch
     response = Mock()
     response.raise_for_status = Mock()
     response.json.return_value = {"hits": {"hits": []}}
-    with patch("quilt_mcp.search.backends.elasticsearch.requests.get", return_value=response) as req_get:
+    with patch.object(backend.http_session, "get", return_value=response) as req_get:
         result = backend._execute_search_api({"query": {"match_all": {}}}, "bucket", 5)
         assert result["hits"]["hits"] == []
         assert req_get.call_args.kwargs["headers"] == {}
@@ -55,6 +58,32 @@ def test_execute_search_api_headers_fallback_and_search_api_fallback(monkeypatch
         assert "hits" in result
 
 
+async def test_aexecute_search_api_awaits_shared_async_client(monkeypatch):
+    backend, mock_backend = _make_backend()
+    response = Mock()
+    response.raise_for_status = Mock()
+    response.json.return_value = {"hits": {"hits": [{"_id": "1"}]}}
+    client = Mock(get=AsyncMock(return_value=response))
+    monkeypatch.setattr("quilt_mcp.search.backends.elasticsearch.get_async_http_client", lambda: client)
+
+    result = await backend._aexecute_search_api({"query": {"match_all": {}}}, "bucket", 5)
+
+    assert result["hits"]["hits"] == [{"_id": "1"}]
+    args, kwargs = client.get.call_args
+    assert args[0] == "https://example-registry.quiltdata.com/api/search"
+    assert kwargs["params"]["index"] == "bucket"
+    assert kwargs["params"]["size"] == "5"
+    assert kwargs["headers"] == {"Authorization": "Bearer token"}
+
+    # Without a registry URL the quilt3 search_api fallback still runs in a worker thread.
+    mock_backend.get_registry_url.return_value = None
+    with patch("quilt_mcp.search.backends.elasticsearch.search_api", return_value={"hits": {"hits": []}}) as api:
+        result = await backend._aexecute_search_api({"query": {"match_all": {}}}, "bucket", 5)
+    assert result == {"hits": {"hits": []}}
+    api.assert_called_once()
+    client.get.assert_awaited_once()
+
+
 async def test_search_unavailable_and_invalid_scope_handler():
     backend, _ = _make_backend()
     backend._initialized = True
@@ -66,10 +95,7 @@ async def test_search_unavailable_and_invalid_scope_handler():
     backend._session_available = True
     with (
         patch.object(backend, "_build_index_pattern", return_value="bucket"),
-        patch(
-            "quilt_mcp.search.backends.elasticsearch.asyncio.to_thread",
-            side_effect=lambda fn, *args: fn(*args),
-        ),
+        patch.object(backend, "_aexecute_search_api", return_value={"hits": {"hits": []}}),
     ):
         # Remove handler to hit invalid scope path
         backend.scope_handlers.pop("file", None)
@@ -90,10 +116,7 @@ async def test_search_empty_pattern_filters_and_error_response():
     # Build response error path and BackendError formatting path
     with (
         patch.object(backend, "_build_index_pattern", return_value="bucket"),
-        patch(
-            "quilt_mcp.search.backends.elasticsearch.asyncio.to_thread",
-            side_effect=lambda fn, *args: {"error": "es failed"},
-        ),
+        patch.object(backend, "_aexecute_search_api", return_value={"error": "es failed"}),
     ):
         errored = await backend.search(
             "query",
@@ -112,26 +135,106 @@ async def test_search_empty_pattern_filters_and_error_response():
     assert "es failed" in (errored.error_message or "")
 
 
-async def test_search_retry_403_then_success(monkeypatch):
+async def test_search_fans_out_after_403_and_remembers_shard_size(monkeypatch):
     backend, _ = _make_backend()
     backend._session_available = True
-    with (
-        patch.object(backend, "_build_index_pattern", return_value="a,b"),
-        patch.object(backend, "_get_available_buckets", return_value=["a", "b", "c"]),
-    ):
-        calls = {"n": 0}
+    buckets = [f"b{i}" for i in range(60)]
+    patterns = []
 
-        async def fake_to_thread(fn, *args):
-            calls["n"] += 1
-            if calls["n"] == 1:
-                raise Exception("403 forbidden")
-            return {"hits": {"hits": []}}
+    async def fake_search_api(dsl_query, index_pattern, limit):
+        patterns.append(index_pattern)
+        indices = index_pattern.split(",")
+        if len(indices) > 45:
+            raise Exception("403 forbidden")
+        return {"hits": {"hits": [{"_index": index, "_id": index, "_score": float(index[1:])} for index in indices]}}
 
-        monkeypatch.setattr("quilt_mcp.search.backends.elasticsearch.asyncio.to_thread", fake_to_thread)
+    monkeypatch.setattr(backend, "_aexecute_search_api", fake_search_api)
+    with patch.object(backend, "_get_available_buckets", return_value=buckets):
         result = await backend.search("q", scope="file", bucket="", limit=5)
+        assert result.status == BackendStatus.AVAILABLE
+        # Full pattern rejected, then shards of 50 (+10), then the rejected 50 re-split into 40 (+10).
+        assert [len(p.split(",")) for p in patterns] == [60, 50, 10, 40, 10]
+        assert result.shards == {"total": 3, "succeeded": 3, "timed_out": [], "failed": []}
+
+        # The accepted shard size is remembered for the catalog: the next
+        # search fans out at that size straight away and still covers all buckets.
+        patterns.clear()
+        again = await backend.search("q", scope="file", bucket="", limit=5)
+
+    assert again.status == BackendStatus.AVAILABLE
+    assert [len(p.split(",")) for p in patterns] == [40, 20]
+    assert [r.bucket for r in again.results] == ["b59", "b58", "b57", "b56", "b55"]
+
+
+async def test_fan_out_merges_top_k_and_reports_timed_out_shards(monkeypatch):
+    backend, _ = _make_backend()
+    backend._session_available = True
+    monkeypatch.setenv("QUILT_SEARCH_SHARD_TIMEOUT", "0.05")
+
+    async def execute(dsl_query, index_pattern, limit):
+        if "slow" in index_pattern:
+            await asyncio.sleep(0.5)
+        scores = {"a": [5.0, 1.0], "b": [4.0, 3.0], "slow": [9.0]}[index_pattern]
+        return {
+            "hits": {
+                "hits": [
+                    {"_index": index_pattern, "_id": f"{index_pattern}{i}", "_score": s} for i, s in enumerate(scores)
+                ]
+            }
+        }
 
-    assert result.status == BackendStatus.AVAILABLE
-    assert calls["n"] >= 2
+    monkeypatch.setattr(backend, "_aexecute_search_api", execute)
+    response, report = await backend._fan_out_search({}, "file", ["a", "b", "slow"], limit=3, shard_size=1)
+
+    assert [hit["_score"] for hit in response["hits"]["hits"]] == [5.0, 4.0, 3.0]
+    assert report["total"] == 3
+    assert report["succeeded"] == 2
+    assert report["timed_out"] == [{"buckets": ["slow"]}]
+
+
+async def test_fan_out_bounds_concurrency(monkeypatch):
+    backend, _ = _make_backend()
+    monkeypatch.setenv("QUILT_SEARCH_FANOUT_CONCURRENCY", "2")
+    active = {"now": 0, "max": 0}
+
+    async def execute(dsl_query, index_pattern, limit):
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.02)
+        active["now"] -= 1
+        return {"hits": {"hits": []}}
+
+    monkeypatch.setattr(backend, "_aexecute_search_api", execute)
+    _, report = await backend._fan_out_search({}, "file", [f"b{i}" for i in range(8)], limit=5, shard_size=1)
+
+    assert report["succeeded"] == 8
+    assert active["max"] == 2
+
+
+async def test_fan_out_raises_when_every_shard_fails(monkeypatch):
+    backend, _ = _make_backend()
+
+    async def execute(dsl_query, index_pattern, limit):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(backend, "_aexecute_search_api", execute)
+    with pytest.raises(RuntimeError, match="boom"):
+        await backend._fan_out_search({}, "file", ["a", "b"], limit=5, shard_size=1)
+
+
+async def test_search_caches_bucket_list_between_unscoped_searches(monkeypatch):
+    backend, mock_backend = _make_backend()
+    backend._session_available = True
+    mock_backend.execute_graphql_query.return_value = {"data": {"bucketConfigs": [{"name": "a"}, {"name": "b"}]}}
+
+    async def fake_search_api(*args):
+        return {"hits": {"hits": []}}
+
+    monkeypatch.setattr(backend, "_aexecute_search_api", fake_search_api)
+    await backend.search("q", scope="file", bucket="")
+    await backend.search("q", scope="global", bucket="")
+
+    assert mock_backend.execute_graphql_query.call_count == 1
 
 
 def test_normalize_results_skips_none():
@@ -142,3 +245,132 @@ def test_normalize_results_skips_none():
 
     results = backend._normalize_results([{"_index": "b1"}, {"_index": "b2"}], "file")
     assert len(results) == 1
+
+
+async def test_count_sends_size_zero_with_total_hits_and_aggregations(monkeypatch):
+    backend, _ = _make_backend()
+    backend._session_available = True
+    captured = {}
+
+    async def execute(dsl_query, index_pattern, limit):
+        captured.update(dsl=dsl_query, pattern=index_pattern, limit=limit)
+        return {
+            "hits": {"total": {"value": 12345, "relation": "eq"}, "hits": []},
+            "aggregations": {
+                "buckets": {
+                    "buckets": [
+                        {"key": "bucket-a", "doc_count": 10000},
+                        {"key": "bucket-a_packages", "doc_count": 45},
+                        {"key": "bucket-b", "doc_count": 2300},
+                    ]
+                },
+                "extensions": {"buckets": [{"key": "csv", "doc_count": 9000}, {"key": "json", "doc_count": 3300}]},
+                "size_histogram": {"buckets": [{"key": "<1KB", "doc_count": 12000}, {"key": ">=1GB", "doc_count": 2}]},
+            },
+        }
+
+    monkeypatch.setattr(backend, "_aexecute_search_api", execute)
+    response = await backend.count("*", scope="global", bucket="bucket-a", include_aggregations=True)
+
+    assert response.status == BackendStatus.AVAILABLE
+    assert response.total == 12345
+    assert response.results == []
+    assert captured["limit"] == 0
+    assert captured["dsl"]["size"] == 0
+    assert captured["dsl"]["track_total_hits"] is True
+    assert set(captured["dsl"]["aggs"]) == {"buckets", "extensions", "size_histogram"}
+    assert response.aggregations["buckets"] == {"bucket-a": 10045, "bucket-b": 2300}
+    assert response.aggregations["extensions"] == {"csv": 9000, "json": 3300}
+    histogram = {entry["key"]: entry["count"] for entry in response.aggregations["size_histogram"]}
+    assert histogram["<1KB"] == 12000
+    assert histogram[">=1GB"] == 2
+    assert histogram["1KB-1MB"] == 0
+
+
+async def test_count_without_aggregations_omits_aggs(monkeypatch):
+    backend, _ = _make_backend()
+    backend._session_available = True
+    captured = {}
+
+    async def execute(dsl_query, index_pattern, limit):
+        captured["dsl"] = dsl_query
+        return {"hits": {"total": 7, "hits": []}}
+
+    monkeypatch.setattr(backend, "_aexecute_search_api", execute)
+    response = await backend.count("csv", scope="file", bucket="bucket-a")
+
+    assert response.total == 7
+    assert response.aggregations is None
+    assert "aggs" not in captured["dsl"]
+
+
+async def test_count_fan_out_sums_totals_and_aggregations(monkeypatch):
+    backend, _ = _make_backend()
+
+    async def execute(dsl_query, index_pattern, limit):
+        return {
+            "hits": {"total": {"value": 5, "relation": "eq"}, "hits": []},
+            "aggregations": {
+                "extensions": {"buckets": [{"key": "csv", "doc_count": 3}]},
+                "buckets": {"buckets": [{"key": index_pattern, "doc_count": 5}]},
+            },
+        }
+
+    monkeypatch.setattr(backend, "_aexecute_search_api", execute)
+    response, report = await backend._fan_out_search(
+        {}, "file", ["a", "b", "c"], limit=0, shard_size=1, merge=backend._merge_count_responses
+    )
+
+    assert report["succeeded"] == 3
+    assert backend._total_hits(response) == 15
+    aggregations = backend._format_aggregations(response["aggregations"])
+    assert aggregations["extensions"] == {"csv": 9}
+    assert aggregations["buckets"] == {"a": 5, "b": 5, "c": 5}
+
+
+def test_concurrent_searches_overlap_on_shared_loop(monkeypatch):
+    delay = 0.3
+    backends = [_make_backend(f"https://registry-{i}.example.com")[0] for i in range(4)]
+
+    def slow_fetch():
+        time.sleep(delay)
+        return ["bucket-a"]
+
+    async def execute(dsl_query, index_pattern, limit):
+        return {"hits": {"hits": []}}
+
+    for backend in backends:
+        monkeypatch.setattr(backend, "_fetch_available_buckets", slow_fetch)
+        monkeypatch.setattr(backend, "_aexecute_search_api", execute)
+
+    async def search_all():
+        return await asyncio.gather(*(backend.search("q") for backend in backends))
+
+    start = time.monotonic()
+    responses = run_sync(search_all(), timeout=30)
+    elapsed = time.monotonic() - start
+
+    assert [response.status for response in responses] == [BackendStatus.AVAILABLE] * len(backends)
+    # Serialized on the loop this would take len(backends) * delay.
+    assert elapsed < 2 * delay
+
+
+async def test_fan_out_resolves_auth_headers_once_per_query(monkeypatch):
+    backend, mock_backend = _make_backend()
+    backend._initialized = True
+    backend._session_available = True
+    response = Mock()
+    response.raise_for_status = Mock()
+    response.json.return_value = {"hits": {"hits": []}}
+    client = Mock(get=AsyncMock(return_value=response))
+    monkeypatch.setattr("quilt_mcp.search.backends.elasticsearch.get_async_http_client", lambda: client)
+
+    with patch.object(backend, "_get_available_buckets", return_value=["a", "b", "c"]):
+        # A one-bucket pattern against three buckets fans out in shards of one.
+        _, report = await backend._run_query({}, "file", "", "a", 5)
+        await backend._fan_out_search({}, "file", ["a", "b", "c"], limit=5, shard_size=1)
+
+    assert report["succeeded"] == 3
+    # One lookup shared by the _run_query() shards, one per shard outside it.
+    assert client.get.await_count == 6
+    assert mock_backend.get_graphql_auth_headers.call_count == 4
@@ -93,7 +93,7 @@ class TestFormatAsTable:
     def test_format_error_handling(self):
         """Test error handling in table formatting."""
         # Mock pandas to raise an exception
-        with patch("quilt_mcp.utils.formatting.pd.DataFrame") as mock_df:
+        with patch("pandas.DataFrame") as mock_df:
             mock_df.side_effect = Exception("Test error")
 
             result = format_as_table([{"test": "data"}])
@@ -252,7 +252,7 @@ class TestFormatAthenaResultsAsTable:
             "format": "csv",
         }
 
-        with patch("quilt_mcp.utils.formatting.pd.read_csv") as mock_read_csv:
+        with patch("pandas.read_csv") as mock_read_csv:
             mock_read_csv.side_effect = Exception("Parse error")
 
             enhanced = format_athena_results_as_table(result)
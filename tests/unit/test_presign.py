@@ -0,0 +1,65 @@
+"""Unit tests for batch S3 presigning."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from quilt_mcp.utils.presign import S3Presigner
+
+
+class _SigningClient:
+    def __init__(self):
+        self.calls = []
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        self.calls.append((operation, Params, ExpiresIn))
+        suffix = f"?v={Params['VersionId']}" if "VersionId" in Params else ""
+        return f"https://signed/{Params['Bucket']}/{Params['Key']}{suffix}"
+
+
+def test_sign_many_uses_one_client_for_all_keys():
+    client = _SigningClient()
+
+    with patch("quilt_mcp.utils.common.get_s3_client") as get_client:
+        get_client.return_value = client
+        urls = S3Presigner().sign_many([f"s3://bucket/key-{i}" for i in range(50)])
+
+    assert get_client.call_count == 1
+    assert len(client.calls) == 50
+    assert urls[0] == "https://signed/bucket/key-0"
+
+
+def test_sign_many_respects_limit_and_keeps_alignment():
+    client = _SigningClient()
+
+    urls = S3Presigner(client).sign_many(["s3://b/a", "s3://b/b", "s3://b/c"], limit=2)
+
+    assert urls == ["https://signed/b/a", "https://signed/b/b", None]
+    assert len(client.calls) == 2
+
+
+def test_sign_uri_passes_version_and_clamps_expiration():
+    client = _SigningClient()
+    presigner = S3Presigner(client, expiration=10_000_000)
+
+    url = presigner.sign_uri("s3://b/path/file.csv?versionId=v1")
+
+    assert url == "https://signed/b/path/file.csv?v=v1"
+    assert client.calls[0][2] == 604800
+
+
+def test_sign_uri_returns_none_for_unsignable_input():
+    client = _SigningClient()
+    presigner = S3Presigner(client)
+
+    assert presigner.sign_uri("https://example.com/x") is None
+    assert presigner.sign_uri("s3://bucket") is None
+    assert client.calls == []
+
+
+def test_client_resolution_failure_is_attempted_once():
+    with patch("quilt_mcp.utils.common.get_s3_client", side_effect=RuntimeError("no creds")) as get_client:
+        presigner = S3Presigner()
+        assert presigner.sign_many(["s3://b/a", "s3://b/b"]) == [None, None]
+
+    assert get_client.call_count == 1
@@ -149,6 +149,57 @@ class TestMCPServerConfiguration(unittest.TestCase):
             self.assertEqual(call_args[1]["host"], "0.0.0.0")  # noqa: S104
             self.assertEqual(call_args[1]["port"], 9000)
 
+    @patch("quilt_mcp.utils.common.build_http_app")
+    @patch("quilt_mcp.utils.common.create_configured_server")
+    def test_run_server_multiple_workers_uses_app_factory(self, mock_create_server, mock_build_app):
+        """Test run_server hands uvicorn the app factory when several workers are requested."""
+        from quilt_mcp.config import get_mode_config, reset_mode_config, set_test_mode_config
+        from quilt_mcp.utils.common import HTTP_APP_FACTORY, get_http_workers
+
+        set_test_mode_config(multiuser_mode=True)
+        try:
+            with patch.dict("sys.modules", {"uvicorn": Mock()}):
+                import sys
+
+                mock_uvicorn = sys.modules["uvicorn"]
+
+                with patch.dict(os.environ, {"FASTMCP_TRANSPORT": "http", "FASTMCP_WORKERS": "3"}):
+                    os.environ.pop("QUILT_DEPLOYMENT", None)
+                    self.assertEqual(get_http_workers(), 3)
+                    self.assertNotIn("QUILT_DEPLOYMENT", os.environ)
+                    run_server()
+                    self.assertEqual(os.environ["QUILT_DEPLOYMENT"], get_mode_config().deployment_mode.value)
+
+                mock_build_app.assert_not_called()
+                call_args = mock_uvicorn.run.call_args
+                self.assertEqual(call_args[0], (HTTP_APP_FACTORY,))
+                self.assertTrue(call_args[1]["factory"])
+                self.assertEqual(call_args[1]["workers"], 3)
+        finally:
+            reset_mode_config()
+
+    @patch("quilt_mcp.utils.common.build_http_app")
+    @patch("quilt_mcp.utils.common.create_configured_server")
+    def test_run_server_single_worker_outside_multiuser_mode(self, mock_create_server, mock_build_app):
+        """Test run_server ignores FASTMCP_WORKERS when sessions are stateful."""
+        from quilt_mcp.config import reset_mode_config, set_test_mode_config
+
+        set_test_mode_config(multiuser_mode=False)
+        try:
+            with patch.dict("sys.modules", {"uvicorn": Mock()}):
+                import sys
+
+                mock_uvicorn = sys.modules["uvicorn"]
+
+                with patch.dict(os.environ, {"FASTMCP_TRANSPORT": "http", "FASTMCP_WORKERS": "3"}):
+                    run_server()
+
+                mock_uvicorn.run.assert_called_once()
+                self.assertIs(mock_uvicorn.run.call_args[0][0], mock_build_app.return_value)
+                self.assertNotIn("workers", mock_uvicorn.run.call_args[1])
+        finally:
+            reset_mode_config()
+
     @patch("quilt_mcp.utils.common.create_configured_server")
     def test_run_server_default_transport(self, mock_create_server):
         """Test run_server with default transport."""
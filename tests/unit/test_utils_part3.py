@@ -56,9 +56,7 @@ def test_s3_and_sts_client_priority(monkeypatch):
 
     monkeypatch.setattr(common, "_runtime_boto3_session", lambda: None)
     jwt_module = types.SimpleNamespace(
-        JWTAuthService=lambda: types.SimpleNamespace(
-            get_boto3_session=lambda: types.SimpleNamespace(client=lambda n: f"jwt-{n}")
-        )
+        JWTAuthService=lambda: types.SimpleNamespace(get_aws_client=lambda n: f"jwt-{n}")
     )
     monkeypatch.setitem(__import__("sys").modules, "quilt_mcp.services.jwt_auth_service", jwt_module)
     assert common.get_s3_client() == "jwt-s3"
@@ -82,10 +80,10 @@ def test_s3_and_sts_client_priority(monkeypatch):
     assert common.get_s3_client() == "quilt3-s3"
     assert common.get_sts_client() == "quilt3-sts"
 
-    # Final fallback to boto3.client
+    # Final fallback to the default boto3 session
     quilt3_module2 = types.SimpleNamespace(logged_in=lambda: False)
     monkeypatch.setitem(__import__("sys").modules, "quilt3", quilt3_module2)
-    monkeypatch.setattr(common.boto3, "client", lambda name: f"default-{name}")
+    monkeypatch.setattr(common.boto3, "DEFAULT_SESSION", types.SimpleNamespace(client=lambda name: f"default-{name}"))
     assert common.get_s3_client() == "default-s3"
     assert common.get_sts_client() == "default-sts"
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import base64
+import io
+import time
 from types import SimpleNamespace
 
 from quilt_mcp.tools import buckets
@@ -37,8 +39,11 @@ def test_bucket_objects_list_success_and_exception(monkeypatch):
                 "NextContinuationToken": "nxt",
             }
 
+        def generate_presigned_url(self, operation, Params, ExpiresIn):
+            assert operation == "get_object"
+            return f"url:s3://{Params['Bucket']}/{Params['Key']}"
+
     monkeypatch.setattr("quilt_mcp.tools.buckets.check_s3_authorization", lambda *_a, **_k: _authorized_ctx(Client()))
-    monkeypatch.setattr("quilt_mcp.tools.buckets.generate_signed_url", lambda s3_uri: f"url:{s3_uri}")
     ok = buckets.bucket_objects_list("demo", include_signed_urls=True)
     assert ok.success is True
     assert ok.count == 1
@@ -57,6 +62,35 @@ def test_bucket_objects_list_success_and_exception(monkeypatch):
     assert "Failed to list objects" in err.error
 
 
+def test_bucket_objects_list_signs_with_request_client_up_to_limit(monkeypatch):
+    class Client:
+        def __init__(self):
+            self.signed = []
+
+        def list_objects_v2(self, **_kwargs):
+            return {"Contents": [{"Key": f"k{i}", "Size": i} for i in range(5)]}
+
+        def generate_presigned_url(self, operation, Params, ExpiresIn):
+            self.signed.append(Params["Key"])
+            return f"url:{Params['Key']}"
+
+    client = Client()
+    monkeypatch.setattr("quilt_mcp.tools.buckets.check_s3_authorization", lambda *_a, **_k: _authorized_ctx(client))
+    monkeypatch.setattr(
+        "quilt_mcp.utils.common.get_s3_client",
+        lambda: (_ for _ in ()).throw(AssertionError("should sign with the request client")),
+    )
+
+    result = buckets.bucket_objects_list("demo", signed_url_limit=2)
+
+    assert [obj.signed_url for obj in result.objects] == ["url:k0", "url:k1", None, None, None]
+    assert client.signed == ["k0", "k1"]
+
+    unsigned = buckets.bucket_objects_list("demo", include_signed_urls=False)
+    assert all(obj.signed_url is None for obj in unsigned.objects)
+    assert client.signed == ["k0", "k1"]
+
+
 def test_bucket_object_info_paths(monkeypatch):
     bad = buckets.bucket_object_info("not-an-s3-uri")
     assert "Invalid S3 URI" in bad.error
@@ -104,15 +138,11 @@ def test_bucket_object_info_paths(monkeypatch):
 
 
 def test_bucket_object_text_paths(monkeypatch):
-    class Body:
-        def read(self, _n):
-            return b"abcdef"
-
     class Client:
         def get_object(self, **kwargs):
             if kwargs.get("VersionId") is not None:
                 assert kwargs["VersionId"] == "v2"
-            return {"Body": Body()}
+            return {"Body": io.BytesIO(b"abcdef")}
 
     monkeypatch.setattr("quilt_mcp.tools.buckets.check_s3_authorization", lambda *_a, **_k: _authorized_ctx(Client()))
     ok = buckets.bucket_object_text("s3://b/k?versionId=v2", max_bytes=3)
@@ -151,20 +181,41 @@ def test_bucket_objects_put_mixed_results(monkeypatch):
     assert any(r.key == "boom" and "upload failed" in (r.error or "") for r in result.results)
 
 
-def test_bucket_object_fetch_base64_text_and_fallback(monkeypatch):
-    class Body:
-        def __init__(self, payload: bytes):
-            self.payload = payload
+def test_bucket_objects_put_concurrent_ordered_results_and_stats(monkeypatch):
+    class Client:
+        def put_object(self, **kwargs):
+            # Earlier keys finish last, so ordering comes from the input, not completion.
+            time.sleep(0.02 * (10 - int(kwargs["Key"])))
+            return {"ETag": f"etag-{kwargs['Key']}"}
+
+    monkeypatch.setenv("QUILT_UPLOAD_MAX_CONCURRENCY", "10")
+    monkeypatch.setattr("quilt_mcp.tools.buckets.check_s3_authorization", lambda *_a, **_k: _authorized_ctx(Client()))
+
+    start = time.perf_counter()
+    result = buckets.bucket_objects_put(
+        bucket="demo",
+        items=[{"key": str(i), "text": "x" * (i + 1), "content_type": "text/plain"} for i in range(10)],
+    )
+    elapsed = time.perf_counter() - start
+
+    assert [r.key for r in result.results] == [str(i) for i in range(10)]
+    assert [r.etag for r in result.results] == [f"etag-{i}" for i in range(10)]
+    assert result.results[0].content_type == "text/plain"
+    assert result.uploaded == 10
+    assert result.bytes_uploaded == sum(range(1, 11))
+    assert result.elapsed_ms is not None and result.elapsed_ms > 0
+    assert result.throughput_mib_per_s is not None
+    # Serial uploads would take ~1.1s.
+    assert elapsed < 0.8
 
-        def read(self, _n):
-            return self.payload
 
+def test_bucket_object_fetch_base64_text_and_fallback(monkeypatch):
     class Client:
         def __init__(self, payload: bytes):
             self.payload = payload
 
         def get_object(self, **_kwargs):
-            return {"Body": Body(self.payload), "ContentType": "application/octet-stream"}
+            return {"Body": io.BytesIO(self.payload), "ContentType": "application/octet-stream"}
 
     monkeypatch.setattr(
         "quilt_mcp.tools.buckets.check_s3_authorization", lambda *_a, **_k: _authorized_ctx(Client(b"abc"))
@@ -191,6 +242,91 @@ def test_bucket_object_fetch_base64_text_and_fallback(monkeypatch):
     assert fb.is_base64 is True
 
 
+class _RangeClient:
+    """Serves ``Range`` requests over an in-memory object, like S3."""
+
+    def __init__(self, payload: bytes):
+        self.payload = payload
+        self.ranges: list[str] = []
+
+    def get_object(self, **kwargs):
+        header = kwargs["Range"]
+        self.ranges.append(header)
+        size = len(self.payload)
+        first, last = header[len("bytes=") :].split("-")
+        if not first:
+            start, end = max(0, size - int(last)), size - 1
+        else:
+            start, end = int(first), min(int(last), size - 1)
+        if start >= size:
+            raise _VersionError("InvalidRange")
+        return {
+            "Body": io.BytesIO(self.payload[start : end + 1]),
+            "ContentRange": f"bytes {start}-{end}/{size}",
+            "ContentType": "text/plain",
+        }
+
+
+def test_bucket_object_text_pages_with_offsets_and_tail(monkeypatch):
+    payload = "line één\nline twee\n".encode()
+    client = _RangeClient(payload)
+    monkeypatch.setattr("quilt_mcp.tools.buckets.check_s3_authorization", lambda *_a, **_k: _authorized_ctx(client))
+
+    pages = []
+    offset = 0
+    while offset is not None:
+        page = buckets.bucket_object_text("s3://b/k", offset=offset, length=7)
+        assert page.success is True
+        assert page.object_size == len(payload)
+        pages.append(page.text)
+        offset = page.next_offset
+    # Pages never split a multi-byte character, so they join back into the original text.
+    assert "".join(pages) == payload.decode()
+    assert "\ufffd" not in "".join(pages)
+    assert client.ranges[0] == "bytes=0-7"
+
+    tail = buckets.bucket_object_text("s3://b/k", tail=5)
+    assert tail.text == "twee\n"
+    assert tail.offset == len(payload) - 5
+    assert tail.next_offset is None
+    assert tail.truncated is False
+
+    past_end = buckets.bucket_object_text("s3://b/k", offset=len(payload) + 10)
+    assert "beyond the end" in past_end.error
+
+    both = buckets.bucket_object_text("s3://b/k", offset=3, tail=5)
+    assert "cannot be combined" in both.error
+
+
+def test_bucket_object_fetch_range_cursor(monkeypatch):
+    payload = bytes(range(100))
+    client = _RangeClient(payload)
+    monkeypatch.setattr("quilt_mcp.tools.buckets.check_s3_authorization", lambda *_a, **_k: _authorized_ctx(client))
+
+    page = buckets.bucket_object_fetch("s3://b/k", offset=10, length=20)
+    assert base64.b64decode(page.data) == payload[10:30]
+    assert page.offset == 10
+    assert page.next_offset == 30
+    assert page.truncated is True
+    assert page.object_size == 100
+
+    last = buckets.bucket_object_fetch("s3://b/k", offset=90, length=20)
+    assert base64.b64decode(last.data) == payload[90:]
+    assert last.next_offset is None
+    assert last.truncated is False
+
+    footer = buckets.bucket_object_fetch("s3://b/k", max_bytes=4, tail=8)
+    assert base64.b64decode(footer.data) == payload[-8:]
+    assert footer.offset == 92
+
+    client.payload = "a€b".encode()
+    split = buckets.bucket_object_fetch("s3://b/k", length=2, base64_encode=False)
+    assert split.is_base64 is False
+    assert split.data == "a"
+    assert split.bytes_read == 1
+    assert split.next_offset == 1
+
+
 def test_bucket_object_fetch_and_link_version_errors(monkeypatch):
     class ErrClient:
         def __init__(self, code: str):
@@ -6,10 +6,24 @@ from dataclasses import asdict
 
 from quilt_mcp.domain.package_info import Package_Info
 from quilt_mcp.domain.content_info import Content_Info
+from quilt_mcp.domain.package_listing import Package_Listing
 from quilt_mcp.ops.quilt_ops import QuiltOps
 from quilt_mcp.tools.packages import packages_list, package_browse
 
 
+def _listing(entries, metadata=None, **kwargs):
+    return Package_Listing(
+        package_name="test/package1",
+        registry="s3://test-bucket",
+        path=kwargs.pop("path", ""),
+        top_hash=kwargs.pop("top_hash", "abc123"),
+        entries=entries,
+        metadata=metadata,
+        total_entries=kwargs.pop("total_entries", len(entries)),
+        **kwargs,
+    )
+
+
 class TestPackagesListQuiltOpsMigration:
     """Test packages_list migration to QuiltOps."""
 
@@ -155,8 +169,9 @@ class TestPackageBrowseQuiltOpsMigration:
 
     def test_package_browse_transforms_content_info_to_entries(self, mock_quilt_ops, sample_content_info_list):
         """Test that Content_Info objects are transformed to entry format."""
-        mock_quilt_ops.browse_content.return_value = sample_content_info_list
-        mock_quilt_ops.get_package_metadata.return_value = {"description": "Test package"}
+        mock_quilt_ops.browse_package.return_value = _listing(
+            sample_content_info_list, metadata={"description": "Test package"}
+        )
 
         with patch('quilt_mcp.tools.package_crud.QuiltOpsFactory') as mock_factory:
             mock_factory.create.return_value = mock_quilt_ops
@@ -176,10 +191,50 @@ class TestPackageBrowseQuiltOpsMigration:
         assert entry2['logical_key'] == "data/"
         assert entry2['size'] is None
 
+    def test_package_browse_presigns_physical_keys_with_one_client(self, mock_quilt_ops):
+        """Test that package_browse signs entries with a physical key using a single client."""
+        mock_quilt_ops.browse_package.return_value = _listing(
+            [
+                Content_Info(
+                    path="a.csv",
+                    size=1,
+                    type="file",
+                    modified_date=None,
+                    download_url=None,
+                    physical_key="s3://data/a.csv?versionId=v1",
+                ),
+                Content_Info(
+                    path="b.csv",
+                    size=2,
+                    type="file",
+                    modified_date=None,
+                    download_url=None,
+                    physical_key="s3://data/b.csv",
+                ),
+                Content_Info(path="dir", size=None, type="directory", modified_date=None, download_url=None),
+            ]
+        )
+        s3_client = Mock()
+        s3_client.generate_presigned_url.side_effect = lambda _op, Params, ExpiresIn: f"signed:{Params['Key']}"
+
+        with (
+            patch('quilt_mcp.tools.package_crud.QuiltOpsFactory') as mock_factory,
+            patch('quilt_mcp.utils.common.get_s3_client', return_value=s3_client) as mock_get_client,
+        ):
+            mock_factory.create.return_value = mock_quilt_ops
+            result = package_browse(package_name="test/package1", registry="s3://test-bucket")
+
+        assert mock_get_client.call_count == 1
+        assert result.entries[0]["download_url"] == "signed:a.csv"
+        assert result.entries[0]["s3_uri"] == "s3://data/a.csv?versionId=v1"
+        assert result.entries[1]["physical_key"] == "s3://data/b.csv"
+        assert "download_url" not in result.entries[2]
+        assert s3_client.generate_presigned_url.call_args_list[0].kwargs["Params"]["VersionId"] == "v1"
+
     def test_package_browse_error_handling(self, mock_quilt_ops):
         """Test that package_browse handles QuiltOps errors gracefully."""
         # Setup mock to raise exception
-        mock_quilt_ops.browse_content.side_effect = Exception("Package not found")
+        mock_quilt_ops.browse_package.side_effect = Exception("Package not found")
 
         with patch('quilt_mcp.tools.package_crud.QuiltOpsFactory') as mock_factory:
             mock_factory.create.return_value = mock_quilt_ops
@@ -193,8 +248,7 @@ class TestPackageBrowseQuiltOpsMigration:
 
     def test_package_browse_maintains_response_format(self, mock_quilt_ops, sample_content_info_list):
         """Test that package_browse maintains the same response format after migration."""
-        mock_quilt_ops.browse_content.return_value = sample_content_info_list
-        mock_quilt_ops.get_package_metadata.return_value = None
+        mock_quilt_ops.browse_package.return_value = _listing(sample_content_info_list)
 
         with patch('quilt_mcp.tools.package_crud.QuiltOpsFactory') as mock_factory:
             mock_factory.create.return_value = mock_quilt_ops
@@ -213,3 +267,27 @@ class TestPackageBrowseQuiltOpsMigration:
         assert result.registry == "s3://test-bucket"
         assert result.total_entries == 3
         assert result.view_type == "flat"  # recursive=False
+
+    def test_package_browse_makes_one_call_with_path_and_pagination(self, mock_quilt_ops, sample_content_info_list):
+        """Test that package_browse pushes path/top/cursor into one browse_package call."""
+        mock_quilt_ops.browse_package.return_value = _listing(
+            sample_content_info_list[:2], metadata={"k": "v"}, path="data/", total_entries=5, next_cursor="next"
+        )
+
+        with patch('quilt_mcp.tools.package_crud.QuiltOpsFactory') as mock_factory:
+            mock_factory.create.return_value = mock_quilt_ops
+
+            result = package_browse(
+                package_name="test/package1", registry="s3://test-bucket", path="data/", top=2, cursor="prev"
+            )
+
+        mock_quilt_ops.browse_package.assert_called_once_with(
+            "test/package1", registry="s3://test-bucket", path="data/", limit=2, cursor="prev"
+        )
+        assert [name for name, _args, _kwargs in mock_quilt_ops.method_calls] == ["browse_package"]
+        assert len(result.entries) == 2
+        assert result.total_entries == 5
+        assert result.next_cursor == "next"
+        assert result.top_hash == "abc123"
+        assert result.path == "data/"
+        assert result.metadata == {"k": "v"}
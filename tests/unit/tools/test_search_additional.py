@@ -52,14 +52,22 @@ def test_parse_docs_sitemap_xml_skips_entries_without_loc():
 
 def test_search_catalog_count_only_normalizes_bucket_and_defaults_backend():
     engine = Mock()
-    engine.search = Mock(return_value=None)
+    captured = {}
 
-    async def _search(**kwargs):
-        return {"total_results": 7}
+    async def _count(**kwargs):
+        captured.update(kwargs)
+        return {
+            "success": True,
+            "total_count": 7,
+            "query": kwargs["query"],
+            "scope": kwargs["scope"],
+            "bucket": kwargs["bucket"],
+            "count_only": True,
+        }
 
-    engine.search.side_effect = _search
+    engine.count.side_effect = _count
 
-    with patch("quilt_mcp.tools.search.UnifiedSearchEngine", return_value=engine):
+    with patch("quilt_mcp.tools.search.get_search_engine", return_value=engine):
         result = search.search_catalog(
             query="csv",
             scope="file",
@@ -71,6 +79,9 @@ def test_search_catalog_count_only_normalizes_bucket_and_defaults_backend():
     assert result["success"] is True
     assert result["total_count"] == 7
     assert result["bucket"] == "bucket-a"
+    assert captured["backend"] == "elasticsearch"
+    assert captured["include_aggregations"] is False
+    engine.search.assert_not_called()
 
 
 def test_search_catalog_success_returns_serialized_success_model():
@@ -90,7 +101,7 @@ def test_search_catalog_success_returns_serialized_success_model():
         }
 
     engine.search.side_effect = _search
-    with patch("quilt_mcp.tools.search.UnifiedSearchEngine", return_value=engine):
+    with patch("quilt_mcp.tools.search.get_search_engine", return_value=engine):
         result = search.search_catalog(query="README", scope="file", bucket="my-bucket")
 
     assert result["success"] is True
@@ -111,7 +122,7 @@ def test_search_catalog_returns_error_dict_for_unsuccessful_result():
         }
 
     engine.search.side_effect = _search
-    with patch("quilt_mcp.tools.search.UnifiedSearchEngine", return_value=engine):
+    with patch("quilt_mcp.tools.search.get_search_engine", return_value=engine):
         result = search.search_catalog(query="x", scope="global", bucket="")
 
     assert result["success"] is False
@@ -127,13 +138,13 @@ def test_search_catalog_maps_timeout_and_os_errors():
     async def _oserror(**_kwargs):
         raise OSError("disk io")
 
-    engine.search.side_effect = _timeout
-    with patch("quilt_mcp.tools.search.UnifiedSearchEngine", return_value=engine):
+    engine.count.side_effect = _timeout
+    with patch("quilt_mcp.tools.search.get_search_engine", return_value=engine):
         with pytest.raises(RuntimeError, match="Search timeout"):
             search.search_catalog(query="x", count_only=True)
 
-    engine.search.side_effect = _oserror
-    with patch("quilt_mcp.tools.search.UnifiedSearchEngine", return_value=engine):
+    engine.count.side_effect = _oserror
+    with patch("quilt_mcp.tools.search.get_search_engine", return_value=engine):
         with pytest.raises(RuntimeError, match="Search I/O error"):
             search.search_catalog(query="x", count_only=True)
 